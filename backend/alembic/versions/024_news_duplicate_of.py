@@ -0,0 +1,40 @@
+"""Add news.duplicate_of_id for near-duplicate clustering.
+
+Near-duplicate articles (same story syndicated across sources) are stored
+with filter_status 'duplicate' and linked to the cluster representative,
+which is the only one scored and analyzed by the LLM pipeline.
+
+Revision ID: 024_news_duplicate_of
+Revises: 023_news_title_idx
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "024_news_duplicate_of"
+down_revision: Union[str, None] = "023_news_title_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # No FK: the representative may be committed after its duplicates
+    op.add_column(
+        "news",
+        sa.Column(
+            "duplicate_of_id",
+            UUID(as_uuid=True),
+            nullable=True,
+            comment="近似重复新闻的代表文章 ID（软引用，无外键）",
+        ),
+    )
+    op.create_index("ix_news_duplicate_of_id", "news", ["duplicate_of_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_news_duplicate_of_id", table_name="news")
+    op.drop_column("news", "duplicate_of_id")
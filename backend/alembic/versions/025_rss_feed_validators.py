@@ -0,0 +1,40 @@
+"""Add HTTP cache validators to rss_feeds for conditional polling.
+
+Stores the ETag / Last-Modified returned by RSSHub so the next poll can
+send If-None-Match / If-Modified-Since and skip download + parse on 304.
+
+Revision ID: 025_rss_feed_validators
+Revises: 024_news_duplicate_of
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "025_rss_feed_validators"
+down_revision: Union[str, None] = "024_news_duplicate_of"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "rss_feeds",
+        sa.Column("etag", sa.String(500), nullable=True, comment="上次响应的 ETag"),
+    )
+    op.add_column(
+        "rss_feeds",
+        sa.Column(
+            "last_modified",
+            sa.String(100),
+            nullable=True,
+            comment="上次响应的 Last-Modified",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("rss_feeds", "last_modified")
+    op.drop_column("rss_feeds", "etag")
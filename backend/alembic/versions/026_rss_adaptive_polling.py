@@ -0,0 +1,42 @@
+"""Add adaptive polling state and bounds to rss_feeds.
+
+Revision ID: 026_rss_adaptive_polling
+Revises: 025_rss_feed_validators
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "026_rss_adaptive_polling"
+down_revision: Union[str, None] = "025_rss_feed_validators"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("rss_feeds", sa.Column("min_poll_interval_minutes", sa.Integer, nullable=True))
+    op.add_column("rss_feeds", sa.Column("max_poll_interval_minutes", sa.Integer, nullable=True))
+    op.add_column("rss_feeds", sa.Column("next_poll_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("rss_feeds", sa.Column("last_entry_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("rss_feeds", sa.Column("avg_interarrival_minutes", sa.Float, nullable=True))
+    op.add_column("rss_feeds", sa.Column("empty_poll_ratio", sa.Float, nullable=True))
+    op.add_column("rss_feeds", sa.Column("hourly_activity", JSONB, nullable=True))
+    op.create_index("ix_rss_feeds_next_poll_at", "rss_feeds", ["next_poll_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rss_feeds_next_poll_at", table_name="rss_feeds")
+    for column in (
+        "hourly_activity",
+        "empty_poll_ratio",
+        "avg_interarrival_minutes",
+        "last_entry_at",
+        "next_poll_at",
+        "max_poll_interval_minutes",
+        "min_poll_interval_minutes",
+    ):
+        op.drop_column("rss_feeds", column)
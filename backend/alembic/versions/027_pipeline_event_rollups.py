@@ -0,0 +1,52 @@
+"""Add hourly pipeline event rollups.
+
+Revision ID: 027_pipeline_event_rollups
+Revises: 026_rss_adaptive_polling
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "027_pipeline_event_rollups"
+down_revision: Union[str, None] = "026_rss_adaptive_polling"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_event_rollups",
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("layer", sa.String(10), nullable=False),
+        sa.Column("node", sa.String(50), nullable=False),
+        sa.Column("count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("success_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("error_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("duration_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("duration_sum", sa.Float, nullable=False, server_default="0"),
+        sa.Column("duration_max", sa.Float, nullable=True),
+        sa.Column("latency_histogram", JSONB, nullable=False, server_default="{}"),
+        sa.Column("counters", JSONB, nullable=False, server_default="{}"),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("bucket_start", "layer", "node"),
+    )
+    op.create_index(
+        "ix_pipeline_event_rollups_layer_node_bucket",
+        "pipeline_event_rollups",
+        ["layer", "node", "bucket_start"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_pipeline_event_rollups_layer_node_bucket",
+        table_name="pipeline_event_rollups",
+    )
+    op.drop_table("pipeline_event_rollups")
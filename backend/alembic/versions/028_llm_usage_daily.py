@@ -0,0 +1,77 @@
+"""Add llm_usage_daily pre-aggregated cost table.
+
+Backfills from existing llm_usage_records using the same sub-group
+extraction as LlmCostService.
+
+Revision ID: 028_llm_usage_daily
+Revises: 027_pipeline_event_rollups
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = "028_llm_usage_daily"
+down_revision: Union[str, None] = "027_pipeline_event_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create llm_usage_daily and backfill it."""
+    op.create_table(
+        "llm_usage_daily",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True,
+                  server_default=sa.text("gen_random_uuid()")),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("purpose", sa.String(50), nullable=False),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("sub_group", sa.String(100), nullable=False,
+                  server_default=""),
+        sa.Column("prompt_tokens", sa.BigInteger(), nullable=False,
+                  server_default="0"),
+        sa.Column("completion_tokens", sa.BigInteger(), nullable=False,
+                  server_default="0"),
+        sa.Column("cached_tokens", sa.BigInteger(), nullable=False,
+                  server_default="0"),
+        sa.Column("total_tokens", sa.BigInteger(), nullable=False,
+                  server_default="0"),
+        sa.Column("cost_usd", sa.Numeric(16, 6), nullable=False,
+                  server_default="0"),
+        sa.Column("calls", sa.Integer(), nullable=False, server_default="0"),
+        sa.UniqueConstraint("day", "purpose", "model", "sub_group",
+                            name="uq_llm_usage_daily_key"),
+    )
+    op.create_index("ix_llm_usage_daily_day", "llm_usage_daily", ["day"])
+
+    op.execute("""
+        INSERT INTO llm_usage_daily (
+            day, purpose, model, sub_group,
+            prompt_tokens, completion_tokens, cached_tokens, total_tokens,
+            cost_usd, calls
+        )
+        SELECT
+            (created_at AT TIME ZONE 'UTC')::date,
+            purpose,
+            model,
+            LEFT(COALESCE(CASE
+                WHEN purpose = 'analysis' THEN metadata_->>'agent_type'
+                WHEN purpose IN ('layer1_scoring', 'layer3_analysis',
+                                 'layer3_lightweight', 'deep_filter')
+                    THEN metadata_->>'agent'
+            END, ''), 100),
+            SUM(prompt_tokens), SUM(completion_tokens), SUM(cached_tokens),
+            SUM(total_tokens), SUM(cost_usd), COUNT(*)
+        FROM llm_usage_records
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def downgrade() -> None:
+    """Drop llm_usage_daily."""
+    op.drop_index("ix_llm_usage_daily_day", table_name="llm_usage_daily")
+    op.drop_table("llm_usage_daily")
@@ -0,0 +1,253 @@
+"""Single-flight coalescing and short-term replay cache for analysis runs.
+
+A full analysis runs the shared data fetch, four LLM agents and synthesis.
+Popular symbols are often requested by many users within minutes, so
+identical requests share work:
+
+- Concurrent requests with the same key attach to one in-flight run. Each
+  stream subscriber first receives the events emitted so far, then the
+  live ones; non-streaming callers wait for the final state.
+- A successful run is kept for ``ANALYSIS_RESULT_CACHE_TTL`` seconds and
+  replayed (events and final state) to later requests.
+
+The key includes a fingerprint of the request's AI configuration (model,
+endpoint, credentials, prompt and sampling settings), so runs are only
+shared between requests that would have made the same LLM calls on the
+same account. When every subscriber of an in-flight run goes away, the run
+is cancelled, as it was before coalescing.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from app.config import settings
+from app.core.user_ai_config import current_user_ai_config
+
+logger = logging.getLogger(__name__)
+
+# Completed runs kept for replay
+RESULT_CACHE_MAX_ENTRIES = 64
+
+AnalysisKey = Tuple[str, str, str, str]
+
+# Builds the run's event stream; the generator stores the final state under
+# outcome["state"] and a failure under outcome["error"]
+EventSource = Callable[[Dict[str, Any]], AsyncGenerator[Dict[str, Any], None]]
+
+_END = object()
+
+
+def analysis_key(symbol: str, market: str, language: str) -> AnalysisKey:
+    """Coalescing key for the current request's AI configuration."""
+    config = current_user_ai_config.get()
+    if config is None:
+        fingerprint = "default"
+    else:
+        raw = json.dumps(
+            [
+                config.model,
+                config.base_url,
+                config.api_key,
+                config.anthropic_api_key,
+                config.system_prompt,
+                config.temperature,
+                config.max_tokens,
+            ],
+            default=str,
+        )
+        fingerprint = hashlib.sha256(raw.encode()).hexdigest()[:16]
+    return (symbol.upper(), market, language, fingerprint)
+
+
+@dataclass
+class _AnalysisRun:
+    key: AnalysisKey
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    queues: Set[asyncio.Queue] = field(default_factory=set)
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+    finished: bool = False
+    final_state: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+    task: Optional[asyncio.Task] = None
+    attached: int = 0
+
+
+@dataclass
+class _CachedRun:
+    expires_at: float
+    events: List[Dict[str, Any]]
+    final_state: Dict[str, Any]
+
+
+class AnalysisCoalescer:
+    """Shares in-flight analysis runs and replays recent results."""
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+        should_cache: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> None:
+        self.ttl = ttl if ttl is not None else settings.ANALYSIS_RESULT_CACHE_TTL
+        self.max_entries = max_entries
+        self._should_cache = should_cache or (lambda state: True)
+        self._inflight: Dict[AnalysisKey, _AnalysisRun] = {}
+        self._cache: "OrderedDict[AnalysisKey, _CachedRun]" = OrderedDict()
+
+        self.runs = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    # === Public API ===
+
+    async def stream(
+        self, key: AnalysisKey, source: EventSource
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield the run's events, sharing/replaying where possible."""
+        cached = self._get_cached(key)
+        if cached is not None:
+            for event in _replayed(cached.events):
+                yield event
+            return
+
+        run = self._attach(key, source)
+        queue: asyncio.Queue = asyncio.Queue()
+        # No await between snapshot and subscribe, so no event is missed
+        history = list(run.events)
+        finished = run.finished
+        if not finished:
+            run.queues.add(queue)
+        try:
+            for event in history:
+                yield event
+            if finished:
+                return
+            while True:
+                event = await queue.get()
+                if event is _END:
+                    return
+                yield event
+        finally:
+            run.queues.discard(queue)
+            self._detach(run)
+
+    async def result(self, key: AnalysisKey, source: EventSource) -> Dict[str, Any]:
+        """Final state of the run (raises if the run failed)."""
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached.final_state
+
+        run = self._attach(key, source)
+        try:
+            await run.done.wait()
+        finally:
+            self._detach(run)
+        if run.error is not None:
+            raise run.error
+        if run.final_state is None:
+            raise RuntimeError(f"Analysis for {key[0]} ended without a result")
+        return run.final_state
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "inflight": len(self._inflight),
+            "cached": len(self._cache),
+            "runs": self.runs,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+        }
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    # === Internals ===
+
+    def _get_cached(self, key: AnalysisKey) -> Optional[_CachedRun]:
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        if cached.expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        return cached
+
+    def _attach(self, key: AnalysisKey, source: EventSource) -> _AnalysisRun:
+        run = self._inflight.get(key)
+        if run is not None and run.task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+            logger.info(f"Coalescing analysis request for {key[0]} onto in-flight run")
+        else:
+            run = _AnalysisRun(key=key)
+            run.task = asyncio.create_task(self._produce(run, source))
+            self._inflight[key] = run
+            self.runs += 1
+        run.attached += 1
+        return run
+
+    def _detach(self, run: _AnalysisRun) -> None:
+        run.attached -= 1
+        if run.attached == 0 and not run.finished:
+            logger.info(f"All subscribers left analysis for {run.key[0]}, cancelling run")
+            run.task.cancel()
+            if self._inflight.get(run.key) is run:
+                del self._inflight[run.key]
+
+    def _publish(self, run: _AnalysisRun, event: Any) -> None:
+        for queue in run.queues:
+            queue.put_nowait(event)
+
+    async def _produce(self, run: _AnalysisRun, source: EventSource) -> None:
+        outcome: Dict[str, Any] = {}
+        try:
+            async for event in source(outcome):
+                run.events.append(event)
+                self._publish(run, event)
+        except asyncio.CancelledError:
+            outcome.setdefault("error", asyncio.CancelledError())
+            raise
+        except Exception as e:
+            logger.exception(f"Analysis run for {run.key[0]} failed: {e}")
+            outcome.setdefault("error", e)
+        finally:
+            run.final_state = outcome.get("state")
+            run.error = outcome.get("error")
+            run.finished = True
+            self._publish(run, _END)
+            run.done.set()
+            if self._inflight.get(run.key) is run:
+                del self._inflight[run.key]
+
+        if run.error is None and run.final_state is not None and self._should_cache(run.final_state):
+            self._cache[run.key] = _CachedRun(
+                expires_at=time.monotonic() + self.ttl,
+                events=run.events,
+                final_state=run.final_state,
+            )
+            self._cache.move_to_end(run.key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+
+def _replayed(events: List[Dict[str, Any]]):
+    """Cached events, with the start event marked as a replay."""
+    for event in events:
+        if event.get("type") == "start":
+            event = {**event, "data": {**event.get("data", {}), "cached": True}}
+        yield event
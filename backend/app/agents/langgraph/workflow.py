@@ -24,6 +24,7 @@ from app.agents.langgraph.nodes import (
     synthesize_node,
     technical_node,
 )
+from app.agents.langgraph.coalescing import AnalysisCoalescer, analysis_key
 from app.agents.langgraph.nodes.clarify_node import should_clarify
 from app.agents.langgraph.state import (
     AnalysisState,
@@ -128,6 +129,22 @@ def get_workflow() -> StateGraph:
     return _compiled_workflow
 
 
+def _has_successful_results(state: AnalysisState) -> bool:
+    return bool(get_successful_results(state))
+
+
+# Singleton instance
+_analysis_coalescer: Optional[AnalysisCoalescer] = None
+
+
+def get_analysis_coalescer() -> AnalysisCoalescer:
+    """Get singleton instance of AnalysisCoalescer."""
+    global _analysis_coalescer
+    if _analysis_coalescer is None:
+        _analysis_coalescer = AnalysisCoalescer(should_cache=_has_successful_results)
+    return _analysis_coalescer
+
+
 async def run_analysis(
     symbol: str,
     market: str,
@@ -136,7 +153,9 @@ async def run_analysis(
     """
     Run the complete analysis workflow.
 
-    This is the main entry point for non-streaming analysis.
+    This is the main entry point for non-streaming analysis. Identical
+    concurrent requests share one run, and a recent successful result is
+    reused (see ``coalescing``).
 
     Args:
         symbol: Stock symbol to analyze
@@ -146,17 +165,10 @@ async def run_analysis(
     Returns:
         Final AnalysisState with all results
     """
-    workflow = get_workflow()
-    initial_state = create_initial_state(symbol, market, language)
-
-    logger.info(f"Starting analysis workflow for {symbol} ({market})")
-
-    # Run the workflow to completion
-    final_state = await workflow.ainvoke(initial_state)
-
-    logger.info(f"Analysis workflow completed for {symbol}")
-
-    return final_state
+    return await get_analysis_coalescer().result(
+        analysis_key(symbol, market, language),
+        lambda outcome: _stream_workflow(symbol, market, language, outcome),
+    )
 
 
 async def stream_analysis(
@@ -168,12 +180,40 @@ async def stream_analysis(
     Run the analysis workflow with streaming output.
 
     This is the entry point for SSE streaming. It yields events
-    as the workflow progresses.
+    as the workflow progresses. Identical concurrent requests subscribe to
+    one run (late subscribers first receive the events emitted so far),
+    and a recent successful run is replayed.
+
+    Args:
+        symbol: Stock symbol to analyze
+        market: Market identifier (US, HK, CN, etc.)
+        language: Output language ("en" or "zh")
+
+    Yields:
+        Dict events with type and data for SSE
+    """
+    async for event in get_analysis_coalescer().stream(
+        analysis_key(symbol, market, language),
+        lambda outcome: _stream_workflow(symbol, market, language, outcome),
+    ):
+        yield event
+
+
+async def _stream_workflow(
+    symbol: str,
+    market: str,
+    language: str,
+    outcome: Dict[str, Any],
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Execute the workflow once, yielding SSE events.
 
     Args:
         symbol: Stock symbol to analyze
         market: Market identifier (US, HK, CN, etc.)
         language: Output language ("en" or "zh")
+        outcome: Receives the final state under "state", or the
+            exception under "error" if the workflow failed
 
     Yields:
         Dict events with type and data for SSE
@@ -358,6 +398,7 @@ async def stream_analysis(
                         }
 
         # Yield completion event (final_state captured from on_chain_end event above)
+        outcome["state"] = final_state
         results = get_successful_results(final_state)
         yield {
             "type": "complete",
@@ -372,6 +413,7 @@ async def stream_analysis(
     except Exception as e:
         # Log full error details for debugging, but return generic message to client
         logger.exception(f"Streaming analysis error for {symbol}: {e}")
+        outcome["error"] = e
         yield {
             "type": "error",
             "data": {
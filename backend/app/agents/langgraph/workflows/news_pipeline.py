@@ -616,8 +616,7 @@ async def update_db_node(state: NewsProcessingState) -> dict:
                     status="success", duration_ms=elapsed,
                     metadata=trace_metadata,
                 ))
-                await PipelineTraceService.record_events_batch(db, all_events)
-                await db.commit()
+                await PipelineTraceService.record_events_batch(all_events)
             except Exception as trace_err:
                 logger.warning("update_db_node: trace write failed: %s", trace_err)
 
@@ -629,14 +628,12 @@ async def update_db_node(state: NewsProcessingState) -> dict:
         elapsed = (time.monotonic() - t0) * 1000
         try:
             from app.services.pipeline_trace_service import PipelineTraceService
-            async with get_task_session() as trace_db:
-                all_events = list(state.get("trace_events", []))
-                all_events.append(PipelineTraceService.make_event(
-                    news_id=news_id, layer="3", node="update_db",
-                    status="error", duration_ms=elapsed, error=str(e)[:200],
-                ))
-                await PipelineTraceService.record_events_batch(trace_db, all_events)
-                await trace_db.commit()
+            all_events = list(state.get("trace_events", []))
+            all_events.append(PipelineTraceService.make_event(
+                news_id=news_id, layer="3", node="update_db",
+                status="error", duration_ms=elapsed, error=str(e)[:200],
+            ))
+            await PipelineTraceService.record_events_batch(all_events)
         except Exception as trace_err:
             logger.debug("update_db_node: fallback trace write also failed: %s", trace_err)
 
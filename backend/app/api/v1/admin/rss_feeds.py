@@ -44,9 +44,13 @@ def _feed_to_response(feed: RssFeed) -> RssFeedResponse:
         symbol=feed.symbol,
         market=feed.market,
         poll_interval_minutes=feed.poll_interval_minutes,
+        min_poll_interval_minutes=feed.min_poll_interval_minutes,
+        max_poll_interval_minutes=feed.max_poll_interval_minutes,
         fulltext_mode=feed.fulltext_mode,
         is_enabled=feed.is_enabled,
         last_polled_at=feed.last_polled_at,
+        next_poll_at=feed.next_poll_at,
+        avg_interarrival_minutes=feed.avg_interarrival_minutes,
         last_error=feed.last_error,
         consecutive_errors=feed.consecutive_errors,
         article_count=feed.article_count,
@@ -244,7 +248,8 @@ async def update_rss_feed(
 
     # by_alias=False: CamelModel defaults to camelCase keys due to
     # serialize_by_alias=True, but SQLAlchemy uses snake_case columns.
-    update_fields = data.model_dump(exclude_none=True, by_alias=False)
+    # exclude_unset keeps explicit nulls so poll bounds can be cleared.
+    update_fields = data.model_dump(exclude_unset=True, by_alias=False)
     logger.info(
         "Admin %d updating RSS feed %s: %s",
         admin.id, feed_id, list(update_fields.keys()),
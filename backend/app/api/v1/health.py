@@ -11,6 +11,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.core.bulkhead import get_all_bulkhead_status
 from app.db.database import get_db
 from app.db.redis import get_redis
 
@@ -168,3 +169,42 @@ async def liveness_check() -> LivenessStatus:
         status="alive",
         timestamp=datetime.now(timezone.utc).isoformat(),
     )
+
+
+@router.get(
+    "/executors",
+    summary="Executor bulkhead metrics",
+    description="Per-upstream thread pool load, rejections, timeouts and queue wait vs. run time.",
+)
+async def executor_status() -> dict[str, Any]:
+    """
+    Executor bulkhead metrics.
+
+    Reports each provider bulkhead's running/queued calls and its
+    queue-wait and run-time statistics since process start.
+    """
+    return {
+        "bulkheads": get_all_bulkhead_status(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@router.get(
+    "/providers",
+    summary="Market data provider routing stats",
+    description="Rolling latency percentiles, error rates and circuit state per provider, market and operation.",
+)
+async def provider_status() -> dict[str, Any]:
+    """
+    Market data provider routing stats.
+
+    Reports the rolling window the provider router uses to order and
+    hedge providers.
+    """
+    from app.services.providers import get_provider_router
+
+    provider_router = await get_provider_router()
+    return {
+        "providers": provider_router.get_health_status(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
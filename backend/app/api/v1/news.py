@@ -8,14 +8,15 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete, select, func
+from sqlalchemy import and_, delete, exists, func, or_, select
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.core.rate_limiter import rate_limit
 from app.core.security import get_current_user
 from app.db.database import get_db
-from app.models.news import News, NewsAlert
+from app.models.news import FilterStatus, News, NewsAlert
 from app.models.user import User
 from app.models.user_settings import UserSettings
 from app.models.watchlist import Watchlist, WatchlistItem
@@ -43,33 +44,70 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/news", tags=["News"])
 
 
-def _news_to_response(article: News) -> NewsResponse:
-    """Convert a News DB model to NewsResponse schema."""
+def _news_to_response(article: News, analyzed: Optional[News] = None) -> NewsResponse:
+    """Convert a News DB model to NewsResponse schema.
+
+    Args:
+        article: Article identity (id, title, source, url, ...)
+        analyzed: Article whose scoring, content and analysis to report;
+            the representative for near-duplicates (defaults to ``article``)
+    """
+    analyzed = analyzed or article
     return NewsResponse(
         id=str(article.id),
         symbol=article.symbol,
         title=article.title,
-        summary=article.investment_summary or article.summary,
+        summary=analyzed.investment_summary or article.summary,
         source=article.source,
         url=article.url,
         published_at=article.published_at,
         market=article.market,
-        sentiment_score=article.sentiment_score,
-        sentiment_tag=article.sentiment_tag,
-        investment_summary=article.investment_summary,
-        detailed_summary=article.detailed_summary,
-        ai_analysis=article.ai_analysis,
-        related_entities=article.related_entities,
-        industry_tags=article.industry_tags,
-        event_tags=article.event_tags,
-        content_score=article.content_score,
+        sentiment_score=analyzed.sentiment_score,
+        sentiment_tag=analyzed.sentiment_tag,
+        investment_summary=analyzed.investment_summary,
+        detailed_summary=analyzed.detailed_summary,
+        ai_analysis=analyzed.ai_analysis,
+        related_entities=analyzed.related_entities,
+        industry_tags=analyzed.industry_tags,
+        event_tags=analyzed.event_tags,
+        content_score=analyzed.content_score,
         processing_path=article.processing_path,
-        score_details=article.score_details,
-        content_status=article.content_status,
+        score_details=analyzed.score_details,
+        content_status=analyzed.content_status,
         filter_status=article.filter_status,
         created_at=article.created_at,
     )
 
+
+async def _resolve_duplicate(db: AsyncSession, article: News) -> News:
+    """Representative of a near-duplicate, else the article itself.
+
+    Near-duplicates skip scoring, fetching and analysis; the news monitors
+    link them to the cluster representative through ``duplicate_of_id``.
+    """
+    if article.duplicate_of_id is None:
+        return article
+    result = await db.execute(select(News).where(News.id == article.duplicate_of_id))
+    return result.scalar_one_or_none() or article
+
+
+def _hide_near_duplicates(query):
+    """Drop near-duplicates already listed through their representative.
+
+    Clustering is scoped per (market, symbol), so a duplicate is hidden only
+    when its representative shares that scope; copies linked across symbols
+    before clustering was scoped stay visible in their own symbol's feed.
+    """
+    representative = aliased(News)
+    return query.where(or_(
+        News.duplicate_of_id.is_(None),
+        ~exists().where(and_(
+            representative.id == News.duplicate_of_id,
+            representative.symbol == News.symbol,
+            representative.market == News.market,
+        )),
+    ))
+
 # Rate limiting configurations for different endpoints
 # Symbol news: 100 requests per minute
 SYMBOL_NEWS_RATE_LIMIT = rate_limit(max_requests=100, window_seconds=60, key_prefix="news_symbol")
@@ -156,9 +194,11 @@ async def get_market_news(
         else:
             query = query.where(News.market == market)
 
-    # Optional filter_status filter
+    # Optional filter_status filter; near-duplicates are listed only on request
     if filter_status:
         query = query.where(News.filter_status == filter_status)
+    if filter_status != FilterStatus.DUPLICATE.value:
+        query = _hide_near_duplicates(query)
 
     # Optional sentiment_tag filter
     if sentiment_tag:
@@ -265,7 +305,7 @@ async def get_news_feed(
     - **page**: Page number (1-indexed)
     - **page_size**: Number of items per page (max 100)
     """
-    from sqlalchemy import desc, or_, cast, literal
+    from sqlalchemy import desc, cast, literal
     from sqlalchemy.dialects.postgresql import JSONB
 
     # Get all symbols from user's watchlists
@@ -296,13 +336,13 @@ async def get_news_feed(
         entity_conditions.append(entities_jsonb.op("@>")(pattern))
 
     # Match by: direct symbol match OR related_entities contains a watchlist symbol
-    query = select(News).where(
+    query = _hide_near_duplicates(select(News).where(
         News.content_status.in_(["fetched", "embedded", "partial"]),
         or_(
             News.symbol.in_(symbols),
             *entity_conditions,
         ),
-    )
+    ))
 
     # Optional sentiment_tag filter
     if sentiment_tag:
@@ -642,7 +682,7 @@ async def get_news_article(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="News article not found",
         )
-    return _news_to_response(article)
+    return _news_to_response(article, await _resolve_duplicate(db, article))
 
 
 @router.get(
@@ -855,6 +895,9 @@ async def get_news_full_content(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="News article not found",
         )
+    requested = news
+    # Near-duplicates are never fetched themselves; serve the representative's content
+    news = await _resolve_duplicate(db, news)
 
     # Check if we need to trigger fetch
     is_fetching = False
@@ -888,8 +931,8 @@ async def get_news_full_content(
             word_count = content_data.get("word_count", 0)
 
     return NewsFullContentResponse(
-        id=str(news.id),
-        title=news.title,
+        id=str(requested.id),
+        title=requested.title,
         full_content=full_content,
         content_status=news.content_status,
         language=news.language,
@@ -942,6 +985,8 @@ async def batch_fetch_content(
             ContentStatus.PENDING.value,
             ContentStatus.FAILED.value,
         ]),
+        # Near-duplicates share their representative's content
+        News.duplicate_of_id.is_(None),
     )
     result = await db.execute(query)
     news_list = result.scalars().all()
@@ -390,6 +390,7 @@ async def risk_decomposition(
             symbols=request.symbols,
             weights=request.weights,
             lookback_days=request.lookback_days,
+            cov_estimator=request.cov_estimator,
         )
         return result
     except PortfolioOptimizationError as e:
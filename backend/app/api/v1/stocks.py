@@ -1,14 +1,17 @@
 """Stock data API endpoints."""
 
 import asyncio
+import json
 import logging
 import math
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
+from app.config import settings
 from app.core.rate_limiter import rate_limit
 from app.core.security import get_current_user
 from app.models.user import User
@@ -31,13 +34,14 @@ from app.schemas.stock import (
     StockQuoteResponse,
     TechnicalIndicatorsResponse,
 )
-from app.services.indicator_service import compute_indicator_series
+from app.services.indicator_service import IndicatorParams, get_indicator_engine
 from app.services.canonical_cache_service import (
     RESAMPLE_MAP,
     get_canonical_cache_service,
     resample_bars,
 )
 from app.services.providers import get_provider_router
+from app.services.quote_stream_service import get_quote_stream_service
 from app.services.stock_service import (
     HistoryInterval as ServiceInterval,
     HistoryPeriod as ServicePeriod,
@@ -131,17 +135,6 @@ def _compute_min_warm_up_bars(
     return result if result > 0 else 200
 
 
-def _trim_series(
-    series: List[Dict[str, Any]],
-    cutoff_str: str,
-) -> List[Dict[str, Any]]:
-    """Keep only data points whose time >= cutoff_str."""
-    # Normalize T separator to space for consistent lexicographic comparison
-    # (ASCII 'T' > ' ', so "2025-03-10T09:30" > "2025-03-10 09:30" would mis-filter)
-    normalized_cutoff = cutoff_str.replace("T", " ")
-    return [p for p in series if p["time"].replace("T", " ") >= normalized_cutoff]
-
-
 async def _compute_indicators_for_symbol(
     symbol: str,
     types: str,
@@ -339,19 +332,7 @@ async def _compute_indicators_for_symbol(
         for bar in bars
     ]
 
-    # 5. Compute indicators on the full dataset
-    raw = await asyncio.to_thread(
-        compute_indicator_series,
-        bars=bar_dicts,
-        indicator_types=type_list,
-        ma_periods=parsed_ma_periods,
-        rsi_period=rsi_period,
-        bb_period=bb_period,
-        bb_std=bb_std,
-        intraday=is_intraday,
-    )
-
-    # 6. Determine cutoff for trimming back to the user's requested window
+    # 5. Determine cutoff for trimming back to the user's requested window
     if original_start_str:
         # Start/end mode: trim to original start (before warm-up extension)
         cutoff_str = original_start_str
@@ -364,7 +345,27 @@ async def _compute_indicators_for_symbol(
         else:
             cutoff_str = cutoff.strftime("%Y-%m-%d")
 
-    # 7. Build response, trimming each series to the user's window
+    # 6. Compute indicators on the full dataset (incrementally when the
+    # engine already holds state for this symbol/interval/params), keeping
+    # only points from the cutoff on
+    params = IndicatorParams(
+        indicator_types=tuple(sorted(set(type_list))),
+        ma_periods=tuple(parsed_ma_periods),
+        rsi_period=rsi_period,
+        bb_period=bb_period,
+        bb_std=bb_std,
+    )
+    raw = await asyncio.to_thread(
+        get_indicator_engine().compute,
+        symbol,
+        interval.value,
+        bar_dicts,
+        params,
+        intraday=is_intraday,
+        since=cutoff_str,
+    )
+
+    # 7. Build response
     ma_dict: Dict[str, MAIndicatorResponse] = {}
     rsi_resp: Optional[MAIndicatorResponse] = None
     macd_resp: Optional[MACDIndicatorResponse] = None
@@ -374,7 +375,7 @@ async def _compute_indicators_for_symbol(
     # Collect MA indicators (sma_* and ema_*)
     for key, value in raw.items():
         if key.startswith(("sma_", "ema_")) and isinstance(value, dict) and "series" in value:
-            trimmed = _trim_series(value["series"], cutoff_str)
+            trimmed = value["series"]
             if trimmed:
                 ma_dict[key] = MAIndicatorResponse(
                     series=[IndicatorDataPoint(**p) for p in trimmed],
@@ -383,7 +384,7 @@ async def _compute_indicators_for_symbol(
 
     # RSI
     if "rsi" in raw and isinstance(raw["rsi"], dict) and "series" in raw["rsi"]:
-        trimmed = _trim_series(raw["rsi"]["series"], cutoff_str)
+        trimmed = raw["rsi"]["series"]
         if trimmed:
             rsi_resp = MAIndicatorResponse(
                 series=[IndicatorDataPoint(**p) for p in trimmed],
@@ -393,9 +394,9 @@ async def _compute_indicators_for_symbol(
     # MACD
     if "macd" in raw and isinstance(raw["macd"], dict) and "macd_line" in raw["macd"]:
         macd_data = raw["macd"]
-        trimmed_macd = _trim_series(macd_data["macd_line"], cutoff_str)
-        trimmed_signal = _trim_series(macd_data["signal_line"], cutoff_str)
-        trimmed_hist = _trim_series(macd_data["histogram"], cutoff_str)
+        trimmed_macd = macd_data["macd_line"]
+        trimmed_signal = macd_data["signal_line"]
+        trimmed_hist = macd_data["histogram"]
         if trimmed_macd and trimmed_signal and trimmed_hist:
             macd_resp = MACDIndicatorResponse(
                 macd_line=[IndicatorDataPoint(**p) for p in trimmed_macd],
@@ -407,9 +408,9 @@ async def _compute_indicators_for_symbol(
     # Bollinger Bands
     if "bb" in raw and isinstance(raw["bb"], dict) and "upper" in raw["bb"]:
         bb_data = raw["bb"]
-        trimmed_upper = _trim_series(bb_data["upper"], cutoff_str)
-        trimmed_middle = _trim_series(bb_data["middle"], cutoff_str)
-        trimmed_lower = _trim_series(bb_data["lower"], cutoff_str)
+        trimmed_upper = bb_data["upper"]
+        trimmed_middle = bb_data["middle"]
+        trimmed_lower = bb_data["lower"]
         if trimmed_upper and trimmed_middle and trimmed_lower:
             bb_resp = BollingerBandsResponse(
                 upper=[IndicatorDataPoint(**p) for p in trimmed_upper],
@@ -505,6 +506,59 @@ async def get_stock_quote_query(
         )
 
 
+@router.get(
+    "/quotes/stream",
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid symbol list"},
+    },
+    summary="Stream real-time quotes",
+    description=(
+        "Server-Sent Events stream of quote updates for a comma-separated list of symbols. "
+        "Sends the latest quote for each symbol, then an event whenever one changes. "
+        "Use instead of polling /quote or /batch/quotes."
+    ),
+)
+async def stream_quotes(
+    request: Request,
+    symbols: str = Query(..., description="Comma-separated stock symbols (e.g., AAPL,0700.HK,GC=F)"),
+    current_user: User = Depends(get_current_user),
+    _rate_limit: None = Depends(STOCK_RATE_LIMIT),
+):
+    """Stream quote updates; all subscribers to a symbol share one upstream refresh."""
+    symbol_list = list(dict.fromkeys(
+        validate_symbol(s) for s in symbols.split(",") if s.strip()
+    ))
+    if not symbol_list or len(symbol_list) > settings.QUOTE_STREAM_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Provide between 1 and {settings.QUOTE_STREAM_MAX_SYMBOLS} symbols",
+        )
+    logger.info(f"Streaming quotes for {len(symbol_list)} symbols (user: {current_user.id})")
+
+    async def event_generator():
+        async for event in get_quote_stream_service().stream(symbol_list):
+            if await request.is_disconnected():
+                break
+            if event["type"] == "quote":
+                try:
+                    quote = StockQuoteResponse(**event["data"])
+                except Exception as e:
+                    logger.debug(f"Skipping malformed streamed quote for {event['symbol']}: {e}")
+                    continue
+                event = {**event, "data": quote.model_dump(mode="json", by_alias=True)}
+            yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+
+
 @router.get(
     "/history",
     response_model=StockHistoryResponse,
@@ -60,6 +60,8 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    AUTH_CACHE_TTL_SECONDS: int = 30  # Redis TTL for cached user principals
+    AUTH_LOCAL_CACHE_TTL_SECONDS: float = 5.0  # in-process principal/token/JTI cache TTL
 
     # Security
     BCRYPT_ROUNDS: int = 12
@@ -76,6 +78,14 @@ class Settings(BaseSettings):
     FINNHUB_API_KEY: Optional[str] = None
     TUSHARE_TOKEN: Optional[str] = None
     ALPHA_VANTAGE_API_KEY: Optional[str] = None
+    AKSHARE_SPOT_REFRESH_SECONDS: float = 15.0  # whole-market spot snapshot refresh interval
+    # Provider routing: start the next provider when one exceeds its recent p95
+    PROVIDER_HEDGING_ENABLED: bool = True
+    PROVIDER_HEDGE_MIN_DELAY: float = 0.3  # seconds
+    PROVIDER_HEDGE_MAX_DELAY: float = 5.0  # seconds (also used until enough samples)
+    # Streaming quotes: one upstream refresh per streamed symbol per interval
+    QUOTE_STREAM_INTERVAL: float = 5.0  # seconds
+    QUOTE_STREAM_MAX_SYMBOLS: int = 50  # per connection
 
     # News Full Content Settings
     FULL_CONTENT_ENABLED: bool = True
@@ -85,6 +95,19 @@ class Settings(BaseSettings):
     SCRAPER_TIMEOUT: int = 30  # seconds
     NEWS_RETENTION_DAYS_DEFAULT: int = 30  # default retention days
     NEWS_CONTENT_BASE_PATH: str = "data/news_content"  # JSON storage path
+    # Redis Bloom filter for URL dedup (sized once; ~6 MB at the defaults)
+    NEWS_URL_INDEX_CAPACITY: int = 5_000_000
+    NEWS_URL_INDEX_FP_RATE: float = 0.01
+    # Buffered pipeline trace writer
+    TRACE_SINK_MAX_EVENTS: int = 10_000  # buffered events before back-pressure/drops
+    TRACE_SINK_BATCH_SIZE: int = 500  # rows per multi-row INSERT
+    TRACE_SINK_FLUSH_INTERVAL: float = 1.0  # seconds between background flushes
+    TRACE_SINK_BACKPRESSURE_TIMEOUT: float = 0.05  # seconds a producer waits when full
+    # Buffered LLM usage ledger
+    LLM_USAGE_MAX_BUFFERED: int = 5_000  # buffered usage records before back-pressure/drops
+    LLM_USAGE_BATCH_SIZE: int = 200  # records per bulk insert
+    LLM_USAGE_FLUSH_INTERVAL: float = 2.0  # seconds between background flushes
+    LLM_USAGE_BACKPRESSURE_TIMEOUT: float = 1.0  # seconds a producer waits when full
 
     # OpenAI Rate Limiting (layered)
     # Global rate limit for all OpenAI API calls combined
@@ -97,6 +120,8 @@ class Settings(BaseSettings):
     # Per-user rate limits
     AI_ANALYSIS_RATE_LIMIT: int = 10  # analysis requests per minute per user
     AI_CHAT_RATE_LIMIT: int = 20  # chat messages per minute per user
+    # Analysis coalescing: identical requests share a run; results replayed for this long
+    ANALYSIS_RESULT_CACHE_TTL: int = 300  # seconds
 
     @model_validator(mode="after")
     def _validate_rate_limits(self) -> "Settings":
@@ -124,9 +149,16 @@ class Settings(BaseSettings):
     # Qlib Service
     QLIB_SERVICE_URL: str = "http://qlib-service:8001"
 
+    # Portfolio optimization
+    PORTFOLIO_OPT_PROCESSES: int = 2  # efficient-frontier solver processes (0 = solve in a thread)
+
     # RSSHub
     RSSHUB_URL: str = "http://rsshub:1200"
     RSSHUB_ACCESS_KEY: str = ""
+    RSS_FETCH_CONCURRENCY_MIN: int = 3  # adaptive feed fetch concurrency floor
+    RSS_FETCH_CONCURRENCY_MAX: int = 16  # ceiling (backs off on timeouts/429/5xx)
+    RSS_POLL_MIN_MINUTES: int = 5  # default adaptive poll interval floor
+    RSS_POLL_MAX_MINUTES: int = 240  # default adaptive poll interval ceiling
 
     # Tavily Extract API (optional, for content fetching fallback)
     TAVILY_API_KEY: Optional[str] = None
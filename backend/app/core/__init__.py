@@ -1,4 +1,11 @@
 # Core module
+from app.core.bulkhead import (
+    Bulkhead,
+    BulkheadConfig,
+    BulkheadFullError,
+    get_bulkhead,
+    run_in_bulkhead,
+)
 from app.core.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
@@ -31,4 +38,10 @@ __all__ = [
     "CircuitState",
     "get_circuit_breaker",
     "reset_all_circuit_breakers",
+    # Bulkhead
+    "Bulkhead",
+    "BulkheadConfig",
+    "BulkheadFullError",
+    "get_bulkhead",
+    "run_in_bulkhead",
 ]
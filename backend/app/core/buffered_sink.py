@@ -0,0 +1,171 @@
+"""Bounded in-process buffer with a background flusher.
+
+Used for best-effort, write-behind persistence (pipeline trace events,
+LLM usage records) so hot paths hand rows over without waiting on the
+database:
+
+- Memory is bounded by ``max_items``. When the buffer is full, producers
+  wait up to ``backpressure_timeout`` for the flusher to free space
+  (back-pressure); whatever still does not fit is dropped and counted.
+- The flusher wakes every ``flush_interval`` seconds, or early once a
+  full batch is buffered, and hands batches of up to ``batch_size`` items
+  to ``_write``.
+- The flusher task belongs to the running event loop. Celery tasks run on
+  a fresh loop per invocation, so sinks must be drained before the loop
+  closes (``worker.task_helpers.run_async_task`` does this) and on API
+  shutdown.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, Generic, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BufferedSink(Generic[T]):
+    """Base class; subclasses implement ``_write``."""
+
+    #: Human-readable name used in log messages
+    name = "buffered sink"
+
+    def __init__(
+        self,
+        max_items: int,
+        batch_size: int,
+        flush_interval: float,
+        backpressure_timeout: float,
+    ) -> None:
+        self.max_items = max_items
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure_timeout = backpressure_timeout
+
+        self._buffer: Deque[T] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._closing = False
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.flush_errors = 0
+        self.peak_buffered = 0
+        self._dropped_logged = 0
+
+    async def _write(self, batch: List[T]) -> int:
+        """
+        Persist one batch. Returns items written.
+
+        Implementations must not raise; on failure they should update
+        ``flush_errors``/``dropped`` and return 0.
+        """
+        raise NotImplementedError
+
+    # -- producer side -----------------------------------------------------
+
+    async def put(self, items: Iterable[T]) -> None:
+        """
+        Buffer items for background writing.
+
+        Returns immediately while there is room. When the buffer is full,
+        waits up to ``backpressure_timeout`` for a flush to free space and
+        drops (and counts) whatever still does not fit.
+        """
+        pending = list(items)
+        if not pending:
+            return
+        self._ensure_flusher()
+
+        while pending:
+            room = self.max_items - len(self._buffer)
+            if room > 0:
+                self._buffer.extend(pending[:room])
+                self.enqueued += min(room, len(pending))
+                pending = pending[room:]
+                continue
+            self._wakeup.set()
+            self._space.clear()
+            try:
+                await asyncio.wait_for(self._space.wait(), self.backpressure_timeout)
+            except asyncio.TimeoutError:
+                self.dropped += len(pending)
+                break
+
+        self.peak_buffered = max(self.peak_buffered, len(self._buffer))
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    def _ensure_flusher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._task = loop.create_task(self._run())
+
+    # -- flusher side ------------------------------------------------------
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write everything currently buffered. Returns items written."""
+        written = 0
+        while self._buffer:
+            batch: List[T] = []
+            while self._buffer and len(batch) < self.batch_size:
+                batch.append(self._buffer.popleft())
+            if self._space is not None:
+                self._space.set()
+            written += await self._write(batch)
+
+        if self.dropped > self._dropped_logged:
+            logger.warning(
+                "%s dropped %d items (buffer full or write failed, max=%d); total dropped=%d",
+                self.name, self.dropped - self._dropped_logged, self.max_items, self.dropped,
+            )
+            self._dropped_logged = self.dropped
+        return written
+
+    async def drain(self) -> None:
+        """Stop the flusher and write all buffered items."""
+        task, self._task = self._task, None
+        if (
+            task is not None
+            and not task.done()
+            and self._loop is asyncio.get_running_loop()
+        ):
+            # Let the flusher finish its current write instead of cancelling
+            # it mid-insert; it exits after one more flush.
+            self._closing = True
+            self._wakeup.set()
+            try:
+                await task
+            finally:
+                self._closing = False
+        await self.flush()
+        self._loop = None
+
+    def stats(self) -> Dict[str, int]:
+        """Counters since process start."""
+        return {
+            "buffered": len(self._buffer),
+            "peak_buffered": self.peak_buffered,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "flush_errors": self.flush_errors,
+        }
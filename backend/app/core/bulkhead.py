@@ -0,0 +1,262 @@
+"""Bulkheaded thread pools for blocking third-party client calls.
+
+yfinance, AKShare, Tushare, Tiingo and the news libraries are synchronous
+and run in threads. Each named bulkhead owns a bounded thread pool and a
+bounded queue, so one slow upstream saturates only its own threads and
+the process-wide thread count is the sum of the configured limits.
+
+- Calls beyond ``max_queue`` waiting calls are rejected immediately with
+  ``BulkheadFullError`` instead of piling up behind a stalled upstream.
+- The timeout covers queue wait plus run time; a call that times out while
+  still queued is cancelled and never runs. (A call already running in a
+  thread cannot be interrupted; it is counted as abandoned.)
+- Queue wait and run time are tracked per bulkhead for ``get_status()``.
+
+Usage:
+    result = await run_in_bulkhead("yfinance", fetch, symbol, timeout=30)
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkheadConfig:
+    """Configuration for a bulkhead."""
+
+    max_workers: int = 4  # Threads running calls concurrently
+    max_queue: int = 32  # Calls allowed to wait for a thread
+    timeout: Optional[float] = 30.0  # Default seconds (queue wait + run)
+
+
+# Per-upstream limits; unknown names get the default config
+BULKHEAD_CONFIGS: Dict[str, BulkheadConfig] = {
+    "yfinance": BulkheadConfig(max_workers=8, max_queue=64),
+    "akshare": BulkheadConfig(max_workers=6, max_queue=64),
+    "tushare": BulkheadConfig(max_workers=3, max_queue=32),
+    "tiingo": BulkheadConfig(max_workers=3, max_queue=32),
+    "market_data": BulkheadConfig(max_workers=3, max_queue=32),
+    "news": BulkheadConfig(max_workers=4, max_queue=64),
+}
+
+
+@dataclass
+class BulkheadStats:
+    """Statistics for a bulkhead."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    timeouts: int = 0
+    cancelled_queued: int = 0
+    abandoned_running: int = 0
+    queue_wait_total: float = 0.0
+    queue_wait_max: float = 0.0
+    run_time_total: float = 0.0
+    run_time_max: float = 0.0
+
+
+class BulkheadFullError(Exception):
+    """Exception raised when a bulkhead's queue is full."""
+
+    pass
+
+
+class Bulkhead:
+    """A bounded thread pool with admission control and timing metrics."""
+
+    def __init__(self, name: str, config: Optional[BulkheadConfig] = None):
+        self.name = name
+        self.config = config or BulkheadConfig()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_workers,
+            thread_name_prefix=f"bulkhead-{name}",
+        )
+        # Guards counters; updated from worker threads and event loops
+        self._lock = threading.Lock()
+        self._stats = BulkheadStats()
+        self._queued = 0
+        self._active = 0
+
+    @property
+    def stats(self) -> BulkheadStats:
+        """Get bulkhead statistics."""
+        return self._stats
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+                self._stats.cancelled_queued += 1
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a blocking function in this bulkhead's threads.
+
+        Args:
+            func: Synchronous function to execute
+            *args: Positional arguments for the function
+            timeout: Seconds for queue wait plus run time
+                (defaults to the bulkhead's configured timeout)
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Result of the function call
+
+        Raises:
+            BulkheadFullError: If the queue is full
+            asyncio.TimeoutError: If the call did not finish in time
+            Exception: Any exception raised by the function
+        """
+        with self._lock:
+            if self._queued >= self.config.max_queue:
+                self._stats.rejected += 1
+                raise BulkheadFullError(
+                    f"Bulkhead '{self.name}' is full "
+                    f"({self._active} running, {self._queued} queued)"
+                )
+            self._queued += 1
+            self._stats.submitted += 1
+
+        enqueued_at = time.monotonic()
+
+        def call() -> Any:
+            started_at = time.monotonic()
+            wait = started_at - enqueued_at
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._stats.queue_wait_total += wait
+                self._stats.queue_wait_max = max(self._stats.queue_wait_max, wait)
+            ok = False
+            try:
+                result = func(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                elapsed = time.monotonic() - started_at
+                with self._lock:
+                    self._active -= 1
+                    self._stats.run_time_total += elapsed
+                    self._stats.run_time_max = max(self._stats.run_time_max, elapsed)
+                    if ok:
+                        self._stats.completed += 1
+                    else:
+                        self._stats.failed += 1
+
+        future = self._executor.submit(call)
+        future.add_done_callback(self._on_done)
+
+        if timeout is None:
+            timeout = self.config.timeout
+        try:
+            # Cancelling the wrapper cancels the concurrent future, which
+            # drops the call if it has not started yet.
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._stats.timeouts += 1
+                if not future.cancelled():
+                    self._stats.abandoned_running += 1
+            logger.warning(
+                f"Bulkhead '{self.name}' timeout after {timeout}s for function: "
+                f"{getattr(func, '__name__', func)}"
+            )
+            raise
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop queued calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_status(self) -> dict:
+        """Get bulkhead status as a dictionary."""
+        with self._lock:
+            s = self._stats
+            started = s.completed + s.failed + self._active
+            finished = s.completed + s.failed
+            return {
+                "name": self.name,
+                "running": self._active,
+                "queued": self._queued,
+                "stats": {
+                    "submitted": s.submitted,
+                    "completed": s.completed,
+                    "failed": s.failed,
+                    "rejected": s.rejected,
+                    "timeouts": s.timeouts,
+                    "cancelled_queued": s.cancelled_queued,
+                    "abandoned_running": s.abandoned_running,
+                    "avg_queue_wait_ms": round(s.queue_wait_total / started * 1000, 2) if started else 0.0,
+                    "max_queue_wait_ms": round(s.queue_wait_max * 1000, 2),
+                    "avg_run_time_ms": round(s.run_time_total / finished * 1000, 2) if finished else 0.0,
+                    "max_run_time_ms": round(s.run_time_max * 1000, 2),
+                },
+                "config": {
+                    "max_workers": self.config.max_workers,
+                    "max_queue": self.config.max_queue,
+                    "timeout": self.config.timeout,
+                },
+            }
+
+
+# Global bulkhead registry
+_bulkheads: Dict[str, Bulkhead] = {}
+_registry_lock = threading.Lock()
+
+
+def get_bulkhead(name: str) -> Bulkhead:
+    """
+    Get or create a bulkhead by name.
+
+    Args:
+        name: Upstream identifier; sizing comes from BULKHEAD_CONFIGS
+
+    Returns:
+        Bulkhead instance
+    """
+    bulkhead = _bulkheads.get(name)
+    if bulkhead is None:
+        with _registry_lock:
+            bulkhead = _bulkheads.get(name)
+            if bulkhead is None:
+                bulkhead = Bulkhead(name, BULKHEAD_CONFIGS.get(name))
+                _bulkheads[name] = bulkhead
+    return bulkhead
+
+
+async def run_in_bulkhead(
+    name: str,
+    func: Callable[..., Any],
+    *args: Any,
+    timeout: Optional[float] = None,
+    **kwargs: Any,
+) -> Any:
+    """Run a blocking function in the named bulkhead (see ``Bulkhead.run``)."""
+    return await get_bulkhead(name).run(func, *args, timeout=timeout, **kwargs)
+
+
+def get_all_bulkhead_status() -> list[dict]:
+    """Get status of all bulkheads."""
+    return [bulkhead.get_status() for bulkhead in list(_bulkheads.values())]
+
+
+def shutdown_bulkheads() -> None:
+    """Shut down all bulkhead thread pools (application shutdown)."""
+    with _registry_lock:
+        for bulkhead in _bulkheads.values():
+            bulkhead.shutdown()
+        _bulkheads.clear()
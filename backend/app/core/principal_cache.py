@@ -0,0 +1,296 @@
+"""Short-TTL cache of authenticated user principals.
+
+``get_current_user`` used to run ``SELECT users WHERE id = ...`` on every
+authenticated request. Resolved users are now cached in two tiers:
+
+- in-process, for ``AUTH_LOCAL_CACHE_TTL_SECONDS`` (bounds how long another
+  API worker can serve a stale principal after a change);
+- in Redis, for ``AUTH_CACHE_TTL_SECONDS``, tagged with a per-user
+  generation counter. Invalidation bumps the counter, so an entry written
+  by a request that loaded the user before the change is never served.
+
+Invalidation is automatic: a session listener collects every ``User`` that
+was updated or deleted in a flush and invalidates those ids once the
+transaction commits (login lockouts, admin status/role changes, password
+resets, ...). Cached principals are rebuilt as clean detached ``User``
+instances and attached to the request session with ``merge(load=False)``,
+so they behave like loaded rows (including later updates) without SQL.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum as PyEnum
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import DateTime, Enum, event, inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_KEY_PREFIX = "auth:principal:"
+PRINCIPAL_GEN_PREFIX = "auth:principal:gen:"
+
+# Max users held in the in-process tier
+_LOCAL_MAX_ENTRIES = 10_000
+
+# session.info key for user ids changed in the current transaction
+_STALE_KEY = "stale_principals"
+
+
+# ---------------------------------------------------------------------------
+# Serialization
+# ---------------------------------------------------------------------------
+
+
+def _user_columns():
+    from app.models.user import User
+
+    return User, sa_inspect(User).column_attrs
+
+
+def principal_to_dict(user: Any) -> Dict[str, Any]:
+    """Column values of a User as a JSON-safe dict."""
+    _, columns = _user_columns()
+    data: Dict[str, Any] = {}
+    for attr in columns:
+        value = getattr(user, attr.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, PyEnum):
+            value = value.value
+        data[attr.key] = value
+    return data
+
+
+def principal_from_dict(data: Dict[str, Any]) -> Any:
+    """Rebuild a clean, detached User from ``principal_to_dict`` output."""
+    User, columns = _user_columns()
+    values: Dict[str, Any] = {}
+    for attr in columns:
+        value = data.get(attr.key)
+        column_type = attr.columns[0].type
+        if value is not None:
+            if isinstance(column_type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column_type, Enum) and column_type.enum_class is not None:
+                value = column_type.enum_class(value)
+        values[attr.key] = value
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class PrincipalCache:
+    """Two-tier (in-process + Redis) cache of user column values."""
+
+    def __init__(
+        self,
+        local_ttl: Optional[float] = None,
+        redis_ttl: Optional[int] = None,
+        max_local: int = _LOCAL_MAX_ENTRIES,
+    ) -> None:
+        self.local_ttl = local_ttl if local_ttl is not None else settings.AUTH_LOCAL_CACHE_TTL_SECONDS
+        self.redis_ttl = redis_ttl if redis_ttl is not None else settings.AUTH_CACHE_TTL_SECONDS
+        self.max_local = max_local
+        self._local: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # user_id -> monotonic time of the last local invalidation
+        self._invalidated: Dict[int, float] = {}
+        self._pending: Set[asyncio.Task] = set()
+
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get(self, user_id: int) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Look up a principal.
+
+        Returns:
+            (column values or None, current generation). Pass the generation
+            to ``put`` after loading the user from the database.
+        """
+        now = time.monotonic()
+        hit = self._local.get(user_id)
+        if hit is not None:
+            if hit[0] > now:
+                self.local_hits += 1
+                return hit[1], 0
+            self._local.pop(user_id, None)
+
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            raw, gen = await redis.mget(
+                f"{PRINCIPAL_KEY_PREFIX}{user_id}", f"{PRINCIPAL_GEN_PREFIX}{user_id}"
+            )
+        except Exception as e:
+            logger.debug("Principal cache read failed for user %s: %s", user_id, e)
+            self.misses += 1
+            return None, -1
+
+        generation = int(gen or 0)
+        if raw:
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                entry = None
+            if entry and entry.get("gen") == generation:
+                self.redis_hits += 1
+                self._put_local(user_id, entry["user"], now)
+                return entry["user"], generation
+
+        self.misses += 1
+        return None, generation
+
+    async def put(self, user: Any, generation: int, loaded_at: float) -> None:
+        """
+        Cache a user loaded from the database.
+
+        Args:
+            user: The loaded User
+            generation: Generation returned by the preceding ``get``
+                (-1 if Redis was unavailable; only the local tier is filled)
+            loaded_at: ``time.monotonic()`` taken before the database query;
+                skipped locally if the user was invalidated since
+        """
+        data = principal_to_dict(user)
+        if self._invalidated.get(user.id, 0.0) < loaded_at:
+            self._put_local(user.id, data, time.monotonic())
+        if generation < 0:
+            return
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            await redis.set(
+                f"{PRINCIPAL_KEY_PREFIX}{user.id}",
+                json.dumps({"gen": generation, "user": data}),
+                ex=self.redis_ttl,
+            )
+        except Exception as e:
+            logger.debug("Principal cache write failed for user %s: %s", user.id, e)
+
+    def _put_local(self, user_id: int, data: Dict[str, Any], now: float) -> None:
+        self._local[user_id] = (now + self.local_ttl, data)
+        self._local.move_to_end(user_id)
+        while len(self._local) > self.max_local:
+            self._local.popitem(last=False)
+
+    def invalidate_local(self, user_ids: Iterable[int]) -> None:
+        now = time.monotonic()
+        for user_id in user_ids:
+            self._local.pop(user_id, None)
+            self._invalidated[user_id] = now
+        # Only recent invalidations matter (they guard in-flight loads)
+        if len(self._invalidated) > self.max_local:
+            cutoff = now - 60
+            self._invalidated = {k: v for k, v in self._invalidated.items() if v > cutoff}
+
+    async def invalidate(self, user_ids: Iterable[int]) -> None:
+        """Drop cached principals locally and in Redis."""
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+        self.invalidate_local(user_ids)
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for user_id in user_ids:
+                gen_key = f"{PRINCIPAL_GEN_PREFIX}{user_id}"
+                pipe.incr(gen_key)
+                pipe.expire(gen_key, self.redis_ttl * 2)
+                pipe.delete(f"{PRINCIPAL_KEY_PREFIX}{user_id}")
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Principal cache invalidation failed for users %s: %s", user_ids, e)
+
+    def invalidate_soon(self, user_ids: Iterable[int]) -> None:
+        """Invalidate from synchronous code (session events)."""
+        user_ids = list(user_ids)
+        self.invalidate_local(user_ids)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running loop; principals %s invalidated locally only", user_ids)
+            return
+        task = loop.create_task(self.invalidate(user_ids))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait for scheduled Redis invalidations on the current loop."""
+        loop = asyncio.get_running_loop()
+        pending = [t for t in self._pending if t.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "local_entries": len(self._local),
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+        }
+
+
+# Singleton instance
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get singleton instance of PrincipalCache."""
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache()
+    return _principal_cache
+
+
+async def drain_principal_invalidations() -> None:
+    """Finish pending Redis invalidations before the current event loop closes."""
+    if _principal_cache is not None:
+        await _principal_cache.drain()
+
+
+# ---------------------------------------------------------------------------
+# Automatic invalidation
+# ---------------------------------------------------------------------------
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_principals(session: Session, flush_context: Any) -> None:
+    from app.models.user import User
+
+    stale = {
+        obj.id
+        for obj in chain(session.dirty, session.deleted)
+        if isinstance(obj, User) and obj.id is not None
+    }
+    if stale:
+        session.info.setdefault(_STALE_KEY, set()).update(stale)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_principals(session: Session) -> None:
+    stale = session.info.pop(_STALE_KEY, None)
+    if stale:
+        get_principal_cache().invalidate_soon(stale)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_principals(session: Session) -> None:
+    session.info.pop(_STALE_KEY, None)
@@ -1,7 +1,9 @@
 """Security utilities for JWT and password hashing."""
 
 import logging
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
@@ -13,6 +15,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.core.principal_cache import get_principal_cache, principal_from_dict
 from app.db.database import get_db
 from app.db.redis import get_redis
 from app.models.user import AccountStatus, User, UserRole
@@ -22,6 +25,15 @@ logger = logging.getLogger(__name__)
 # Token blacklist key prefix
 TOKEN_BLACKLIST_PREFIX = "token:blacklist:"
 
+# Local caches on the authentication hot path (bounded LRUs). Entries live
+# for AUTH_LOCAL_CACHE_TTL_SECONDS, which bounds how long another API
+# worker may accept a token after it is revoked elsewhere.
+_LOCAL_AUTH_CACHE_MAX = 10_000
+# jti -> monotonic expiry of a "not blacklisted" answer
+_not_blacklisted: "OrderedDict[str, float]" = OrderedDict()
+# access token -> (wall-clock expiry, decoded payload)
+_decoded_tokens: "OrderedDict[str, tuple[float, dict[str, Any]]]" = OrderedDict()
+
 # Password hashing context with bcrypt
 pwd_context = CryptContext(
     schemes=["bcrypt"],
@@ -51,6 +63,7 @@ async def add_token_to_blacklist(token_id: str, expires_in: int) -> None:
         token_id: The unique JWT ID (jti claim)
         expires_in: Time in seconds until the token expires
     """
+    _not_blacklisted.pop(token_id, None)
     redis_client = await get_redis()
     key = f"{TOKEN_BLACKLIST_PREFIX}{token_id}"
     # Set the key with expiration matching the token expiration
@@ -67,10 +80,24 @@ async def is_token_blacklisted(token_id: str) -> bool:
     Returns:
         True if the token is blacklisted, False otherwise
     """
+    now = time.monotonic()
+    cached_until = _not_blacklisted.get(token_id)
+    if cached_until is not None and cached_until > now:
+        return False
+
     redis_client = await get_redis()
     key = f"{TOKEN_BLACKLIST_PREFIX}{token_id}"
     result = await redis_client.exists(key)
-    return bool(result)
+    if result:
+        _not_blacklisted.pop(token_id, None)
+        return True
+
+    # Negative-cache the answer: polling clients re-send the same token
+    _not_blacklisted[token_id] = now + settings.AUTH_LOCAL_CACHE_TTL_SECONDS
+    _not_blacklisted.move_to_end(token_id)
+    while len(_not_blacklisted) > _LOCAL_AUTH_CACHE_MAX:
+        _not_blacklisted.popitem(last=False)
+    return False
 
 
 def _get_jwt_key_for_signing() -> str:
@@ -205,6 +232,57 @@ def decode_token_sync(token: str) -> dict[str, Any]:
 decode_token = decode_token_sync
 
 
+def _decode_token_cached(token: str) -> dict[str, Any]:
+    """
+    Decode a token, reusing recent results for the same token string.
+
+    Signature checks (possibly against several rotation keys) are skipped
+    for a token seen within AUTH_LOCAL_CACHE_TTL_SECONDS; expiry is still
+    enforced from the cached ``exp`` claim.
+    """
+    now = time.time()
+    cached = _decoded_tokens.get(token)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    payload = decode_token(token)
+    valid_until = now + settings.AUTH_LOCAL_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        valid_until = min(valid_until, float(exp))
+    _decoded_tokens[token] = (valid_until, payload)
+    _decoded_tokens.move_to_end(token)
+    while len(_decoded_tokens) > _LOCAL_AUTH_CACHE_MAX:
+        _decoded_tokens.popitem(last=False)
+    return payload
+
+
+async def _resolve_principal(db: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    Load the user for an access token, from the principal cache if possible.
+
+    Cached principals are attached to ``db`` without a query, so callers can
+    use and modify them like a freshly selected row.
+    """
+    cache = get_principal_cache()
+    cached, generation = await cache.get(user_id)
+    if cached is not None:
+        try:
+            return await db.merge(principal_from_dict(cached), load=False)
+        except Exception as e:
+            logger.warning("Discarding unusable cached principal for user %s: %s", user_id, e)
+            cache.invalidate_local([user_id])
+
+    loaded_at = time.monotonic()
+    result = await db.execute(
+        select(User).where(User.id == user_id)
+    )
+    user = result.scalar_one_or_none()
+    if user is not None:
+        await cache.put(user, generation, loaded_at)
+    return user
+
+
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
     db: AsyncSession = Depends(get_db),
@@ -220,7 +298,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    payload = decode_token(credentials.credentials)
+    payload = _decode_token_cached(credentials.credentials)
 
     # Verify token type
     if payload.get("type") != "access":
@@ -247,11 +325,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Fetch user from database
-    result = await db.execute(
-        select(User).where(User.id == int(user_id))
-    )
-    user = result.scalar_one_or_none()
+    # Fetch user (principal cache, falling back to the database)
+    user = await _resolve_principal(db, int(user_id))
 
     if user is None:
         raise HTTPException(
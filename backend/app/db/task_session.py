@@ -22,6 +22,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 
 from app.config import settings
+from app.core import principal_cache  # noqa: F401  (registers User cache invalidation)
 from app.core.user_ai_config import UserAIConfig, current_user_ai_config
 
 logger = logging.getLogger(__name__)
@@ -211,6 +211,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down...")
 
+    # Flush buffered pipeline trace events, filter stats and LLM usage
+    # while the DB and Redis are still reachable
+    from app.services.filter_stats_service import drain_filter_stats
+    from app.services.llm_cost_service import drain_llm_usage
+    from app.services.pipeline_trace_sink import drain_trace_sink
+    await drain_trace_sink()
+    await drain_filter_stats()
+    await drain_llm_usage()
+
+    # Stop quote stream refresh loops before the provider executors go away
+    from app.services.quote_stream_service import shutdown_quote_stream
+    await shutdown_quote_stream()
+
+    from app.services.portfolio_optimization import shutdown_optimization_pool
+    shutdown_optimization_pool()
+
+    from app.core.bulkhead import shutdown_bulkheads
+    shutdown_bulkheads()
+
     # Cleanup services in reverse order of dependency
     logger.debug("Cleaning up stock service...")
     await cleanup_stock_service()
@@ -18,10 +18,10 @@ from app.models.report import (
 from app.models.document_embedding import DocumentEmbedding
 from app.models.chat import Conversation, ChatMessage
 from app.models.llm_provider import LlmProvider
-from app.models.pipeline_event import PipelineEvent
+from app.models.pipeline_event import PipelineEvent, PipelineEventRollup
 from app.models.qlib_backtest import QlibBacktest, BacktestStatus
 from app.models.rss_feed import RssFeed, FeedCategory
-from app.models.llm_cost import ModelPricing, LlmUsageRecord
+from app.models.llm_cost import ModelPricing, LlmUsageRecord, LlmUsageDaily
 
 __all__ = [
     "User",
@@ -51,10 +51,12 @@ __all__ = [
     "ChatMessage",
     "LlmProvider",
     "PipelineEvent",
+    "PipelineEventRollup",
     "QlibBacktest",
     "BacktestStatus",
     "RssFeed",
     "FeedCategory",
     "ModelPricing",
     "LlmUsageRecord",
+    "LlmUsageDaily",
 ]
@@ -1,4 +1,4 @@
-"""LLM cost tracking models — pricing configuration and usage records."""
+"""LLM cost tracking models — pricing configuration, usage records and daily rollups."""
 
 import uuid
 from datetime import date, datetime, timezone
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Optional
 
 from sqlalchemy import (
-    Date, DateTime, ForeignKey, Integer, Numeric, String,
+    BigInteger, Date, DateTime, ForeignKey, Integer, Numeric, String,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
@@ -137,3 +137,49 @@ class LlmUsageRecord(Base):
             f"<LlmUsageRecord(model={self.model}, purpose={self.purpose}, "
             f"tokens={self.total_tokens}, cost=${self.cost_usd})>"
         )
+
+
+class LlmUsageDaily(Base):
+    """
+    Pre-aggregated LLM usage per UTC day, purpose, model and sub-group.
+
+    Maintained by ``LlmCostService`` in the same transaction that inserts
+    the corresponding ``LlmUsageRecord`` rows, so dashboard aggregations
+    read a few rows per day instead of scanning raw records. ``sub_group``
+    is the agent/sub-type extracted from record metadata ('' if none).
+    Rows are kept after raw records are cleaned up.
+    """
+
+    __tablename__ = "llm_usage_daily"
+    __table_args__ = (
+        UniqueConstraint("day", "purpose", "model", "sub_group",
+                         name="uq_llm_usage_daily_key"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+    )
+    day: Mapped[date] = mapped_column(
+        Date(), nullable=False, index=True,
+        comment="UTC day of the usage",
+    )
+    purpose: Mapped[str] = mapped_column(String(50), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    sub_group: Mapped[str] = mapped_column(
+        String(100), nullable=False, default="",
+        comment="Agent / sub-type from metadata ('' if none)",
+    )
+    prompt_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    completion_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    cached_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    cost_usd: Mapped[Decimal] = mapped_column(
+        Numeric(16, 6), nullable=False, default=0,
+    )
+    calls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<LlmUsageDaily(day={self.day}, purpose={self.purpose}, "
+            f"model={self.model}, calls={self.calls}, cost=${self.cost_usd})>"
+        )
@@ -45,6 +45,7 @@ class FilterStatus(str, Enum):
     FINE_DELETE = "delete"           # 精筛: 删除
     FILTER_FAILED = "failed"         # 筛选失败
     DISCARDED = "discarded"          # Layer 1评分低于丢弃阈值
+    DUPLICATE = "duplicate"          # 近似重复，复用代表文章的评分/分析
 
 
 class News(Base):
@@ -288,6 +289,14 @@ class News(Base):
         comment="来源 RSS Feed ID（如有）",
     )
 
+    # === 近似重复聚类 ===
+    duplicate_of_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+        index=True,
+        comment="近似重复新闻的代表文章 ID（软引用，无外键）",
+    )
+
     # 复合索引用于 RAG 查询优化
     __table_args__ = (
         Index("ix_news_stock_entities_score", "has_stock_entities", "max_entity_score"),
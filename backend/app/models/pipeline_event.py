@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Float, Index, String, Text
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -93,3 +93,70 @@ class PipelineEvent(Base):
             f"<PipelineEvent(id={self.id}, news_id={self.news_id}, "
             f"layer={self.layer}, node={self.node}, status={self.status})>"
         )
+
+
+class PipelineEventRollup(Base):
+    """
+    Hourly per-layer/node aggregate of pipeline events.
+
+    Maintained by ``PipelineRollupService.refresh`` so dashboard stats read
+    a few hundred rows instead of scanning raw events. ``latency_histogram``
+    is a sparse log-bucket histogram (bucket index -> count) that merges by
+    summing, and ``counters`` holds node-specific sums (image counts, score
+    buckets, cache tokens, etc.).
+    """
+
+    __tablename__ = "pipeline_event_rollups"
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        comment="Start of the hourly bucket (UTC)",
+    )
+
+    layer: Mapped[str] = mapped_column(String(10), primary_key=True)
+
+    node: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    success_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    duration_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Events with a recorded duration",
+    )
+    duration_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    duration_max: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    latency_histogram: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        comment="Sparse log-bucket latency histogram: bucket index -> count",
+    )
+
+    counters: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        comment="Node-specific metadata sums",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_pipeline_event_rollups_layer_node_bucket", "layer", "node", "bucket_start"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<PipelineEventRollup(bucket_start={self.bucket_start}, "
+            f"layer={self.layer}, node={self.node}, count={self.count})>"
+        )
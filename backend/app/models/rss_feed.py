@@ -5,8 +5,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, DateTime, Float, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.database import Base
@@ -83,6 +83,18 @@ class RssFeed(Base):
         comment="轮询间隔（分钟），最小5分钟",
     )
 
+    min_poll_interval_minutes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="自适应轮询间隔下限（分钟），为空时使用全局默认",
+    )
+
+    max_poll_interval_minutes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="自适应轮询间隔上限（分钟），为空时使用全局默认",
+    )
+
     fulltext_mode: Mapped[bool] = mapped_column(
         Boolean,
         nullable=False,
@@ -102,6 +114,38 @@ class RssFeed(Base):
         comment="上次轮询时间",
     )
 
+    # === 自适应轮询状态 (rss_poll_scheduler) ===
+    next_poll_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        index=True,
+        comment="下次计划轮询时间",
+    )
+
+    last_entry_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="最近一篇新文章的发布时间",
+    )
+
+    avg_interarrival_minutes: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="新文章平均间隔（分钟，EWMA）",
+    )
+
+    empty_poll_ratio: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="无新内容轮询占比（含304，EWMA）",
+    )
+
+    hourly_activity: Mapped[Optional[list]] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="按UTC小时统计的新文章数（衰减计数，24项）",
+    )
+
     last_error: Mapped[Optional[str]] = mapped_column(
         String(500),
         nullable=True,
@@ -115,6 +159,18 @@ class RssFeed(Base):
         comment="连续错误次数（成功时重置为0，>=10时自动禁用）",
     )
 
+    etag: Mapped[Optional[str]] = mapped_column(
+        String(500),
+        nullable=True,
+        comment="上次响应的 ETag（用于条件请求）",
+    )
+
+    last_modified: Mapped[Optional[str]] = mapped_column(
+        String(100),
+        nullable=True,
+        comment="上次响应的 Last-Modified（用于条件请求）",
+    )
+
     article_count: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
@@ -23,6 +23,8 @@ Structure:
 
 from app.prompts.chat_prompt import (
     build_chat_system_prompt,
+    build_chat_summary_context,
+    CHAT_SUMMARY_SYSTEM_PROMPT,
     CHAT_SYSTEM_PROMPT_EN,
     CHAT_SYSTEM_PROMPT_ZH,
 )
@@ -59,6 +61,8 @@ from app.prompts.analysis import (
 __all__ = [
     # Chat prompts
     "build_chat_system_prompt",
+    "build_chat_summary_context",
+    "CHAT_SUMMARY_SYSTEM_PROMPT",
     "CHAT_SYSTEM_PROMPT_EN",
     "CHAT_SYSTEM_PROMPT_ZH",
     # News filter prompts
@@ -55,3 +55,39 @@ def build_chat_system_prompt(language: str = "en", symbol: str | None = None) ->
     if symbol:
         prompt += STOCK_CONTEXT_EN.format(symbol=symbol)
     return prompt
+
+
+# Rolling summary of turns that have left the context window
+CHAT_SUMMARY_SYSTEM_PROMPT = """You maintain a running summary of a conversation between a user and a stock market analysis assistant.
+
+You are given the existing summary (possibly empty) and the next turns of the conversation. Return an updated summary that:
+- Keeps the stocks, figures, conclusions and user preferences that later turns may refer back to
+- Drops greetings, repetition and tool-call details
+- Is written in the same language as the conversation
+- Is at most {max_words} words
+
+Return only the summary text."""
+
+SUMMARY_CONTEXT_EN = """
+
+**Earlier in this conversation** (summary of turns no longer shown):
+{summary}"""
+
+SUMMARY_CONTEXT_ZH = """
+
+**此前的对话**（已不再显示的内容摘要）：
+{summary}"""
+
+
+def build_chat_summary_context(summary: str, language: str = "en") -> str:
+    """Build the system prompt section carrying the conversation summary.
+
+    Args:
+        summary: Rolling summary of turns evicted from the context window
+        language: Language code ("en" or "zh")
+
+    Returns:
+        Text to append to the chat system prompt
+    """
+    template = SUMMARY_CONTEXT_ZH if language == "zh" else SUMMARY_CONTEXT_EN
+    return template.format(summary=summary)
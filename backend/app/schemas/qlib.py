@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
 if TYPE_CHECKING:
     from app.models.qlib_backtest import QlibBacktest
@@ -233,6 +233,7 @@ class OptimizationConstraints(CamelModel):
     max_weight: float = Field(1.0, ge=0.0, le=1.0)
     risk_free_rate: float = Field(0.02, ge=-0.1, le=0.5)
     target_return: float = Field(0.1, ge=-1.0, le=5.0)
+    cov_estimator: Literal["sample", "ledoit_wolf"] = "sample"
 
 
 def _validate_symbols(v: List[str]) -> List[str]:
@@ -293,6 +294,7 @@ class RiskDecompositionRequest(CamelModel):
     symbols: List[str] = Field(..., min_length=2, max_length=100)
     weights: Dict[str, float] = Field(...)
     lookback_days: int = Field(252, ge=30, le=1260)
+    cov_estimator: Literal["sample", "ledoit_wolf"] = "sample"
 
     @field_validator("symbols")
     @classmethod
@@ -18,6 +18,9 @@ class RssFeedCreate(CamelModel):
     symbol: Optional[str] = Field(None, max_length=20)
     market: str = Field(default="US", max_length=10)
     poll_interval_minutes: int = Field(default=15, ge=5, le=1440)
+    # Bounds for adaptive polling (None = global default)
+    min_poll_interval_minutes: Optional[int] = Field(None, ge=1, le=1440)
+    max_poll_interval_minutes: Optional[int] = Field(None, ge=1, le=10080)
     fulltext_mode: bool = False
 
     @field_validator("rsshub_route")
@@ -38,6 +41,8 @@ class RssFeedUpdate(CamelModel):
     symbol: Optional[str] = Field(None, max_length=20)
     market: Optional[str] = Field(None, max_length=10)
     poll_interval_minutes: Optional[int] = Field(None, ge=5, le=1440)
+    min_poll_interval_minutes: Optional[int] = Field(None, ge=1, le=1440)
+    max_poll_interval_minutes: Optional[int] = Field(None, ge=1, le=10080)
     fulltext_mode: Optional[bool] = None
     is_enabled: Optional[bool] = None
 
@@ -60,9 +65,13 @@ class RssFeedResponse(CamelModel):
     symbol: Optional[str] = None
     market: str = "US"
     poll_interval_minutes: int = 15
+    min_poll_interval_minutes: Optional[int] = None
+    max_poll_interval_minutes: Optional[int] = None
     fulltext_mode: bool = False
     is_enabled: bool = True
     last_polled_at: Optional[datetime] = None
+    next_poll_at: Optional[datetime] = None
+    avg_interarrival_minutes: Optional[float] = None  # 学习到的发文间隔
     last_error: Optional[str] = None
     consecutive_errors: int = 0
     article_count: int = 0
@@ -0,0 +1,339 @@
+"""Incremental context window for chat conversations.
+
+Each conversation's recent turns are kept in Redis together with their
+token counts (tiktoken), so a chat turn reads its history without querying
+``chat_messages`` and the window only ever grows by appending:
+
+- ``chat:ctx:{id}:window``  JSON list of recent turns ``{role, content, tokens}``
+- ``chat:ctx:{id}:pending`` Redis list of evicted turns not yet summarized
+- ``chat:ctx:{id}:summary`` rolling summary of everything evicted so far
+
+When the window exceeds its message or token budget, the oldest turns are
+evicted in one chunk (down to half the budget) rather than one per turn.
+The prompt prefix (system prompt + summary + older turns) therefore stays
+identical across most turns, which lets provider prompt caching reuse it,
+and early context is folded into the summary by a background LLM call
+instead of being dropped.
+
+If Redis is unavailable or the window has expired, the window is rebuilt
+from the most recent ``chat_messages`` rows.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.llm import ChatRequest, Message, Role, get_llm_gateway
+from app.models.chat import ChatMessage
+from app.prompts import CHAT_SUMMARY_SYSTEM_PROMPT
+from app.services.token_service import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Window budget; exceeding either evicts the oldest turns down to half of it
+MAX_CONTEXT_MESSAGES = 20
+MAX_CONTEXT_TOKENS = 4000
+
+# Upper bound for the rolling summary
+SUMMARY_MAX_TOKENS = 400
+
+# Evicted turns kept for summarization (oldest dropped beyond this)
+MAX_PENDING_TURNS = 50
+
+# Idle conversations' context expires from Redis after a week
+CONTEXT_TTL_SECONDS = 7 * 24 * 3600
+
+# Guards against two processes summarizing the same conversation
+SUMMARY_LOCK_SECONDS = 120
+
+_KEY_PREFIX = "chat:ctx:"
+
+
+def _key(conversation_id: UUID, part: str) -> str:
+    return f"{_KEY_PREFIX}{conversation_id}:{part}"
+
+
+@dataclass
+class ContextWindow:
+    """History to send ahead of the new user message."""
+
+    messages: List[Dict[str, str]] = field(default_factory=list)
+    summary: Optional[str] = None
+    tokens: int = 0
+
+
+def evict_oldest(
+    entries: List[Dict[str, Any]],
+    max_messages: int = MAX_CONTEXT_MESSAGES,
+    max_tokens: int = MAX_CONTEXT_TOKENS,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split ``entries`` into (kept, evicted) once the budget is exceeded.
+
+    Nothing is evicted while the window is within budget. Past it, the
+    oldest turns go until the window is at half budget, always keeping the
+    most recent turn.
+    """
+    total = sum(e["tokens"] for e in entries)
+    if len(entries) <= max_messages and total <= max_tokens:
+        return entries, []
+
+    cut = 0
+    while cut < len(entries) - 1 and (
+        len(entries) - cut > max_messages // 2 or total > max_tokens // 2
+    ):
+        total -= entries[cut]["tokens"]
+        cut += 1
+    return entries[cut:], entries[:cut]
+
+
+class ChatContextService:
+    """Maintains per-conversation context windows and rolling summaries."""
+
+    def __init__(self) -> None:
+        self._summarizing: Set[UUID] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    # === Reading ===
+
+    async def load(self, db: AsyncSession, conversation_id: UUID) -> ContextWindow:
+        """Context window for the next turn (rebuilt from the DB on a miss)."""
+        redis = None
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            window_raw, summary = await asyncio.gather(
+                redis.get(_key(conversation_id, "window")),
+                redis.get(_key(conversation_id, "summary")),
+            )
+            if window_raw is not None:
+                entries = json.loads(window_raw)
+                return ContextWindow(
+                    messages=[{"role": e["role"], "content": e["content"]} for e in entries],
+                    summary=summary or None,
+                    tokens=sum(e["tokens"] for e in entries),
+                )
+        except Exception as e:
+            logger.warning("Chat context cache read failed for %s: %s", conversation_id, e)
+            redis = None
+
+        entries = await self._load_from_db(db, conversation_id)
+        if redis is not None:
+            try:
+                # The summary and pending turns described the expired window
+                await redis.delete(
+                    _key(conversation_id, "summary"), _key(conversation_id, "pending")
+                )
+                await redis.set(
+                    _key(conversation_id, "window"),
+                    json.dumps(entries, ensure_ascii=False),
+                    ex=CONTEXT_TTL_SECONDS,
+                )
+            except Exception as e:
+                logger.warning("Chat context cache seed failed for %s: %s", conversation_id, e)
+        return ContextWindow(
+            messages=[{"role": e["role"], "content": e["content"]} for e in entries],
+            tokens=sum(e["tokens"] for e in entries),
+        )
+
+    async def _load_from_db(
+        self, db: AsyncSession, conversation_id: UUID
+    ) -> List[Dict[str, Any]]:
+        result = await db.execute(
+            select(ChatMessage)
+            .where(ChatMessage.conversation_id == conversation_id)
+            .order_by(desc(ChatMessage.created_at))
+            .limit(MAX_CONTEXT_MESSAGES)
+        )
+        rows = list(result.scalars().all())
+        rows.reverse()  # chronological order
+
+        # Only final user/assistant messages are persisted (not intermediate
+        # tool-role messages).  The assistant text already contains the
+        # summarised tool results, so the model has sufficient context.
+        entries = []
+        for msg in rows:
+            content = msg.content or ""
+            # Assistant token_count is the completion usage (tool calls
+            # included), so only user counts describe the stored content
+            tokens = msg.token_count if msg.role == "user" and msg.token_count else None
+            entries.append({
+                "role": msg.role,
+                "content": content,
+                "tokens": tokens if tokens is not None else count_tokens(content),
+            })
+        kept, _ = evict_oldest(entries)
+        return kept
+
+    # === Writing ===
+
+    async def append(
+        self,
+        conversation_id: UUID,
+        role: str,
+        content: str,
+        tokens: Optional[int] = None,
+    ) -> bool:
+        """Append a persisted message to the cached window.
+
+        Returns True when older turns were evicted and await summarization.
+        A missing window is left missing; the next ``load`` rebuilds it
+        from the DB, which already holds this message.
+        """
+        entry = {
+            "role": role,
+            "content": content,
+            "tokens": tokens if tokens is not None else count_tokens(content),
+        }
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            window_key = _key(conversation_id, "window")
+            window_raw = await redis.get(window_key)
+            if window_raw is None:
+                return False
+
+            kept, evicted = evict_oldest(json.loads(window_raw) + [entry])
+            await redis.set(window_key, json.dumps(kept, ensure_ascii=False), ex=CONTEXT_TTL_SECONDS)
+            await redis.expire(_key(conversation_id, "summary"), CONTEXT_TTL_SECONDS)
+            if not evicted:
+                return False
+
+            pending_key = _key(conversation_id, "pending")
+            await redis.rpush(pending_key, *(json.dumps(e, ensure_ascii=False) for e in evicted))
+            await redis.ltrim(pending_key, -MAX_PENDING_TURNS, -1)
+            await redis.expire(pending_key, CONTEXT_TTL_SECONDS)
+            return True
+        except Exception as e:
+            logger.warning("Chat context cache append failed for %s: %s", conversation_id, e)
+            return False
+
+    async def invalidate(self, conversation_id: UUID) -> None:
+        """Drop all cached context for a conversation."""
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            await redis.delete(
+                _key(conversation_id, "window"),
+                _key(conversation_id, "summary"),
+                _key(conversation_id, "pending"),
+            )
+        except Exception as e:
+            logger.warning("Chat context cache invalidation failed for %s: %s", conversation_id, e)
+
+    # === Rolling summary ===
+
+    def schedule_summary(
+        self,
+        conversation_id: UUID,
+        model: str,
+        provider_kwargs: Dict[str, Any],
+        user_id: int,
+    ) -> None:
+        """Fold pending evicted turns into the summary in the background."""
+        if conversation_id in self._summarizing:
+            return
+        self._summarizing.add(conversation_id)
+        task = asyncio.create_task(
+            self._summarize(conversation_id, model, provider_kwargs, user_id)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _summarize(
+        self,
+        conversation_id: UUID,
+        model: str,
+        provider_kwargs: Dict[str, Any],
+        user_id: int,
+    ) -> None:
+        lock_key = _key(conversation_id, "summarizing")
+        redis = None
+        locked = False
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            locked = bool(await redis.set(lock_key, "1", nx=True, ex=SUMMARY_LOCK_SECONDS))
+            if not locked:
+                return
+
+            pending_key = _key(conversation_id, "pending")
+            batch = await redis.lrange(pending_key, 0, -1)
+            if not batch:
+                return
+            previous = await redis.get(_key(conversation_id, "summary")) or ""
+
+            turns = []
+            for raw in batch:
+                entry = json.loads(raw)
+                turns.append(f"{entry['role']}: {entry['content']}")
+            user_content = (
+                f"Existing summary:\n{previous or '(none)'}\n\n"
+                f"Next turns:\n" + "\n\n".join(turns)
+            )
+
+            gateway = get_llm_gateway()
+            response = await gateway.chat(
+                ChatRequest(
+                    model=model,
+                    messages=[
+                        Message(
+                            role=Role.SYSTEM,
+                            content=CHAT_SUMMARY_SYSTEM_PROMPT.format(
+                                max_words=SUMMARY_MAX_TOKENS // 2
+                            ),
+                        ),
+                        Message(role=Role.USER, content=user_content),
+                    ],
+                    max_tokens=SUMMARY_MAX_TOKENS,
+                    temperature=0.2,
+                ),
+                **provider_kwargs,
+                purpose="chat_summary",
+                user_id=user_id,
+                usage_metadata={"conversation_id": str(conversation_id)},
+            )
+            summary = (response.content or "").strip()
+            if not summary:
+                return
+
+            await redis.set(_key(conversation_id, "summary"), summary, ex=CONTEXT_TTL_SECONDS)
+            # Turns evicted while the LLM call ran stay queued for next time
+            await redis.ltrim(pending_key, len(batch), -1)
+            logger.info(
+                "Summarized %d evicted turns for conversation %s", len(batch), conversation_id
+            )
+        except Exception as e:
+            logger.warning("Chat context summary failed for %s: %s", conversation_id, e)
+        finally:
+            self._summarizing.discard(conversation_id)
+            if locked and redis is not None:
+                try:
+                    await redis.delete(lock_key)
+                except Exception:
+                    pass
+
+
+# Singleton instance
+_chat_context_service: Optional[ChatContextService] = None
+
+
+def get_chat_context_service() -> ChatContextService:
+    """Get singleton instance of ChatContextService."""
+    global _chat_context_service
+    if _chat_context_service is None:
+        _chat_context_service = ChatContextService()
+    return _chat_context_service
@@ -38,11 +38,15 @@ from app.core.user_ai_config import current_user_ai_config
 from app.core.token_bucket import get_chat_rate_limiter, get_user_chat_rate_limiter
 from app.models.chat import ChatMessage, Conversation
 from app.skills.chat_adapter import (
+    ChatToolMemo,
     execute_chat_tool,
     get_chat_tools,
     get_tool_label,
+    plan_tool_prefetch,
 )
-from app.prompts import build_chat_system_prompt
+from app.prompts import build_chat_summary_context, build_chat_system_prompt
+from app.services.chat_context import get_chat_context_service
+from app.services.token_service import count_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +54,6 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 
-# Maximum messages to include in the context window sent to the LLM
-_MAX_CONTEXT_MESSAGES = 10
-
-# Rough token budget for the context window (used for trimming)
-_MAX_CONTEXT_TOKENS = 4000
-
-# Average characters per token (conservative estimate for mixed EN/ZH text)
-_CHARS_PER_TOKEN = 3
-
 # Maximum tool call loop iterations to prevent infinite loops
 _MAX_TOOL_ITERATIONS = 3
 
@@ -180,6 +175,7 @@ class ChatService:
             delete(Conversation).where(Conversation.id == conversation_id)
         )
         await db.flush()
+        await get_chat_context_service().invalidate(conversation_id)
         logger.info("Deleted conversation %s for user %d", conversation_id, user_id)
         return True
 
@@ -262,6 +258,7 @@ class ChatService:
         - ``error``              -- on failure
         """
         assistant_message_id = str(_uuid.uuid4())
+        tool_memo = ChatToolMemo(conversation_id)
 
         try:
             # 1. Rate-limit check
@@ -282,14 +279,17 @@ class ChatService:
                 return
 
             # 3. Build context window BEFORE saving new user message
-            history = await self._build_context_window(db, conversation_id)
+            context = get_chat_context_service()
+            window = await context.load(db, conversation_id)
 
             # 4. Save user message and commit immediately
+            user_tokens = count_tokens(user_message)
             await self.add_message(
                 db,
                 conversation_id,
                 role="user",
                 content=user_message,
+                token_count=user_tokens,
             )
 
             # 5. Auto-generate title
@@ -301,13 +301,24 @@ class ChatService:
                 conversation.symbol = symbol
 
             await db.commit()
+            needs_summary = await context.append(
+                conversation_id, "user", user_message, user_tokens
+            )
 
-            # 6. Build gateway messages payload (no inline RAG -- RAG is a tool)
+            # 6. Build gateway messages payload (no inline RAG -- RAG is a tool).
+            # The system prompt and summary only change when turns are evicted,
+            # so they form a stable, cacheable prefix.
             system_prompt = self._build_system_prompt(language, symbol)
+            if window.summary:
+                system_prompt += build_chat_summary_context(window.summary, language)
             gateway_messages: list[Message] = [
-                Message(role=Role.SYSTEM, content=system_prompt),
+                Message(
+                    role=Role.SYSTEM,
+                    content=system_prompt,
+                    cache_control={"type": "ephemeral"},
+                ),
             ]
-            for h in history:
+            for h in window.messages:
                 gateway_messages.append(
                     Message(role=Role(h["role"]), content=h.get("content") or "")
                 )
@@ -322,6 +333,14 @@ class ChatService:
                 "messageId": assistant_message_id,
             })
 
+            # Speculatively start likely tool calls so they run alongside
+            # the first LLM round-trip; the model's own calls join them
+            prefetch_symbol = symbol or conversation.symbol
+            if prefetch_symbol:
+                usage = await tool_memo.load_usage()
+                for name, args in plan_tool_prefetch(prefetch_symbol, usage):
+                    tool_memo.prefetch(name, args, _tool_executor(name, args, user_id))
+
             # 8. Tool call loop (using synthesis model from LangGraph config)
             gateway = get_llm_gateway()
             model, provider_kwargs = await get_chat_model_config()
@@ -445,6 +464,7 @@ class ChatService:
 
                     # Execute all tool calls in parallel, each with its own
                     # DB session to avoid concurrent use of a single AsyncSession.
+                    # Repeated calls share one result through the memo.
                     async def _run_tool(tc_obj: ToolCall) -> tuple[str, str, dict]:
                         tc_id = tc_obj.id
                         name = tc_obj.name
@@ -452,8 +472,9 @@ class ChatService:
                             args = json.loads(tc_obj.arguments)
                         except json.JSONDecodeError:
                             args = {}
-                        async with AsyncSessionLocal() as tool_db:
-                            result = await execute_chat_tool(name, args, user_id, tool_db)
+                        result = await tool_memo.run(
+                            name, args, _tool_executor(name, args, user_id)
+                        )
                         return tc_id, name, result
 
                     tasks = [_run_tool(tc) for tc in collected_tool_calls]
@@ -473,6 +494,7 @@ class ChatService:
                             tc_id, tc_name, tool_result = res
 
                         # Track for metadata
+                        tool_memo.record_usage(tc_name)
                         all_tool_calls_meta.append({
                             "id": tc_id,
                             "name": tc_name,
@@ -517,7 +539,7 @@ class ChatService:
             # 9. Persist assistant message
             assistant_text = "".join(full_content)
             if not total_completion_tokens:
-                total_completion_tokens = max(1, len(assistant_text) // _CHARS_PER_TOKEN)
+                total_completion_tokens = max(1, count_tokens(assistant_text, model))
 
             tool_calls_json = all_tool_calls_meta if all_tool_calls_meta else None
             rag_context_json = rag_sources if rag_sources else None
@@ -535,6 +557,12 @@ class ChatService:
 
             conversation.updated_at = datetime.now(timezone.utc)
             await db.commit()
+            await tool_memo.save_usage()
+
+            if await context.append(conversation_id, "assistant", assistant_text):
+                needs_summary = True
+            if needs_summary:
+                context.schedule_summary(conversation_id, model, provider_kwargs, user_id)
 
             # 10. Final event
             yield _sse({
@@ -574,6 +602,10 @@ class ChatService:
                 "type": "error",
                 "error": error_msg,
             })
+        finally:
+            # Prefetches the model never asked for (or an aborted stream)
+            # must not keep running provider and DB work
+            tool_memo.cancel_prefetches()
 
     # ------------------------------------------------------------------
     # System prompt (no RAG injection -- RAG is now a tool)
@@ -596,52 +628,22 @@ class ChatService:
 
         return build_chat_system_prompt(language, symbol)
 
-    # ------------------------------------------------------------------
-    # Context window
-    # ------------------------------------------------------------------
-
-    async def _build_context_window(
-        self,
-        db: AsyncSession,
-        conversation_id: UUID,
-        max_messages: int = _MAX_CONTEXT_MESSAGES,
-    ) -> list[dict]:
-        """Fetch recent messages and convert to OpenAI message format.
 
-        Handles both regular messages and tool call messages:
-        - ``role="assistant"`` with ``tool_calls`` metadata → reconstructed
-        - ``role="tool"`` with ``tool_call_id`` → included correctly
-        - Regular ``user``/``assistant`` messages → standard format
+# ---------------------------------------------------------------------------
+# Tool execution helper
+# ---------------------------------------------------------------------------
 
-        Messages are returned in chronological order. Oldest are dropped
-        if estimated token count exceeds ``_MAX_CONTEXT_TOKENS``.
-        """
-        result = await db.execute(
-            select(ChatMessage)
-            .where(ChatMessage.conversation_id == conversation_id)
-            .order_by(desc(ChatMessage.created_at))
-            .limit(max_messages)
-        )
-        rows = list(result.scalars().all())
-        rows.reverse()  # chronological order
-
-        messages: list[dict] = []
-        for msg in rows:
-            # Only final user/assistant messages are persisted (not intermediate
-            # tool-role messages).  The assistant text already contains the
-            # summarised tool results, so the model has sufficient context.
-            messages.append({"role": msg.role, "content": msg.content or ""})
-
-        # Trim oldest messages when estimated token count is too high
-        token_estimate = sum(
-            len(m.get("content") or "") // _CHARS_PER_TOKEN for m in messages
-        )
-        while token_estimate > _MAX_CONTEXT_TOKENS and len(messages) > 1:
-            removed = messages.pop(0)
-            token_estimate -= len(removed.get("content") or "") // _CHARS_PER_TOKEN
+def _tool_executor(name: str, args: dict, user_id: int):
+    """Build a call running a chat tool in its own DB session.
 
-        return messages
+    Each call gets its own AsyncSession so tool calls (and prefetches) can
+    run concurrently.
+    """
+    async def _execute() -> dict:
+        async with AsyncSessionLocal() as tool_db:
+            return await execute_chat_tool(name, args, user_id, tool_db)
 
+    return _execute
 
 
 # ---------------------------------------------------------------------------
@@ -2,11 +2,20 @@
 
 Tracks filter decisions and errors using Redis counters with daily granularity.
 Provides statistics for admin dashboard and alerting.
+
+Counters live in one hash per day (``news:filter:{YYYYMMDD}``, field =
+stat type). Increments are accumulated in process and flushed with a
+single pipelined HINCRBY batch shortly afterwards (``FLUSH_DELAY_SECONDS``)
+or when the Celery task's event loop ends, so stat tracking no longer
+costs Redis round-trips on the LLM call path. Reads fetch every day of a
+range in one pipeline.
 """
 
+import asyncio
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.db.redis import get_redis
 
@@ -16,6 +25,9 @@ logger = logging.getLogger(__name__)
 KEY_PREFIX = "news:filter"
 TTL_DAYS = 7  # Keep stats for 7 days
 
+# Delay before buffered increments are flushed to Redis
+FLUSH_DELAY_SECONDS = 0.25
+
 
 class FilterStatsService:
     """
@@ -94,29 +106,100 @@ class FilterStatsService:
         "layer1_signal_output_tokens",
     ]
 
+    def __init__(self, flush_delay: float = FLUSH_DELAY_SECONDS) -> None:
+        self.flush_delay = flush_delay
+        self._valid_types = frozenset(self.STAT_TYPES + self.TOKEN_TYPES)
+        # (date, stat_type) -> delta not yet written to Redis
+        self._pending: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_now: Optional[asyncio.Event] = None
+
+    @staticmethod
+    def _day_key(date: str) -> str:
+        return f"{KEY_PREFIX}:{date}"
+
     async def increment(self, stat_type: str, count: int = 1) -> None:
         """
         Increment a filter statistic counter.
 
+        The delta is buffered locally and written to Redis by the next
+        background flush.
+
         Args:
             stat_type: Type of statistic (see STAT_TYPES or TOKEN_TYPES)
             count: Amount to increment (default 1)
         """
-        valid_types = self.STAT_TYPES + self.TOKEN_TYPES
-        if stat_type not in valid_types:
+        if stat_type not in self._valid_types:
             logger.warning(f"Unknown stat type: {stat_type}")
             return
+        self._add(stat_type, count)
 
-        try:
-            redis = await get_redis()
-            date_str = datetime.now().strftime("%Y%m%d")
-            key = f"{KEY_PREFIX}:{date_str}:{stat_type}"
+    def _add(self, stat_type: str, count: int) -> None:
+        if not count:
+            return
+        date_str = datetime.now().strftime("%Y%m%d")
+        self._pending[(date_str, stat_type)] += count
+        self._schedule_flush()
 
-            await redis.incrby(key, count)
-            await redis.expire(key, TTL_DAYS * 86400)
+    def _schedule_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop; flushed by the next caller that has one
+        if self._loop is loop and self._flush_task is not None and not self._flush_task.done():
+            return
+        self._loop = loop
+        self._flush_now = asyncio.Event()
+        self._flush_task = loop.create_task(self._flush_later(self._flush_now))
+
+    async def _flush_later(self, flush_now: asyncio.Event) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(flush_now.wait(), self.flush_delay)
+            except asyncio.TimeoutError:
+                pass
+            # Keep going while increments arrived during the flush; stop on
+            # failure so a Redis outage is retried by the next increment.
+            if not await self.flush() or not self._pending or flush_now.is_set():
+                return
+
+    async def flush(self) -> bool:
+        """
+        Write buffered increments to Redis in one pipeline (non-fatal).
 
+        Returns:
+            False if the write failed (deltas are kept for the next flush)
+        """
+        if not self._pending:
+            return True
+        pending, self._pending = self._pending, defaultdict(int)
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline(transaction=False)
+            dates = set()
+            for (date, stat_type), count in pending.items():
+                pipe.hincrby(self._day_key(date), stat_type, count)
+                dates.add(date)
+            for date in dates:
+                pipe.expire(self._day_key(date), TTL_DAYS * 86400)
+            await pipe.execute()
         except Exception as e:
-            logger.warning(f"Failed to increment filter stat {stat_type}: {e}")
+            # Keep the deltas for the next flush (bounded: stats x days)
+            for key, count in pending.items():
+                self._pending[key] += count
+            logger.warning(f"Failed to flush {len(pending)} filter stat counters: {e}")
+            return False
+        return True
+
+    async def drain(self) -> None:
+        """Flush buffered increments before the current event loop closes."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done() and self._loop is asyncio.get_running_loop():
+            self._flush_now.set()
+            await task
+        await self.flush()
+        self._loop = None
 
     async def track_tokens(
         self,
@@ -144,8 +227,41 @@ class FilterStatsService:
             logger.warning(f"Unknown filter stage: {stage}")
             return
 
-        await self.increment(f"{stage}_input_tokens", input_tokens)
-        await self.increment(f"{stage}_output_tokens", output_tokens)
+        self._add(f"{stage}_input_tokens", input_tokens or 0)
+        self._add(f"{stage}_output_tokens", output_tokens or 0)
+
+    async def _fetch_days(self, dates: List[str]) -> Dict[str, Dict[str, int]]:
+        """Read the counters of several days with one pipeline."""
+        await self.flush()
+
+        all_types = self.STAT_TYPES + self.TOKEN_TYPES
+        result = {date: {stat: 0 for stat in all_types} for date in dates}
+        if not dates:
+            return result
+
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for date in dates:
+                pipe.hgetall(self._day_key(date))
+                # Per-stat string keys written before the per-day hash; they
+                # expire within TTL_DAYS.
+                pipe.mget([f"{KEY_PREFIX}:{date}:{stat}" for stat in all_types])
+            replies = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to get filter stats for {len(dates)} days: {e}")
+            return result
+
+        for i, date in enumerate(dates):
+            stats = result[date]
+            day_hash, legacy = replies[2 * i], replies[2 * i + 1]
+            for stat_type, value in (day_hash or {}).items():
+                if stat_type in stats:
+                    stats[stat_type] += int(value)
+            for stat_type, value in zip(all_types, legacy or ()):
+                if value:
+                    stats[stat_type] += int(value)
+        return result
 
     async def get_daily_stats(self, date: Optional[str] = None) -> Dict[str, int]:
         """
@@ -159,23 +275,7 @@ class FilterStatsService:
         """
         if date is None:
             date = datetime.now().strftime("%Y%m%d")
-
-        all_types = self.STAT_TYPES + self.TOKEN_TYPES
-        stats = {stat: 0 for stat in all_types}
-
-        try:
-            redis = await get_redis()
-
-            for stat_type in all_types:
-                key = f"{KEY_PREFIX}:{date}:{stat_type}"
-                value = await redis.get(key)
-                if value:
-                    stats[stat_type] = int(value)
-
-        except Exception as e:
-            logger.warning(f"Failed to get daily stats for {date}: {e}")
-
-        return stats
+        return (await self._fetch_days([date]))[date]
 
     async def get_stats_range(self, days: int = 7) -> Dict[str, Dict[str, int]]:
         """
@@ -187,14 +287,21 @@ class FilterStatsService:
         Returns:
             Dict mapping date (YYYYMMDD) to stats dict
         """
-        result = {}
         today = datetime.now()
+        dates = [(today - timedelta(days=i)).strftime("%Y%m%d") for i in range(days)]
+        return await self._fetch_days(dates)
 
-        for i in range(days):
-            date = (today - timedelta(days=i)).strftime("%Y%m%d")
-            result[date] = await self.get_daily_stats(date)
+    def _summarize(self, range_stats: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+        """Sum per-day stats into one dict."""
+        all_types = self.STAT_TYPES + self.TOKEN_TYPES
+        summary = {stat: 0 for stat in all_types}
 
-        return result
+        for date_stats in range_stats.values():
+            for stat_type, count in date_stats.items():
+                if stat_type in summary:
+                    summary[stat_type] += count
+
+        return summary
 
     async def get_summary_stats(self, days: int = 7) -> Dict[str, int]:
         """
@@ -206,21 +313,20 @@ class FilterStatsService:
         Returns:
             Dict with aggregated counts for each stat type (includes tokens)
         """
-        range_stats = await self.get_stats_range(days)
-        all_types = self.STAT_TYPES + self.TOKEN_TYPES
-        summary = {stat: 0 for stat in all_types}
-
-        for date_stats in range_stats.values():
-            for stat_type, count in date_stats.items():
-                if stat_type in summary:
-                    summary[stat_type] += count
+        return self._summarize(await self.get_stats_range(days))
 
-        return summary
-
-    async def get_filter_rates(self, days: int = 7) -> Dict[str, float]:
+    async def get_filter_rates(
+        self,
+        days: int = 7,
+        summary: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, float]:
         """
         Calculate filter effectiveness rates.
 
+        Args:
+            days: Number of days to aggregate
+            summary: Pre-fetched summary stats for the period (skips the read)
+
         Returns:
             Dict with calculated rates:
             - initial_skip_rate: Percentage skipped in initial filter
@@ -228,7 +334,8 @@ class FilterStatsService:
             - filter_error_rate: Percentage of filter errors
             - embedding_error_rate: Percentage of embedding errors
         """
-        summary = await self.get_summary_stats(days)
+        if summary is None:
+            summary = await self.get_summary_stats(days)
 
         # Initial filter totals
         initial_total = (
@@ -263,17 +370,23 @@ class FilterStatsService:
 
         return rates
 
-    async def get_token_summary(self, days: int = 7) -> Dict[str, any]:
+    async def get_token_summary(
+        self,
+        days: int = 7,
+        summary: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, any]:
         """
         Get token usage summary with cost estimates.
 
         Args:
             days: Number of days to aggregate
+            summary: Pre-fetched summary stats for the period (skips the read)
 
         Returns:
             Dict with token counts and estimated costs
         """
-        summary = await self.get_summary_stats(days)
+        if summary is None:
+            summary = await self.get_summary_stats(days)
 
         initial_input = summary.get("initial_input_tokens", 0)
         initial_output = summary.get("initial_output_tokens", 0)
@@ -356,13 +469,18 @@ class FilterStatsService:
         """
         Get comprehensive filter statistics for admin dashboard.
 
+        Reads the whole range once; rates, tokens and alerts (today's
+        counters) are derived from it.
+
         Returns:
             Dict with counts, rates, tokens, and alerts
         """
-        summary = await self.get_summary_stats(days)
-        rates = await self.get_filter_rates(days)
-        tokens = await self.get_token_summary(days)
-        alerts = await self.check_thresholds()
+        range_stats = await self.get_stats_range(days)
+        summary = self._summarize(range_stats)
+        rates = await self.get_filter_rates(days, summary=summary)
+        tokens = await self.get_token_summary(days, summary=summary)
+        today = datetime.now().strftime("%Y%m%d")
+        alerts = await self.check_thresholds(today_stats=range_stats.get(today))
 
         # Calculate totals
         initial_total = (
@@ -497,14 +615,20 @@ class FilterStatsService:
             },
         }
 
-    async def check_thresholds(self) -> List[Dict[str, str]]:
+    async def check_thresholds(
+        self,
+        today_stats: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, str]]:
         """
         Check if any rates exceed warning/critical thresholds.
 
+        Args:
+            today_stats: Pre-fetched stats for today (skips the read)
+
         Returns:
             List of alert dicts with keys: stat, rate, level, message
         """
-        rates = await self.get_filter_rates(days=1)  # Check last 24h
+        rates = await self.get_filter_rates(days=1, summary=today_stats)  # Check last 24h
         alerts = []
 
         # Threshold definitions: (stat_key, warning, critical)
@@ -546,3 +670,9 @@ def get_filter_stats_service() -> FilterStatsService:
     if _service is None:
         _service = FilterStatsService()
     return _service
+
+
+async def drain_filter_stats() -> None:
+    """Flush buffered filter stat increments before the event loop closes."""
+    if _service is not None:
+        await _service.drain()
@@ -9,7 +9,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
@@ -99,6 +99,13 @@ def calculate_word_count(text: str, language: str) -> int:
         return len(text.split())
 
 
+def _cancel_pending(tasks: List[asyncio.Task]) -> None:
+    """Cancel tasks an abandoned batch iterator no longer waits for."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+
+
 class ContentSource(str, Enum):
     """Content source providers."""
 
@@ -734,43 +741,7 @@ class PlaywrightProvider(ContentProvider):
                 response.raise_for_status()
                 data = response.json()
 
-            if not data.get("success"):
-                return FetchResult(
-                    success=False,
-                    error=data.get("error", "Playwright extraction failed")[:500],
-                    source=ContentSource.PLAYWRIGHT,
-                )
-
-            full_text = (data.get("full_text") or "").strip()
-
-            # Always detect language and calculate CJK-aware word count (override playwright's detection)
-            detected_language = detect_language(full_text) if full_text else (data.get("language") or "en")
-            word_count = calculate_word_count(full_text, detected_language) if full_text else 0
-            is_partial = len(full_text) < MIN_CONTENT_LENGTH
-
-            # Apply MAX_CONTENT_LENGTH truncation for consistency with other providers
-            if len(full_text) > MAX_CONTENT_LENGTH:
-                full_text = full_text[:MAX_CONTENT_LENGTH] + "..."
-
-            elapsed = time.monotonic() - start_time
-            logger.info(
-                "Playwright fetch succeeded: url=%s, words=%d, lang=%s, elapsed=%.2fs",
-                url[:80], word_count, detected_language, elapsed,
-            )
-
-            return FetchResult(
-                success=True,
-                full_text=full_text if full_text else None,
-                authors=data.get("authors"),
-                keywords=None,
-                top_image=None,
-                language=detected_language,
-                publish_date=None,
-                is_partial=is_partial,
-                word_count=word_count,
-                source=ContentSource.PLAYWRIGHT,
-                metadata=data.get("metadata"),
-            )
+            return self._to_fetch_result(url, data, start_time)
 
         except httpx.TimeoutException:
             logger.error("Playwright service timeout for %s", url[:80])
@@ -794,6 +765,129 @@ class PlaywrightProvider(ContentProvider):
                 source=ContentSource.PLAYWRIGHT,
             )
 
+    # Must not exceed the service's MAX_BATCH_URLS
+    BATCH_MAX_URLS = 50
+
+    async def fetch_batch(
+        self, urls: List[str],
+    ) -> AsyncIterator[Tuple[str, FetchResult]]:
+        """Fetch many URLs via the service's streaming ``/extract/batch`` endpoint.
+
+        Yields ``(url, FetchResult)`` pairs in completion order, so callers
+        can start processing the first articles while the rest are still
+        rendering. Every input URL yields exactly one result: if the stream
+        breaks, URLs without a result are reported as failures.
+
+        Args:
+            urls: Article URLs (duplicates are fetched once per occurrence)
+        """
+        if not urls:
+            return
+
+        if not await self._check_availability():
+            for url in urls:
+                yield url, FetchResult(
+                    success=False,
+                    error="Playwright service not available",
+                    source=ContentSource.PLAYWRIGHT,
+                )
+            return
+
+        # Read timeout bounds the gap between streamed lines, not the batch total
+        timeout = httpx.Timeout(FETCH_TIMEOUT + 10, connect=5.0)
+
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            for offset in range(0, len(urls), self.BATCH_MAX_URLS):
+                chunk = urls[offset:offset + self.BATCH_MAX_URLS]
+                pending = set(range(len(chunk)))
+                start_time = time.monotonic()
+                error: Optional[str] = None
+
+                try:
+                    async with client.stream(
+                        "POST",
+                        f"{self.service_url}/extract/batch",
+                        json={"urls": chunk},
+                    ) as response:
+                        response.raise_for_status()
+                        async for line in response.aiter_lines():
+                            if not line.strip():
+                                continue
+                            try:
+                                data = _json.loads(line)
+                                index = int(data["index"])
+                            except (ValueError, KeyError, TypeError) as e:
+                                logger.warning("Malformed Playwright batch line: %s", e)
+                                continue
+                            if index not in pending:
+                                continue
+                            pending.discard(index)
+                            yield chunk[index], self._to_fetch_result(
+                                chunk[index], data, start_time,
+                            )
+                except httpx.TimeoutException:
+                    logger.error("Playwright batch timeout (%d urls pending)", len(pending))
+                    error = "Playwright service timeout"
+                except httpx.HTTPStatusError as e:
+                    logger.error("Playwright batch HTTP error: %s", e)
+                    error = f"Playwright service error: {e.response.status_code}"
+                except Exception as e:
+                    logger.error("Error in Playwright batch fetch: %s", e)
+                    error = str(e)[:500]
+
+                if pending:
+                    logger.warning(
+                        "Playwright batch finished with %d/%d urls missing",
+                        len(pending), len(chunk),
+                    )
+                for index in sorted(pending):
+                    yield chunk[index], FetchResult(
+                        success=False,
+                        error=error or "Missing from Playwright batch response",
+                        source=ContentSource.PLAYWRIGHT,
+                    )
+
+    @staticmethod
+    def _to_fetch_result(url: str, data: Dict[str, Any], start_time: float) -> FetchResult:
+        """Convert a service extraction payload into a FetchResult."""
+        if not data.get("success"):
+            return FetchResult(
+                success=False,
+                error=(data.get("error") or "Playwright extraction failed")[:500],
+                source=ContentSource.PLAYWRIGHT,
+            )
+
+        full_text = (data.get("full_text") or "").strip()
+
+        # Always detect language and calculate CJK-aware word count (override playwright's detection)
+        detected_language = detect_language(full_text) if full_text else (data.get("language") or "en")
+        word_count = calculate_word_count(full_text, detected_language) if full_text else 0
+        is_partial = len(full_text) < MIN_CONTENT_LENGTH
+
+        # Apply MAX_CONTENT_LENGTH truncation for consistency with other providers
+        if len(full_text) > MAX_CONTENT_LENGTH:
+            full_text = full_text[:MAX_CONTENT_LENGTH] + "..."
+
+        elapsed = time.monotonic() - start_time
+        logger.info(
+            "Playwright fetch succeeded: url=%s, words=%d, lang=%s, elapsed=%.2fs",
+            url[:80], word_count, detected_language, elapsed,
+        )
+
+        return FetchResult(
+            success=True,
+            full_text=full_text if full_text else None,
+            authors=data.get("authors"),
+            keywords=None,
+            top_image=None,
+            language=detected_language,
+            publish_date=None,
+            is_partial=is_partial,
+            word_count=word_count,
+            source=ContentSource.PLAYWRIGHT,
+            metadata=data.get("metadata"),
+        )
+
 
 class FullContentService:
     """
@@ -973,18 +1067,7 @@ class FullContentService:
             primary, url[:80], result.success, result.is_partial,
         )
 
-        # Build fallback chain dynamically based on available providers
-        fallback_chain = []
-        if ContentSource.PLAYWRIGHT in self.providers:
-            fallback_chain.append(ContentSource.PLAYWRIGHT)
-        if ContentSource.TAVILY in self.providers:
-            fallback_chain.append(ContentSource.TAVILY)
-        if ContentSource.POLYGON in self.providers:
-            fallback_chain.append(ContentSource.POLYGON)
-
-        # Remove primary from fallback chain to avoid retry
-        fallback_chain = [s for s in fallback_chain if s != primary]
-
+        fallback_chain = self._fallback_chain(primary)
         if not fallback_chain:
             logger.warning(
                 "No fallback providers configured for %s (primary=%s)",
@@ -992,10 +1075,152 @@ class FullContentService:
             )
             return result
 
+        return await self._run_fallbacks(
+            url, result, fallback_chain,
+            language=language, polygon_api_key=polygon_api_key,
+        )
+
+    async def fetch_many_with_fallback(
+        self,
+        urls: List[str],
+        primary_source: Optional[ContentSource] = None,
+        language: Optional[str] = None,
+        polygon_api_key: Optional[str] = None,
+        concurrency: int = 3,
+        delay: float = 0.0,
+    ) -> AsyncIterator[Tuple[str, FetchResult]]:
+        """
+        Batch counterpart of ``fetch_with_fallback``.
+
+        The primary source runs per URL (``concurrency`` at a time, each slot
+        pausing ``delay`` seconds between fetches). Every URL that still needs
+        a fallback is then rendered through one streamed Playwright
+        ``/extract/batch`` request, and the rest of the fallback chain runs
+        per URL as its rendered result arrives.
+
+        Args:
+            urls: Article URLs (duplicates are fetched once)
+            primary_source: Primary source to try first
+            language: Expected language
+            polygon_api_key: Polygon API key for fallback
+            concurrency: Concurrent primary fetches
+            delay: Seconds each slot waits after a primary fetch
+
+        Yields:
+            (url, FetchResult) once per distinct URL, in completion order
+        """
+        urls = list(dict.fromkeys(urls))
+        primary = primary_source or self.default_source
+        chain = self._fallback_chain(primary)
+        sem = asyncio.Semaphore(concurrency)
+
+        if not chain or chain[0] != ContentSource.PLAYWRIGHT:
+            # Nothing to batch: plain per-URL fallback
+            async def fetch_one(url: str) -> Tuple[str, FetchResult]:
+                async with sem:
+                    result = await self.fetch_with_fallback(
+                        url, primary_source=primary,
+                        language=language, polygon_api_key=polygon_api_key,
+                    )
+                    await asyncio.sleep(delay)
+                    return url, result
+
+            tasks = [asyncio.create_task(fetch_one(u)) for u in urls]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                _cancel_pending(tasks)
+            return
+
+        async def fetch_primary(url: str) -> Tuple[str, FetchResult, bool]:
+            """(url, result, done) where done means no fallback is needed."""
+            if self.is_blocked_domain(url):
+                logger.info("Blocked domain detected (batch path): %s", url)
+                return url, FetchResult(
+                    success=False,
+                    error="Domain blocked (social media or paywall)",
+                ), True
+            async with sem:
+                result = await self.fetch_content(
+                    url, source=primary, language=language,
+                    polygon_api_key=polygon_api_key,
+                )
+                await asyncio.sleep(delay)
+            return url, result, bool(
+                result.success and result.full_text and not result.is_partial
+            )
+
+        needs_render: Dict[str, FetchResult] = {}
+        tasks = [asyncio.create_task(fetch_primary(u)) for u in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                url, result, done = await next_done
+                if done:
+                    yield url, result
+                else:
+                    needs_render[url] = result
+        finally:
+            _cancel_pending(tasks)
+
+        if not needs_render:
+            return
+
+        logger.info(
+            "Rendering %d/%d urls through one Playwright batch (primary=%s)",
+            len(needs_render), len(urls), primary,
+        )
+        playwright = self.providers[ContentSource.PLAYWRIGHT]
+        async for url, rendered in playwright.fetch_batch(list(needs_render)):
+            yield url, await self._run_fallbacks(
+                url, needs_render[url], chain[1:],
+                language=language, polygon_api_key=polygon_api_key,
+                rendered=rendered,
+            )
+
+    def _fallback_chain(self, primary: ContentSource) -> List[ContentSource]:
+        """Configured fallback providers in order, excluding the primary."""
+        chain = [
+            source
+            for source in (ContentSource.PLAYWRIGHT, ContentSource.TAVILY, ContentSource.POLYGON)
+            if source in self.providers
+        ]
+        return [s for s in chain if s != primary]
+
+    async def _run_fallbacks(
+        self,
+        url: str,
+        result: FetchResult,
+        chain: List[ContentSource],
+        language: Optional[str] = None,
+        polygon_api_key: Optional[str] = None,
+        rendered: Optional[FetchResult] = None,
+    ) -> FetchResult:
+        """
+        Try ``chain`` after the primary ``result`` fell short.
+
+        Args:
+            url: Article URL
+            result: Primary source result (returned if everything fails)
+            chain: Fallback sources still to try
+            language: Expected language
+            polygon_api_key: Polygon API key for fallback
+            rendered: Playwright result already fetched in a batch
+
+        Returns:
+            First full result, else the longest partial one, else ``result``
+        """
         # Track best partial result by word count
         best_result = result if (result.success and result.full_text) else None
 
-        for fallback_source in fallback_chain:
+        if rendered is not None:
+            if rendered.success and rendered.full_text:
+                if not rendered.is_partial:
+                    return rendered
+                if best_result is None or rendered.word_count > best_result.word_count:
+                    best_result = rendered
+
+        for fallback_source in chain:
             logger.info("Trying fallback provider: %s for %s", fallback_source, url[:80])
 
             fallback_result = await self.fetch_content(
@@ -1,21 +1,41 @@
 """Technical indicator computation service.
 
 Computes time-series technical indicators (SMA, EMA, RSI, MACD, Bollinger Bands)
-from OHLCV bar data using the `ta` library.
+from OHLCV bar data. The formulas reproduce the `ta` library's defaults
+(``fillna=False``): SMA/Bollinger use full rolling windows (population std),
+EMA/MACD use ``ewm(span, adjust=False)`` and RSI uses Wilder smoothing
+(``ewm(alpha=1/window, adjust=False)``).
+
+Indicators are computed by streaming bars through O(1) rolling calculators
+(running sums, EMA values, RSI averages). ``IndicatorEngine`` keeps that
+state per (symbol, interval, params) next to the output columns, so a chart
+refresh that only adds bars, or revises the still-forming last bar, costs
+O(new bars) instead of a full recomputation. Output columns are float
+arrays serialized with numpy masks.
 """
 
+import bisect
+import copy
 import logging
+import math
+import threading
 import time
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import ta.momentum
-import ta.trend
-import ta.volatility
 
 logger = logging.getLogger(__name__)
 
+# Cached indicator states (one per symbol/interval/params/window start)
+_ENGINE_MAX_ENTRIES = 128
+
+_NAN = float("nan")
+
 
 def _format_time(value: Any, intraday: bool = False) -> str:
     """Format a time value for indicator data points.
@@ -41,224 +61,494 @@ def _format_time(value: Any, intraday: bool = False) -> str:
     return s
 
 
-def _series_to_points(
-    dates: pd.Index,
-    values: pd.Series,
-    intraday: bool = False,
-) -> List[Dict[str, Any]]:
-    """Convert a pandas Series to a list of {time, value} dicts.
 
-    Drops NaN values and rounds to 4 decimal places.
-    """
-    points: List[Dict[str, Any]] = []
-    for date, val in zip(dates, values):
-        if pd.notna(val):
-            points.append({
-                "time": _format_time(date, intraday=intraday),
-                "value": round(float(val), 4),
-            })
-    return points
+# ---------------------------------------------------------------------------
+# Rolling calculators
+# ---------------------------------------------------------------------------
 
 
-def compute_indicator_series(
-    bars: List[Dict[str, Any]],
-    indicator_types: List[str],
-    ma_periods: Optional[List[int]] = None,
-    rsi_period: int = 14,
-    macd_fast: int = 12,
-    macd_slow: int = 26,
-    macd_signal: int = 9,
-    bb_period: int = 20,
-    bb_std: float = 2.0,
-    intraday: bool = False,
-) -> Dict[str, Any]:
-    """Compute technical indicator series from OHLCV bars.
+class _Ema:
+    """Recursive EMA, equivalent to ``ewm(alpha, adjust=False).mean()``."""
 
-    Args:
-        bars: List of bar dicts with keys: date, open, high, low, close, volume.
-        indicator_types: Which indicators to compute. Valid values:
-            "sma", "ema", "rsi", "macd", "bb".
-        ma_periods: Periods for SMA/EMA moving averages. Defaults to [20, 50, 200].
-        rsi_period: Period for RSI. Defaults to 14.
-        macd_fast: Fast EMA period for MACD. Defaults to 12.
-        macd_slow: Slow EMA period for MACD. Defaults to 26.
-        macd_signal: Signal line period for MACD. Defaults to 9.
-        bb_period: Period for Bollinger Bands. Defaults to 20.
-        bb_std: Standard deviation multiplier for Bollinger Bands. Defaults to 2.0.
+    __slots__ = ("alpha", "min_periods", "value", "count")
 
-    Returns:
-        Dictionary with indicator keys mapped to series data and a "warnings" list.
-    """
-    if ma_periods is None:
-        ma_periods = [20, 50, 200]
+    def __init__(self, alpha: float, min_periods: int) -> None:
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.value = _NAN
+        self.count = 0
 
-    start_time = time.monotonic()
-    result: Dict[str, Any] = {}
-    warnings: List[str] = []
-    num_bars = len(bars)
+    def update(self, x: float) -> float:
+        """Add an observation; returns the EMA or NaN before warm-up."""
+        if self.count == 0:
+            self.value = x
+        else:
+            self.value = (1.0 - self.alpha) * self.value + self.alpha * x
+        self.count += 1
+        return self.value if self.count >= self.min_periods else _NAN
 
-    logger.info(
-        "Computing indicators %s for %d bars (ma_periods=%s)",
-        indicator_types, num_bars, ma_periods,
-    )
 
-    if num_bars < 2:
-        warnings.append(f"Insufficient data: only {num_bars} bar(s) provided")
-        result["warnings"] = warnings
-        return result
+class _RollingWindow:
+    """Fixed-size window with O(1) mean and population std (Welford)."""
+
+    __slots__ = ("window", "values", "mean", "m2")
 
-    # Build DataFrame from bars — validate required columns
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.values: Deque[float] = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, x: float) -> bool:
+        """Add an observation; returns True once the window is full."""
+        if len(self.values) < self.window:
+            self.values.append(x)
+            delta = x - self.mean
+            self.mean += delta / len(self.values)
+            self.m2 += delta * (x - self.mean)
+        else:
+            old = self.values.popleft()
+            self.values.append(x)
+            old_mean = self.mean
+            self.mean += (x - old) / self.window
+            self.m2 += (x - old) * (x - self.mean + old - old_mean)
+        return len(self.values) == self.window
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(max(self.m2, 0.0) / self.window)
+
+
+class _Rsi:
+    """Wilder RSI from smoothed gains/losses."""
+
+    __slots__ = ("prev", "up", "down")
+
+    def __init__(self, window: int) -> None:
+        self.prev: Optional[float] = None
+        # The first bar has no change; ta counts it as a zero gain/loss
+        self.up = _Ema(1.0 / window, window)
+        self.down = _Ema(1.0 / window, window)
+
+    def update(self, x: float) -> float:
+        diff = 0.0 if self.prev is None else x - self.prev
+        self.prev = x
+        up = self.up.update(diff if diff > 0 else 0.0)
+        down = self.down.update(-diff if diff < 0 else 0.0)
+        if math.isnan(down):
+            return _NAN
+        if down == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + up / down)
+
+
+@dataclass(frozen=True)
+class IndicatorParams:
+    """Indicator selection and parameters (part of the engine cache key)."""
+
+    indicator_types: Tuple[str, ...]
+    ma_periods: Tuple[int, ...] = (20, 50, 200)
+    rsi_period: int = 14
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    bb_period: int = 20
+    bb_std: float = 2.0
+
+    def has(self, indicator_type: str) -> bool:
+        return indicator_type in self.indicator_types
+
+
+class _Calculators:
+    """Rolling state for one parameter set; ``step`` emits one output row."""
+
+    def __init__(self, params: IndicatorParams) -> None:
+        self.params = params
+        self.sma = {p: _RollingWindow(p) for p in params.ma_periods} if params.has("sma") else {}
+        self.ema = {p: _Ema(2.0 / (p + 1), p) for p in params.ma_periods} if params.has("ema") else {}
+        self.rsi = _Rsi(params.rsi_period) if params.has("rsi") else None
+        if params.has("macd"):
+            self.macd_fast = _Ema(2.0 / (params.macd_fast + 1), params.macd_fast)
+            self.macd_slow = _Ema(2.0 / (params.macd_slow + 1), params.macd_slow)
+            self.macd_sig = _Ema(2.0 / (params.macd_signal + 1), params.macd_signal)
+        self.bb = _RollingWindow(params.bb_period) if params.has("bb") else None
+
+    def columns(self) -> List[str]:
+        cols = [f"sma_{p}" for p in self.sma] + [f"ema_{p}" for p in self.ema]
+        if self.rsi is not None:
+            cols.append("rsi")
+        if self.params.has("macd"):
+            cols += ["macd_line", "signal_line", "histogram"]
+        if self.bb is not None:
+            cols += ["bb_upper", "bb_middle", "bb_lower"]
+        return cols
+
+    def step(self, close: float) -> List[float]:
+        """Advance every calculator by one close (NaN closes are skipped)."""
+        if math.isnan(close):
+            return [_NAN] * len(self.columns())
+
+        row: List[float] = []
+        for window in self.sma.values():
+            row.append(window.mean if window.update(close) else _NAN)
+        for ema in self.ema.values():
+            row.append(ema.update(close))
+        if self.rsi is not None:
+            row.append(self.rsi.update(close))
+        if self.params.has("macd"):
+            fast = self.macd_fast.update(close)
+            slow = self.macd_slow.update(close)
+            macd = fast - slow
+            if math.isnan(macd):
+                row += [_NAN, _NAN, _NAN]
+            else:
+                signal = self.macd_sig.update(macd)
+                row += [macd, signal, macd - signal]
+        if self.bb is not None:
+            if self.bb.update(close):
+                mid = self.bb.mean
+                band = self.params.bb_std * self.bb.std
+                row += [mid + band, mid, mid - band]
+            else:
+                row += [_NAN, _NAN, _NAN]
+        return row
+
+
+# ---------------------------------------------------------------------------
+# Indicator state (calculators + output columns)
+# ---------------------------------------------------------------------------
+
+
+def _bar_close(bar: Dict[str, Any]) -> float:
+    value = bar.get("close")
     try:
-        df = pd.DataFrame(bars)
-        if "close" not in df.columns or "date" not in df.columns:
-            warnings.append("Bar data missing required 'close' or 'date' columns")
-            result["warnings"] = warnings
-            return result
-        close = df["close"].astype(float)
-        dates = df["date"]
-    except (KeyError, ValueError, TypeError) as e:
-        logger.error("Invalid bar data structure: %s", e)
-        warnings.append(f"Invalid bar data: {e}")
-        result["warnings"] = warnings
-        return result
+        return _NAN if value is None else float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _bar_key(bar: Dict[str, Any]) -> Tuple[str, float]:
+    return str(bar.get("date")), _bar_close(bar)
+
+
+def _same_bar(a: Tuple[str, float], b: Tuple[str, float]) -> bool:
+    return a[0] == b[0] and (a[1] == b[1] or (math.isnan(a[1]) and math.isnan(b[1])))
+
+
+class IndicatorState:
+    """Indicator outputs for a bar sequence plus the state to extend it.
+
+    The last bar is kept provisional: calculators are committed through the
+    second-to-last bar, so a revised last bar (a still-forming daily or
+    intraday candle) only replays that bar.
+    """
+
+    def __init__(self, params: IndicatorParams, intraday: bool) -> None:
+        self.params = params
+        self.intraday = intraday
+        self._calc = _Calculators(params)
+        self.column_names = self._calc.columns()
+        self.columns: Dict[str, array] = {name: array("d") for name in self.column_names}
+        self.times: List[str] = []
+        self._norm_times: List[str] = []
+        self._keys: List[Tuple[str, float]] = []
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def _append(self, bar: Dict[str, Any], calc: _Calculators) -> None:
+        key = _bar_key(bar)
+        for name, value in zip(self.column_names, calc.step(key[1])):
+            self.columns[name].append(value)
+        t = _format_time(bar.get("date"), intraday=self.intraday)
+        self.times.append(t)
+        self._norm_times.append(t.replace("T", " "))
+        self._keys.append(key)
+
+    def _truncate(self, n: int) -> None:
+        for col in self.columns.values():
+            del col[n:]
+        del self.times[n:]
+        del self._norm_times[n:]
+        del self._keys[n:]
+
+    def extends(self, bars: List[Dict[str, Any]]) -> bool:
+        """True if ``bars`` continue this state's committed prefix."""
+        committed = len(self._keys) - 1
+        if committed < 1 or len(bars) < committed + 1:
+            return False
+        return (
+            _same_bar(_bar_key(bars[0]), self._keys[0])
+            and _same_bar(_bar_key(bars[committed - 1]), self._keys[committed - 1])
+        )
 
-    # SMA
-    if "sma" in indicator_types:
-        for period in ma_periods:
-            key = f"sma_{period}"
+    def update(self, bars: List[Dict[str, Any]]) -> int:
+        """Bring the state in line with ``bars``. Returns bars processed.
+
+        Callers must check ``extends`` first (or use a fresh state).
+        """
+        n = len(bars)
+        if n == len(self._keys) and n and _same_bar(_bar_key(bars[-1]), self._keys[-1]):
+            return 0
+
+        committed = max(len(self._keys) - 1, 0)
+        self._truncate(committed)
+        for bar in bars[committed:n - 1]:
+            self._append(bar, self._calc)
+        if n:
+            self._append(bars[n - 1], copy.deepcopy(self._calc))
+        return n - committed
+
+    # -- serialization ------------------------------------------------------
+
+    def start_index(self, since: Optional[str]) -> int:
+        """Index of the first bar at or after ``since`` (times are sorted)."""
+        if not since:
+            return 0
+        return bisect.bisect_left(self._norm_times, since.replace("T", " "))
+
+    def has_values(self, name: str) -> bool:
+        return bool(np.any(~np.isnan(np.array(self.columns[name], dtype=np.float64))))
+
+    def points(self, name: str, start: int = 0) -> List[Dict[str, Any]]:
+        """``{time, value}`` points for a column from ``start``, NaNs dropped."""
+        values = np.array(self.columns[name], dtype=np.float64)[start:]
+        idx = np.flatnonzero(~np.isnan(values))
+        times = self.times
+        return [
+            {"time": times[start + i], "value": round(v, 4)}
+            for i, v in zip(idx.tolist(), values[idx].tolist())
+        ]
+
+
+def build_indicator_result(
+    state: IndicatorState,
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Serialize a state into the ``compute_indicator_series`` result shape.
+
+    Args:
+        state: Indicator state covering the full bar sequence.
+        since: Optional cutoff; points before it are omitted. Warnings still
+            reflect the full sequence.
+    """
+    params = state.params
+    result: Dict[str, Any] = {}
+    warnings: List[str] = []
+    num_bars = len(state)
+    start = state.start_index(since)
+
+    # SMA / EMA
+    for ma_type, label in (("sma", "SMA"), ("ema", "EMA")):
+        if not params.has(ma_type):
+            continue
+        for period in params.ma_periods:
+            key = f"{ma_type}_{period}"
             if num_bars < period:
                 warnings.append(
-                    f"SMA {period} needs {period} bars, only have {num_bars}"
+                    f"{label} {period} needs {period} bars, only have {num_bars}"
                 )
                 continue
-            try:
-                indicator = ta.trend.SMAIndicator(close=close, window=period)
-                series = indicator.sma_indicator()
-                points = _series_to_points(dates, series, intraday=intraday)
-                if points:
-                    result[key] = {
-                        "series": points,
-                        "metadata": {"period": period, "type": "sma"},
-                    }
-                else:
-                    warnings.append(f"SMA {period} produced no valid data points")
-            except Exception as e:
-                logger.error("Error computing SMA %d: %s", period, e)
-                warnings.append(f"SMA {period} computation failed: {e}")
-
-    # EMA
-    if "ema" in indicator_types:
-        for period in ma_periods:
-            key = f"ema_{period}"
-            if num_bars < period:
-                warnings.append(
-                    f"EMA {period} needs {period} bars, only have {num_bars}"
-                )
+            if not state.has_values(key):
+                warnings.append(f"{label} {period} produced no valid data points")
                 continue
-            try:
-                indicator = ta.trend.EMAIndicator(close=close, window=period)
-                series = indicator.ema_indicator()
-                points = _series_to_points(dates, series, intraday=intraday)
-                if points:
-                    result[key] = {
-                        "series": points,
-                        "metadata": {"period": period, "type": "ema"},
-                    }
-                else:
-                    warnings.append(f"EMA {period} produced no valid data points")
-            except Exception as e:
-                logger.error("Error computing EMA %d: %s", period, e)
-                warnings.append(f"EMA {period} computation failed: {e}")
+            result[key] = {
+                "series": state.points(key, start),
+                "metadata": {"period": period, "type": ma_type},
+            }
 
     # RSI
-    if "rsi" in indicator_types:
-        if num_bars < rsi_period + 1:
+    if params.has("rsi"):
+        if num_bars < params.rsi_period + 1:
             warnings.append(
-                f"RSI {rsi_period} needs at least {rsi_period + 1} bars, "
+                f"RSI {params.rsi_period} needs at least {params.rsi_period + 1} bars, "
                 f"only have {num_bars}"
             )
+        elif not state.has_values("rsi"):
+            warnings.append("RSI produced no valid data points")
         else:
-            try:
-                indicator = ta.momentum.RSIIndicator(close=close, window=rsi_period)
-                series = indicator.rsi()
-                points = _series_to_points(dates, series, intraday=intraday)
-                if points:
-                    result["rsi"] = {
-                        "series": points,
-                        "metadata": {"period": rsi_period},
-                    }
-                else:
-                    warnings.append("RSI produced no valid data points")
-            except Exception as e:
-                logger.error("Error computing RSI: %s", e)
-                warnings.append(f"RSI computation failed: {e}")
+            result["rsi"] = {
+                "series": state.points("rsi", start),
+                "metadata": {"period": params.rsi_period},
+            }
 
     # MACD
-    if "macd" in indicator_types:
-        min_bars_needed = macd_slow + macd_signal
+    if params.has("macd"):
+        min_bars_needed = params.macd_slow + params.macd_signal
         if num_bars < min_bars_needed:
             warnings.append(
                 f"MACD needs at least {min_bars_needed} bars, only have {num_bars}"
             )
         else:
-            try:
-                indicator = ta.trend.MACD(
-                    close=close,
-                    window_slow=macd_slow,
-                    window_fast=macd_fast,
-                    window_sign=macd_signal,
-                )
-                macd_line = indicator.macd()
-                signal_line = indicator.macd_signal()
-                histogram = indicator.macd_diff()
-                result["macd"] = {
-                    "macd_line": _series_to_points(dates, macd_line, intraday=intraday),
-                    "signal_line": _series_to_points(dates, signal_line, intraday=intraday),
-                    "histogram": _series_to_points(dates, histogram, intraday=intraday),
-                    "metadata": {
-                        "fast": macd_fast,
-                        "slow": macd_slow,
-                        "signal": macd_signal,
-                    },
-                }
-            except Exception as e:
-                logger.error("Error computing MACD: %s", e)
-                warnings.append(f"MACD computation failed: {e}")
+            result["macd"] = {
+                "macd_line": state.points("macd_line", start),
+                "signal_line": state.points("signal_line", start),
+                "histogram": state.points("histogram", start),
+                "metadata": {
+                    "fast": params.macd_fast,
+                    "slow": params.macd_slow,
+                    "signal": params.macd_signal,
+                },
+            }
 
     # Bollinger Bands
-    if "bb" in indicator_types:
-        if num_bars < bb_period:
+    if params.has("bb"):
+        if num_bars < params.bb_period:
             warnings.append(
-                f"Bollinger Bands need {bb_period} bars, only have {num_bars}"
+                f"Bollinger Bands need {params.bb_period} bars, only have {num_bars}"
             )
         else:
-            try:
-                indicator = ta.volatility.BollingerBands(
-                    close=close,
-                    window=bb_period,
-                    window_dev=bb_std,
-                )
-                upper = indicator.bollinger_hband()
-                middle = indicator.bollinger_mavg()
-                lower = indicator.bollinger_lband()
-                result["bb"] = {
-                    "upper": _series_to_points(dates, upper, intraday=intraday),
-                    "middle": _series_to_points(dates, middle, intraday=intraday),
-                    "lower": _series_to_points(dates, lower, intraday=intraday),
-                    "metadata": {"period": bb_period, "std_dev": bb_std},
-                }
-            except Exception as e:
-                logger.error("Error computing Bollinger Bands: %s", e)
-                warnings.append(f"Bollinger Bands computation failed: {e}")
+            result["bb"] = {
+                "upper": state.points("bb_upper", start),
+                "middle": state.points("bb_middle", start),
+                "lower": state.points("bb_lower", start),
+                "metadata": {"period": params.bb_period, "std_dev": params.bb_std},
+            }
 
     result["warnings"] = warnings
+    return result
 
-    elapsed_ms = (time.monotonic() - start_time) * 1000
-    logger.info(
-        "Indicator computation completed in %.1fms: %d indicators, %d warnings",
-        elapsed_ms,
-        len([k for k in result if k != "warnings"]),
-        len(warnings),
-    )
 
-    return result
+def _validate_bars(bars: List[Dict[str, Any]]) -> Optional[str]:
+    """Return a warning if bars cannot be used for indicator computation."""
+    if len(bars) < 2:
+        return f"Insufficient data: only {len(bars)} bar(s) provided"
+    first = bars[0]
+    if not isinstance(first, dict) or "close" not in first or "date" not in first:
+        return "Bar data missing required 'close' or 'date' columns"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Engine (cached states)
+# ---------------------------------------------------------------------------
+
+
+class IndicatorEngine:
+    """LRU cache of indicator states keyed by symbol, interval and params.
+
+    EMA/RSI values depend on where the bar sequence starts, so a cached
+    state is only reused when the new bars share its first bar; otherwise
+    it is rebuilt. Safe to call from worker threads (``asyncio.to_thread``).
+    """
+
+    def __init__(self, max_entries: int = _ENGINE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._states: "OrderedDict[Tuple, IndicatorState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.rebuilds = 0
+
+    def compute(
+        self,
+        symbol: str,
+        interval: str,
+        bars: List[Dict[str, Any]],
+        params: IndicatorParams,
+        intraday: bool = False,
+        since: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Indicator series for ``bars`` (same shape as ``compute_indicator_series``)."""
+        invalid = _validate_bars(bars)
+        if invalid:
+            return {"warnings": [invalid]}
+
+        start_time = time.monotonic()
+        key = (symbol.upper(), interval, params, intraday)
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                self._states.move_to_end(key)
+
+        result: Optional[Dict[str, Any]] = None
+        if state is not None:
+            with state.lock:
+                if state.extends(bars):
+                    processed = state.update(bars)
+                    result = build_indicator_result(state, since=since)
+                    self.hits += 1
+
+        if result is None:
+            state = IndicatorState(params, intraday)
+            processed = state.update(bars)
+            result = build_indicator_result(state, since=since)
+            self.rebuilds += 1
+            with self._lock:
+                self._states[key] = state
+                self._states.move_to_end(key)
+                while len(self._states) > self.max_entries:
+                    self._states.popitem(last=False)
+
+        logger.info(
+            "Indicators %s %s: %d bars (%d processed) in %.1fms",
+            symbol, interval, len(bars), processed,
+            (time.monotonic() - start_time) * 1000,
+        )
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._states), "hits": self.hits, "rebuilds": self.rebuilds}
+
+
+# Singleton instance
+_engine: Optional[IndicatorEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_indicator_engine() -> IndicatorEngine:
+    """Get singleton instance of IndicatorEngine."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = IndicatorEngine()
+    return _engine
+
+
+def compute_indicator_series(
+    bars: List[Dict[str, Any]],
+    indicator_types: List[str],
+    ma_periods: Optional[List[int]] = None,
+    rsi_period: int = 14,
+    macd_fast: int = 12,
+    macd_slow: int = 26,
+    macd_signal: int = 9,
+    bb_period: int = 20,
+    bb_std: float = 2.0,
+    intraday: bool = False,
+) -> Dict[str, Any]:
+    """Compute technical indicator series from OHLCV bars (uncached).
+
+    Args:
+        bars: List of bar dicts with keys: date, open, high, low, close, volume.
+        indicator_types: Which indicators to compute. Valid values:
+            "sma", "ema", "rsi", "macd", "bb".
+        ma_periods: Periods for SMA/EMA moving averages. Defaults to [20, 50, 200].
+        rsi_period: Period for RSI. Defaults to 14.
+        macd_fast: Fast EMA period for MACD. Defaults to 12.
+        macd_slow: Slow EMA period for MACD. Defaults to 26.
+        macd_signal: Signal line period for MACD. Defaults to 9.
+        bb_period: Period for Bollinger Bands. Defaults to 20.
+        bb_std: Standard deviation multiplier for Bollinger Bands. Defaults to 2.0.
+
+    Returns:
+        Dictionary with indicator keys mapped to series data and a "warnings" list.
+    """
+    invalid = _validate_bars(bars)
+    if invalid:
+        return {"warnings": [invalid]}
+
+    params = IndicatorParams(
+        indicator_types=tuple(sorted(set(indicator_types))),
+        ma_periods=tuple(ma_periods if ma_periods is not None else (20, 50, 200)),
+        rsi_period=rsi_period,
+        macd_fast=macd_fast,
+        macd_slow=macd_slow,
+        macd_signal=macd_signal,
+        bb_period=bb_period,
+        bb_std=bb_std,
+    )
+    state = IndicatorState(params, intraday)
+    state.update(bars)
+    return build_indicator_result(state)
@@ -21,6 +21,14 @@ Prompt cache strategy:
 
 Agents 2 and 3 hit the prompt cache on the shared SYSTEM+batch prefix,
 reducing token costs by ~60-70% for the duplicated input.
+
+Batching:
+    Articles are packed into batches by estimated prompt tokens rather than
+    a fixed count, so short headlines share one call while long summaries
+    cannot overflow the context or truncate the JSON output. The first
+    batch runs alone to populate the cached SYSTEM prefix; the remaining
+    batches are dispatched concurrently, bounded by
+    ``_MAX_CONCURRENT_BATCHES`` and the background LLM rate limiter.
 """
 
 import asyncio
@@ -50,6 +58,25 @@ _MAX_TEXT_LENGTH = 3000
 # Default score assigned to an agent on failure (fail-open).
 _DEFAULT_AGENT_SCORE = 50
 
+# Token budget for the article block of one batch prompt (excludes the
+# ~800-token SYSTEM prompt). Estimated with ``_estimate_tokens``.
+_BATCH_TOKEN_BUDGET = 6000
+
+# Output tokens reserved per article for the JSON response.
+_OUTPUT_TOKENS_PER_ARTICLE = 80
+
+# Default cap on articles per batch (the token budget usually binds first).
+_DEFAULT_MAX_BATCH_ARTICLES = 40
+
+# Batches scored concurrently after the cache warm-up batch.
+_MAX_CONCURRENT_BATCHES = 3
+
+# Max seconds a batch waits on the background rate limiter before
+# proceeding anyway (scoring is fail-open, never blocked indefinitely).
+_RATE_LIMIT_WAIT_SECONDS = 30.0
+
+_CJK_CHAR_RE = re.compile(r"[\u3000-\u9fff\uac00-\ud7af\uff00-\uffef]")
+
 # Default routing thresholds (overridden by system_settings when available).
 _DEFAULT_DISCARD_THRESHOLD = 105
 _DEFAULT_FULL_ANALYSIS_THRESHOLD = 195
@@ -195,6 +222,54 @@ def _extract_json(text: str) -> Dict[str, Any]:
         return {}
 
 
+def _estimate_tokens(text: str) -> int:
+    """Rough token estimate: ~1 token per CJK char, ~4 chars per token otherwise."""
+    if not text:
+        return 0
+    cjk = len(_CJK_CHAR_RE.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def _plan_batches(
+    articles: List[Dict[str, str]],
+    token_budget: int = _BATCH_TOKEN_BUDGET,
+    max_articles: int = _DEFAULT_MAX_BATCH_ARTICLES,
+) -> List[Tuple[List[int], int]]:
+    """Greedily pack articles (in input order) into token-bounded batches.
+
+    An article larger than the whole budget gets a batch of its own.
+
+    Args:
+        articles: Articles with ``title`` and ``text`` keys.
+        token_budget: Max estimated tokens of formatted article text per batch.
+        max_articles: Max articles per batch.
+
+    Returns:
+        List of (article indices, estimated tokens) per batch.
+    """
+    batches: List[Tuple[List[int], int]] = []
+    current: List[int] = []
+    current_tokens = 0
+
+    for idx, article in enumerate(articles):
+        title = (article.get("title") or "")[:200]
+        text = (article.get("text") or "")[:_MAX_TEXT_LENGTH]
+        # +8 for the "[n] " marker and separators
+        tokens = _estimate_tokens(title) + _estimate_tokens(text) + 8
+
+        if current and (
+            current_tokens + tokens > token_budget or len(current) >= max_articles
+        ):
+            batches.append((current, current_tokens))
+            current, current_tokens = [], 0
+        current.append(idx)
+        current_tokens += tokens
+
+    if current:
+        batches.append((current, current_tokens))
+    return batches
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -305,7 +380,7 @@ class Layer1ScoringService:
         base_messages: List[Message],
         model_config,
         batch_size: int,
-    ) -> Tuple[str, Dict[str, Any], str]:
+    ) -> Tuple[str, Dict[str, Any], str, Dict[str, int]]:
         """Run a single scoring agent against the shared batch.
 
         Args:
@@ -315,8 +390,8 @@ class Layer1ScoringService:
             batch_size: Number of articles in the batch (for validation).
 
         Returns:
-            Tuple of (agent_name, parsed JSON dict, raw response text).
-            On LLM or parse error, the dict is empty.
+            Tuple of (agent_name, parsed JSON dict, raw response text,
+            token usage dict). On LLM or parse error, the dict is empty.
         """
         agent_prompt = _AGENT_PROMPTS[agent_name]
 
@@ -330,7 +405,7 @@ class Layer1ScoringService:
             messages=messages,
             response_format={"type": "json_object"},
             temperature=0.2,
-            max_tokens=max(2000, batch_size * 80),
+            max_tokens=max(2000, batch_size * _OUTPUT_TOKENS_PER_ARTICLE),
             timeout=60,
         )
 
@@ -346,8 +421,13 @@ class Layer1ScoringService:
             )
             elapsed_ms = (time.monotonic() - t0) * 1000
 
+            usage: Dict[str, int] = {}
             # Track token usage (non-fatal)
             if response.usage:
+                usage = {
+                    "input": response.usage.prompt_tokens or 0,
+                    "output": response.usage.completion_tokens or 0,
+                }
                 try:
                     from app.services.filter_stats_service import get_filter_stats_service
 
@@ -372,7 +452,7 @@ class Layer1ScoringService:
                 agent_name, elapsed_ms, batch_size, len(parsed),
             )
 
-            return agent_name, parsed, raw
+            return agent_name, parsed, raw, usage
 
         except Exception as e:
             elapsed_ms = (time.monotonic() - t0) * 1000
@@ -380,7 +460,7 @@ class Layer1ScoringService:
                 "[Layer1/%s] LLM call failed (%.0fms): %s",
                 agent_name, elapsed_ms, e,
             )
-            return agent_name, {}, ""
+            return agent_name, {}, "", {}
 
     # ------------------------------------------------------------------
     # Score extraction & validation
@@ -457,24 +537,49 @@ class Layer1ScoringService:
         except Exception:
             logger.debug("Layer1 routing stats tracking failed", exc_info=True)
 
+    # ------------------------------------------------------------------
+    # Rate limiting
+    # ------------------------------------------------------------------
+
+    async def _acquire_rate_limit(self) -> None:
+        """Take one background rate-limit token per batch (non-fatal).
+
+        A batch is one logical request (its 3 agent calls share a cached
+        prefix). Waits up to ``_RATE_LIMIT_WAIT_SECONDS``; scoring proceeds
+        after that (or on Redis errors) since Layer 1 is fail-open.
+        """
+        try:
+            from app.core.token_bucket import get_background_rate_limiter
+
+            rate_limiter = await get_background_rate_limiter()
+            acquired = await rate_limiter.wait_and_acquire(
+                timeout=_RATE_LIMIT_WAIT_SECONDS,
+            )
+            if not acquired:
+                logger.warning("[Layer1] Background rate limit wait timed out, proceeding")
+        except Exception:
+            logger.debug("[Layer1] Rate limiter unavailable", exc_info=True)
+
     # ------------------------------------------------------------------
     # Single-batch scoring
     # ------------------------------------------------------------------
 
     async def _score_batch(
         self,
-        db: AsyncSession,
+        model_config,
         articles: List[Dict[str, str]],
         discard_threshold: int,
         full_analysis_threshold: int,
+        estimated_tokens: int = 0,
     ) -> List[Layer1ScoringResult]:
         """Score a single batch of articles with 3 concurrent agents.
 
         Args:
-            db: Database session for model config resolution.
+            model_config: Resolved model configuration (shared by all batches).
             articles: Batch of articles (each has ``url``, ``title``, ``text``).
             discard_threshold: Score below which articles are discarded.
             full_analysis_threshold: Score at or above which articles get full analysis.
+            estimated_tokens: Planner's token estimate, logged against actual usage.
 
         Returns:
             List of ``Layer1ScoringResult``, one per article (in input order).
@@ -499,6 +604,7 @@ class Layer1ScoringService:
         # --- 2. Build shared messages for non-critical articles ---
         agent_results_map: Dict[str, Dict[str, Any]] = {}
         agent_raw_map: Dict[str, str] = {}
+        input_tokens = output_tokens = 0
 
         if non_critical_indices:
             # Only include non-critical articles in the LLM batch to save tokens.
@@ -519,10 +625,7 @@ class Layer1ScoringService:
                 ),
             ]
 
-            # --- 3. Resolve model ---
-            model_config = await self._resolve_model(db)
-
-            # --- 4. Run 3 agents concurrently ---
+            # --- 3. Run 3 agents concurrently ---
             tasks = [
                 self._run_agent(name, base_messages, model_config, len(batch_articles))
                 for name in self.AGENT_NAMES
@@ -533,11 +636,13 @@ class Layer1ScoringService:
                 if isinstance(item, Exception):
                     logger.error("[Layer1] Agent task raised exception: %s", item)
                     continue
-                agent_name, parsed, raw = item
+                agent_name, parsed, raw, usage = item
                 agent_results_map[agent_name] = parsed
                 agent_raw_map[agent_name] = raw
+                input_tokens += usage.get("input", 0)
+                output_tokens += usage.get("output", 0)
 
-        # --- 5. Assemble per-article results ---
+        # --- 4. Assemble per-article results ---
         results: List[Layer1ScoringResult] = []
 
         # Mapping: for non-critical articles, their position in the LLM batch
@@ -617,9 +722,11 @@ class Layer1ScoringService:
 
         logger.info(
             "[Layer1] Batch scored %d articles (%.0fms): "
-            "critical=%d, routing=%s, thresholds=(%d/%d)",
+            "critical=%d, routing=%s, thresholds=(%d/%d), "
+            "tokens(est=%d, in=%d, out=%d)",
             batch_size, elapsed_ms, critical_count, routing_counts,
             discard_threshold, full_analysis_threshold,
+            estimated_tokens, input_tokens, output_tokens,
         )
 
         return results
@@ -632,13 +739,15 @@ class Layer1ScoringService:
         self,
         db: AsyncSession,
         articles: List[Dict[str, str]],
-        batch_size: int = 20,
+        batch_size: int = _DEFAULT_MAX_BATCH_ARTICLES,
     ) -> List[Layer1ScoringResult]:
         """Score a list of articles and determine routing decisions.
 
         This is the main entry point for Layer 1 scoring.  Articles are
-        processed in batches of ``batch_size`` to keep LLM context windows
-        manageable.
+        packed into batches of at most ``_BATCH_TOKEN_BUDGET`` estimated
+        prompt tokens and ``batch_size`` articles.  The first batch warms
+        the prompt cache; the rest run concurrently under the background
+        rate limiter.
 
         On service-level failure (e.g., unable to resolve model config),
         all articles default to ``"lightweight"`` routing (fail-open).
@@ -651,7 +760,7 @@ class Layer1ScoringService:
                 - ``text``: Article summary or full text (will be truncated
                   to ``_MAX_TEXT_LENGTH`` characters per article).
             batch_size: Maximum number of articles per LLM call.
-                Defaults to 20.
+                Defaults to 40; the token budget usually binds first.
 
         Returns:
             List of ``Layer1ScoringResult`` in the same order as the input
@@ -666,23 +775,44 @@ class Layer1ScoringService:
             # Read thresholds once for the entire scoring run.
             discard_threshold, full_analysis_threshold = await self._get_thresholds(db)
 
-            all_results: List[Layer1ScoringResult] = []
+            # Resolve once: batches run concurrently and must not share
+            # the session.
+            model_config = await self._resolve_model(db)
+
+            plan = _plan_batches(articles, max_articles=batch_size)
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_BATCHES)
+
+            async def score_planned(
+                indices: List[int], est_tokens: int,
+            ) -> List[Layer1ScoringResult]:
+                async with semaphore:
+                    await self._acquire_rate_limit()
+                    return await self._score_batch(
+                        model_config,
+                        [articles[i] for i in indices],
+                        discard_threshold,
+                        full_analysis_threshold,
+                        estimated_tokens=est_tokens,
+                    )
 
-            # Process in batches
-            for i in range(0, len(articles), batch_size):
-                batch = articles[i : i + batch_size]
-                batch_results = await self._score_batch(
-                    db, batch, discard_threshold, full_analysis_threshold,
-                )
-                all_results.extend(batch_results)
+            # Warm-up batch first so the SYSTEM prefix is cached for the rest
+            batch_results = [await score_planned(*plan[0])]
+            batch_results.extend(
+                await asyncio.gather(*[score_planned(*p) for p in plan[1:]])
+            )
+
+            all_results: List[Layer1ScoringResult] = [
+                r for results in batch_results for r in results
+            ]
 
             # Track routing stats (non-fatal)
             await self._track_routing_stats(all_results)
 
             elapsed_ms = (time.monotonic() - t0) * 1000
             logger.info(
-                "[Layer1] Total scoring complete: %d articles in %.0fms",
-                len(articles), elapsed_ms,
+                "[Layer1] Total scoring complete: %d articles in %d batches "
+                "(%.1f articles/batch) in %.0fms",
+                len(articles), len(plan), len(articles) / len(plan), elapsed_ms,
             )
 
             return all_results
@@ -3,19 +3,31 @@
 Records every LLM API call permanently in PostgreSQL with token counts and
 cost (calculated at insert time using active pricing). Provides aggregation
 queries for the admin cost tracking dashboard.
+
+Usage is recorded write-behind: ``record_usage`` only buffers the call
+(``LlmUsageSink``), and a background flush prices the batch (pricing
+cache), bulk-inserts the raw records and upserts the per-day
+``LlmUsageDaily`` rollups in one transaction. Dashboard aggregations read
+the daily rollups.
 """
 
 import logging
 import time
+import uuid
+from collections import defaultdict
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import case, func, literal_column, select, and_, desc, cast, Date as SADate
+from sqlalchemy import func, insert, select, and_, desc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
+from app.core.buffered_sink import BufferedSink
 from app.db.database import get_async_session
-from app.models.llm_cost import LlmUsageRecord, ModelPricing
+from app.db.task_session import get_task_session
+from app.models.llm_cost import LlmUsageDaily, LlmUsageRecord, ModelPricing
 
 logger = logging.getLogger(__name__)
 
@@ -39,11 +51,15 @@ class LlmCostService:
     # ------------------------------------------------------------------
 
     async def get_active_pricing(
-        self, model: str, ref_date: Optional[date] = None,
+        self,
+        model: str,
+        ref_date: Optional[date] = None,
+        db: Optional[AsyncSession] = None,
     ) -> Optional[ModelPricing]:
         """Get the active pricing for a model on a given date.
 
-        Uses in-memory cache (5-min TTL) for performance.
+        Uses in-memory cache (5-min TTL) for performance. On a miss the
+        lookup runs on ``db`` if given, otherwise on a new session.
         """
         d = ref_date or date.today()
         cache_key = f"{model}:{d.isoformat()}"
@@ -51,19 +67,22 @@ class LlmCostService:
         if cached and (time.monotonic() - cached[1]) < _CACHE_TTL:
             return cached[0]
 
-        async with get_async_session() as db:
-            result = await db.execute(
-                select(ModelPricing)
-                .where(
-                    and_(
-                        ModelPricing.model == model,
-                        ModelPricing.effective_from <= d,
-                    )
+        query = (
+            select(ModelPricing)
+            .where(
+                and_(
+                    ModelPricing.model == model,
+                    ModelPricing.effective_from <= d,
                 )
-                .order_by(desc(ModelPricing.effective_from))
-                .limit(1)
             )
-            pricing = result.scalar_one_or_none()
+            .order_by(desc(ModelPricing.effective_from))
+            .limit(1)
+        )
+        if db is not None:
+            pricing = (await db.execute(query)).scalar_one_or_none()
+        else:
+            async with get_async_session() as session:
+                pricing = (await session.execute(query)).scalar_one_or_none()
 
         # Evict oldest entries if cache exceeds max size
         if len(_pricing_cache) >= _CACHE_MAX_SIZE:
@@ -253,38 +272,94 @@ class LlmCostService:
         user_id: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Record a single LLM usage event. Fire-and-forget with own session.
+        """Record a single LLM usage event. Fire-and-forget.
 
-        Never raises — failures are logged at debug level.
+        The call is buffered and priced/written by a background flush.
+        Never raises — failures are logged.
         """
         try:
-            pricing = await self.get_active_pricing(model)
-            cost = self.calculate_cost(
-                pricing, prompt_tokens, completion_tokens, cached_tokens
-            )
+            await get_llm_usage_sink().put([{
+                "id": uuid.uuid4(),
+                "created_at": datetime.now(timezone.utc),
+                "model": model,
+                "purpose": purpose,
+                "user_id": user_id,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "cached_tokens": cached_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "metadata_": metadata,
+            }])
+        except Exception:
+            logger.warning("Failed to record LLM usage", exc_info=True)
 
-            record = LlmUsageRecord(
-                model=model,
-                purpose=purpose,
-                user_id=user_id,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                cached_tokens=cached_tokens,
-                total_tokens=prompt_tokens + completion_tokens,
-                cost_usd=cost,
-                metadata_=metadata,
-                pricing_id=pricing.id if pricing else None,
+    async def write_usage_batch(
+        self, db: AsyncSession, records: List[Dict[str, Any]],
+    ) -> None:
+        """Price buffered usage records, insert them and update daily rollups.
+
+        Pricing is resolved once per (model, day) in the batch. The caller
+        commits.
+        """
+        pricing_by_key: Dict[Tuple[str, date], Optional[ModelPricing]] = {}
+        daily: Dict[Tuple[date, str, str, str], Dict[str, Any]] = defaultdict(
+            lambda: {
+                "prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0,
+                "total_tokens": 0, "cost_usd": Decimal("0"), "calls": 0,
+            }
+        )
+
+        for record in records:
+            day = record["created_at"].date()
+            key = (record["model"], day)
+            if key not in pricing_by_key:
+                pricing_by_key[key] = await self.get_active_pricing(
+                    record["model"], day, db=db,
+                )
+            pricing = pricing_by_key[key]
+            record["cost_usd"] = self.calculate_cost(
+                pricing, record["prompt_tokens"], record["completion_tokens"],
+                record["cached_tokens"],
             )
+            record["pricing_id"] = pricing.id if pricing else None
 
-            async with get_async_session() as db:
-                db.add(record)
-                await db.commit()
+            totals = daily[(
+                day, record["purpose"], record["model"],
+                usage_sub_group(record["purpose"], record["metadata_"]),
+            )]
+            for field in ("prompt_tokens", "completion_tokens", "cached_tokens", "total_tokens"):
+                totals[field] += record[field]
+            totals["cost_usd"] += record["cost_usd"]
+            totals["calls"] += 1
 
-        except Exception:
-            logger.warning("Failed to record LLM usage", exc_info=True)
+        await db.execute(insert(LlmUsageRecord), records)
+
+        stmt = pg_insert(LlmUsageDaily).values([
+            {
+                "id": uuid.uuid4(),
+                "day": day,
+                "purpose": purpose,
+                "model": model,
+                "sub_group": sub_group,
+                **totals,
+            }
+            for (day, purpose, model, sub_group), totals in daily.items()
+        ])
+        await db.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_llm_usage_daily_key",
+                set_={
+                    col: getattr(LlmUsageDaily, col) + getattr(stmt.excluded, col)
+                    for col in (
+                        "prompt_tokens", "completion_tokens", "cached_tokens",
+                        "total_tokens", "cost_usd", "calls",
+                    )
+                },
+            )
+        )
 
     # ------------------------------------------------------------------
-    # Aggregation queries
+    # Aggregation queries (daily rollups)
     # ------------------------------------------------------------------
 
     def _time_filter(
@@ -293,26 +368,32 @@ class LlmCostService:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
     ):
-        """Build a WHERE clause for created_at time range.
+        """Build a WHERE clause on the rollup day (UTC).
 
-        If start_date/end_date are provided (ISO date strings), use them.
-        Otherwise fall back to ``days`` relative to now.
+        If start_date/end_date are provided (ISO date strings, inclusive),
+        use them. Otherwise cover the last ``days`` days including today.
         """
         if start_date:
-            start_dt = datetime.fromisoformat(start_date).replace(tzinfo=timezone.utc)
+            start_day = date.fromisoformat(start_date[:10])
         else:
-            start_dt = datetime.now(timezone.utc) - timedelta(days=days)
+            start_day = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
 
-        conditions = [LlmUsageRecord.created_at >= start_dt]
+        conditions = [LlmUsageDaily.day >= start_day]
         if end_date:
-            # end_date is inclusive: add 1 day
-            end_dt = (
-                datetime.fromisoformat(end_date).replace(tzinfo=timezone.utc)
-                + timedelta(days=1)
-            )
-            conditions.append(LlmUsageRecord.created_at < end_dt)
+            conditions.append(LlmUsageDaily.day <= date.fromisoformat(end_date[:10]))
         return and_(*conditions) if len(conditions) > 1 else conditions[0]
 
+    @staticmethod
+    def _sums():
+        return (
+            func.coalesce(func.sum(LlmUsageDaily.cost_usd), 0).label("cost"),
+            func.coalesce(func.sum(LlmUsageDaily.prompt_tokens), 0).label("prompt"),
+            func.coalesce(func.sum(LlmUsageDaily.completion_tokens), 0).label("completion"),
+            func.coalesce(func.sum(LlmUsageDaily.cached_tokens), 0).label("cached"),
+            func.coalesce(func.sum(LlmUsageDaily.total_tokens), 0).label("total"),
+            func.coalesce(func.sum(LlmUsageDaily.calls), 0).label("calls"),
+        )
+
     async def get_cost_summary(
         self,
         db: AsyncSession,
@@ -324,32 +405,14 @@ class LlmCostService:
         time_cond = self._time_filter(days, start_date, end_date)
 
         # Totals
-        totals = await db.execute(
-            select(
-                func.coalesce(func.sum(LlmUsageRecord.cost_usd), 0).label("cost"),
-                func.coalesce(func.sum(LlmUsageRecord.prompt_tokens), 0).label("prompt"),
-                func.coalesce(func.sum(LlmUsageRecord.completion_tokens), 0).label("completion"),
-                func.coalesce(func.sum(LlmUsageRecord.cached_tokens), 0).label("cached"),
-                func.coalesce(func.sum(LlmUsageRecord.total_tokens), 0).label("total"),
-                func.count().label("calls"),
-            )
-            .where(time_cond)
-        )
+        totals = await db.execute(select(*self._sums()).where(time_cond))
         t = totals.one()
 
         # By purpose
         by_purpose_q = await db.execute(
-            select(
-                LlmUsageRecord.purpose,
-                func.sum(LlmUsageRecord.cost_usd).label("cost"),
-                func.sum(LlmUsageRecord.prompt_tokens).label("prompt"),
-                func.sum(LlmUsageRecord.completion_tokens).label("completion"),
-                func.sum(LlmUsageRecord.cached_tokens).label("cached"),
-                func.sum(LlmUsageRecord.total_tokens).label("total"),
-                func.count().label("calls"),
-            )
+            select(LlmUsageDaily.purpose, *self._sums())
             .where(time_cond)
-            .group_by(LlmUsageRecord.purpose)
+            .group_by(LlmUsageDaily.purpose)
             .order_by(desc("cost"))
         )
         by_purpose = [
@@ -367,17 +430,9 @@ class LlmCostService:
 
         # By model
         by_model_q = await db.execute(
-            select(
-                LlmUsageRecord.model,
-                func.sum(LlmUsageRecord.cost_usd).label("cost"),
-                func.sum(LlmUsageRecord.prompt_tokens).label("prompt"),
-                func.sum(LlmUsageRecord.completion_tokens).label("completion"),
-                func.sum(LlmUsageRecord.cached_tokens).label("cached"),
-                func.sum(LlmUsageRecord.total_tokens).label("total"),
-                func.count().label("calls"),
-            )
+            select(LlmUsageDaily.model, *self._sums())
             .where(time_cond)
-            .group_by(LlmUsageRecord.model)
+            .group_by(LlmUsageDaily.model)
             .order_by(desc("cost"))
         )
         by_model = [
@@ -430,25 +485,17 @@ class LlmCostService:
         """Get daily cost breakdown for charts."""
         time_cond = self._time_filter(days, start_date, end_date)
 
-        day_col = cast(LlmUsageRecord.created_at, SADate).label("day")
         query = (
-            select(
-                day_col,
-                func.sum(LlmUsageRecord.cost_usd).label("cost"),
-                func.sum(LlmUsageRecord.prompt_tokens).label("prompt"),
-                func.sum(LlmUsageRecord.completion_tokens).label("completion"),
-                func.sum(LlmUsageRecord.cached_tokens).label("cached"),
-                func.count().label("calls"),
-            )
+            select(LlmUsageDaily.day, *self._sums())
             .where(time_cond)
-            .group_by(day_col)
-            .order_by(day_col)
+            .group_by(LlmUsageDaily.day)
+            .order_by(LlmUsageDaily.day)
         )
 
         if purpose:
-            query = query.where(LlmUsageRecord.purpose == purpose)
+            query = query.where(LlmUsageDaily.purpose == purpose)
         if model:
-            query = query.where(LlmUsageRecord.model == model)
+            query = query.where(LlmUsageDaily.model == model)
 
         result = await db.execute(query)
         return [
@@ -470,51 +517,21 @@ class LlmCostService:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Get usage breakdown with sub-group detail from JSONB metadata.
+        """Get usage breakdown with sub-group detail.
 
-        Extracts agent/sub-type from metadata for purposes that have it:
-        - analysis → metadata_->>'agent_type' (fundamental/technical/etc.)
-        - layer1_scoring → metadata_->>'agent' (macro/market/signal)
-        - layer3_analysis/layer3_lightweight/deep_filter → metadata_->>'agent'
+        Sub-groups are extracted from record metadata when rollups are
+        written (see ``usage_sub_group``).
 
         Returns flat list of {purpose, subGroup, costUsd, tokens, calls}.
         Frontend maps purposes into display categories.
         """
         time_cond = self._time_filter(days, start_date, end_date)
 
-        # Build CASE expression to extract sub-group from JSONB metadata
-        sub_group_expr = case(
-            (
-                LlmUsageRecord.purpose == "analysis",
-                LlmUsageRecord.metadata_["agent_type"].astext,
-            ),
-            (
-                LlmUsageRecord.purpose == "layer1_scoring",
-                LlmUsageRecord.metadata_["agent"].astext,
-            ),
-            (
-                LlmUsageRecord.purpose.in_(
-                    ["layer3_analysis", "layer3_lightweight", "deep_filter"]
-                ),
-                LlmUsageRecord.metadata_["agent"].astext,
-            ),
-            else_=literal_column("''"),
-        ).label("sub_group")
-
         result = await db.execute(
-            select(
-                LlmUsageRecord.purpose,
-                sub_group_expr,
-                func.sum(LlmUsageRecord.cost_usd).label("cost"),
-                func.sum(LlmUsageRecord.prompt_tokens).label("prompt"),
-                func.sum(LlmUsageRecord.completion_tokens).label("completion"),
-                func.sum(LlmUsageRecord.cached_tokens).label("cached"),
-                func.sum(LlmUsageRecord.total_tokens).label("total"),
-                func.count().label("calls"),
-            )
+            select(LlmUsageDaily.purpose, LlmUsageDaily.sub_group, *self._sums())
             .where(time_cond)
-            .group_by(LlmUsageRecord.purpose, sub_group_expr)
-            .order_by(LlmUsageRecord.purpose, desc("cost"))
+            .group_by(LlmUsageDaily.purpose, LlmUsageDaily.sub_group)
+            .order_by(LlmUsageDaily.purpose, desc("cost"))
         )
 
         return [
@@ -532,6 +549,61 @@ class LlmCostService:
         ]
 
 
+# ---------------------------------------------------------------------------
+# Usage buffer
+# ---------------------------------------------------------------------------
+
+
+_AGENT_SUB_GROUP_PURPOSES = frozenset(
+    ["layer1_scoring", "layer3_analysis", "layer3_lightweight", "deep_filter"]
+)
+
+
+def usage_sub_group(purpose: str, metadata: Optional[Dict[str, Any]]) -> str:
+    """Agent/sub-type of a usage record for the category breakdown.
+
+    - analysis → metadata['agent_type'] (fundamental/technical/etc.)
+    - layer1_scoring → metadata['agent'] (macro/market/signal)
+    - layer3_analysis/layer3_lightweight/deep_filter → metadata['agent']
+    """
+    if not metadata:
+        return ""
+    if purpose == "analysis":
+        value = metadata.get("agent_type")
+    elif purpose in _AGENT_SUB_GROUP_PURPOSES:
+        value = metadata.get("agent")
+    else:
+        return ""
+    return str(value)[:100] if value is not None else ""
+
+
+class LlmUsageSink(BufferedSink[dict]):
+    """Buffers usage records and writes them with daily rollups in bulk."""
+
+    name = "LLM usage sink"
+
+    def __init__(self) -> None:
+        super().__init__(
+            max_items=settings.LLM_USAGE_MAX_BUFFERED,
+            batch_size=settings.LLM_USAGE_BATCH_SIZE,
+            flush_interval=settings.LLM_USAGE_FLUSH_INTERVAL,
+            backpressure_timeout=settings.LLM_USAGE_BACKPRESSURE_TIMEOUT,
+        )
+
+    async def _write(self, batch: List[dict]) -> int:
+        try:
+            async with get_task_session() as db:
+                await get_llm_cost_service().write_usage_batch(db, batch)
+                await db.commit()
+        except Exception:
+            self.flush_errors += 1
+            self.dropped += len(batch)
+            logger.warning("Failed to write %d LLM usage records", len(batch), exc_info=True)
+            return 0
+        self.written += len(batch)
+        return len(batch)
+
+
 # ---------------------------------------------------------------------------
 # Singleton
 # ---------------------------------------------------------------------------
@@ -545,3 +617,23 @@ def get_llm_cost_service() -> LlmCostService:
     if _service is None:
         _service = LlmCostService()
     return _service
+
+
+_usage_sink: Optional[LlmUsageSink] = None
+
+
+def get_llm_usage_sink() -> LlmUsageSink:
+    """Get singleton instance of LlmUsageSink."""
+    global _usage_sink
+    if _usage_sink is None:
+        _usage_sink = LlmUsageSink()
+    return _usage_sink
+
+
+async def drain_llm_usage() -> None:
+    """Flush buffered usage records before the current event loop closes."""
+    if _usage_sink is not None:
+        try:
+            await _usage_sink.drain()
+        except Exception as e:
+            logger.warning("LLM usage sink drain failed: %s", e)
@@ -14,49 +14,26 @@ import asyncio
 import json
 import logging
 import random
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
 
+from app.core.bulkhead import run_in_bulkhead
 from app.db.redis import get_redis
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for synchronous API calls
-_executor: Optional[ThreadPoolExecutor] = None
-_executor_lock = asyncio.Lock()
-
 EXTERNAL_API_TIMEOUT = 30  # seconds
 
 
-async def _get_executor() -> ThreadPoolExecutor:
-    """Get shared thread pool executor."""
-    global _executor
-    if _executor is None:
-        async with _executor_lock:
-            if _executor is None:
-                _executor = ThreadPoolExecutor(max_workers=4)
-    return _executor
-
-
 async def run_in_executor(func: Callable, *args, **kwargs) -> Any:
-    """Run synchronous function in thread pool with timeout."""
-    loop = asyncio.get_running_loop()
-    executor = await _get_executor()
+    """Run synchronous function in the market_data bulkhead; None on timeout."""
     try:
-        return await asyncio.wait_for(
-            loop.run_in_executor(
-                executor,
-                lambda: func(*args, **kwargs),
-            ),
-            timeout=EXTERNAL_API_TIMEOUT,
+        return await run_in_bulkhead(
+            "market_data", func, *args, timeout=EXTERNAL_API_TIMEOUT, **kwargs
         )
     except asyncio.TimeoutError:
-        logger.warning(
-            f"Executor timeout after {EXTERNAL_API_TIMEOUT}s for function: {func.__name__}"
-        )
         return None
 
 
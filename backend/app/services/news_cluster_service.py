@@ -0,0 +1,180 @@
+"""Near-duplicate clustering for news ingestion.
+
+The same story is often syndicated across wires and aggregators under
+different URLs, so URL dedup lets every copy through to Layer 1 scoring,
+full-content fetch, Layer 3 analysis and embedding. This service groups
+new articles by SimHash of title + summary; the first article of each
+cluster becomes its representative and the rest are linked to it
+(``News.duplicate_of_id``) and skip the LLM pipeline.
+
+Clustering is scoped to the article's (market, symbol): a per-symbol copy
+of a syndicated headline stays visible in that symbol's feed instead of
+being linked under another symbol's (or a general news) representative.
+
+Representatives are also recorded in a rolling Redis window so copies
+arriving in later polls (or through the other ingestion path) link to
+the article that was already processed. When Redis is unavailable the
+clustering degrades to within-batch only.
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.db.redis import get_redis
+from app.utils.simhash import (
+    DEFAULT_MAX_DISTANCE,
+    NearDuplicateIndex,
+    bands,
+    hamming_distance,
+    simhash,
+)
+
+logger = logging.getLogger(__name__)
+
+# Redis band buckets: hash of fingerprint (hex) -> representative news id
+BUCKET_KEY_PREFIX = "news:simhash"
+WINDOW_SECONDS = 24 * 3600
+
+# Summary chars included in the fingerprint (long bodies dilute the title)
+SUMMARY_CHARS = 500
+
+
+def cluster_scope(symbol: Optional[str], market: Optional[str]) -> str:
+    """Scope within which articles may cluster together."""
+    return f"{market or ''}:{symbol or ''}"
+
+
+def fingerprint_text(title: Optional[str], summary: Optional[str]) -> str:
+    """Text used for fingerprinting an article."""
+    return f"{title or ''} {(summary or '')[:SUMMARY_CHARS]}"
+
+
+class NewsClusterService:
+    """Assigns new articles to near-duplicate clusters."""
+
+    def __init__(
+        self,
+        max_distance: int = DEFAULT_MAX_DISTANCE,
+        window_seconds: int = WINDOW_SECONDS,
+    ) -> None:
+        self.max_distance = max_distance
+        self.window_seconds = window_seconds
+
+    def _bucket_key(self, scope: str, band: Tuple[int, int]) -> str:
+        return f"{BUCKET_KEY_PREFIX}:{scope}:{band[0]}:{band[1]:x}"
+
+    async def _lookup_window(
+        self, fingerprints: List[Tuple[str, int]],
+    ) -> List[Optional[str]]:
+        """Closest same-scope representative id in the Redis window for each fingerprint."""
+        matches: List[Optional[str]] = [None] * len(fingerprints)
+        if not fingerprints:
+            return matches
+
+        num_bands = self.max_distance + 1
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for scope, fp in fingerprints:
+                for band in bands(fp, self.max_distance):
+                    pipe.hgetall(self._bucket_key(scope, band))
+            results = await pipe.execute()
+        except Exception as e:
+            logger.warning("Near-duplicate window lookup failed, batch-only clustering: %s", e)
+            return matches
+
+        for i, (_, fp) in enumerate(fingerprints):
+            best: Optional[Tuple[int, str]] = None
+            for bucket in results[i * num_bands:(i + 1) * num_bands]:
+                for other_hex, rep_id in (bucket or {}).items():
+                    distance = hamming_distance(fp, int(other_hex, 16))
+                    if distance <= self.max_distance and (best is None or distance < best[0]):
+                        best = (distance, rep_id)
+            if best:
+                matches[i] = best[1]
+        return matches
+
+    async def _record_window(self, representatives: List[Tuple[str, int, str]]) -> None:
+        """Add new representatives to the Redis window (non-fatal)."""
+        if not representatives:
+            return
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for scope, fp, rep_id in representatives:
+                for band in bands(fp, self.max_distance):
+                    key = self._bucket_key(scope, band)
+                    pipe.hset(key, f"{fp:016x}", rep_id)
+                    pipe.expire(key, self.window_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "Failed to record %d cluster representatives: %s", len(representatives), e,
+            )
+
+    async def link_duplicates(
+        self,
+        articles: Sequence[Tuple[str, str, Optional[str], Optional[str]]],
+        local_index: Optional[Dict[str, NearDuplicateIndex[str]]] = None,
+    ) -> Dict[str, str]:
+        """
+        Cluster a batch of new articles.
+
+        Args:
+            articles: (news id, scope, title, summary) tuples in arrival
+                order; ``scope`` comes from :func:`cluster_scope` and only
+                articles with the same scope are clustered together
+            local_index: Optional per-scope indexes shared across batches of
+                one run, so clustering keeps working across batches if Redis
+                is down
+
+        Returns:
+            Dict mapping duplicate news id -> representative news id.
+            Articles not in the dict are representatives (or too short
+            to fingerprint) and should be processed normally.
+        """
+        indexes = local_index if local_index is not None else {}
+
+        fingerprinted: List[Tuple[str, str, int]] = []
+        for news_id, scope, title, summary in articles:
+            fp = simhash(fingerprint_text(title, summary))
+            if fp is not None:
+                fingerprinted.append((news_id, scope, fp))
+
+        window_matches = await self._lookup_window(
+            [(scope, fp) for _, scope, fp in fingerprinted]
+        )
+
+        duplicates: Dict[str, str] = {}
+        new_representatives: List[Tuple[str, int, str]] = []
+        for (news_id, scope, fp), window_rep in zip(fingerprinted, window_matches):
+            index = indexes.get(scope)
+            if index is None:
+                index = indexes[scope] = NearDuplicateIndex(self.max_distance)
+            rep_id = index.find(fp) or window_rep
+            if rep_id and rep_id != news_id:
+                duplicates[news_id] = rep_id
+                continue
+            index.add(fp, news_id)
+            new_representatives.append((scope, fp, news_id))
+
+        await self._record_window(new_representatives)
+
+        if duplicates:
+            logger.info(
+                "Near-duplicate clustering: %d articles, %d linked to existing clusters",
+                len(articles), len(duplicates),
+            )
+        return duplicates
+
+
+# Singleton instance
+_service: Optional[NewsClusterService] = None
+
+
+def get_news_cluster_service() -> NewsClusterService:
+    """Get singleton instance of NewsClusterService."""
+    global _service
+    if _service is None:
+        _service = NewsClusterService()
+    return _service
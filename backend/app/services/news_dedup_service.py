@@ -0,0 +1,254 @@
+"""Shared URL dedup index for news ingestion.
+
+Keeps a Bloom filter of every stored ``News.url`` in a Redis bitmap so
+that ingestion paths (news monitor, RSS polling) can rule out most
+candidate URLs without querying Postgres. Only URLs the filter reports
+as *probably* present are checked against the ``news`` table, so the
+expensive ``url IN (...)`` query shrinks to the (few) real duplicates
+plus false positives.
+
+The filter never produces false negatives for URLs it has seen, but it
+cannot forget deleted rows, so it is rebuilt from the ``news`` table
+periodically (see ``worker.tasks.news_monitor.rebuild_news_url_index``).
+Until the first rebuild completes, and whenever Redis is unavailable,
+callers transparently fall back to the full DB query. The unique index
+on ``news.url`` remains the final guard against duplicates.
+"""
+
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.redis import get_redis
+from app.models.news import News
+
+logger = logging.getLogger(__name__)
+
+# Redis keys
+INDEX_KEY = "news:url_bloom"
+READY_KEY = "news:url_bloom:ready"
+REBUILD_LOCK_KEY = "lock:news:url_bloom:rebuild"
+
+REBUILD_LOCK_TTL = 1800  # seconds
+REBUILD_PARTITION_SIZE = 5000
+# URLs inserted while a rebuild scans the table are re-added afterwards
+REBUILD_CATCHUP_MARGIN = timedelta(minutes=5)
+
+
+def bloom_parameters(capacity: int, fp_rate: float) -> Tuple[int, int]:
+    """Compute (num_bits, num_hashes) for a Bloom filter.
+
+    Args:
+        capacity: Expected number of items
+        fp_rate: Target false-positive probability at capacity
+
+    Returns:
+        Tuple of (bit array size, number of hash functions)
+    """
+    capacity = max(1, capacity)
+    num_bits = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))
+    num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+    return num_bits, num_hashes
+
+
+def bit_positions(url: str, num_bits: int, num_hashes: int) -> List[int]:
+    """Bit offsets for a URL using double hashing over one SHA-256 digest."""
+    digest = hashlib.sha256(url.encode("utf-8")).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:16], "big") | 1
+    return [(h1 + i * h2) % num_bits for i in range(num_hashes)]
+
+
+class NewsDedupService:
+    """
+    URL dedup index backed by a Redis bitmap Bloom filter.
+
+    Filter size is fixed by ``NEWS_URL_INDEX_CAPACITY`` and
+    ``NEWS_URL_INDEX_FP_RATE`` so bit positions stay stable across
+    rebuilds and processes. Exceeding the capacity only raises the
+    false-positive rate (more DB fallbacks), never correctness.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        fp_rate: Optional[float] = None,
+    ) -> None:
+        self.capacity = capacity or settings.NEWS_URL_INDEX_CAPACITY
+        self.num_bits, self.num_hashes = bloom_parameters(
+            self.capacity, fp_rate or settings.NEWS_URL_INDEX_FP_RATE,
+        )
+
+    async def is_ready(self) -> bool:
+        """Whether the index has been built and can be trusted for misses."""
+        try:
+            redis = await get_redis()
+            return bool(await redis.exists(READY_KEY))
+        except Exception as e:
+            logger.warning("News URL index readiness check failed: %s", e)
+            return False
+
+    async def _probable_hits(self, urls: List[str]) -> Optional[Set[str]]:
+        """URLs the filter reports as possibly stored, or None if unusable."""
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline(transaction=False)
+            pipe.exists(READY_KEY)
+            for url in urls:
+                for pos in bit_positions(url, self.num_bits, self.num_hashes):
+                    pipe.getbit(INDEX_KEY, pos)
+            results = await pipe.execute()
+        except Exception as e:
+            logger.warning("News URL index lookup failed, using DB dedup: %s", e)
+            return None
+
+        if not results[0]:
+            return None
+
+        hits: Set[str] = set()
+        bits = results[1:]
+        for i, url in enumerate(urls):
+            offset = i * self.num_hashes
+            if all(bits[offset:offset + self.num_hashes]):
+                hits.add(url)
+        return hits
+
+    async def add_urls(self, urls: Iterable[str]) -> None:
+        """Record URLs in the filter (non-fatal on Redis errors)."""
+        urls = [u for u in urls if u]
+        if not urls:
+            return
+        try:
+            redis = await get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for url in urls:
+                for pos in bit_positions(url, self.num_bits, self.num_hashes):
+                    pipe.setbit(INDEX_KEY, pos, 1)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to add %d URLs to news URL index: %s", len(urls), e)
+
+    async def filter_new_urls(
+        self,
+        db: AsyncSession,
+        urls: Iterable[str],
+    ) -> Set[str]:
+        """
+        Return the subset of ``urls`` not yet stored in the ``news`` table.
+
+        Definite filter misses are accepted without touching the DB; only
+        probable hits are verified with a ``url IN (...)`` query. Returned
+        URLs are added to the filter immediately, so concurrent ingestion
+        paths see them as probable hits even before the rows commit.
+
+        Args:
+            db: Database session used for the fallback query
+            urls: Candidate URLs (empty values and duplicates are ignored)
+
+        Returns:
+            Set of URLs that are new
+        """
+        unique_urls = list(dict.fromkeys(u for u in urls if u))
+        if not unique_urls:
+            return set()
+
+        probable = await self._probable_hits(unique_urls)
+        check_urls = unique_urls if probable is None else [
+            u for u in unique_urls if u in probable
+        ]
+
+        existing: Set[str] = set()
+        if check_urls:
+            result = await db.execute(select(News.url).where(News.url.in_(check_urls)))
+            existing = {row[0] for row in result.fetchall()}
+
+        new_urls = [u for u in unique_urls if u not in existing]
+        await self.add_urls(new_urls)
+
+        logger.debug(
+            "URL dedup: candidates=%d, db_checked=%d, existing=%d, new=%d, index=%s",
+            len(unique_urls), len(check_urls), len(existing), len(new_urls),
+            "off" if probable is None else "on",
+        )
+        return set(new_urls)
+
+    async def rebuild(self, db: AsyncSession) -> Dict[str, int]:
+        """
+        Rebuild the filter from the ``news`` table.
+
+        The bitmap is assembled locally and written with a single SET, so
+        readers switch from the old to the new filter atomically. Guarded
+        by a Redis lock so concurrent triggers do not duplicate work.
+
+        Returns:
+            Dict with ``urls`` indexed and ``elapsed_ms``; ``skipped`` = 1
+            when another rebuild holds the lock.
+        """
+        redis = await get_redis()
+        if not await redis.set(REBUILD_LOCK_KEY, "1", nx=True, ex=REBUILD_LOCK_TTL):
+            logger.info("News URL index rebuild already running, skipping")
+            return {"urls": 0, "elapsed_ms": 0, "skipped": 1}
+
+        t0 = time.monotonic()
+        started_at = datetime.now(timezone.utc)
+        try:
+            bitmap = bytearray((self.num_bits + 7) // 8)
+            count = 0
+
+            stream = await db.stream(
+                select(News.url).execution_options(yield_per=REBUILD_PARTITION_SIZE)
+            )
+            async for partition in stream.partitions(REBUILD_PARTITION_SIZE):
+                for (url,) in partition:
+                    for pos in bit_positions(url, self.num_bits, self.num_hashes):
+                        # Redis bitmaps are MSB-first within each byte
+                        bitmap[pos >> 3] |= 0x80 >> (pos & 7)
+                    count += 1
+
+            pipe = redis.pipeline(transaction=True)
+            pipe.set(INDEX_KEY, bytes(bitmap))
+            pipe.set(READY_KEY, started_at.isoformat())
+            await pipe.execute()
+
+            # Re-add rows inserted while the table was being scanned; their
+            # bits may have gone to the filter that was just replaced.
+            result = await db.execute(
+                select(News.url).where(
+                    News.created_at >= started_at - REBUILD_CATCHUP_MARGIN
+                )
+            )
+            await self.add_urls(row[0] for row in result.fetchall())
+
+            elapsed_ms = int((time.monotonic() - t0) * 1000)
+            if count > self.capacity:
+                logger.warning(
+                    "News URL index holds %d URLs, above capacity %d; "
+                    "false-positive rate will rise (raise NEWS_URL_INDEX_CAPACITY)",
+                    count, self.capacity,
+                )
+            logger.info(
+                "News URL index rebuilt: urls=%d, bits=%d, hashes=%d, elapsed=%dms",
+                count, self.num_bits, self.num_hashes, elapsed_ms,
+            )
+            return {"urls": count, "elapsed_ms": elapsed_ms, "skipped": 0}
+        finally:
+            await redis.delete(REBUILD_LOCK_KEY)
+
+
+# Singleton instance
+_service: Optional[NewsDedupService] = None
+
+
+def get_news_dedup_service() -> NewsDedupService:
+    """Get singleton instance of NewsDedupService."""
+    global _service
+    if _service is None:
+        _service = NewsDedupService()
+    return _service
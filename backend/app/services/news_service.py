@@ -7,23 +7,19 @@ import json
 import logging
 import random
 import re
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, TypedDict
 
 from app.config import settings
+from app.core.bulkhead import run_in_bulkhead
 
 if TYPE_CHECKING:
     from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for synchronous library calls
-_executor: Optional[ThreadPoolExecutor] = None
-_executor_lock = asyncio.Lock()
-
 # Timeout for external API calls (in seconds)
 EXTERNAL_API_TIMEOUT = 30
 
@@ -62,26 +58,10 @@ def sanitize_html(text: Optional[str]) -> Optional[str]:
     return text.strip() if text else None
 
 
-async def _get_executor() -> ThreadPoolExecutor:
-    """Get thread pool executor, initialize if needed."""
-    global _executor
-    if _executor is None:
-        async with _executor_lock:
-            if _executor is None:
-                _executor = ThreadPoolExecutor(max_workers=5)
-    return _executor
-
-
 async def run_in_executor(func: Callable, *args, **kwargs) -> Any:
-    """Run synchronous function in thread pool with timeout."""
-    loop = asyncio.get_running_loop()
-    executor = await _get_executor()
-    return await asyncio.wait_for(
-        loop.run_in_executor(
-            executor,
-            lambda: func(*args, **kwargs),
-        ),
-        timeout=EXTERNAL_API_TIMEOUT,
+    """Run synchronous function in the news bulkhead with timeout."""
+    return await run_in_bulkhead(
+        "news", func, *args, timeout=EXTERNAL_API_TIMEOUT, **kwargs
     )
 
 
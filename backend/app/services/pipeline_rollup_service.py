@@ -0,0 +1,484 @@
+"""Hourly rollups of pipeline trace events.
+
+Dashboard stats used to compute ``percentile_cont`` and metadata
+aggregates over every ``pipeline_events`` row in the window on each page
+load. Instead, a periodic job (``refresh_pipeline_rollups``) folds raw
+events into one ``PipelineEventRollup`` row per (hour, layer, node) with:
+
+- counts by status,
+- duration count / sum / max,
+- a log-bucket latency histogram (mergeable by summing, so any window's
+  p50/p95 comes from the merged histogram within ~5% relative error),
+- node-specific counters extracted from event metadata.
+
+Each refresh recomputes the buckets of a short lookback window from raw
+events and replaces them, so late-committed events (Layer 2 writes its
+trace at the end of the graph) are picked up and reruns are idempotent.
+Rollups are kept longer than raw events.
+"""
+
+import logging
+import math
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.redis import get_redis
+from app.models.pipeline_event import PipelineEvent, PipelineEventRollup
+
+logger = logging.getLogger(__name__)
+
+# Buckets recomputed by each refresh (covers late-committed Layer 2 traces)
+REFRESH_LOOKBACK = timedelta(hours=2)
+
+# First refresh backfills everything still in raw retention
+BACKFILL_WINDOW = timedelta(days=7)
+
+ROLLUP_RETENTION_DAYS = 90
+
+REFRESH_LOCK_KEY = "lock:pipeline:rollups:refresh"
+REFRESH_LOCK_TTL = 600  # seconds
+REFRESH_PARTITION_SIZE = 5000
+
+# Atomic compare-and-delete (same as CacheService.release_lock): a refresh
+# that outlived its TTL must not release the lock of the next refresh
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
+# ---------------------------------------------------------------------------
+# Latency histogram
+# ---------------------------------------------------------------------------
+
+# Sub-buckets per power of two: bucket width ~9%, midpoint error <~4.5%
+HISTOGRAM_SUB_BUCKETS = 8
+# Bucket 0 holds durations below 1ms; the last bucket (~37h) is open-ended
+HISTOGRAM_MAX_BUCKET = HISTOGRAM_SUB_BUCKETS * 27
+
+
+def latency_bucket(duration_ms: float) -> int:
+    """Histogram bucket index for a duration."""
+    if duration_ms < 1.0:
+        return 0
+    idx = 1 + int(math.log2(duration_ms) * HISTOGRAM_SUB_BUCKETS)
+    return min(idx, HISTOGRAM_MAX_BUCKET)
+
+
+def bucket_value(idx: int) -> float:
+    """Representative duration (geometric midpoint) of a bucket."""
+    if idx <= 0:
+        return 0.5
+    return 2 ** ((idx - 0.5) / HISTOGRAM_SUB_BUCKETS)
+
+
+def histogram_quantile(
+    histogram: Dict[int, int],
+    q: float,
+    max_ms: Optional[float] = None,
+) -> Optional[float]:
+    """
+    Approximate quantile of a latency histogram.
+
+    Args:
+        histogram: Bucket index -> count
+        q: Quantile in [0, 1]
+        max_ms: Exact maximum, used to clamp the top bucket's estimate
+
+    Returns:
+        Estimated duration in ms, or None for an empty histogram
+    """
+    total = sum(histogram.values())
+    if total <= 0:
+        return None
+    # Same rank convention as percentile_cont (0-based, n - 1 span)
+    target = q * (total - 1)
+    cumulative = 0
+    for idx in sorted(histogram):
+        cumulative += histogram[idx]
+        if cumulative > target:
+            value = bucket_value(idx)
+            return min(value, max_ms) if max_ms is not None else value
+    return max_ms
+
+
+# ---------------------------------------------------------------------------
+# Node-specific counters
+# ---------------------------------------------------------------------------
+
+# Layer 1 scoring (0-300): (upper bound exclusive, label), aligned with thresholds
+LAYER1_SCORE_BUCKETS: Sequence[Tuple[float, str]] = (
+    (60, "0-59"), (105, "60-104"), (150, "105-149"), (195, "150-194"),
+    (math.inf, "195-300"),
+)
+# Legacy Layer 2 score_and_route (0-100)
+LEGACY_SCORE_BUCKETS: Sequence[Tuple[float, str]] = (
+    (20, "0-19"), (40, "20-39"), (60, "40-59"), (80, "60-79"),
+    (math.inf, "80-100"),
+)
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lower() in ("true", "t", "1", "yes")
+    return value is True
+
+
+def _score_label(score: float, buckets: Sequence[Tuple[float, str]]) -> str:
+    for upper, label in buckets:
+        if score < upper:
+            return label
+    return buckets[-1][1]
+
+
+def _fetch_counters(meta: dict, cache_meta: dict) -> Dict[str, float]:
+    downloaded = _as_number(meta.get("images_downloaded")) or 0
+    provider = meta.get("provider")
+    return {
+        "images_found": _as_number(meta.get("images_found")) or 0,
+        "images_downloaded": downloaded,
+        "with_images": 1 if downloaded > 0 else 0,
+        f"provider:{'unknown' if provider is None else provider}": 1,
+    }
+
+
+def _cleaning_counters(meta: dict, cache_meta: dict) -> Dict[str, float]:
+    counters = {
+        "visual_data": 1 if _as_bool(meta.get("has_visual_data")) else 0,
+        "image_count": _as_number(meta.get("image_count")) or 0,
+        "insights_length": _as_number(meta.get("image_insights_length")) or 0,
+    }
+    original = _as_number(meta.get("original_length"))
+    cleaned = _as_number(meta.get("cleaned_length"))
+    if original and original > 0 and cleaned is not None:
+        counters["retention_sum"] = cleaned / original
+        counters["retention_count"] = 1
+    return counters
+
+
+def _layer1_score_counters(meta: dict, cache_meta: dict) -> Dict[str, float]:
+    score = _as_number(meta.get("score"))
+    if score is None:
+        return {}
+    label = _score_label(score, LAYER1_SCORE_BUCKETS)
+    decision = meta.get("decision")
+    return {
+        "scored": 1,
+        f"score:{label}": 1,
+        f"score:{label}:full_analysis": 1 if decision == "full_analysis" else 0,
+        f"score:{label}:lightweight": 1 if decision == "lightweight" else 0,
+        f"score:{label}:critical": 1 if decision == "critical_event" else 0,
+    }
+
+
+def _legacy_score_counters(meta: dict, cache_meta: dict) -> Dict[str, float]:
+    score = _as_number(meta.get("score"))
+    if score is None:
+        return {}
+    label = _score_label(score, LEGACY_SCORE_BUCKETS)
+    path = meta.get("processing_path")
+    return {
+        "scored": 1,
+        f"score:{label}": 1,
+        f"score:{label}:full_analysis": 1 if path == "full_analysis" else 0,
+        f"score:{label}:lightweight": 1 if path == "lightweight" else 0,
+        f"score:{label}:critical": 1 if _as_bool(meta.get("is_critical_event")) else 0,
+    }
+
+
+def _cache_counters(meta: dict, cache_meta: dict) -> Dict[str, float]:
+    counters = {
+        "cached_tokens": _as_number(cache_meta.get("cached_tokens")) or 0,
+        "prompt_tokens": _as_number(cache_meta.get("prompt_tokens")) or 0,
+    }
+    hit_rate = _as_number(cache_meta.get("cache_hit_rate"))
+    if hit_rate is not None:
+        counters["hit_rate_sum"] = hit_rate
+        counters["hit_rate_count"] = 1
+        counters["cache_hits"] = 1 if hit_rate > 0 else 0
+    return counters
+
+
+# (layer, node) -> extractor over successful events' (metadata, cache_metadata)
+COUNTER_EXTRACTORS: Dict[Tuple[str, str], Callable[[dict, dict], Dict[str, float]]] = {
+    ("1.5", "fetch"): _fetch_counters,
+    ("1.5", "content_cleaning"): _cleaning_counters,
+    ("1", "layer1_scoring"): _layer1_score_counters,
+    ("2", "score_and_route"): _legacy_score_counters,
+    ("2", "multi_agent_analysis"): _cache_counters,
+}
+
+
+def event_counters(
+    layer: str,
+    node: str,
+    status: str,
+    metadata: Optional[dict],
+    cache_metadata: Optional[dict],
+) -> Dict[str, float]:
+    """Node-specific counters contributed by one event (successes only)."""
+    extractor = COUNTER_EXTRACTORS.get((layer, node))
+    if extractor is None or status != "success":
+        return {}
+    return extractor(metadata or {}, cache_metadata or {})
+
+
+# ---------------------------------------------------------------------------
+# Aggregates
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class NodeRollup:
+    """Mergeable aggregate of events for one layer/node."""
+
+    layer: str
+    node: str
+    count: int = 0
+    success_count: int = 0
+    error_count: int = 0
+    duration_count: int = 0
+    duration_sum: float = 0.0
+    duration_max: Optional[float] = None
+    histogram: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    counters: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+    def add_event(
+        self,
+        status: str,
+        duration_ms: Optional[float],
+        metadata: Optional[dict] = None,
+        cache_metadata: Optional[dict] = None,
+    ) -> None:
+        """Fold one raw event into the aggregate."""
+        self.count += 1
+        if status == "success":
+            self.success_count += 1
+        elif status == "error":
+            self.error_count += 1
+        if duration_ms is not None:
+            self.duration_count += 1
+            self.duration_sum += duration_ms
+            if self.duration_max is None or duration_ms > self.duration_max:
+                self.duration_max = duration_ms
+            self.histogram[latency_bucket(duration_ms)] += 1
+        for key, value in event_counters(
+            self.layer, self.node, status, metadata, cache_metadata,
+        ).items():
+            self.counters[key] += value
+
+    def to_row(self, bucket_start: datetime, updated_at: datetime) -> Dict[str, Any]:
+        """Column values for storing the aggregate as one rollup bucket."""
+        return {
+            "bucket_start": bucket_start,
+            "layer": self.layer,
+            "node": self.node,
+            "count": self.count,
+            "success_count": self.success_count,
+            "error_count": self.error_count,
+            "duration_count": self.duration_count,
+            "duration_sum": self.duration_sum,
+            "duration_max": self.duration_max,
+            "latency_histogram": {str(k): v for k, v in self.histogram.items()},
+            "counters": dict(self.counters),
+            "updated_at": updated_at,
+        }
+
+    def merge_row(self, row: PipelineEventRollup) -> None:
+        """Fold a stored rollup row into the aggregate."""
+        self.count += row.count
+        self.success_count += row.success_count
+        self.error_count += row.error_count
+        self.duration_count += row.duration_count
+        self.duration_sum += row.duration_sum
+        if row.duration_max is not None and (
+            self.duration_max is None or row.duration_max > self.duration_max
+        ):
+            self.duration_max = row.duration_max
+        for idx, n in (row.latency_histogram or {}).items():
+            self.histogram[int(idx)] += n
+        for key, value in (row.counters or {}).items():
+            self.counters[key] += value
+
+    @property
+    def avg_ms(self) -> Optional[float]:
+        return self.duration_sum / self.duration_count if self.duration_count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        return histogram_quantile(self.histogram, q, self.duration_max)
+
+    def counter(self, key: str) -> float:
+        return self.counters.get(key, 0)
+
+
+def _floor_bucket(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+class PipelineRollupService:
+    """Maintains and reads hourly pipeline event rollups."""
+
+    async def refresh(
+        self,
+        db: AsyncSession,
+        since: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Recompute rollup buckets from raw events.
+
+        Buckets from ``since`` (floored to the hour; default: the refresh
+        lookback, or the full raw retention on first run) up to now are
+        replaced in one transaction, so readers never see a partial
+        refresh. Guarded by a Redis lock, which is held until the
+        transaction is committed so a concurrent refresh cannot interleave
+        its delete and insert with ours.
+
+        Returns:
+            Dict with ``events`` scanned, ``buckets`` written and
+            ``elapsed_ms``; ``skipped`` = 1 when another refresh is running.
+        """
+        redis = await get_redis()
+        token = uuid.uuid4().hex
+        if not await redis.set(REFRESH_LOCK_KEY, token, nx=True, ex=REFRESH_LOCK_TTL):
+            logger.info("Pipeline rollup refresh already running, skipping")
+            return {"events": 0, "buckets": 0, "elapsed_ms": 0, "skipped": 1}
+
+        t0 = time.monotonic()
+        try:
+            now = datetime.now(timezone.utc)
+            if since is None:
+                has_rollups = (await db.execute(
+                    select(PipelineEventRollup.bucket_start).limit(1)
+                )).first() is not None
+                since = now - (REFRESH_LOOKBACK if has_rollups else BACKFILL_WINDOW)
+            start = _floor_bucket(since)
+
+            aggregates: Dict[Tuple[datetime, str, str], NodeRollup] = {}
+            events = 0
+            stream = await db.stream(
+                select(
+                    PipelineEvent.layer,
+                    PipelineEvent.node,
+                    PipelineEvent.status,
+                    PipelineEvent.duration_ms,
+                    PipelineEvent.metadata_,
+                    PipelineEvent.cache_metadata,
+                    PipelineEvent.created_at,
+                )
+                .where(PipelineEvent.created_at >= start)
+                .execution_options(yield_per=REFRESH_PARTITION_SIZE)
+            )
+            async for partition in stream.partitions(REFRESH_PARTITION_SIZE):
+                for layer, node, status, duration_ms, meta, cache_meta, created_at in partition:
+                    key = (_floor_bucket(created_at), layer, node)
+                    agg = aggregates.get(key)
+                    if agg is None:
+                        agg = aggregates[key] = NodeRollup(layer=layer, node=node)
+                    agg.add_event(status, duration_ms, meta, cache_meta)
+                    events += 1
+
+            await db.execute(
+                delete(PipelineEventRollup).where(PipelineEventRollup.bucket_start >= start)
+            )
+            if aggregates:
+                await db.execute(
+                    insert(PipelineEventRollup),
+                    [
+                        agg.to_row(bucket_start, now)
+                        for (bucket_start, _, _), agg in aggregates.items()
+                    ],
+                )
+            await db.commit()
+
+            elapsed_ms = int((time.monotonic() - t0) * 1000)
+            logger.info(
+                "Pipeline rollups refreshed from %s: events=%d, buckets=%d, elapsed=%dms",
+                start.isoformat(), events, len(aggregates), elapsed_ms,
+            )
+            return {
+                "events": events,
+                "buckets": len(aggregates),
+                "elapsed_ms": elapsed_ms,
+                "skipped": 0,
+            }
+        finally:
+            try:
+                if not await redis.eval(_RELEASE_LOCK_SCRIPT, 1, REFRESH_LOCK_KEY, token):
+                    logger.warning("Pipeline rollup refresh lock expired before the refresh finished")
+            except Exception as e:
+                logger.warning("Failed to release pipeline rollup refresh lock: %s", e)
+
+    async def read(
+        self,
+        db: AsyncSession,
+        days: int,
+        layer: Optional[str] = None,
+        nodes: Optional[Iterable[str]] = None,
+    ) -> List[NodeRollup]:
+        """
+        Merge rollups over the last ``days`` into one aggregate per layer/node.
+
+        The window starts at the hour containing ``now - days``.
+
+        Returns:
+            Aggregates ordered by (layer, node)
+        """
+        since = _floor_bucket(datetime.now(timezone.utc) - timedelta(days=days))
+        conditions = [PipelineEventRollup.bucket_start >= since]
+        if layer is not None:
+            conditions.append(PipelineEventRollup.layer == layer)
+        if nodes is not None:
+            conditions.append(PipelineEventRollup.node.in_(list(nodes)))
+
+        result = await db.execute(select(PipelineEventRollup).where(*conditions))
+
+        merged: Dict[Tuple[str, str], NodeRollup] = {}
+        for row in result.scalars():
+            key = (row.layer, row.node)
+            agg = merged.get(key)
+            if agg is None:
+                agg = merged[key] = NodeRollup(layer=row.layer, node=row.node)
+            agg.merge_row(row)
+        return [merged[key] for key in sorted(merged)]
+
+    async def cleanup(
+        self,
+        db: AsyncSession,
+        retention_days: int = ROLLUP_RETENTION_DAYS,
+    ) -> int:
+        """Delete rollup buckets older than the retention period."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        result = await db.execute(
+            delete(PipelineEventRollup).where(PipelineEventRollup.bucket_start < cutoff)
+        )
+        return result.rowcount
+
+
+# Singleton instance
+_service: Optional[PipelineRollupService] = None
+
+
+def get_pipeline_rollup_service() -> PipelineRollupService:
+    """Get singleton instance of PipelineRollupService."""
+    global _service
+    if _service is None:
+        _service = PipelineRollupService()
+    return _service
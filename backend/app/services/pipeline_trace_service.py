@@ -1,7 +1,8 @@
 """Pipeline tracing service for news processing observability.
 
 Provides event recording, querying, and aggregate statistics for
-the 3-layer news processing pipeline.
+the 3-layer news processing pipeline. Aggregate statistics are read
+from hourly rollups (see ``pipeline_rollup_service``).
 """
 
 import logging
@@ -9,22 +10,40 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from sqlalchemy import select, delete, func, and_, text, case, cast, Float
+from sqlalchemy import select, delete, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.pipeline_event import PipelineEvent
+from app.services.pipeline_rollup_service import (
+    LAYER1_SCORE_BUCKETS,
+    LEGACY_SCORE_BUCKETS,
+    NodeRollup,
+    get_pipeline_rollup_service,
+)
+from app.services.pipeline_trace_sink import get_pipeline_trace_sink
 
 logger = logging.getLogger(__name__)
 
 
+def _round(value: Optional[float], digits: int) -> Optional[float]:
+    return round(value, digits) if value is not None else None
+
+
+def _ratio(numerator: float, denominator: float) -> Optional[float]:
+    return numerator / denominator if denominator else None
+
+
 class PipelineTraceService:
     """
     Service for recording and querying pipeline execution events.
 
     Supports two usage patterns:
-    - Direct recording (Layer 1 / 1.5): call record_event() with caller's session
+    - Direct recording (Layer 1 / 1.5): call record_event()
     - Batch recording (Layer 2 / LangGraph): accumulate dicts in state,
-      then flush via record_events_batch() in update_db_node
+      then hand them over via record_events_batch() in update_db_node
+
+    Both go through the buffered trace sink, which writes events with
+    multi-row inserts from a background task.
     """
 
     @staticmethod
@@ -59,7 +78,6 @@ class PipelineTraceService:
 
     @staticmethod
     async def record_event(
-        db: AsyncSession,
         news_id: str,
         layer: str,
         node: str,
@@ -69,47 +87,50 @@ class PipelineTraceService:
         error: Optional[str] = None,
     ) -> None:
         """
-        Record a single pipeline event using the caller's session.
+        Record a single pipeline event.
 
-        Intended for Layer 1 and Layer 1.5 where each task has its own
-        DB session. The caller is responsible for committing.
+        Intended for Layer 1 and Layer 1.5. The event is buffered and
+        written in the background (see ``pipeline_trace_sink``), so it is
+        independent of the caller's transaction.
         """
-        event = PipelineEvent(
-            news_id=news_id,
-            layer=layer,
-            node=node,
-            status=status,
-            duration_ms=duration_ms,
-            metadata_=metadata,
-            error=error,
-        )
-        db.add(event)
+        await get_pipeline_trace_sink().put([
+            PipelineTraceService.make_event(
+                news_id=news_id,
+                layer=layer,
+                node=node,
+                status=status,
+                duration_ms=duration_ms,
+                metadata=metadata,
+                error=error,
+            )
+        ])
 
     @staticmethod
-    async def record_events_batch(
-        db: AsyncSession,
-        events: List[dict],
-    ) -> None:
+    async def record_events_batch(events: List[dict]) -> None:
         """
-        Batch insert pipeline events from LangGraph state.
+        Record pipeline events accumulated in LangGraph state.
 
-        Intended for Layer 2 update_db_node, which flushes all accumulated
-        trace events in a single transaction.
+        Intended for Layer 2 update_db_node, which hands over all
+        accumulated trace events at once. Events are buffered and written
+        in the background.
         """
+        rows = []
         for event_data in events:
-            event = PipelineEvent(
-                id=event_data.get("id", str(uuid4())),
+            row = PipelineTraceService.make_event(
                 news_id=event_data["news_id"],
                 layer=event_data["layer"],
                 node=event_data["node"],
                 status=event_data["status"],
                 duration_ms=event_data.get("duration_ms"),
-                metadata_=event_data.get("metadata_"),
+                metadata=event_data.get("metadata_"),
                 error=event_data.get("error"),
                 cache_metadata=event_data.get("cache_metadata"),
-                created_at=event_data.get("created_at", datetime.now(timezone.utc)),
             )
-            db.add(event)
+            # Keep the id and timestamp assigned when the node ran
+            row["id"] = event_data.get("id") or row["id"]
+            row["created_at"] = event_data.get("created_at") or row["created_at"]
+            rows.append(row)
+        await get_pipeline_trace_sink().put(rows)
 
     @staticmethod
     async def get_article_timeline(
@@ -136,7 +157,8 @@ class PipelineTraceService:
         """
         Compute per-layer/node aggregate statistics over a time window.
 
-        Uses PostgreSQL percentile_cont() for p50/p95 latency calculations.
+        Reads hourly rollups; p50/p95 latency comes from the merged
+        latency histograms.
 
         Returns:
             {
@@ -156,48 +178,20 @@ class PipelineTraceService:
                 ]
             }
         """
-        since = datetime.now(timezone.utc) - timedelta(days=days)
-
-        stmt = (
-            select(
-                PipelineEvent.layer,
-                PipelineEvent.node,
-                func.count().label("count"),
-                func.count()
-                .filter(PipelineEvent.status == "success")
-                .label("success_count"),
-                func.count()
-                .filter(PipelineEvent.status == "error")
-                .label("error_count"),
-                func.avg(PipelineEvent.duration_ms).label("avg_ms"),
-                func.percentile_cont(0.5)
-                .within_group(PipelineEvent.duration_ms)
-                .label("p50_ms"),
-                func.percentile_cont(0.95)
-                .within_group(PipelineEvent.duration_ms)
-                .label("p95_ms"),
-                func.max(PipelineEvent.duration_ms).label("max_ms"),
-            )
-            .where(PipelineEvent.created_at >= since)
-            .group_by(PipelineEvent.layer, PipelineEvent.node)
-            .order_by(PipelineEvent.layer, PipelineEvent.node)
-        )
-
-        result = await db.execute(stmt)
-        rows = result.all()
+        rollups = await get_pipeline_rollup_service().read(db, days)
 
         nodes = []
-        for row in rows:
+        for agg in rollups:
             nodes.append({
-                "layer": row.layer,
-                "node": row.node,
-                "count": row.count,
-                "success_count": row.success_count,
-                "error_count": row.error_count,
-                "avg_ms": round(row.avg_ms, 1) if row.avg_ms is not None else None,
-                "p50_ms": round(row.p50_ms, 1) if row.p50_ms is not None else None,
-                "p95_ms": round(row.p95_ms, 1) if row.p95_ms is not None else None,
-                "max_ms": round(row.max_ms, 1) if row.max_ms is not None else None,
+                "layer": agg.layer,
+                "node": agg.node,
+                "count": agg.count,
+                "success_count": agg.success_count,
+                "error_count": agg.error_count,
+                "avg_ms": _round(agg.avg_ms, 1),
+                "p50_ms": _round(agg.quantile(0.5), 1),
+                "p95_ms": _round(agg.quantile(0.95), 1),
+                "max_ms": _round(agg.duration_max, 1),
             })
 
         return {
@@ -211,140 +205,68 @@ class PipelineTraceService:
         days: int = 7,
     ) -> Dict:
         """
-        Get Layer 1.5 aggregate stats from pipeline_events.
+        Get Layer 1.5 aggregate stats from pipeline event rollups.
 
         Returns fetch overview, image extraction stats, content cleaning stats,
         and provider distribution.
         """
-        since = datetime.now(timezone.utc) - timedelta(days=days)
-
-        # --- Fetch node stats ---
-        fetch_result = await db.execute(
-            text("""
-                SELECT
-                    COUNT(*) AS total,
-                    COUNT(*) FILTER (WHERE status = 'success') AS success,
-                    COUNT(*) FILTER (WHERE status = 'error') AS errors,
-                    AVG(duration_ms) AS avg_ms,
-                    percentile_cont(0.5) WITHIN GROUP (ORDER BY duration_ms) AS p50_ms,
-                    percentile_cont(0.95) WITHIN GROUP (ORDER BY duration_ms) AS p95_ms,
-                    AVG(
-                        CASE WHEN metadata->>'images_found' IS NOT NULL
-                             THEN (metadata->>'images_found')::int ELSE 0 END
-                    ) FILTER (WHERE status = 'success') AS avg_images_found,
-                    AVG(
-                        CASE WHEN metadata->>'images_downloaded' IS NOT NULL
-                             THEN (metadata->>'images_downloaded')::int ELSE 0 END
-                    ) FILTER (WHERE status = 'success') AS avg_images_downloaded,
-                    COUNT(*) FILTER (
-                        WHERE status = 'success'
-                        AND metadata->>'images_downloaded' IS NOT NULL
-                        AND (metadata->>'images_downloaded')::int > 0
-                    ) AS articles_with_images
-                FROM pipeline_events
-                WHERE layer = '1.5' AND node = 'fetch'
-                    AND created_at >= :since
-            """),
-            {"since": since},
+        rollups = {
+            agg.node: agg
+            for agg in await get_pipeline_rollup_service().read(
+                db, days, layer="1.5", nodes=("fetch", "content_cleaning"),
+            )
+        }
+        fetch = rollups.get("fetch") or NodeRollup(layer="1.5", node="fetch")
+        cleaning = rollups.get("content_cleaning") or NodeRollup(
+            layer="1.5", node="content_cleaning",
         )
-        fetch_row = fetch_result.first()
 
+        # --- Fetch node stats ---
         fetch_stats = {
-            "total": fetch_row.total if fetch_row else 0,
-            "success": fetch_row.success if fetch_row else 0,
-            "errors": fetch_row.errors if fetch_row else 0,
-            "avg_ms": round(fetch_row.avg_ms, 1) if fetch_row and fetch_row.avg_ms else None,
-            "p50_ms": round(fetch_row.p50_ms, 1) if fetch_row and fetch_row.p50_ms else None,
-            "p95_ms": round(fetch_row.p95_ms, 1) if fetch_row and fetch_row.p95_ms else None,
-            "avg_images_found": (
-                round(fetch_row.avg_images_found, 1)
-                if fetch_row and fetch_row.avg_images_found else 0
-            ),
-            "avg_images_downloaded": (
-                round(fetch_row.avg_images_downloaded, 1)
-                if fetch_row and fetch_row.avg_images_downloaded else 0
-            ),
-            "articles_with_images": fetch_row.articles_with_images if fetch_row else 0,
+            "total": fetch.count,
+            "success": fetch.success_count,
+            "errors": fetch.error_count,
+            "avg_ms": _round(fetch.avg_ms, 1) or None,
+            "p50_ms": _round(fetch.quantile(0.5), 1) or None,
+            "p95_ms": _round(fetch.quantile(0.95), 1) or None,
+            "avg_images_found": _round(
+                _ratio(fetch.counter("images_found"), fetch.success_count), 1,
+            ) or 0,
+            "avg_images_downloaded": _round(
+                _ratio(fetch.counter("images_downloaded"), fetch.success_count), 1,
+            ) or 0,
+            "articles_with_images": int(fetch.counter("with_images")),
         }
 
         # --- Provider distribution ---
-        provider_result = await db.execute(
-            text("""
-                SELECT
-                    COALESCE(metadata->>'provider', 'unknown') AS provider,
-                    COUNT(*) AS count
-                FROM pipeline_events
-                WHERE layer = '1.5' AND node = 'fetch'
-                    AND status = 'success'
-                    AND created_at >= :since
-                GROUP BY provider
-                ORDER BY count DESC
-            """),
-            {"since": since},
+        provider_distribution = sorted(
+            (
+                {"provider": key.split(":", 1)[1], "count": int(value)}
+                for key, value in fetch.counters.items()
+                if key.startswith("provider:") and value
+            ),
+            key=lambda p: p["count"],
+            reverse=True,
         )
-        provider_distribution = [
-            {"provider": row.provider, "count": row.count}
-            for row in provider_result.all()
-        ]
 
         # --- Content cleaning stats ---
-        cleaning_result = await db.execute(
-            text("""
-                SELECT
-                    COUNT(*) AS total,
-                    COUNT(*) FILTER (WHERE status = 'success') AS success,
-                    COUNT(*) FILTER (WHERE status = 'error') AS errors,
-                    AVG(duration_ms) AS avg_ms,
-                    percentile_cont(0.5) WITHIN GROUP (ORDER BY duration_ms) AS p50_ms,
-                    percentile_cont(0.95) WITHIN GROUP (ORDER BY duration_ms) AS p95_ms,
-                    AVG(
-                        CASE WHEN metadata->>'original_length' IS NOT NULL
-                             AND (metadata->>'original_length')::int > 0
-                             THEN (metadata->>'cleaned_length')::float
-                                  / (metadata->>'original_length')::float
-                             ELSE NULL END
-                    ) FILTER (WHERE status = 'success') AS avg_retention_rate,
-                    COUNT(*) FILTER (
-                        WHERE status = 'success'
-                        AND (metadata->>'has_visual_data')::boolean = true
-                    ) AS articles_with_visual_data,
-                    AVG(
-                        CASE WHEN metadata->>'image_count' IS NOT NULL
-                             THEN (metadata->>'image_count')::int ELSE 0 END
-                    ) FILTER (WHERE status = 'success') AS avg_image_count,
-                    AVG(
-                        CASE WHEN metadata->>'image_insights_length' IS NOT NULL
-                             THEN (metadata->>'image_insights_length')::int ELSE 0 END
-                    ) FILTER (WHERE status = 'success') AS avg_insights_length
-                FROM pipeline_events
-                WHERE layer = '1.5' AND node = 'content_cleaning'
-                    AND created_at >= :since
-            """),
-            {"since": since},
-        )
-        cleaning_row = cleaning_result.first()
-
         cleaning_stats = {
-            "total": cleaning_row.total if cleaning_row else 0,
-            "success": cleaning_row.success if cleaning_row else 0,
-            "errors": cleaning_row.errors if cleaning_row else 0,
-            "avg_ms": round(cleaning_row.avg_ms, 1) if cleaning_row and cleaning_row.avg_ms else None,
-            "p50_ms": round(cleaning_row.p50_ms, 1) if cleaning_row and cleaning_row.p50_ms else None,
-            "p95_ms": round(cleaning_row.p95_ms, 1) if cleaning_row and cleaning_row.p95_ms else None,
-            "avg_retention_rate": (
-                round(cleaning_row.avg_retention_rate, 3)
-                if cleaning_row and cleaning_row.avg_retention_rate is not None
-                else None
-            ),
-            "articles_with_visual_data": cleaning_row.articles_with_visual_data if cleaning_row else 0,
-            "avg_image_count": (
-                round(cleaning_row.avg_image_count, 1)
-                if cleaning_row and cleaning_row.avg_image_count else 0
-            ),
-            "avg_insights_length": (
-                round(cleaning_row.avg_insights_length, 0)
-                if cleaning_row and cleaning_row.avg_insights_length else 0
+            "total": cleaning.count,
+            "success": cleaning.success_count,
+            "errors": cleaning.error_count,
+            "avg_ms": _round(cleaning.avg_ms, 1) or None,
+            "p50_ms": _round(cleaning.quantile(0.5), 1) or None,
+            "p95_ms": _round(cleaning.quantile(0.95), 1) or None,
+            "avg_retention_rate": _round(
+                _ratio(cleaning.counter("retention_sum"), cleaning.counter("retention_count")), 3,
             ),
+            "articles_with_visual_data": int(cleaning.counter("visual_data")),
+            "avg_image_count": _round(
+                _ratio(cleaning.counter("image_count"), cleaning.success_count), 1,
+            ) or 0,
+            "avg_insights_length": _round(
+                _ratio(cleaning.counter("insights_length"), cleaning.success_count), 0,
+            ) or 0,
         }
 
         return {
@@ -360,193 +282,66 @@ class PipelineTraceService:
         days: int = 7,
     ) -> Dict:
         """
-        Get news pipeline stats from pipeline_events metadata.
+        Get news pipeline stats from pipeline event rollups.
 
         Returns score distribution, cache stats, and per-node latency
         for pipeline nodes (score_and_route, multi_agent_analysis, lightweight_filter).
         """
-        since = datetime.now(timezone.utc) - timedelta(days=days)
+        phase2_nodes = ("score_and_route", "multi_agent_analysis", "lightweight_filter")
+        service = get_pipeline_rollup_service()
+        layer1 = await service.read(db, days, layer="1", nodes=("layer1_scoring",))
+        layer2 = {
+            agg.node: agg
+            for agg in await service.read(db, days, layer="2", nodes=phase2_nodes)
+        }
 
         # Score distribution: support both old Phase 2 (layer=2, score 0-100)
-        # and new Layer 1 (layer=1, score 0-300) events
-        # Check which source has data and use appropriate buckets
-        layer1_count_result = await db.execute(
-            text("""
-                SELECT COUNT(*) AS cnt FROM pipeline_events
-                WHERE layer = '1' AND node = 'layer1_scoring'
-                    AND status = 'success'
-                    AND created_at >= :since
-                    AND metadata IS NOT NULL
-                    AND metadata->>'score' IS NOT NULL
-            """),
-            {"since": since},
-        )
-        has_layer1_events = (layer1_count_result.scalar() or 0) > 0
-
-        if has_layer1_events:
-            # New Layer 1 scoring: 0-300 buckets aligned with thresholds
-            # decision field: full_analysis / lightweight / discard
-            score_result = await db.execute(
-                text("""
-                    SELECT
-                        CASE
-                            WHEN (metadata->>'score')::int < 60 THEN '0-59'
-                            WHEN (metadata->>'score')::int < 105 THEN '60-104'
-                            WHEN (metadata->>'score')::int < 150 THEN '105-149'
-                            WHEN (metadata->>'score')::int < 195 THEN '150-194'
-                            ELSE '195-300'
-                        END AS bucket,
-                        COUNT(*) AS count,
-                        COUNT(*) FILTER (
-                            WHERE metadata->>'decision' = 'full_analysis'
-                        ) AS full_analysis,
-                        COUNT(*) FILTER (
-                            WHERE metadata->>'decision' = 'lightweight'
-                        ) AS lightweight,
-                        COUNT(*) FILTER (
-                            WHERE metadata->>'decision' = 'critical_event'
-                        ) AS critical
-                    FROM pipeline_events
-                    WHERE layer = '1' AND node = 'layer1_scoring'
-                        AND status = 'success'
-                        AND created_at >= :since
-                        AND metadata IS NOT NULL
-                        AND metadata->>'score' IS NOT NULL
-                    GROUP BY bucket
-                    ORDER BY MIN((metadata->>'score')::int)
-                """),
-                {"since": since},
-            )
+        # and new Layer 1 (layer=1, score 0-300) events, preferring Layer 1
+        if layer1 and layer1[0].counter("scored") > 0:
+            scoring, buckets = layer1[0], LAYER1_SCORE_BUCKETS
         else:
-            # Legacy Phase 2 scoring: 0-100 buckets
-            score_result = await db.execute(
-                text("""
-                    SELECT
-                        CASE
-                            WHEN (metadata->>'score')::int < 20 THEN '0-19'
-                            WHEN (metadata->>'score')::int < 40 THEN '20-39'
-                            WHEN (metadata->>'score')::int < 60 THEN '40-59'
-                            WHEN (metadata->>'score')::int < 80 THEN '60-79'
-                            ELSE '80-100'
-                        END AS bucket,
-                        COUNT(*) AS count,
-                        COUNT(*) FILTER (
-                            WHERE metadata->>'processing_path' = 'full_analysis'
-                        ) AS full_analysis,
-                        COUNT(*) FILTER (
-                            WHERE metadata->>'processing_path' = 'lightweight'
-                        ) AS lightweight,
-                        COUNT(*) FILTER (
-                            WHERE (metadata->>'is_critical_event')::boolean = true
-                        ) AS critical
-                    FROM pipeline_events
-                    WHERE layer = '2' AND node = 'score_and_route'
-                        AND status = 'success'
-                        AND created_at >= :since
-                        AND metadata IS NOT NULL
-                        AND metadata->>'score' IS NOT NULL
-                    GROUP BY bucket
-                    ORDER BY MIN((metadata->>'score')::int)
-                """),
-                {"since": since},
-            )
-
-        score_distribution = [
-            {
-                "bucket": row.bucket,
-                "count": row.count,
-                "full_analysis": row.full_analysis,
-                "lightweight": row.lightweight,
-                "critical": row.critical,
-            }
-            for row in score_result.all()
-        ]
-
-        # Cache stats from multi_agent_analysis events
-        cache_result = await db.execute(
-            text("""
-                SELECT
-                    COUNT(*) AS total,
-                    AVG(
-                        CASE WHEN cache_metadata->>'cache_hit_rate' IS NOT NULL
-                             THEN (cache_metadata->>'cache_hit_rate')::float
-                             ELSE NULL END
-                    ) AS avg_cache_hit_rate,
-                    SUM(
-                        CASE WHEN cache_metadata IS NOT NULL
-                             AND (cache_metadata->>'cache_hit_rate')::float > 0
-                             THEN 1 ELSE 0 END
-                    ) AS cache_hits,
-                    SUM(
-                        CASE WHEN cache_metadata->>'cached_tokens' IS NOT NULL
-                             THEN (cache_metadata->>'cached_tokens')::int
-                             ELSE 0 END
-                    ) AS total_cached_tokens,
-                    SUM(
-                        CASE WHEN cache_metadata->>'prompt_tokens' IS NOT NULL
-                             THEN (cache_metadata->>'prompt_tokens')::int
-                             ELSE 0 END
-                    ) AS total_prompt_tokens
-                FROM pipeline_events
-                WHERE layer = '2' AND node = 'multi_agent_analysis'
-                    AND status = 'success'
-                    AND created_at >= :since
-            """),
-            {"since": since},
+            scoring, buckets = layer2.get("score_and_route"), LEGACY_SCORE_BUCKETS
+
+        score_distribution = []
+        if scoring is not None:
+            for _, label in buckets:
+                count = int(scoring.counter(f"score:{label}"))
+                if not count:
+                    continue
+                score_distribution.append({
+                    "bucket": label,
+                    "count": count,
+                    "full_analysis": int(scoring.counter(f"score:{label}:full_analysis")),
+                    "lightweight": int(scoring.counter(f"score:{label}:lightweight")),
+                    "critical": int(scoring.counter(f"score:{label}:critical")),
+                })
+
+        # Cache stats from successful multi_agent_analysis events
+        analysis = layer2.get("multi_agent_analysis") or NodeRollup(
+            layer="2", node="multi_agent_analysis",
         )
-        cache_row = cache_result.first()
         cache_stats = {
-            "total": cache_row.total if cache_row else 0,
-            "avg_cache_hit_rate": (
-                round(cache_row.avg_cache_hit_rate, 3)
-                if cache_row and cache_row.avg_cache_hit_rate is not None
-                else None
+            "total": analysis.success_count,
+            "avg_cache_hit_rate": _round(
+                _ratio(analysis.counter("hit_rate_sum"), analysis.counter("hit_rate_count")), 3,
             ),
-            "cache_hits": cache_row.cache_hits if cache_row else 0,
-            "total_cached_tokens": cache_row.total_cached_tokens if cache_row else 0,
-            "total_prompt_tokens": cache_row.total_prompt_tokens if cache_row else 0,
+            "cache_hits": int(analysis.counter("cache_hits")),
+            "total_cached_tokens": int(analysis.counter("cached_tokens")),
+            "total_prompt_tokens": int(analysis.counter("prompt_tokens")),
         }
 
         # Per-node latency for Phase 2 nodes
-        phase2_nodes = ("score_and_route", "multi_agent_analysis", "lightweight_filter")
-        latency_stmt = (
-            select(
-                PipelineEvent.node,
-                func.count().label("count"),
-                func.count()
-                .filter(PipelineEvent.status == "success")
-                .label("success"),
-                func.count()
-                .filter(PipelineEvent.status == "error")
-                .label("errors"),
-                func.avg(PipelineEvent.duration_ms).label("avg_ms"),
-                func.percentile_cont(0.5)
-                .within_group(PipelineEvent.duration_ms)
-                .label("p50_ms"),
-                func.percentile_cont(0.95)
-                .within_group(PipelineEvent.duration_ms)
-                .label("p95_ms"),
-            )
-            .where(
-                PipelineEvent.created_at >= since,
-                PipelineEvent.layer == "2",
-                PipelineEvent.node.in_(phase2_nodes),
-            )
-            .group_by(PipelineEvent.node)
-            .order_by(PipelineEvent.node)
-        )
-        latency_result = await db.execute(latency_stmt)
         node_latency = [
             {
-                "node": row.node,
-                "count": row.count,
-                "success": row.success,
-                "errors": row.errors,
-                "avg_ms": round(row.avg_ms, 1) if row.avg_ms else None,
-                "p50_ms": round(row.p50_ms, 1) if row.p50_ms else None,
-                "p95_ms": round(row.p95_ms, 1) if row.p95_ms else None,
+                "node": agg.node,
+                "count": agg.count,
+                "success": agg.success_count,
+                "errors": agg.error_count,
+                "avg_ms": _round(agg.avg_ms, 1) or None,
+                "p50_ms": _round(agg.quantile(0.5), 1) or None,
+                "p95_ms": _round(agg.quantile(0.95), 1) or None,
             }
-            for row in latency_result.all()
+            for agg in layer2.values()
         ]
 
         return {
@@ -0,0 +1,81 @@
+"""Buffered background writer for pipeline trace events.
+
+``PipelineTraceService.record_event`` / ``record_events_batch`` used to
+add ORM rows to the pipeline's own session, so every traced node paid
+for the insert inside its transaction (and a trace failure could roll
+back real work). Events now go into a bounded in-process buffer
+(``TRACE_SINK_*`` settings, see ``app.core.buffered_sink``) and a
+background task writes them with multi-row INSERTs on its own session.
+Tracing never fails the pipeline; events that do not fit are dropped
+and counted.
+"""
+
+import logging
+from typing import List, Optional
+
+from sqlalchemy import insert
+
+from app.config import settings
+from app.core.buffered_sink import BufferedSink
+from app.db.task_session import get_task_session
+from app.models.pipeline_event import PipelineEvent
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineTraceSink(BufferedSink[dict]):
+    """Buffers ``PipelineTraceService.make_event`` dicts for bulk insert."""
+
+    name = "Pipeline trace sink"
+
+    def __init__(
+        self,
+        max_events: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        backpressure_timeout: Optional[float] = None,
+    ) -> None:
+        super().__init__(
+            max_items=max_events or settings.TRACE_SINK_MAX_EVENTS,
+            batch_size=batch_size or settings.TRACE_SINK_BATCH_SIZE,
+            flush_interval=flush_interval or settings.TRACE_SINK_FLUSH_INTERVAL,
+            backpressure_timeout=(
+                backpressure_timeout
+                if backpressure_timeout is not None
+                else settings.TRACE_SINK_BACKPRESSURE_TIMEOUT
+            ),
+        )
+
+    async def _write(self, batch: List[dict]) -> int:
+        try:
+            async with get_task_session() as db:
+                await db.execute(insert(PipelineEvent), batch)
+                await db.commit()
+        except Exception as e:
+            self.flush_errors += 1
+            self.dropped += len(batch)
+            logger.warning("Pipeline trace flush of %d events failed: %s", len(batch), e)
+            return 0
+        self.written += len(batch)
+        return len(batch)
+
+
+# Singleton instance
+_sink: Optional[PipelineTraceSink] = None
+
+
+def get_pipeline_trace_sink() -> PipelineTraceSink:
+    """Get singleton instance of PipelineTraceSink."""
+    global _sink
+    if _sink is None:
+        _sink = PipelineTraceSink()
+    return _sink
+
+
+async def drain_trace_sink() -> None:
+    """Flush buffered trace events before the current event loop closes."""
+    if _sink is not None:
+        try:
+            await _sink.drain()
+        except Exception as e:
+            logger.warning("Pipeline trace sink drain failed: %s", e)
@@ -3,12 +3,27 @@
 Runs in the main backend process (not qlib-service) since it's lightweight
 and stateless. Uses CanonicalCache daily close prices directly.
 
-All computation is offloaded to a thread via asyncio.to_thread() to avoid
-blocking the event loop.
+The portfolio page issues optimize, efficient-frontier and risk-decomposition
+requests for the same symbol set back to back, so the aligned price matrix,
+returns, expected returns and covariance estimates (sample and Ledoit-Wolf
+shrinkage) are computed once per (symbol set, lookback, as-of date) and
+shared through a small in-process TTL cache; concurrent misses for the same
+key share a single fetch.
+
+Single optimizations run in a thread via asyncio.to_thread(). The efficient
+frontier is solved as a parametric sweep over one cvxpy problem (the target
+return is a parameter, so each point warm-starts from the previous one) in
+a process pool, since cvxpy canonicalization holds the GIL.
 """
 
 import asyncio
 import logging
+import multiprocessing
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -20,12 +35,202 @@ logger = logging.getLogger(__name__)
 # Limit concurrent price fetches to avoid overwhelming the cache/provider
 _FETCH_CONCURRENCY = 10
 
+# Annualization factor for daily returns (matches PyPortfolioOpt's default)
+_TRADING_DAYS = 252
+
+# Market inputs cache: entries are keyed by as-of date, the TTL only bounds
+# staleness of today's (still moving) bar
+_INPUTS_CACHE_TTL = 600  # seconds
+_INPUTS_CACHE_MAX_ENTRIES = 32
+
 
 class PortfolioOptimizationError(Exception):
     """Raised when optimization fails."""
     pass
 
 
+@dataclass
+class MarketInputs:
+    """Aligned price matrix and the estimates derived from it."""
+
+    prices: pd.DataFrame
+    returns: pd.DataFrame
+    mu: pd.Series
+    sample_cov: pd.DataFrame
+    shrunk_cov: pd.DataFrame
+    shrinkage: float
+
+    def cov(self, estimator: str = "sample") -> pd.DataFrame:
+        """Annualized covariance for the given estimator."""
+        if estimator == "sample":
+            return self.sample_cov
+        if estimator == "ledoit_wolf":
+            return self.shrunk_cov
+        raise PortfolioOptimizationError(f"Unknown covariance estimator: {estimator}")
+
+
+def ledoit_wolf_cov(
+    returns: pd.DataFrame,
+    frequency: int = _TRADING_DAYS,
+) -> Tuple[pd.DataFrame, float]:
+    """Ledoit-Wolf shrinkage of the covariance towards a scaled identity.
+
+    Same estimator as ``sklearn.covariance.ledoit_wolf`` (which
+    PyPortfolioOpt's ``CovarianceShrinkage.ledoit_wolf`` wraps), implemented
+    with numpy so scikit-learn is not required.
+
+    Returns:
+        (annualized shrunk covariance, shrinkage intensity in [0, 1])
+    """
+    X = returns.values - returns.values.mean(axis=0)
+    n_samples, n_features = X.shape
+
+    X2 = X ** 2
+    emp_cov_trace = X2.sum(axis=0) / n_samples
+    mu = emp_cov_trace.sum() / n_features
+
+    beta_ = float((X2.T @ X2).sum())
+    delta_ = float(((X.T @ X) ** 2).sum()) / n_samples ** 2
+    beta = (beta_ / n_samples - delta_) / (n_features * n_samples)
+    delta = (delta_ - 2.0 * mu * emp_cov_trace.sum() + n_features * mu ** 2) / n_features
+    beta = min(beta, delta)
+    shrinkage = 0.0 if beta <= 0 or delta <= 0 else float(beta / delta)
+
+    emp_cov = X.T @ X / n_samples
+    shrunk = (1.0 - shrinkage) * emp_cov
+    shrunk[np.diag_indices(n_features)] += shrinkage * mu
+
+    cov = pd.DataFrame(shrunk * frequency, index=returns.columns, columns=returns.columns)
+    return cov, shrinkage
+
+
+def _build_market_inputs(prices: pd.DataFrame) -> MarketInputs:
+    """Compute returns, expected returns and covariance estimates once."""
+    from pypfopt import expected_returns, risk_models
+
+    returns = expected_returns.returns_from_prices(prices)
+    shrunk_cov, shrinkage = ledoit_wolf_cov(returns)
+    return MarketInputs(
+        prices=prices,
+        returns=returns,
+        mu=expected_returns.mean_historical_return(prices),
+        sample_cov=risk_models.sample_cov(prices),
+        shrunk_cov=shrunk_cov,
+        shrinkage=shrinkage,
+    )
+
+
+def _frontier_sweep(
+    mu: pd.Series,
+    cov: pd.DataFrame,
+    weight_bounds: Tuple[float, float],
+    n_points: int,
+) -> List[Dict[str, Any]]:
+    """Solve the efficient frontier as one parametric sweep.
+
+    Module-level so it can be pickled to the process pool. PyPortfolioOpt
+    keeps ``target_return`` as a cvxpy Parameter: the first
+    ``efficient_return`` call builds the problem, later calls only update
+    the parameter and re-solve, which cvxpy warm-starts from the previous
+    solution.
+    """
+    from pypfopt import EfficientFrontier
+
+    # Find min feasible return (min-volatility portfolio). Needs its own
+    # instance: PyPortfolioOpt refuses to change the objective of a solved
+    # problem.
+    ef_min = EfficientFrontier(mu, cov, weight_bounds=weight_bounds)
+    ef_min.min_volatility()
+    min_ret = ef_min.portfolio_performance(verbose=False)[0]
+
+    # Upper bound: use the max individual asset expected return
+    # (max_sharpe gives a return below this, so using mu.max() is more correct)
+    max_ret = float(mu.max())
+    if max_ret <= min_ret:
+        max_ret = min_ret + 0.05
+
+    target_returns = np.linspace(min_ret, max_ret, n_points)
+    frontier: List[Dict[str, Any]] = []
+
+    ef = EfficientFrontier(mu, cov, weight_bounds=weight_bounds)
+    for target in target_returns:
+        try:
+            ef.efficient_return(float(target))
+            perf = ef.portfolio_performance(verbose=False)
+            frontier.append({
+                "expected_return": round(perf[0], 6),
+                "volatility": round(perf[1], 6),
+                "sharpe_ratio": round(perf[2], 4),
+            })
+        except Exception as e:
+            logger.debug("Frontier point at target=%.4f infeasible: %s", target, e)
+            continue
+
+    return frontier
+
+
+# ---------------------------------------------------------------------------
+# Solver process pool
+# ---------------------------------------------------------------------------
+
+# Singleton instance
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Lazily create the solver process pool (None when disabled)."""
+    global _process_pool
+    if _process_pool is None:
+        from app.config import settings
+
+        workers = settings.PORTFOLIO_OPT_PROCESSES
+        if workers <= 0:
+            return None
+        # spawn: forking a process that runs an event loop and DB pools is unsafe
+        _process_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+async def _run_in_process_pool(fn, *args):
+    """Run a picklable function in the solver pool, falling back to a thread."""
+    global _process_pool
+    pool = _get_process_pool()
+    if pool is not None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            logger.warning("Portfolio solver pool broken, recreating; solving in a thread")
+            _process_pool = None
+            pool.shutdown(wait=False)
+    return await asyncio.to_thread(fn, *args)
+
+
+def shutdown_optimization_pool() -> None:
+    """Stop the solver process pool (API shutdown)."""
+    global _process_pool
+    pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ---------------------------------------------------------------------------
+# Market inputs cache
+# ---------------------------------------------------------------------------
+
+_InputsKey = Tuple[Tuple[str, ...], int, date]
+
+_inputs_cache: "OrderedDict[_InputsKey, Tuple[float, MarketInputs]]" = OrderedDict()
+_inputs_inflight: Dict[_InputsKey, asyncio.Task] = {}
+
+
+def clear_market_inputs_cache() -> None:
+    """Drop cached market inputs (tests, manual refresh)."""
+    _inputs_cache.clear()
+
+
 class PortfolioOptimizationService:
     """PyPortfolioOpt wrapper for portfolio optimization."""
 
@@ -95,9 +300,64 @@ class PortfolioOptimizationService:
 
         return prices
 
+    @classmethod
+    async def _get_market_inputs(
+        cls,
+        symbols: List[str],
+        lookback_days: int = 252,
+    ) -> MarketInputs:
+        """Cached market inputs for a symbol set.
+
+        Keyed by (symbol set, lookback, as-of date). Concurrent callers that
+        miss on the same key await one shared load.
+        """
+        key: _InputsKey = (tuple(sorted(set(symbols))), lookback_days, date.today())
+        hit = _inputs_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _INPUTS_CACHE_TTL:
+            _inputs_cache.move_to_end(key)
+            return hit[1]
+
+        loop = asyncio.get_running_loop()
+        task = _inputs_inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(cls._load_market_inputs(key))
+            _inputs_inflight[key] = task
+
+            def _done(t: asyncio.Task, k: _InputsKey = key) -> None:
+                if _inputs_inflight.get(k) is t:
+                    del _inputs_inflight[k]
+
+            task.add_done_callback(_done)
+
+        # Shield so one cancelled request does not cancel the shared load
+        return await asyncio.shield(task)
+
+    @classmethod
+    async def _load_market_inputs(cls, key: _InputsKey) -> MarketInputs:
+        symbols, lookback_days, _ = key
+        prices = await cls._get_price_matrix(list(symbols), lookback_days)
+        inputs = await asyncio.to_thread(_build_market_inputs, prices)
+
+        _inputs_cache[key] = (time.monotonic(), inputs)
+        _inputs_cache.move_to_end(key)
+        while len(_inputs_cache) > _INPUTS_CACHE_MAX_ENTRIES:
+            _inputs_cache.popitem(last=False)
+
+        logger.debug(
+            "Market inputs cached: %d symbols, %d days, shrinkage=%.3f",
+            len(prices.columns), len(prices), inputs.shrinkage,
+        )
+        return inputs
+
+    @staticmethod
+    def _result_symbols(symbols: List[str], inputs: MarketInputs) -> List[str]:
+        """Symbols with usable data, in request order."""
+        columns = set(inputs.prices.columns)
+        return [s for s in dict.fromkeys(symbols) if s in columns]
+
     @staticmethod
     def _optimize_sync(
-        prices: pd.DataFrame,
+        inputs: MarketInputs,
         method: str,
         constraints: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
@@ -105,17 +365,12 @@ class PortfolioOptimizationService:
 
         Methods: max_sharpe, min_volatility, risk_parity, efficient_return
         """
-        from pypfopt import (
-            EfficientFrontier,
-            expected_returns,
-            risk_models,
-        )
+        from pypfopt import EfficientFrontier
 
         constraints = constraints or {}
 
-        # Compute expected returns and covariance
-        mu = expected_returns.mean_historical_return(prices)
-        S = risk_models.sample_cov(prices)
+        mu = inputs.mu
+        S = inputs.cov(constraints.get("cov_estimator") or "sample")
 
         # Weight bounds (validated by schema)
         weight_bounds = (
@@ -136,7 +391,9 @@ class PortfolioOptimizationService:
             ef.efficient_return(target_return=target_return)
         elif method == "risk_parity":
             from pypfopt import HRPOpt
-            hrp = HRPOpt(expected_returns.returns_from_prices(prices))
+            # HRP clusters on the return sample; it needs returns (not just a
+            # covariance) to report expected return and Sharpe.
+            hrp = HRPOpt(inputs.returns)
             hrp.optimize()
             weights = hrp.clean_weights()
             perf = hrp.portfolio_performance(
@@ -186,67 +443,14 @@ class PortfolioOptimizationService:
             "method": method,
         }
 
-    @staticmethod
-    def _efficient_frontier_sync(
-        prices: pd.DataFrame,
-        n_points: int = 20,
-        constraints: Optional[Dict[str, Any]] = None,
-    ) -> List[Dict[str, Any]]:
-        """Compute efficient frontier points (runs in thread)."""
-        from pypfopt import EfficientFrontier, expected_returns, risk_models
-
-        constraints = constraints or {}
-        mu = expected_returns.mean_historical_return(prices)
-        S = risk_models.sample_cov(prices)
-
-        weight_bounds = (
-            constraints.get("min_weight", 0.0),
-            constraints.get("max_weight", 1.0),
-        )
-
-        # Find min feasible return (min-volatility portfolio)
-        ef_min = EfficientFrontier(mu, S, weight_bounds=weight_bounds)
-        ef_min.min_volatility()
-        min_ret = ef_min.portfolio_performance(verbose=False)[0]
-
-        # Upper bound: use the max individual asset expected return
-        # (max_sharpe gives a return below this, so using mu.max() is more correct)
-        max_ret = float(mu.max())
-        if max_ret <= min_ret:
-            max_ret = min_ret + 0.05
-
-        # Generate frontier points
-        target_returns = np.linspace(min_ret, max_ret, n_points)
-        frontier: List[Dict[str, Any]] = []
-
-        for target in target_returns:
-            try:
-                ef = EfficientFrontier(mu, S, weight_bounds=weight_bounds)
-                ef.efficient_return(float(target))
-                perf = ef.portfolio_performance(verbose=False)
-                frontier.append({
-                    "expected_return": round(perf[0], 6),
-                    "volatility": round(perf[1], 6),
-                    "sharpe_ratio": round(perf[2], 4),
-                })
-            except Exception as e:
-                logger.debug("Frontier point at target=%.4f infeasible: %s", target, e)
-                continue
-
-        return frontier
-
     @staticmethod
     def _risk_decomposition_sync(
-        prices: pd.DataFrame,
+        S: pd.DataFrame,
         weights: Dict[str, float],
     ) -> Dict[str, Any]:
         """Compute risk contribution per asset (runs in thread)."""
-        from pypfopt import risk_models
-
-        S = risk_models.sample_cov(prices)
-
-        # Align weights with price columns
-        symbols = list(prices.columns)
+        # Align weights with covariance columns
+        symbols = list(S.columns)
         w = np.array([weights.get(s, 0.0) for s in symbols])
 
         # Portfolio variance
@@ -281,12 +485,12 @@ class PortfolioOptimizationService:
     ) -> Dict[str, Any]:
         """Run portfolio optimization."""
         logger.info("optimize: symbols=%d method=%s lookback=%d", len(symbols), method, lookback_days)
-        prices = await cls._get_price_matrix(symbols, lookback_days)
+        inputs = await cls._get_market_inputs(symbols, lookback_days)
         result = await asyncio.to_thread(
-            cls._optimize_sync, prices, method, constraints,
+            cls._optimize_sync, inputs, method, constraints,
         )
-        result["symbols"] = list(prices.columns)
-        result["data_days"] = len(prices)
+        result["symbols"] = cls._result_symbols(symbols, inputs)
+        result["data_days"] = len(inputs.prices)
         logger.info("optimize complete: %d symbols, sharpe=%.3f", len(result["symbols"]), result["sharpe_ratio"])
         return result
 
@@ -298,15 +502,24 @@ class PortfolioOptimizationService:
         constraints: Optional[Dict[str, Any]] = None,
         lookback_days: int = 252,
     ) -> Dict[str, Any]:
-        """Compute efficient frontier."""
+        """Compute efficient frontier (parametric sweep in the solver pool)."""
         logger.info("efficient_frontier: symbols=%d n_points=%d", len(symbols), n_points)
-        prices = await cls._get_price_matrix(symbols, lookback_days)
-        frontier = await asyncio.to_thread(
-            cls._efficient_frontier_sync, prices, n_points, constraints,
+        constraints = constraints or {}
+        inputs = await cls._get_market_inputs(symbols, lookback_days)
+        weight_bounds = (
+            constraints.get("min_weight", 0.0),
+            constraints.get("max_weight", 1.0),
+        )
+        frontier = await _run_in_process_pool(
+            _frontier_sweep,
+            inputs.mu,
+            inputs.cov(constraints.get("cov_estimator") or "sample"),
+            weight_bounds,
+            n_points,
         )
         return {
-            "symbols": list(prices.columns),
-            "data_days": len(prices),
+            "symbols": cls._result_symbols(symbols, inputs),
+            "data_days": len(inputs.prices),
             "frontier": frontier,
         }
 
@@ -316,13 +529,14 @@ class PortfolioOptimizationService:
         symbols: List[str],
         weights: Dict[str, float],
         lookback_days: int = 252,
+        cov_estimator: str = "sample",
     ) -> Dict[str, Any]:
         """Compute risk decomposition."""
         logger.info("risk_decomposition: symbols=%d", len(symbols))
-        prices = await cls._get_price_matrix(symbols, lookback_days)
+        inputs = await cls._get_market_inputs(symbols, lookback_days)
         result = await asyncio.to_thread(
-            cls._risk_decomposition_sync, prices, weights,
+            cls._risk_decomposition_sync, inputs.cov(cov_estimator), weights,
         )
-        result["symbols"] = list(prices.columns)
-        result["data_days"] = len(prices)
+        result["symbols"] = cls._result_symbols(symbols, inputs)
+        result["data_days"] = len(inputs.prices)
         return result
@@ -1,17 +1,22 @@
 """AKShare data provider for A-shares, HK stocks, and institutional data."""
 
-import asyncio
 import json
 import logging
 import random
-from concurrent.futures import ThreadPoolExecutor
+import time
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional, Set
 
 import pandas as pd
 
+from app.core.bulkhead import run_in_bulkhead
 from app.db.redis import get_redis
 from app.services.providers.base import DataProvider
+from app.services.providers.market_snapshot import (
+    SPOT_CN,
+    SPOT_HK,
+    get_market_snapshot_service,
+)
 from app.services.stock_types import (
     DataSource,
     HistoryInterval,
@@ -28,12 +33,12 @@ from app.services.stock_types import (
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for synchronous akshare calls
-_executor: Optional[ThreadPoolExecutor] = None
-_executor_lock = asyncio.Lock()
-
 EXTERNAL_API_TIMEOUT = 30  # seconds
 
+# Skip the per-symbol HK share lookup for a while after it fails, so quotes
+# do not pay for an unavailable Xueqiu endpoint on every call
+HK_SHARES_RETRY_SECONDS = 600
+
 # Cache TTL configurations (base_seconds, random_range_seconds)
 CACHE_TTL = {
     "fund_holdings": (86400, 3600),  # 24h + rand(1h)
@@ -43,36 +48,15 @@ CACHE_TTL = {
     "stock_industry_cn": (86400, 3600),  # 24h + rand(1h)
     "sector_history": (300, 60),  # 5min + rand(1min)
     "hk_history": (300, 60),  # 5min + rand(1min)
+    "hk_total_shares": (86400, 3600),  # 24h + rand(1h)
 }
 
 
-async def _get_executor() -> ThreadPoolExecutor:
-    """Get thread pool executor, initialize if needed."""
-    global _executor
-    if _executor is None:
-        async with _executor_lock:
-            if _executor is None:
-                _executor = ThreadPoolExecutor(max_workers=10)
-    return _executor
-
-
 async def run_in_executor(func: Callable, *args, **kwargs) -> Any:
-    """Run synchronous function in thread pool with timeout."""
-    loop = asyncio.get_running_loop()
-    executor = await _get_executor()
-    try:
-        return await asyncio.wait_for(
-            loop.run_in_executor(
-                executor,
-                lambda: func(*args, **kwargs),
-            ),
-            timeout=EXTERNAL_API_TIMEOUT,
-        )
-    except asyncio.TimeoutError:
-        logger.warning(
-            f"Executor timeout after {EXTERNAL_API_TIMEOUT}s for function: {func.__name__}"
-        )
-        raise
+    """Run synchronous function in the akshare bulkhead with timeout."""
+    return await run_in_bulkhead(
+        "akshare", func, *args, timeout=EXTERNAL_API_TIMEOUT, **kwargs
+    )
 
 
 def _get_ttl(data_type: str) -> int:
@@ -98,6 +82,8 @@ class AKShareProvider(DataProvider):
     def __init__(self):
         self._redis = None
         self._cache_prefix = "akshare:"
+        # HK code -> monotonic time of the last failed total-shares lookup
+        self._hk_shares_misses: Dict[str, float] = {}
 
     @property
     def source(self) -> DataSource:
@@ -168,43 +154,13 @@ class AKShareProvider(DataProvider):
     async def _get_quote_cn(
         self, symbol: str, market: Market
     ) -> Optional[StockQuote]:
-        """Get real-time quote for A-shares."""
+        """Get real-time quote for A-shares from the shared spot snapshot."""
         try:
-            import akshare as ak
-
             code = normalize_symbol(symbol, market)
-
-            def fetch():
-                df = ak.stock_zh_a_spot_em()
-                row = df[df["代码"] == code]
-                if row.empty:
-                    return None
-                return row.iloc[0].to_dict()
-
-            data = await run_in_executor(fetch)
-            if not data:
+            row = await get_market_snapshot_service().get_row(SPOT_CN, code)
+            if not row:
                 return None
-
-            price = float(data.get("最新价", 0))
-            change = float(data.get("涨跌额", 0))
-            change_pct = float(data.get("涨跌幅", 0))
-
-            return StockQuote(
-                symbol=symbol,
-                name=data.get("名称"),
-                price=price,
-                change=round(change, 4),
-                change_percent=round(change_pct, 2),
-                volume=int(data.get("成交量", 0)),
-                market_cap=float(data.get("总市值", 0)) if data.get("总市值") else None,
-                day_high=float(data.get("最高", 0)) if data.get("最高") else None,
-                day_low=float(data.get("最低", 0)) if data.get("最低") else None,
-                open=float(data.get("今开", 0)) if data.get("今开") else None,
-                previous_close=float(data.get("昨收", 0)) if data.get("昨收") else None,
-                timestamp=datetime.utcnow(),
-                market=market,
-                source=DataSource.AKSHARE,
-            )
+            return self._quote_from_spot_row(symbol, market, row)
         except Exception as e:
             logger.error(f"AKShare CN quote error for {symbol}: {e}")
             return None
@@ -212,48 +168,121 @@ class AKShareProvider(DataProvider):
     async def _get_quote_hk(self, symbol: str) -> Optional[StockQuote]:
         """Get real-time quote for HK stocks.
 
-        Uses stock_individual_spot_xq (Xueqiu) for fast per-symbol lookup
-        instead of stock_hk_spot_em which downloads the entire HK market.
+        Served from the shared HK spot snapshot; falls back to a per-symbol
+        stock_individual_spot_xq (Xueqiu) lookup when the snapshot is
+        unavailable or does not list the symbol. The HK spot table has no
+        market cap, so it is derived from the cached total share count.
         """
         try:
-            import akshare as ak
-
             code = normalize_symbol(symbol, Market.HK)
+            row = await get_market_snapshot_service().get_row(SPOT_HK, code)
+            if not row:
+                return await self._get_quote_hk_xq(symbol, code)
+            quote = self._quote_from_spot_row(symbol, Market.HK, row)
+            if quote is not None and quote.market_cap is None:
+                shares = await self._get_hk_total_shares(code)
+                if shares:
+                    quote.market_cap = shares * quote.price
+            return quote
+        except Exception as e:
+            logger.error(f"AKShare HK quote error for {symbol}: {e}")
+            return None
 
-            def fetch():
-                df = ak.stock_individual_spot_xq(symbol=code)
-                if df is None or df.empty:
-                    return None
-                # Convert item/value pairs to dict
-                return dict(zip(df["item"], df["value"]))
+    async def _get_hk_total_shares(self, code: str) -> Optional[float]:
+        """Total shares of an HK stock from Xueqiu, cached for a day."""
+        import akshare as ak
 
-            data = await run_in_executor(fetch)
-            if not data:
+        def fetch():
+            df = ak.stock_individual_spot_xq(symbol=code)
+            if df is None or df.empty:
                 return None
+            data = dict(zip(df["item"], df["value"]))
+            shares = data.get("基金份额/总股本")
+            if shares:
+                return {"total_shares": float(shares)}
+            # Older responses only carry the market cap
+            cap, price = data.get("资产净值/总市值"), data.get("现价")
+            if cap and price:
+                return {"total_shares": float(cap) / float(price)}
+            return None
 
-            price = float(data.get("现价", 0))
-            change = float(data.get("涨跌", 0))
-            change_pct = float(data.get("涨幅", 0))
+        async def fetch_async():
+            return await run_in_executor(fetch)
 
-            return StockQuote(
-                symbol=symbol,
-                name=data.get("名称"),
-                price=price,
-                change=round(change, 4),
-                change_percent=round(change_pct, 2),
-                volume=int(data.get("成交量", 0)),
-                market_cap=float(data.get("资产净值/总市值", 0)) if data.get("资产净值/总市值") else None,
-                day_high=float(data.get("最高", 0)) if data.get("最高") else None,
-                day_low=float(data.get("最低", 0)) if data.get("最低") else None,
-                open=float(data.get("今开", 0)) if data.get("今开") else None,
-                previous_close=float(data.get("昨收", 0)) if data.get("昨收") else None,
-                timestamp=datetime.utcnow(),
-                market=Market.HK,
-                source=DataSource.AKSHARE,
-            )
-        except Exception as e:
-            logger.error(f"AKShare HK quote error for {symbol}: {e}")
+        missed_at = self._hk_shares_misses.get(code)
+        if missed_at is not None and time.monotonic() - missed_at < HK_SHARES_RETRY_SECONDS:
+            return None
+        data = await self._get_cached_or_fetch("hk_total_shares", code, fetch_async)
+        if not data:
+            self._hk_shares_misses[code] = time.monotonic()
             return None
+        self._hk_shares_misses.pop(code, None)
+        return data["total_shares"]
+
+    @staticmethod
+    def _quote_from_spot_row(
+        symbol: str, market: Market, data: Dict[str, Any]
+    ) -> Optional[StockQuote]:
+        """Build a StockQuote from a spot snapshot row (None if not trading)."""
+        if data.get("最新价") is None:
+            return None
+
+        def opt(key: str) -> Optional[float]:
+            value = data.get(key)
+            return float(value) if value else None
+
+        return StockQuote(
+            symbol=symbol,
+            name=data.get("名称"),
+            price=float(data["最新价"]),
+            change=round(float(data.get("涨跌额") or 0), 4),
+            change_percent=round(float(data.get("涨跌幅") or 0), 2),
+            volume=int(data.get("成交量") or 0),
+            market_cap=opt("总市值"),
+            day_high=opt("最高"),
+            day_low=opt("最低"),
+            open=opt("今开"),
+            previous_close=opt("昨收"),
+            timestamp=datetime.utcnow(),
+            market=market,
+            source=DataSource.AKSHARE,
+        )
+
+    async def _get_quote_hk_xq(self, symbol: str, code: str) -> Optional[StockQuote]:
+        """Per-symbol HK quote from Xueqiu."""
+        import akshare as ak
+
+        def fetch():
+            df = ak.stock_individual_spot_xq(symbol=code)
+            if df is None or df.empty:
+                return None
+            # Convert item/value pairs to dict
+            return dict(zip(df["item"], df["value"]))
+
+        data = await run_in_executor(fetch)
+        if not data:
+            return None
+
+        price = float(data.get("现价", 0))
+        change = float(data.get("涨跌", 0))
+        change_pct = float(data.get("涨幅", 0))
+
+        return StockQuote(
+            symbol=symbol,
+            name=data.get("名称"),
+            price=price,
+            change=round(change, 4),
+            change_percent=round(change_pct, 2),
+            volume=int(data.get("成交量", 0)),
+            market_cap=float(data.get("资产净值/总市值", 0)) if data.get("资产净值/总市值") else None,
+            day_high=float(data.get("最高", 0)) if data.get("最高") else None,
+            day_low=float(data.get("最低", 0)) if data.get("最低") else None,
+            open=float(data.get("今开", 0)) if data.get("今开") else None,
+            previous_close=float(data.get("昨收", 0)) if data.get("昨收") else None,
+            timestamp=datetime.utcnow(),
+            market=Market.HK,
+            source=DataSource.AKSHARE,
+        )
 
     async def get_history(
         self,
@@ -609,50 +638,34 @@ class AKShareProvider(DataProvider):
         return results
 
     async def _search_cn(self, query: str) -> List[SearchResult]:
-        """Search A-share stocks."""
+        """Search A-share stocks in the shared spot snapshot."""
         try:
-            import akshare as ak
-
-            def fetch():
-                df = ak.stock_zh_a_spot_em()
-                mask = df["名称"].str.contains(query, na=False) | df["代码"].str.contains(query, na=False)
-                return df[mask].head(20).to_dict("records")
-
-            results = await run_in_executor(fetch)
-
+            matches = await get_market_snapshot_service().search(SPOT_CN, query)
             return [
                 SearchResult(
-                    symbol=f"{r['代码']}.{'SS' if r['代码'].startswith('6') else 'SZ'}",
-                    name=r["名称"],
-                    exchange="SSE" if r["代码"].startswith("6") else "SZSE",
-                    market=Market.SH if r["代码"].startswith("6") else Market.SZ,
+                    symbol=f"{code}.{'SS' if code.startswith('6') else 'SZ'}",
+                    name=name,
+                    exchange="SSE" if code.startswith("6") else "SZSE",
+                    market=Market.SH if code.startswith("6") else Market.SZ,
                 )
-                for r in results
+                for code, name in matches
             ]
         except Exception as e:
             logger.error(f"AKShare CN search error for {query}: {e}")
             return []
 
     async def _search_hk(self, query: str) -> List[SearchResult]:
-        """Search HK stocks."""
+        """Search HK stocks in the shared spot snapshot."""
         try:
-            import akshare as ak
-
-            def fetch():
-                df = ak.stock_hk_spot_em()
-                mask = df["名称"].str.contains(query, na=False) | df["代码"].str.contains(query, na=False)
-                return df[mask].head(20).to_dict("records")
-
-            results = await run_in_executor(fetch)
-
+            matches = await get_market_snapshot_service().search(SPOT_HK, query)
             return [
                 SearchResult(
-                    symbol=f"{r['代码']}.HK",
-                    name=r["名称"],
+                    symbol=f"{code}.HK",
+                    name=name,
                     exchange="HKEX",
                     market=Market.HK,
                 )
-                for r in results
+                for code, name in matches
             ]
         except Exception as e:
             logger.error(f"AKShare HK search error for {query}: {e}")
@@ -0,0 +1,207 @@
+"""Rolling latency and error tracking for provider routing.
+
+``ProviderRouter`` records every provider attempt here, keyed by
+(provider, market, operation). The tracker keeps a time-bounded window of
+recent attempts and answers two questions for the router:
+
+- ``rank``: the provider order to try. The static priority order is kept
+  unless a provider is degraded (circuit open, high error rate, or a
+  median latency far above a healthy alternative), in which case it
+  moves behind the healthy ones. Old samples age out of the window, so a
+  demoted provider is retried once its bad samples expire.
+- ``hedge_delay``: how long to wait on a provider before starting the
+  next one in parallel, from that provider's recent p95 latency.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    get_circuit_breaker,
+)
+from app.services.providers.base import DataProvider
+from app.services.stock_types import Market
+
+# Samples older than this are ignored
+WINDOW_SECONDS = 300.0
+WINDOW_MAX_SAMPLES = 200
+
+# Minimum samples before stats influence ordering / hedging
+MIN_SAMPLES = 10
+
+# Degraded when at least this share of recent attempts failed
+ERROR_RATE_THRESHOLD = 0.5
+
+# Slow when p50 exceeds SLOW_FACTOR x the best healthy alternative's p50
+# (and SLOW_FLOOR_SECONDS, so fast providers are never reordered by noise)
+SLOW_FACTOR = 3.0
+SLOW_FLOOR_SECONDS = 1.0
+
+BREAKER_CONFIG = CircuitBreakerConfig(failure_threshold=5, recovery_timeout=30.0)
+
+# Attempt outcomes
+OK = "ok"  # Returned data
+EMPTY = "empty"  # Returned None and no other provider had data either
+ERROR = "error"  # Raised, or returned None while another provider had data
+SLOW = "slow"  # Cancelled after a hedge answered first (latency is a lower bound)
+
+StatsKey = Tuple[str, Market, str]
+
+
+@dataclass
+class _Sample:
+    at: float
+    latency: float
+    outcome: str
+
+
+@dataclass
+class ProviderStats:
+    """Summary of recent attempts for one (provider, market, operation)."""
+
+    samples: int
+    error_rate: float
+    p50: Optional[float]
+    p95: Optional[float]
+    p99: Optional[float]
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[index]
+
+
+class ProviderHealthTracker:
+    """Rolling per-(provider, market, operation) latency and error stats."""
+
+    def __init__(self) -> None:
+        self._samples: Dict[StatsKey, Deque[_Sample]] = {}
+        self._breakers: Dict[Tuple[str, Market], CircuitBreaker] = {}
+
+    # === Recording ===
+
+    def record(
+        self,
+        provider: DataProvider,
+        market: Market,
+        operation: str,
+        latency: float,
+        outcome: str,
+    ) -> None:
+        key = (provider.source.value, market, operation)
+        window = self._samples.get(key)
+        if window is None:
+            window = self._samples[key] = deque(maxlen=WINDOW_MAX_SAMPLES)
+        window.append(_Sample(time.monotonic(), latency, outcome))
+
+    def _summarize(self, key: StatsKey) -> ProviderStats:
+        cutoff = time.monotonic() - WINDOW_SECONDS
+        recent = [s for s in self._samples.get(key) or () if s.at >= cutoff]
+        if not recent:
+            return ProviderStats(0, 0.0, None, None, None)
+        errors = sum(1 for s in recent if s.outcome == ERROR)
+        # Latency percentiles describe calls that completed normally
+        latencies = sorted(s.latency for s in recent if s.outcome != ERROR)
+        return ProviderStats(
+            samples=len(recent),
+            error_rate=errors / len(recent),
+            p50=_percentile(latencies, 0.50),
+            p95=_percentile(latencies, 0.95),
+            p99=_percentile(latencies, 0.99),
+        )
+
+    def stats(self, provider: DataProvider, market: Market, operation: str) -> ProviderStats:
+        return self._summarize((provider.source.value, market, operation))
+
+    # === Circuit breakers ===
+
+    async def breaker(self, provider: DataProvider, market: Market) -> CircuitBreaker:
+        key = (provider.source.value, market)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = await get_circuit_breaker(
+                f"provider:{provider.source.value}:{market.value}", BREAKER_CONFIG
+            )
+            self._breakers[key] = breaker
+        return breaker
+
+    # === Routing decisions ===
+
+    def rank(
+        self,
+        providers: List[DataProvider],
+        market: Market,
+        operation: str,
+    ) -> List[DataProvider]:
+        """Static order, with degraded providers moved behind healthy ones."""
+        stats = {p.source: self.stats(p, market, operation) for p in providers}
+
+        def unhealthy(p: DataProvider) -> bool:
+            breaker = self._breakers.get((p.source.value, market))
+            if breaker is not None and breaker.is_open:
+                # OPEN only moves to HALF_OPEN on the next call; once the
+                # recovery timeout has passed, let the static order retry it
+                last_failure = breaker.stats.last_failure_time or 0.0
+                if time.time() - last_failure < breaker.config.recovery_timeout:
+                    return True
+            s = stats[p.source]
+            return s.samples >= MIN_SAMPLES and s.error_rate >= ERROR_RATE_THRESHOLD
+
+        healthy_p50 = {
+            p.source: stats[p.source].p50
+            for p in providers
+            if not unhealthy(p)
+            and stats[p.source].samples >= MIN_SAMPLES
+            and stats[p.source].p50 is not None
+        }
+
+        def slow(p: DataProvider) -> bool:
+            p50 = healthy_p50.get(p.source)
+            if p50 is None or p50 < SLOW_FLOOR_SECONDS:
+                return False
+            others = [v for src, v in healthy_p50.items() if src != p.source]
+            return bool(others) and p50 > SLOW_FACTOR * min(others)
+
+        order = {p.source: i for i, p in enumerate(providers)}
+        return sorted(
+            providers,
+            key=lambda p: (unhealthy(p), slow(p), order[p.source]),
+        )
+
+    def hedge_delay(self, provider: DataProvider, market: Market, operation: str) -> float:
+        """Seconds to wait on ``provider`` before hedging with the next one."""
+        s = self.stats(provider, market, operation)
+        if s.samples < MIN_SAMPLES or s.p95 is None:
+            return settings.PROVIDER_HEDGE_MAX_DELAY
+        return min(
+            max(s.p95, settings.PROVIDER_HEDGE_MIN_DELAY),
+            settings.PROVIDER_HEDGE_MAX_DELAY,
+        )
+
+    def get_status(self) -> List[dict]:
+        """Current stats for every tracked (provider, market, operation)."""
+        status = []
+        for key in list(self._samples):
+            s = self._summarize(key)
+            if not s.samples:
+                continue
+            source, market, operation = key
+            breaker = self._breakers.get((source, market))
+            status.append({
+                "provider": source,
+                "market": market.value,
+                "operation": operation,
+                "samples": s.samples,
+                "error_rate": round(s.error_rate, 3),
+                "p50_ms": round(s.p50 * 1000, 1) if s.p50 is not None else None,
+                "p99_ms": round(s.p99 * 1000, 1) if s.p99 is not None else None,
+                "circuit": breaker.state.value if breaker else None,
+            })
+        return status
@@ -0,0 +1,320 @@
+"""Shared whole-market spot snapshots for AKShare quotes and search.
+
+``ak.stock_zh_a_spot_em()`` / ``ak.stock_hk_spot_em()`` download the full
+spot table (~5,000 A-share rows, ~2,500 HK rows) on every call, and the
+provider used to call them once per quote or search. Each table is now
+downloaded at most once per ``AKSHARE_SPOT_REFRESH_SECONDS`` across all
+workers:
+
+- in-process, concurrent callers share one in-flight refresh;
+- across processes, a Redis ``SET NX`` lock elects one refresher and the
+  others wait for the snapshot it publishes (stored column-wise as JSON).
+
+Snapshots are kept as pandas frames indexed by stock code, so quote and
+batch-quote lookups are index hits and search is a vectorized scan. When a
+refresh fails, the last good snapshot keeps being served.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from app.config import settings
+from app.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY_PREFIX = "akshare:spot:"
+
+# Snapshot tables
+SPOT_CN = "cn"
+SPOT_HK = "hk"
+
+# Columns kept from the spot tables (missing ones are skipped)
+SPOT_TEXT_COLUMNS = ("名称",)
+SPOT_NUMERIC_COLUMNS = (
+    "最新价",
+    "涨跌额",
+    "涨跌幅",
+    "成交量",
+    "总市值",
+    "最高",
+    "最低",
+    "今开",
+    "昨收",
+)
+
+# How long a non-leader waits for the leader's snapshot before fetching itself
+_LEADER_WAIT_SECONDS = 35.0
+_LEADER_POLL_SECONDS = 0.25
+
+
+def _fetch_spot_table(table: str) -> pd.DataFrame:
+    import akshare as ak
+
+    if table == SPOT_CN:
+        return ak.stock_zh_a_spot_em()
+    if table == SPOT_HK:
+        return ak.stock_hk_spot_em()
+    raise ValueError(f"Unknown spot table: {table}")
+
+
+# ---------------------------------------------------------------------------
+# Frame helpers
+# ---------------------------------------------------------------------------
+
+
+def build_spot_frame(raw: pd.DataFrame) -> pd.DataFrame:
+    """Reduce a raw AKShare spot table to an indexed, typed frame."""
+    frame = pd.DataFrame(index=raw["代码"].astype(str).str.strip())
+    frame.index.name = "代码"
+    for col in SPOT_TEXT_COLUMNS:
+        if col in raw.columns:
+            frame[col] = raw[col].astype(str).values
+    for col in SPOT_NUMERIC_COLUMNS:
+        if col in raw.columns:
+            frame[col] = pd.to_numeric(raw[col], errors="coerce").values
+    return frame[~frame.index.duplicated(keep="first")]
+
+
+def frame_to_payload(frame: pd.DataFrame, fetched_at: float) -> str:
+    """Serialize a spot frame column-wise (NaN becomes null)."""
+    columns = {
+        col: frame[col].astype(object).where(frame[col].notna(), None).tolist()
+        for col in frame.columns
+    }
+    return json.dumps(
+        {"fetched_at": fetched_at, "codes": frame.index.tolist(), "columns": columns},
+        ensure_ascii=False,
+    )
+
+
+def frame_from_payload(payload: str) -> Tuple[pd.DataFrame, float]:
+    """Inverse of ``frame_to_payload``."""
+    data = json.loads(payload)
+    frame = pd.DataFrame(data["columns"], index=pd.Index(data["codes"], name="代码"))
+    for col in SPOT_NUMERIC_COLUMNS:
+        if col in frame.columns:
+            frame[col] = pd.to_numeric(frame[col], errors="coerce")
+    return frame, float(data["fetched_at"])
+
+
+def _row_to_dict(frame: pd.DataFrame, code: str) -> Dict[str, Any]:
+    row = frame.loc[code]
+    return {
+        col: (None if pd.isna(value) else value)
+        for col, value in row.items()
+    }
+
+
+def search_frame(frame: pd.DataFrame, query: str, limit: int = 20) -> List[Tuple[str, str]]:
+    """(code, name) pairs whose code or name contains ``query``."""
+    names = frame["名称"] if "名称" in frame.columns else pd.Series("", index=frame.index)
+    mask = names.str.contains(query, na=False, regex=False) | frame.index.str.contains(
+        query, na=False, regex=False
+    )
+    hits = frame.index[mask][:limit]
+    return [(code, names[code]) for code in hits]
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+
+class MarketSnapshotService:
+    """Per-table spot snapshots with single-flight refresh."""
+
+    def __init__(self, refresh_seconds: Optional[float] = None) -> None:
+        self.refresh_seconds = (
+            refresh_seconds
+            if refresh_seconds is not None
+            else settings.AKSHARE_SPOT_REFRESH_SECONDS
+        )
+        # table -> (frame, fetched_at epoch seconds)
+        self._frames: Dict[str, Tuple[pd.DataFrame, float]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        self.downloads = 0
+        self.redis_loads = 0
+        self.refresh_errors = 0
+
+    def _fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at < self.refresh_seconds
+
+    async def get_frame(self, table: str) -> Optional[pd.DataFrame]:
+        """
+        Get the current snapshot for ``table`` (``SPOT_CN`` or ``SPOT_HK``).
+
+        Returns:
+            The indexed spot frame, or None if no snapshot could be loaded.
+        """
+        cached = self._frames.get(table)
+        if cached is not None and self._fresh(cached[1]):
+            return cached[0]
+
+        task = self._inflight.get(table)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._refresh(table))
+            self._inflight[table] = task
+            task.add_done_callback(lambda t, table=table: self._clear_inflight(table, t))
+
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            self.refresh_errors += 1
+            if cached is not None:
+                logger.warning(
+                    "Spot snapshot refresh for %s failed, serving %.0fs old data: %s",
+                    table, time.time() - cached[1], e,
+                )
+                return cached[0]
+            logger.error("Spot snapshot for %s unavailable: %s", table, e)
+            return None
+
+    def _clear_inflight(self, table: str, task: asyncio.Task) -> None:
+        if self._inflight.get(table) is task:
+            del self._inflight[table]
+
+    async def _refresh(self, table: str) -> pd.DataFrame:
+        key = f"{SNAPSHOT_KEY_PREFIX}{table}"
+        lock_key = f"{key}:lock"
+        try:
+            redis = await get_redis()
+        except Exception as e:
+            logger.debug("Redis unavailable for spot snapshot %s: %s", table, e)
+            return await self._download(table, None)
+
+        frame = await self._load_published(redis, key)
+        if frame is not None:
+            return frame
+
+        token = uuid.uuid4().hex
+        try:
+            leader = await redis.set(lock_key, token, nx=True, ex=int(_LEADER_WAIT_SECONDS))
+        except Exception as e:
+            logger.debug("Spot snapshot lock failed for %s: %s", table, e)
+            leader = True
+            token = None
+
+        if leader:
+            try:
+                return await self._download(table, redis)
+            finally:
+                if token is not None:
+                    await self._release(redis, lock_key, token)
+
+        # Another worker is downloading; wait for it to publish
+        deadline = time.monotonic() + _LEADER_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_LEADER_POLL_SECONDS)
+            frame = await self._load_published(redis, key)
+            if frame is not None:
+                return frame
+            try:
+                if not await redis.exists(lock_key):
+                    break
+            except Exception:
+                break
+
+        frame = await self._load_published(redis, key)
+        if frame is not None:
+            return frame
+        logger.info("No published %s spot snapshot after waiting, fetching directly", table)
+        return await self._download(table, redis)
+
+    async def _load_published(self, redis: Any, key: str) -> Optional[pd.DataFrame]:
+        table = key[len(SNAPSHOT_KEY_PREFIX):]
+        try:
+            payload = await redis.get(key)
+            if not payload:
+                return None
+            frame, fetched_at = frame_from_payload(payload)
+        except Exception as e:
+            logger.debug("Ignoring unreadable spot snapshot %s: %s", key, e)
+            return None
+        if not self._fresh(fetched_at):
+            return None
+        self.redis_loads += 1
+        self._frames[table] = (frame, fetched_at)
+        return frame
+
+    async def _download(self, table: str, redis: Optional[Any]) -> pd.DataFrame:
+        from app.services.providers.akshare import run_in_executor
+
+        def fetch() -> pd.DataFrame:
+            return build_spot_frame(_fetch_spot_table(table))
+
+        frame = await run_in_executor(fetch)
+        fetched_at = time.time()
+        self.downloads += 1
+        self._frames[table] = (frame, fetched_at)
+        logger.debug("Downloaded %s spot snapshot (%d rows)", table, len(frame))
+
+        if redis is not None:
+            try:
+                await redis.set(
+                    f"{SNAPSHOT_KEY_PREFIX}{table}",
+                    frame_to_payload(frame, fetched_at),
+                    ex=max(int(self.refresh_seconds * 4), 60),
+                )
+            except Exception as e:
+                logger.warning("Failed to publish %s spot snapshot: %s", table, e)
+        return frame
+
+    @staticmethod
+    async def _release(redis: Any, lock_key: str, token: str) -> None:
+        try:
+            if await redis.get(lock_key) == token:
+                await redis.delete(lock_key)
+        except Exception as e:
+            logger.debug("Spot snapshot lock release failed: %s", e)
+
+    # === Lookups ===
+
+    async def get_row(self, table: str, code: str) -> Optional[Dict[str, Any]]:
+        """Spot row for one code, or None if unknown / unavailable."""
+        rows = await self.get_rows(table, [code])
+        return rows.get(code)
+
+    async def get_rows(self, table: str, codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Spot rows for the given codes (unknown codes are omitted)."""
+        frame = await self.get_frame(table)
+        if frame is None:
+            return {}
+        return {code: _row_to_dict(frame, code) for code in codes if code in frame.index}
+
+    async def search(self, table: str, query: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """(code, name) matches for ``query`` in one table."""
+        frame = await self.get_frame(table)
+        if frame is None:
+            return []
+        return search_frame(frame, query, limit)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tables": {
+                table: {"rows": len(frame), "age_seconds": round(time.time() - fetched_at, 1)}
+                for table, (frame, fetched_at) in self._frames.items()
+            },
+            "downloads": self.downloads,
+            "redis_loads": self.redis_loads,
+            "refresh_errors": self.refresh_errors,
+        }
+
+
+# Singleton instance
+_market_snapshot_service: Optional[MarketSnapshotService] = None
+
+
+def get_market_snapshot_service() -> MarketSnapshotService:
+    """Get singleton instance of MarketSnapshotService."""
+    global _market_snapshot_service
+    if _market_snapshot_service is None:
+        _market_snapshot_service = MarketSnapshotService()
+    return _market_snapshot_service
@@ -2,9 +2,14 @@
 
 import asyncio
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
+from app.config import settings
+from app.core.circuit_breaker import CircuitBreakerOpenError
+from app.services.providers import health
 from app.services.providers.base import DataProvider
+from app.services.providers.health import ProviderHealthTracker
 from app.services.stock_types import (
     HistoryInterval,
     HistoryPeriod,
@@ -32,6 +37,10 @@ class ProviderRouter:
     - METAL: yfinance only
     - HK: AKShare primary, yfinance fallback
     - A-shares (SH/SZ): AKShare primary, Tushare fallback (if available), yfinance fallback
+
+    The order is adjusted per request from rolling health stats (see
+    ``providers.health``): degraded providers move to the back, and slow
+    providers are hedged with the next one.
     """
 
     def __init__(
@@ -45,6 +54,7 @@ class ProviderRouter:
         self._akshare = akshare
         self._tushare = tushare
         self._tiingo = tiingo
+        self._health = ProviderHealthTracker()
 
         # Build routing table: Market -> List[Provider] (in priority order)
         tushare_list = [tushare] if tushare and tushare.is_available() else []
@@ -69,7 +79,13 @@ class ProviderRouter:
         func: Callable[[DataProvider], T],
     ) -> Optional[T]:
         """
-        Try providers in order until one succeeds.
+        Try providers until one returns data.
+
+        Providers are ordered by ``ProviderHealthTracker.rank`` (static
+        priority, degraded providers last). A provider that raises or
+        returns None hands over to the next one immediately; a provider that
+        is slower than its recent p95 gets the next one started in parallel
+        (hedging) and the first non-None result wins.
 
         Args:
             market: Target market
@@ -79,27 +95,101 @@ class ProviderRouter:
         Returns:
             Result from first successful provider, or None
         """
-        providers = self.get_providers(market)
+        # Health stats are kept per operation type, e.g. "get_quote"
+        kind = operation.split("(", 1)[0]
+        providers = self._health.rank(self.get_providers(market), market, kind)
+        hedging = settings.PROVIDER_HEDGING_ENABLED
+
+        pending: Dict[asyncio.Task, Tuple[DataProvider, float]] = {}
+        empty: List[Tuple[DataProvider, float]] = []
+        next_index = 0
+
+        async def attempt(provider: DataProvider) -> Optional[T]:
+            # func is usually a lambda returning a coroutine; the breaker
+            # only awaits coroutine functions, so wrap it
+            async def call() -> Optional[T]:
+                return await func(provider)
+
+            breaker = await self._health.breaker(provider, market)
+            return await breaker.call(call)
+
+        def launch() -> None:
+            nonlocal next_index
+            provider = providers[next_index]
+            next_index += 1
+            task = asyncio.ensure_future(attempt(provider))
+            pending[task] = (provider, time.monotonic())
+
+        try:
+            while pending or next_index < len(providers):
+                if not pending:
+                    launch()
+                    continue
+
+                timeout = None
+                if hedging and next_index < len(providers) and len(pending) == 1:
+                    (provider, started), = pending.values()
+                    delay = self._health.hedge_delay(provider, market, kind)
+                    timeout = max(0.0, started + delay - time.monotonic())
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    logger.debug(
+                        f"{operation}: {providers[next_index - 1].source.value} slow, "
+                        f"hedging with {providers[next_index].source.value}"
+                    )
+                    launch()
+                    continue
 
-        for i, provider in enumerate(providers):
-            try:
-                result = await func(provider)
-                if result is not None:
-                    if i > 0:
+                for task in done:
+                    provider, started = pending.pop(task)
+                    latency = time.monotonic() - started
+                    try:
+                        result = task.result()
+                    except CircuitBreakerOpenError:
+                        logger.debug(f"{operation}: {provider.source.value} circuit open, skipping")
+                        continue
+                    except Exception as e:
+                        self._health.record(provider, market, kind, latency, health.ERROR)
+                        logger.warning(f"{operation}: {provider.source.value} failed: {e}")
+                        continue
+
+                    if result is None:
+                        empty.append((provider, latency))
+                        logger.debug(
+                            f"{operation}: {provider.source.value} returned None, trying next"
+                        )
+                        continue
+
+                    self._health.record(provider, market, kind, latency, health.OK)
+                    # Providers that came back empty while this one had data
+                    # failed the request
+                    for p, lat in empty:
+                        self._health.record(p, market, kind, lat, health.ERROR)
+                    # Losers are cancelled below; what they took so far still
+                    # tells the ranking that they are slow
+                    now = time.monotonic()
+                    for p, start in pending.values():
+                        self._health.record(p, market, kind, now - start, health.SLOW)
+                    if provider is not providers[0]:
                         logger.info(
                             f"{operation}: Fallback to {provider.source.value} succeeded"
                         )
                     return result
-                # Result was None, try next provider
-                logger.debug(
-                    f"{operation}: {provider.source.value} returned None, trying next"
-                )
-            except Exception as e:
-                logger.warning(f"{operation}: {provider.source.value} failed: {e}")
-                continue
+        finally:
+            for task in pending:
+                task.cancel()
 
+        for p, lat in empty:
+            self._health.record(p, market, kind, lat, health.EMPTY)
         return None
 
+    def get_health_status(self) -> List[dict]:
+        """Rolling latency / error stats per (provider, market, operation)."""
+        return self._health.get_status()
+
     # === Core Routing Methods ===
 
     async def get_quote(
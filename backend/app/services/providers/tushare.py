@@ -1,12 +1,11 @@
 """Tushare data provider for A-shares (fallback)."""
 
-import asyncio
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Callable, List, Optional, Set
 
+from app.core.bulkhead import run_in_bulkhead
 from app.services.providers.base import DataProvider
 from app.services.stock_types import (
     DataSource,
@@ -21,40 +20,14 @@ from app.services.stock_types import (
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for synchronous tushare calls
-_executor: Optional[ThreadPoolExecutor] = None
-_executor_lock = asyncio.Lock()
-
 EXTERNAL_API_TIMEOUT = 30  # seconds
 
 
-async def _get_executor() -> ThreadPoolExecutor:
-    """Get thread pool executor, initialize if needed."""
-    global _executor
-    if _executor is None:
-        async with _executor_lock:
-            if _executor is None:
-                _executor = ThreadPoolExecutor(max_workers=4)
-    return _executor
-
-
 async def run_in_executor(func: Callable, *args, **kwargs) -> Any:
-    """Run synchronous function in thread pool with timeout."""
-    loop = asyncio.get_running_loop()
-    executor = await _get_executor()
-    try:
-        return await asyncio.wait_for(
-            loop.run_in_executor(
-                executor,
-                lambda: func(*args, **kwargs),
-            ),
-            timeout=EXTERNAL_API_TIMEOUT,
-        )
-    except asyncio.TimeoutError:
-        logger.warning(
-            f"Executor timeout after {EXTERNAL_API_TIMEOUT}s for function: {func.__name__}"
-        )
-        raise
+    """Run synchronous function in the tushare bulkhead with timeout."""
+    return await run_in_bulkhead(
+        "tushare", func, *args, timeout=EXTERNAL_API_TIMEOUT, **kwargs
+    )
 
 
 class TushareProvider(DataProvider):
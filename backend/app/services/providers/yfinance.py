@@ -4,12 +4,12 @@ import asyncio
 import json
 import logging
 import random
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Set
 
 import pandas as pd
 
+from app.core.bulkhead import run_in_bulkhead
 from app.db.redis import get_redis
 from app.services.providers.base import DataProvider
 from app.services.stock_types import (
@@ -28,10 +28,6 @@ from app.services.stock_types import (
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for synchronous yfinance calls
-_executor: Optional[ThreadPoolExecutor] = None
-_executor_lock = asyncio.Lock()
-
 EXTERNAL_API_TIMEOUT = 30  # seconds
 
 # Cache TTL configurations (base_seconds, random_range_seconds)
@@ -51,33 +47,11 @@ MARKET_INDICES = {
 }
 
 
-async def _get_executor() -> ThreadPoolExecutor:
-    """Get thread pool executor, initialize if needed."""
-    global _executor
-    if _executor is None:
-        async with _executor_lock:
-            if _executor is None:
-                _executor = ThreadPoolExecutor(max_workers=10)
-    return _executor
-
-
 async def run_in_executor(func: Callable, *args, **kwargs) -> Any:
-    """Run synchronous function in thread pool with timeout."""
-    loop = asyncio.get_running_loop()
-    executor = await _get_executor()
-    try:
-        return await asyncio.wait_for(
-            loop.run_in_executor(
-                executor,
-                lambda: func(*args, **kwargs),
-            ),
-            timeout=EXTERNAL_API_TIMEOUT,
-        )
-    except asyncio.TimeoutError:
-        logger.warning(
-            f"Executor timeout after {EXTERNAL_API_TIMEOUT}s for function: {func.__name__}"
-        )
-        raise
+    """Run synchronous function in the yfinance bulkhead with timeout."""
+    return await run_in_bulkhead(
+        "yfinance", func, *args, timeout=EXTERNAL_API_TIMEOUT, **kwargs
+    )
 
 
 def _get_ttl(data_type: str) -> int:
@@ -0,0 +1,300 @@
+"""Streaming quote fan-out for SSE subscribers.
+
+Clients watching prices subscribe through ``GET /stocks/quotes/stream``
+instead of polling ``/stocks/quote`` and ``/stocks/batch/quotes``.
+
+- Every API worker runs one refresh loop per symbol that has local
+  subscribers, but only the worker holding the symbol's Redis lease fetches:
+  it asks the ``ProviderRouter`` for a quote every ``QUOTE_STREAM_INTERVAL``
+  seconds and publishes changes on ``quotes:live:{symbol}``.  Other workers'
+  loops just keep trying for the lease, taking over if the leader goes away.
+- Each worker listens on the channel pattern once and fans updates out to
+  its local subscribers through bounded per-connection queues.
+
+So any number of watching clients, across any number of workers, cost one
+upstream fetch per symbol per interval.  If Redis is unavailable, each
+worker fetches for its own subscribers.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "quotes:live:"
+LEASE_PREFIX = "quotes:live-lease:"
+LAST_QUOTE_PREFIX = "quotes:live-last:"
+
+# Per-connection buffer; a slow client loses its oldest updates
+SUBSCRIBER_QUEUE_SIZE = 32
+
+# Seconds without updates before a heartbeat event is sent
+HEARTBEAT_SECONDS = 15.0
+
+# Fields that change on every fetch without the quote itself changing
+_VOLATILE_FIELDS = ("timestamp", "source")
+
+
+def _same_quote(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    keys = (set(a) | set(b)) - set(_VOLATILE_FIELDS)
+    return all(a.get(k) == b.get(k) for k in keys)
+
+
+class QuoteStreamService:
+    """Per-worker quote subscriptions, refresh loops and Redis fan-out."""
+
+    def __init__(self) -> None:
+        self._worker_id = uuid.uuid4().hex
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._loops: Dict[str, asyncio.Task] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._last: Dict[str, Dict[str, Any]] = {}
+
+        self.fetches = 0
+        self.published = 0
+        self.dropped = 0
+
+    # === Subscriptions ===
+
+    async def stream(
+        self,
+        symbols: List[str],
+        heartbeat: float = HEARTBEAT_SECONDS,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield quote events for ``symbols`` until the consumer stops.
+
+        Starts with the latest known quote for each symbol, then yields
+        ``{"type": "quote", "symbol", "data"}`` on every change and
+        ``{"type": "heartbeat"}`` when idle.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        for symbol in symbols:
+            self._subscribers.setdefault(symbol, set()).add(queue)
+            self._ensure_loop(symbol)
+        self._ensure_listener()
+
+        try:
+            for symbol in symbols:
+                quote = self._last.get(symbol) or await self._initial_quote(symbol)
+                if quote is not None:
+                    yield {"type": "quote", "symbol": symbol, "data": quote}
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield {"type": "heartbeat"}
+                    continue
+                yield event
+        finally:
+            self._unsubscribe(symbols, queue)
+
+    def _unsubscribe(self, symbols: List[str], queue: asyncio.Queue) -> None:
+        for symbol in symbols:
+            subscribers = self._subscribers.get(symbol)
+            if subscribers is None:
+                continue
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[symbol]
+                self._last.pop(symbol, None)
+                loop = self._loops.pop(symbol, None)
+                if loop is not None:
+                    loop.cancel()
+        if not self._subscribers and self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    def _deliver(self, symbol: str, event: Dict[str, Any]) -> None:
+        self._last[symbol] = event["data"]
+        for queue in self._subscribers.get(symbol, ()):
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+
+    async def _initial_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Last published quote, else the regular cached quote path."""
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            raw = await redis.get(LAST_QUOTE_PREFIX + symbol)
+            if raw:
+                return json.loads(raw)
+        except Exception as e:
+            logger.debug("Last streamed quote unavailable for %s: %s", symbol, e)
+
+        try:
+            from app.services.stock_service import get_stock_service
+
+            stock_service = await get_stock_service()
+            return await stock_service.get_quote(symbol)
+        except Exception as e:
+            logger.warning("Initial quote failed for %s: %s", symbol, e)
+            return None
+
+    # === Refresh loops ===
+
+    def _ensure_loop(self, symbol: str) -> None:
+        loop = self._loops.get(symbol)
+        if loop is None or loop.done():
+            self._loops[symbol] = asyncio.create_task(self._refresh_loop(symbol))
+
+    async def _refresh_loop(self, symbol: str) -> None:
+        interval = settings.QUOTE_STREAM_INTERVAL
+        clock = asyncio.get_running_loop()
+        while symbol in self._subscribers:
+            started = clock.time()
+            try:
+                redis, leader = await self._hold_lease(symbol, interval)
+                if leader:
+                    await self._refresh(symbol, redis)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Quote stream refresh failed for %s: %s", symbol, e)
+            await asyncio.sleep(max(0.0, interval - (clock.time() - started)))
+
+    async def _hold_lease(self, symbol: str, interval: float):
+        """(redis, is_leader) for this symbol; leads alone when Redis is down."""
+        lease_ms = int(interval * 3000)
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            key = LEASE_PREFIX + symbol
+            if await redis.set(key, self._worker_id, nx=True, px=lease_ms):
+                return redis, True
+            if await redis.get(key) == self._worker_id:
+                await redis.pexpire(key, lease_ms)
+                return redis, True
+            return redis, False
+        except Exception as e:
+            logger.debug("Quote stream lease unavailable for %s: %s", symbol, e)
+            return None, True
+
+    async def _refresh(self, symbol: str, redis: Any) -> None:
+        from app.services.providers import get_provider_router
+        from app.services.stock_service import detect_market
+
+        provider_router = await get_provider_router()
+        quote = await provider_router.get_quote(symbol, detect_market(symbol))
+        self.fetches += 1
+        if quote is None:
+            return
+
+        data = quote.to_dict()
+        previous = self._last.get(symbol)
+        if previous is not None and _same_quote(previous, data):
+            return
+
+        event = {"type": "quote", "symbol": symbol, "data": data}
+        self._deliver(symbol, event)
+        if redis is None:
+            return
+        try:
+            await redis.publish(
+                CHANNEL_PREFIX + symbol,
+                json.dumps({"origin": self._worker_id, **event}, default=str),
+            )
+            await redis.set(
+                LAST_QUOTE_PREFIX + symbol,
+                json.dumps(data, default=str),
+                ex=max(1, int(settings.QUOTE_STREAM_INTERVAL * 6)),
+            )
+            self.published += 1
+        except Exception as e:
+            logger.debug("Quote stream publish failed for %s: %s", symbol, e)
+
+    # === Redis listener ===
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while self._subscribers:
+            pubsub = None
+            try:
+                from app.db.redis import get_redis
+
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                await pubsub.psubscribe(CHANNEL_PREFIX + "*")
+                backoff = 1.0
+                while self._subscribers:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        self._on_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Quote stream listener error, retrying in %.0fs: %s", backoff, e)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.reset()
+                    except Exception:
+                        pass
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        try:
+            event = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if event.pop("origin", None) == self._worker_id:
+            return  # Already delivered locally
+        symbol = event.get("symbol")
+        if symbol in self._subscribers and event.get("data"):
+            self._deliver(symbol, event)
+
+    # === Lifecycle ===
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "symbols": len(self._subscribers),
+            "subscribers": len({id(q) for qs in self._subscribers.values() for q in qs}),
+            "fetches": self.fetches,
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+    async def shutdown(self) -> None:
+        tasks = list(self._loops.values())
+        if self._listener is not None:
+            tasks.append(self._listener)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loops.clear()
+        self._listener = None
+        self._subscribers.clear()
+
+
+# Singleton instance
+_quote_stream_service: Optional[QuoteStreamService] = None
+
+
+def get_quote_stream_service() -> QuoteStreamService:
+    """Get singleton instance of QuoteStreamService."""
+    global _quote_stream_service
+    if _quote_stream_service is None:
+        _quote_stream_service = QuoteStreamService()
+    return _quote_stream_service
+
+
+async def shutdown_quote_stream() -> None:
+    """Stop refresh loops and the Redis listener (application shutdown)."""
+    if _quote_stream_service is not None:
+        await _quote_stream_service.shutdown()
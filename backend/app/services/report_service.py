@@ -3,10 +3,12 @@
 import asyncio
 import html
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, time, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from sqlalchemy import and_, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -30,6 +32,7 @@ from app.schemas.report import (
     StockPerformanceSummary,
     TechnicalSummary,
 )
+from app.services.stock_types import HistoryInterval, HistoryPeriod
 
 logger = logging.getLogger(__name__)
 
@@ -316,6 +319,231 @@ class ReportService:
         await self.db.commit()
 
 
+# ============== Shared Market Snapshot ==============
+
+# Concurrent history/news fetches while building a snapshot
+SNAPSHOT_FETCH_CONCURRENCY = 8
+
+# Reports per generation batch (one snapshot per batch)
+REPORT_BATCH_SIZE = 50
+
+# Bars used for report technicals (SMA 20 trend, RSI 14, 20-day range)
+_TECHNICAL_WINDOW = 30
+_RSI_PERIOD = 14
+
+
+@dataclass
+class ReportMarketSnapshot:
+    """Quotes, technicals and news for a set of symbols, fetched once.
+
+    Built for the union of symbols across a batch of reports; each report
+    then reads the entries for its own symbols.
+    """
+
+    performance: Dict[str, StockPerformanceSummary] = field(default_factory=dict)
+    technicals: Dict[str, TechnicalSummary] = field(default_factory=dict)
+    news: Dict[str, NewsSummary] = field(default_factory=dict)
+
+    def performance_for(self, symbols: List[str]) -> List[StockPerformanceSummary]:
+        return [self.performance.get(s) or StockPerformanceSummary(symbol=s) for s in symbols]
+
+    def technicals_for(self, symbols: List[str]) -> List[TechnicalSummary]:
+        return [self.technicals.get(s) or TechnicalSummary(symbol=s) for s in symbols]
+
+    def news_for(self, symbols: List[str]) -> List[NewsSummary]:
+        return [self.news.get(s) or NewsSummary(symbol=s) for s in symbols]
+
+
+def compute_technical_summaries(
+    closes: Dict[str, List[float]],
+) -> Dict[str, TechnicalSummary]:
+    """Compute trend, RSI and 20-day range for many symbols at once.
+
+    Closes are right-aligned into one NaN-padded matrix (symbols x last
+    ``_TECHNICAL_WINDOW`` bars) so every indicator is a single numpy
+    reduction across all symbols.
+
+    - RSI: simple average of gains/losses over the last 14 changes
+      (needs 15 closes)
+    - Trend: last close vs SMA 20 (+/-2% band, needs 20 closes)
+    - Support/resistance: min/max of the last 20 closes
+    """
+    symbols = [s for s, c in closes.items() if len(c) > _RSI_PERIOD]
+    summaries = {
+        s: TechnicalSummary(symbol=s) for s, c in closes.items() if len(c) <= _RSI_PERIOD
+    }
+    if not symbols:
+        return summaries
+
+    matrix = np.full((len(symbols), _TECHNICAL_WINDOW), np.nan)
+    for i, symbol in enumerate(symbols):
+        tail = closes[symbol][-_TECHNICAL_WINDOW:]
+        matrix[i, _TECHNICAL_WINDOW - len(tail):] = tail
+    counts = np.sum(~np.isnan(matrix), axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        deltas = np.diff(matrix[:, -(_RSI_PERIOD + 1):], axis=1)
+        avg_gain = np.clip(deltas, 0, None).sum(axis=1) / _RSI_PERIOD
+        avg_loss = np.clip(-deltas, 0, None).sum(axis=1) / _RSI_PERIOD
+        rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+        last20 = matrix[:, -20:]
+        sma_20 = np.nanmean(last20, axis=1)
+        support = np.nanmin(last20, axis=1)
+        resistance = np.nanmax(last20, axis=1)
+    current = matrix[:, -1]
+
+    for i, symbol in enumerate(symbols):
+        trend = "neutral"
+        if counts[i] >= 20:
+            if current[i] > sma_20[i] * 1.02:
+                trend = "bullish"
+            elif current[i] < sma_20[i] * 0.98:
+                trend = "bearish"
+        summaries[symbol] = TechnicalSummary(
+            symbol=symbol,
+            trend=trend,
+            support_level=round(float(support[i]), 2),
+            resistance_level=round(float(resistance[i]), 2),
+            rsi=round(float(rsi[i]), 2),
+        )
+    return summaries
+
+
+def summarize_news(symbol: str, news: List[Dict[str, Any]]) -> NewsSummary:
+    """Count sentiment over the 10 most recent articles."""
+    positive_count = 0
+    negative_count = 0
+    neutral_count = 0
+    headlines = []
+
+    for article in news[:10]:  # Limit to recent 10 articles
+        headlines.append(article.get("title", "")[:100])
+
+        sentiment = article.get("sentiment_score")
+        if sentiment is not None:
+            if sentiment > 0.2:
+                positive_count += 1
+            elif sentiment < -0.2:
+                negative_count += 1
+            else:
+                neutral_count += 1
+        else:
+            neutral_count += 1
+
+    return NewsSummary(
+        symbol=symbol,
+        total_articles=len(news),
+        positive_count=positive_count,
+        negative_count=negative_count,
+        neutral_count=neutral_count,
+        top_headlines=headlines[:5],
+    )
+
+
+async def build_market_snapshot(
+    symbols: List[str],
+    news_symbols: Optional[List[str]] = None,
+) -> ReportMarketSnapshot:
+    """Fetch quotes, daily history and news once for a set of symbols.
+
+    Quotes use the batch quote path; history and news are fetched
+    concurrently (bounded by ``SNAPSHOT_FETCH_CONCURRENCY``). Failures for
+    individual symbols leave empty summaries for them.
+
+    Args:
+        symbols: Symbols to include (duplicates are ignored)
+        news_symbols: Symbols that need news (defaults to none)
+    """
+    from app.services.news_service import get_news_service
+    from app.services.stock_service import get_stock_service
+
+    symbols = list(dict.fromkeys(symbols))
+    news_symbols = list(dict.fromkeys(news_symbols or []))
+    stock_service = await get_stock_service()
+    semaphore = asyncio.Semaphore(SNAPSHOT_FETCH_CONCURRENCY)
+    snapshot = ReportMarketSnapshot()
+
+    async def _quotes() -> None:
+        try:
+            quotes = await stock_service.get_batch_quotes(symbols)
+        except Exception as e:
+            logger.warning(f"Error gathering stock performance: {e}")
+            return
+        for symbol in symbols:
+            quote = quotes.get(symbol)
+            if quote:
+                snapshot.performance[symbol] = StockPerformanceSummary(
+                    symbol=symbol,
+                    name=quote.get("name"),
+                    current_price=quote.get("price"),
+                    day_change=quote.get("change"),
+                    day_change_percent=quote.get("change_percent"),
+                    volume=quote.get("volume"),
+                    market_cap=quote.get("market_cap"),
+                )
+
+    async def _closes(symbol: str) -> Tuple[str, List[float]]:
+        async with semaphore:
+            try:
+                history = await stock_service.get_history(
+                    symbol, period=HistoryPeriod.ONE_MONTH, interval=HistoryInterval.DAILY
+                )
+            except Exception as e:
+                logger.warning(f"Error calculating technical for {symbol}: {e}")
+                return symbol, []
+        bars = (history or {}).get("bars") or []
+        return symbol, [float(b["close"]) for b in bars if b.get("close")]
+
+    async def _news(symbol: str) -> None:
+        async with semaphore:
+            try:
+                news = await news_service.get_news_by_symbol(symbol)
+            except Exception as e:
+                logger.warning(f"Error gathering news for {symbol}: {e}")
+                return
+        snapshot.news[symbol] = summarize_news(symbol, news)
+
+    news_service = await get_news_service() if news_symbols else None
+    results = await asyncio.gather(
+        _quotes(),
+        asyncio.gather(*[_closes(s) for s in symbols]),
+        *[_news(s) for s in news_symbols],
+    )
+    snapshot.technicals = compute_technical_summaries(dict(results[1]))
+
+    logger.info(
+        "Report snapshot: %d symbols (%d quotes, %d with technicals, %d news)",
+        len(symbols), len(snapshot.performance),
+        sum(1 for t in snapshot.technicals.values() if t.trend), len(snapshot.news),
+    )
+    return snapshot
+
+
+def plan_report_batches(
+    jobs: List[Tuple[Any, List[str]]],
+    batch_size: int = REPORT_BATCH_SIZE,
+) -> List[List[Any]]:
+    """Group report jobs into batches that share as many symbols as possible.
+
+    Jobs are ordered by their sorted symbol sets, so identical and
+    overlapping watchlists land next to each other, then cut into batches
+    of ``batch_size``; each batch gets one snapshot.
+
+    Args:
+        jobs: (job, symbols) pairs
+        batch_size: Maximum jobs per batch
+
+    Returns:
+        Batches of jobs
+    """
+    ordered = sorted(jobs, key=lambda item: sorted(item[1]))
+    return [
+        [job for job, _ in ordered[i:i + batch_size]]
+        for i in range(0, len(ordered), batch_size)
+    ]
+
+
 class ReportGenerator:
     """Service for generating report content."""
 
@@ -350,6 +578,7 @@ class ReportGenerator:
         symbols: List[str],
         include_portfolio: bool = False,
         include_news: bool = True,
+        snapshot: Optional[ReportMarketSnapshot] = None,
     ) -> Report:
         """
         Generate full report content.
@@ -359,6 +588,8 @@ class ReportGenerator:
             symbols: List of stock symbols to analyze
             include_portfolio: Whether to include portfolio summary
             include_news: Whether to include news summary
+            snapshot: Shared market data covering ``symbols`` (batch
+                generation); fetched for this report alone when omitted
 
         Returns:
             Updated report with content
@@ -369,12 +600,16 @@ class ReportGenerator:
             await self.db.commit()
 
             # Gather all data
-            stock_performance = await self._gather_stock_performance(symbols)
-            technical_analysis = await self._gather_technical_analysis(symbols)
+            if snapshot is None:
+                snapshot = await build_market_snapshot(
+                    symbols, news_symbols=symbols if include_news else None
+                )
+            stock_performance = snapshot.performance_for(symbols)
+            technical_analysis = snapshot.technicals_for(symbols)
 
             news_summary = []
             if include_news:
-                news_summary = await self._gather_news_summary(symbols)
+                news_summary = snapshot.news_for(symbols)
 
             portfolio_summary = None
             if include_portfolio:
@@ -423,180 +658,6 @@ class ReportGenerator:
             await self.db.refresh(report)
             return report
 
-    async def _gather_stock_performance(
-        self, symbols: List[str]
-    ) -> List[StockPerformanceSummary]:
-        """Gather stock performance data for all symbols."""
-        from app.services.stock_service import get_stock_service
-
-        try:
-            stock_service = await get_stock_service()
-            quotes = await stock_service.get_batch_quotes(symbols)
-
-            performance_list = []
-            for symbol in symbols:
-                quote = quotes.get(symbol)
-                if quote:
-                    performance_list.append(
-                        StockPerformanceSummary(
-                            symbol=symbol,
-                            name=quote.get("name"),
-                            current_price=quote.get("price"),
-                            day_change=quote.get("change"),
-                            day_change_percent=quote.get("change_percent"),
-                            volume=quote.get("volume"),
-                            market_cap=quote.get("market_cap"),
-                        )
-                    )
-                else:
-                    performance_list.append(
-                        StockPerformanceSummary(symbol=symbol)
-                    )
-
-            return performance_list
-
-        except Exception as e:
-            logger.warning(f"Error gathering stock performance: {e}")
-            return [StockPerformanceSummary(symbol=s) for s in symbols]
-
-    async def _gather_technical_analysis(
-        self, symbols: List[str]
-    ) -> List[TechnicalSummary]:
-        """Gather basic technical indicators for all symbols."""
-        from app.services.stock_service import get_stock_service
-
-        try:
-            stock_service = await get_stock_service()
-            technical_list = []
-
-            for symbol in symbols:
-                try:
-                    # Get historical data for technical analysis
-                    history = await stock_service.get_history(
-                        symbol, period="1mo", interval="1d"
-                    )
-
-                    if history and len(history) > 14:
-                        # Calculate basic RSI
-                        prices = [h.get("close", 0) for h in history if h.get("close")]
-                        rsi = self._calculate_rsi(prices)
-
-                        # Determine trend
-                        if len(prices) >= 20:
-                            sma_20 = sum(prices[-20:]) / 20
-                            current_price = prices[-1] if prices else 0
-                            if current_price > sma_20 * 1.02:
-                                trend = "bullish"
-                            elif current_price < sma_20 * 0.98:
-                                trend = "bearish"
-                            else:
-                                trend = "neutral"
-                        else:
-                            trend = "neutral"
-
-                        # Support and resistance (simplified)
-                        recent_prices = prices[-20:] if len(prices) >= 20 else prices
-                        support = min(recent_prices) if recent_prices else None
-                        resistance = max(recent_prices) if recent_prices else None
-
-                        technical_list.append(
-                            TechnicalSummary(
-                                symbol=symbol,
-                                trend=trend,
-                                support_level=round(support, 2) if support else None,
-                                resistance_level=round(resistance, 2) if resistance else None,
-                                rsi=round(rsi, 2) if rsi else None,
-                            )
-                        )
-                    else:
-                        technical_list.append(TechnicalSummary(symbol=symbol))
-
-                except Exception as e:
-                    logger.warning(f"Error calculating technical for {symbol}: {e}")
-                    technical_list.append(TechnicalSummary(symbol=symbol))
-
-            return technical_list
-
-        except Exception as e:
-            logger.warning(f"Error gathering technical analysis: {e}")
-            return [TechnicalSummary(symbol=s) for s in symbols]
-
-    def _calculate_rsi(self, prices: List[float], period: int = 14) -> Optional[float]:
-        """Calculate RSI indicator."""
-        if len(prices) < period + 1:
-            return None
-
-        deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
-        recent_deltas = deltas[-(period):]
-
-        gains = [d if d > 0 else 0 for d in recent_deltas]
-        losses = [-d if d < 0 else 0 for d in recent_deltas]
-
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
-
-        if avg_loss == 0:
-            return 100.0
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi
-
-    async def _gather_news_summary(
-        self, symbols: List[str]
-    ) -> List[NewsSummary]:
-        """Gather news summary for all symbols."""
-        from app.services.news_service import get_news_service
-
-        try:
-            news_service = await get_news_service()
-            news_summaries = []
-
-            for symbol in symbols:
-                try:
-                    news = await news_service.get_news_by_symbol(symbol)
-
-                    positive_count = 0
-                    negative_count = 0
-                    neutral_count = 0
-                    headlines = []
-
-                    for article in news[:10]:  # Limit to recent 10 articles
-                        headlines.append(article.get("title", "")[:100])
-
-                        sentiment = article.get("sentiment_score")
-                        if sentiment is not None:
-                            if sentiment > 0.2:
-                                positive_count += 1
-                            elif sentiment < -0.2:
-                                negative_count += 1
-                            else:
-                                neutral_count += 1
-                        else:
-                            neutral_count += 1
-
-                    news_summaries.append(
-                        NewsSummary(
-                            symbol=symbol,
-                            total_articles=len(news),
-                            positive_count=positive_count,
-                            negative_count=negative_count,
-                            neutral_count=neutral_count,
-                            top_headlines=headlines[:5],
-                        )
-                    )
-
-                except Exception as e:
-                    logger.warning(f"Error gathering news for {symbol}: {e}")
-                    news_summaries.append(NewsSummary(symbol=symbol))
-
-            return news_summaries
-
-        except Exception as e:
-            logger.warning(f"Error gathering news summary: {e}")
-            return [NewsSummary(symbol=s) for s in symbols]
-
     async def _gather_portfolio_summary(
         self, user_id: int
     ) -> Optional[PortfolioSummaryForReport]:
@@ -782,6 +843,40 @@ class ReportGenerator:
 
         return []
 
+    async def get_symbols_for_schedules(
+        self, schedules: List[ReportSchedule]
+    ) -> Dict[str, List[str]]:
+        """
+        Resolve symbols for many schedules with a single watchlist query.
+
+        Returns:
+            Mapping of schedule ID to symbols (empty list if none)
+        """
+        watchlist_users = {s.user_id for s in schedules if not s.symbols}
+        watchlist_symbols: Dict[int, List[str]] = {}
+
+        if watchlist_users:
+            query = (
+                select(Watchlist)
+                .where(
+                    and_(
+                        Watchlist.user_id.in_(watchlist_users),
+                        Watchlist.is_default == True,
+                    )
+                )
+                .options(selectinload(Watchlist.items))
+            )
+            result = await self.db.execute(query)
+            for watchlist in result.scalars().all():
+                watchlist_symbols[watchlist.user_id] = [
+                    item.symbol for item in watchlist.items
+                ]
+
+        return {
+            schedule.id: list(schedule.symbols or watchlist_symbols.get(schedule.user_id, []))
+            for schedule in schedules
+        }
+
 
 def generate_html_report(report: Report) -> str:
     """Generate HTML version of the report."""
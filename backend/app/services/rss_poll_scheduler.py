@@ -0,0 +1,143 @@
+"""Adaptive poll scheduling for RSS feeds.
+
+Each feed learns its posting cadence from what polls return:
+
+- ``avg_interarrival_minutes``: EWMA of the gap between consecutive new
+  entries (by publish time), stretched when a feed goes quiet.
+- ``empty_poll_ratio``: EWMA of polls that produced nothing new
+  (304 Not Modified or only already-known entries).
+- ``hourly_activity``: decayed count of new entries per UTC hour, so
+  feeds that only post during market hours are polled less overnight.
+
+The next poll is scheduled at roughly half the expected gap between
+entries, backed off by the empty-poll ratio and the time-of-day pattern,
+and clamped to the feed's bounds (``min/max_poll_interval_minutes`` or
+the ``RSS_POLL_MIN/MAX_MINUTES`` defaults). Feeds without history use
+their static ``poll_interval_minutes``; failing feeds back off
+exponentially.
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+from app.config import settings
+from app.models.rss_feed import RssFeed
+
+# EWMA weights
+INTERARRIVAL_ALPHA = 0.3
+EMPTY_RATIO_ALPHA = 0.2
+
+# Per-poll decay of the hour-of-day histogram (~half-life of 70 polls)
+HOURLY_DECAY = 0.99
+
+# Poll this fraction of the expected gap between entries
+TARGET_GAP_FRACTION = 0.5
+
+# Minimum histogram mass before the time-of-day factor is applied
+MIN_HOURLY_SAMPLES = 24.0
+
+# Bounds of the time-of-day multiplier
+HOUR_FACTOR_RANGE = (0.5, 2.0)
+
+# Inter-arrival samples are clamped to this range (minutes)
+INTERARRIVAL_RANGE = (0.5, 7 * 24 * 60.0)
+
+MAX_ERROR_BACKOFF_EXPONENT = 5
+
+
+def poll_bounds(feed: RssFeed) -> Tuple[float, float]:
+    """Effective (min, max) poll interval in minutes for a feed."""
+    lo = feed.min_poll_interval_minutes or settings.RSS_POLL_MIN_MINUTES
+    hi = feed.max_poll_interval_minutes or settings.RSS_POLL_MAX_MINUTES
+    return float(lo), float(max(lo, hi))
+
+
+def _clamp(value: float, lo: float, hi: float) -> float:
+    return max(lo, min(hi, value))
+
+
+def record_poll(
+    feed: RssFeed,
+    now: datetime,
+    new_entry_times: Sequence[datetime],
+) -> None:
+    """
+    Update a feed's learned cadence after a successful poll.
+
+    Args:
+        feed: Feed that was polled
+        now: Poll time (UTC)
+        new_entry_times: Publish times of entries stored by this poll
+            (empty for 304 or when every entry was already known)
+    """
+    empty = not new_entry_times
+    ratio = feed.empty_poll_ratio or 0.0
+    feed.empty_poll_ratio = (
+        (1 - EMPTY_RATIO_ALPHA) * ratio + EMPTY_RATIO_ALPHA * (1.0 if empty else 0.0)
+    )
+
+    avg = feed.avg_interarrival_minutes
+    if empty:
+        # A quiet stretch longer than the current estimate is evidence the
+        # feed slowed down; fold it in so polling backs off.
+        if avg is not None and feed.last_entry_at is not None:
+            quiet = (now - feed.last_entry_at).total_seconds() / 60
+            if quiet > avg:
+                quiet = _clamp(quiet, *INTERARRIVAL_RANGE)
+                feed.avg_interarrival_minutes = (
+                    (1 - INTERARRIVAL_ALPHA) * avg + INTERARRIVAL_ALPHA * quiet
+                )
+        return
+
+    # Future-dated entries are treated as published now
+    times = sorted(min(t, now) for t in new_entry_times)
+    previous: Optional[datetime] = feed.last_entry_at
+    for t in times:
+        if previous is not None and t >= previous:
+            gap = _clamp((t - previous).total_seconds() / 60, *INTERARRIVAL_RANGE)
+            if avg is None:
+                avg = gap
+            else:
+                avg = (1 - INTERARRIVAL_ALPHA) * avg + INTERARRIVAL_ALPHA * gap
+        if previous is None or t > previous:
+            previous = t
+    feed.avg_interarrival_minutes = avg
+    feed.last_entry_at = previous
+
+    hourly: List[float] = list(feed.hourly_activity or [0.0] * 24)
+    hourly = [round(h * HOURLY_DECAY, 4) for h in hourly]
+    for t in times:
+        hourly[t.hour] += 1.0
+    # Reassign so SQLAlchemy sees the JSON change
+    feed.hourly_activity = hourly
+
+
+def hour_factor(feed: RssFeed, hour: int) -> float:
+    """Interval multiplier for the given UTC hour (<1 busy, >1 quiet)."""
+    hourly = feed.hourly_activity
+    if not hourly or sum(hourly) < MIN_HOURLY_SAMPLES:
+        return 1.0
+    mean = sum(hourly) / 24
+    return _clamp(mean / max(hourly[hour], 1e-6), *HOUR_FACTOR_RANGE)
+
+
+def next_poll_interval(feed: RssFeed, now: datetime) -> float:
+    """Minutes until the feed should be polled again."""
+    lo, hi = poll_bounds(feed)
+
+    if feed.consecutive_errors:
+        exponent = min(feed.consecutive_errors, MAX_ERROR_BACKOFF_EXPONENT)
+        return _clamp(feed.poll_interval_minutes * 2 ** exponent, lo, hi)
+
+    if feed.avg_interarrival_minutes is None:
+        return _clamp(float(feed.poll_interval_minutes), lo, hi)
+
+    interval = feed.avg_interarrival_minutes * TARGET_GAP_FRACTION
+    interval *= 1 + (feed.empty_poll_ratio or 0.0)
+    interval *= hour_factor(feed, now.hour)
+    return _clamp(interval, lo, hi)
+
+
+def schedule_next_poll(feed: RssFeed, now: datetime) -> None:
+    """Set ``feed.next_poll_at`` from its learned cadence."""
+    feed.next_poll_at = now + timedelta(minutes=next_poll_interval(feed, now))
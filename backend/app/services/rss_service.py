@@ -12,20 +12,63 @@ import time
 import uuid
 from calendar import timegm
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import feedparser
 import httpx
-from sqlalchemy import func, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.news import ContentStatus, FilterStatus, News
 from app.models.rss_feed import FeedCategory, RssFeed
+from app.services.rss_poll_scheduler import record_poll, schedule_next_poll
+from app.services.news_dedup_service import get_news_dedup_service
 from app.services.news_storage_service import NewsStorageService, get_news_storage_service
 
 logger = logging.getLogger(__name__)
 
+MAX_ENTRIES_PER_POLL = 100
+MAX_CONSECUTIVE_ERRORS = 10
+
+# Feed settings an explicit null resets to the global default
+CLEARABLE_FEED_FIELDS = frozenset({"min_poll_interval_minutes", "max_poll_interval_minutes"})
+
+
+class _AdaptiveLimiter:
+    """AIMD concurrency limit for feed fetches.
+
+    Grows by roughly one slot per ``limit`` successful fetches and halves
+    on overload signals (timeouts, 429, 5xx), staying within bounds.
+    """
+
+    def __init__(self, minimum: int, maximum: int) -> None:
+        self._min = max(1, minimum)
+        self._max = max(self._min, maximum)
+        self._limit = float(self._min)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+        self.peak = self._min
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def record(self, overloaded: bool) -> None:
+        """Adjust the limit after a fetch completes."""
+        if overloaded:
+            self._limit = max(float(self._min), self._limit / 2)
+        else:
+            self._limit = min(float(self._max), self._limit + 1 / self._limit)
+        self.peak = max(self.peak, int(self._limit))
+
 
 class RssService:
     """
@@ -73,7 +116,7 @@ class RssService:
                 response = await client.get(url)
                 response.raise_for_status()
 
-            parsed = feedparser.parse(response.text)
+            parsed = await asyncio.to_thread(feedparser.parse, response.text)
             articles = []
             for entry in (parsed.entries or [])[:20]:
                 articles.append({
@@ -127,55 +170,101 @@ class RssService:
     async def _fetch_feed_data(
         self,
         feed: RssFeed,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> Dict[str, Any]:
         """
-        Phase 1: HTTP fetch + feedparser parse. No DB operations.
+        Phase 1: conditional HTTP fetch + feedparser parse. No DB operations.
 
-        Returns a dict with parsed entries data or error information.
+        Sends the feed's stored ETag / Last-Modified validators so unchanged
+        feeds come back as 304 without a body. Parsing runs in a worker
+        thread so large feeds do not stall concurrent fetches.
+
+        Args:
+            feed: Feed to fetch (only route/mode/validators are read)
+            client: Shared HTTP client; a one-off client is used if omitted
+
+        Returns:
+            Dict with ``entries``, ``error``, ``elapsed``, ``not_modified``,
+            the response ``etag``/``last_modified`` validators, and
+            ``overloaded`` (timeout, 429 or 5xx) for the adaptive limiter.
         """
         url = self._build_feed_url(feed.rsshub_route, feed.fulltext_mode)
+        headers = {}
+        if feed.etag:
+            headers["If-None-Match"] = feed.etag
+        if feed.last_modified:
+            headers["If-Modified-Since"] = feed.last_modified
+
+        data: Dict[str, Any] = {
+            "entries": [],
+            "error": None,
+            "elapsed": 0.0,
+            "not_modified": False,
+            "etag": None,
+            "last_modified": None,
+            "overloaded": False,
+        }
         start_time = time.monotonic()
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
+            if client is None:
+                async with httpx.AsyncClient(timeout=30.0) as own_client:
+                    response = await own_client.get(url, headers=headers)
+            else:
+                response = await client.get(url, headers=headers)
+
+            if response.status_code == 304:
+                data["not_modified"] = True
+            else:
                 response.raise_for_status()
+                data["entries"] = await asyncio.to_thread(
+                    self._parse_feed_entries, response.text, feed.name,
+                )
+                data["etag"] = (response.headers.get("etag") or "")[:500] or None
+                data["last_modified"] = (
+                    response.headers.get("last-modified") or ""
+                )[:100] or None
 
-            parsed = feedparser.parse(response.text)
-            entries = parsed.entries or []
+        except httpx.ConnectError as e:
+            data["error"] = f"Connection error: {str(e)[:200]}"
+        except httpx.TimeoutException as e:
+            data["error"] = f"Timeout: {str(e)[:200]}"
+            data["overloaded"] = True
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            data["error"] = f"HTTP {status_code}"
+            data["overloaded"] = status_code == 429 or status_code >= 500
+        except Exception as e:
+            data["error"] = str(e)[:500]
 
-            MAX_ENTRIES_PER_POLL = 100
-            if len(entries) > MAX_ENTRIES_PER_POLL:
-                logger.warning("Feed %s returned %d entries, limiting to %d", feed.name, len(entries), MAX_ENTRIES_PER_POLL)
-                entries = entries[:MAX_ENTRIES_PER_POLL]
+        data["elapsed"] = time.monotonic() - start_time
+        return data
 
-            # Pre-process entries into plain dicts (no DB needed)
-            prepared_entries = []
-            for entry in entries:
-                link = getattr(entry, "link", None)
-                if not link:
-                    continue
-                prepared_entries.append({
-                    "link": link,
-                    "title": getattr(entry, "title", "")[:500],
-                    "summary": self._extract_summary(entry),
-                    "published_at": self._parse_entry_date_as_datetime(entry),
-                    "fulltext_content": self._extract_fulltext(entry),
-                })
+    def _parse_feed_entries(self, text: str, feed_name: str) -> List[Dict[str, Any]]:
+        """Parse a feed body into plain entry dicts (runs in a worker thread)."""
+        parsed = feedparser.parse(text)
+        entries = parsed.entries or []
 
-            elapsed = time.monotonic() - start_time
-            return {
-                "entries": prepared_entries,
-                "error": None,
-                "elapsed": elapsed,
-            }
+        if len(entries) > MAX_ENTRIES_PER_POLL:
+            logger.warning(
+                "Feed %s returned %d entries, limiting to %d",
+                feed_name, len(entries), MAX_ENTRIES_PER_POLL,
+            )
+            entries = entries[:MAX_ENTRIES_PER_POLL]
 
-        except httpx.ConnectError as e:
-            return {"entries": [], "error": f"Connection error: {str(e)[:200]}", "elapsed": time.monotonic() - start_time}
-        except httpx.HTTPStatusError as e:
-            return {"entries": [], "error": f"HTTP {e.response.status_code}", "elapsed": time.monotonic() - start_time}
-        except Exception as e:
-            return {"entries": [], "error": str(e)[:500], "elapsed": time.monotonic() - start_time}
+        prepared_entries = []
+        for entry in entries:
+            link = getattr(entry, "link", None)
+            if not link:
+                continue
+            prepared_entries.append({
+                "link": link,
+                "title": getattr(entry, "title", "")[:500],
+                "summary": self._extract_summary(entry),
+                "published_at": self._parse_entry_date_as_datetime(entry),
+                "fulltext_content": self._extract_fulltext(entry),
+            })
+        return prepared_entries
 
     async def poll_feed(
         self,
@@ -196,186 +285,269 @@ class RssService:
         Returns:
             Dict with new_count, skipped_count, fulltext_articles, standard_articles
         """
-        result = {
-            "feed_id": str(feed.id),
-            "feed_name": feed.name,
-            "new_count": 0,
-            "skipped_count": 0,
-            "fulltext_articles": [],  # Articles with fulltext already saved (for Layer 2)
-            "standard_articles": [],  # Articles needing Layer 1.5 fetch
-            "error": None,
-        }
-
-        # Phase 1: Fetch data (skip if pre-fetched)
         if fetched_data is None:
             fetched_data = await self._fetch_feed_data(feed)
+        results = await self._store_polled_feeds(db, [(feed, fetched_data)])
+        return results[0]
 
-        if fetched_data.get("error"):
-            result["error"] = fetched_data["error"]
-            feed.last_polled_at = datetime.now(timezone.utc)
-            feed.consecutive_errors += 1
-            feed.last_error = result["error"]
-            logger.warning("Feed %s fetch failed: %s", feed.name, result["error"])
-
-            if feed.consecutive_errors >= 10:
-                feed.is_enabled = False
-                logger.warning(
-                    "Auto-disabled feed %s after %d consecutive errors",
-                    feed.name, feed.consecutive_errors,
-                )
-            return result
+    async def _store_polled_feeds(
+        self,
+        db: AsyncSession,
+        polled: List[Tuple[RssFeed, Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Phase 2: update feed health and store new entries of all feeds at once.
 
-        prepared_entries = fetched_data["entries"]
+        Entries of every successfully fetched feed are deduplicated with one
+        URL-index lookup and written with a single ``INSERT ... ON CONFLICT
+        DO NOTHING``, so a poll cycle costs a constant number of round trips
+        regardless of how many feeds were due. Validators are only saved
+        after the entries are stored, so a failed write is retried with a
+        full fetch next time instead of being masked by a 304.
 
-        if not prepared_entries:
-            logger.info("Feed %s returned 0 entries", feed.name)
-            feed.last_polled_at = datetime.now(timezone.utc)
-            feed.consecutive_errors = 0
-            feed.last_error = None
-            return result
+        Returns:
+            One result dict per feed, in input order
+        """
+        now = datetime.now(timezone.utc)
+        results: List[Dict[str, Any]] = []
+        to_store: List[Tuple[RssFeed, Dict[str, Any], Dict[str, Any]]] = []
+
+        for feed, fetched_data in polled:
+            result = {
+                "feed_id": str(feed.id),
+                "feed_name": feed.name,
+                "new_count": 0,
+                "skipped_count": 0,
+                "not_modified": False,
+                "fulltext_articles": [],  # Articles with fulltext already saved (for Layer 2)
+                "standard_articles": [],  # Articles needing Layer 1.5 fetch
+                "error": None,
+            }
+            results.append(result)
+
+            if fetched_data.get("error"):
+                result["error"] = fetched_data["error"]
+                logger.warning("Feed %s fetch failed: %s", feed.name, result["error"])
+                self._record_feed_error(feed, result["error"], now)
+            elif fetched_data.get("not_modified"):
+                result["not_modified"] = True
+                logger.debug("Feed %s not modified", feed.name)
+                self._record_feed_success(feed, now)
+            elif not fetched_data["entries"]:
+                logger.info("Feed %s returned 0 entries", feed.name)
+                self._record_feed_success(feed, now, fetched_data)
+            else:
+                to_store.append((feed, fetched_data, result))
 
-        # Phase 2: DB operations (dedup, create News records)
-        try:
-            # Batch dedup: collect all URLs from entries and check against DB
-            entry_urls = [e["link"] for e in prepared_entries]
+        if to_store:
+            try:
+                await self._bulk_insert_entries(db, to_store, now)
+            except Exception as e:
+                logger.exception("Storing entries for %d feeds failed: %s", len(to_store), e)
+                for feed, _, result in to_store:
+                    result["error"] = str(e)[:500]
+                    result["new_count"] = 0
+                    result["fulltext_articles"] = []
+                    result["standard_articles"] = []
+                    self._record_feed_error(feed, result["error"], now)
+            else:
+                for feed, fetched_data, result in to_store:
+                    self._record_feed_success(feed, now, fetched_data)
+                    feed.article_count += result["new_count"]
+                    logger.info(
+                        "Polled feed %s: %d new, %d skipped (%.1fs)",
+                        feed.name, result["new_count"], result["skipped_count"],
+                        fetched_data.get("elapsed", 0),
+                    )
+
+        # Learn each feed's cadence and schedule its next poll
+        for (feed, _), result in zip(polled, results):
+            if not result["error"]:
+                new_articles = result["fulltext_articles"] + result["standard_articles"]
+                record_poll(feed, now, [news.published_at for news in new_articles])
+            schedule_next_poll(feed, now)
+
+        return results
+
+    async def _bulk_insert_entries(
+        self,
+        db: AsyncSession,
+        to_store: List[Tuple[RssFeed, Dict[str, Any], Dict[str, Any]]],
+        now: datetime,
+    ) -> None:
+        """Deduplicate and insert entries of several feeds in one statement.
 
-            existing_urls: set = set()
-            if entry_urls:
-                dedup_query = select(News.url).where(News.url.in_(entry_urls))
-                dedup_result = await db.execute(dedup_query)
-                existing_urls = {row[0] for row in dedup_result.fetchall()}
+        Fills ``new_count``/``skipped_count`` and the article lists of each
+        feed's result dict. Inserted rows are loaded back as ORM objects so
+        callers can update scoring fields and commit as before.
+        """
+        storage_service = get_news_storage_service()
 
-            storage_service = get_news_storage_service()
+        all_urls = [
+            entry["link"] for _, fetched_data, _ in to_store
+            for entry in fetched_data["entries"]
+        ]
+        new_urls = await get_news_dedup_service().filter_new_urls(db, all_urls)
 
-            for entry_data in prepared_entries:
-                link = entry_data["link"]
+        rows: List[Dict[str, Any]] = []
+        row_results: List[Dict[str, Any]] = []
+        claimed: set = set()
 
-                if link in existing_urls:
+        for feed, fetched_data, result in to_store:
+            symbol = feed.symbol or "MARKET"
+            for entry_data in fetched_data["entries"]:
+                link = entry_data["link"]
+                # Already stored, or claimed by an earlier feed this cycle
+                if link not in new_urls or link in claimed:
                     result["skipped_count"] += 1
                     continue
+                claimed.add(link)
+
+                row = {
+                    "id": uuid.uuid4(),
+                    "symbol": symbol,
+                    "title": entry_data["title"],
+                    "summary": entry_data["summary"],
+                    "source": f"rss:{feed.name}"[:100],
+                    "url": link,
+                    "published_at": entry_data["published_at"],
+                    "market": feed.market,
+                    "has_stock_entities": False,
+                    "has_macro_entities": False,
+                    "has_visual_data": False,
+                    "filter_status": FilterStatus.PENDING.value,
+                    "content_status": ContentStatus.PENDING.value,
+                    "content_file_path": None,
+                    "content_fetched_at": None,
+                    "rss_feed_id": feed.id,
+                    "created_at": now,
+                }
+
+                # Fulltext mode with enough content: save it now, skip Layer 1.5
+                fulltext_content = entry_data["fulltext_content"]
+                if feed.fulltext_mode and fulltext_content and len(fulltext_content) >= 500:
+                    file_path = self._save_fulltext(
+                        storage_service, row, feed.name, fulltext_content,
+                    )
+                    if file_path:
+                        row["content_file_path"] = file_path
+                        row["content_status"] = ContentStatus.FETCHED.value
+                        row["content_fetched_at"] = datetime.now(timezone.utc)
+
+                rows.append(row)
+                row_results.append(result)
+
+        if not rows:
+            return
 
-                # Mark as seen to avoid intra-batch duplicates
-                existing_urls.add(link)
-
-                title = entry_data["title"]
-                summary = entry_data["summary"]
-                published_at = entry_data["published_at"]
-                symbol = feed.symbol or "MARKET"
-
-                # Create News record
-                news = News(
-                    symbol=symbol,
-                    title=title,
-                    summary=summary,
-                    source=f"rss:{feed.name}"[:100],
-                    url=link,
-                    published_at=published_at,
-                    market=feed.market,
-                    related_entities=None,
-                    has_stock_entities=False,
-                    has_macro_entities=False,
-                    max_entity_score=None,
-                    primary_entity=None,
-                    primary_entity_type=None,
-                    filter_status=FilterStatus.PENDING.value,
-                    rss_feed_id=feed.id,
+        try:
+            async with db.begin_nested():
+                stmt = (
+                    pg_insert(News)
+                    .on_conflict_do_nothing(index_elements=[News.url])
+                    .returning(News.id)
                 )
+                inserted = await db.execute(stmt, rows)
+                inserted_ids = {row[0] for row in inserted.fetchall()}
+        except Exception:
+            for row in rows:
+                if row["content_file_path"]:
+                    storage_service.delete_content(row["content_file_path"])
+            raise
+
+        news_by_id: Dict[uuid.UUID, News] = {}
+        if inserted_ids:
+            loaded = await db.execute(select(News).where(News.id.in_(inserted_ids)))
+            news_by_id = {news.id: news for news in loaded.scalars().all()}
+
+        for row, result in zip(rows, row_results):
+            news = news_by_id.get(row["id"])
+            if news is None:
+                # Lost a race with a concurrent writer (e.g. the news monitor)
+                logger.debug("Duplicate URL skipped (race): %s", row["url"])
+                result["skipped_count"] += 1
+                if row["content_file_path"]:
+                    storage_service.delete_content(row["content_file_path"])
+                continue
 
-                # Check if fulltext mode provides enough content
-                fulltext_content = entry_data["fulltext_content"]
-                if feed.fulltext_mode and fulltext_content and len(fulltext_content) >= 500:
-                    # Save content directly, skip Layer 1.5
-                    try:
-                        async with db.begin_nested():
-                            db.add(news)
-                            await db.flush()  # Get the ID assigned
-                    except IntegrityError:
-                        logger.debug("Duplicate URL skipped (race): %s", link)
-                        result["skipped_count"] += 1
-                        continue
-
-                    try:
-                        # Detect language (CJK-aware)
-                        chinese_chars = len(re.findall(r"[\u4e00-\u9fff]", fulltext_content))
-                        total_chars = len(fulltext_content)
-                        detected_language = "zh" if (total_chars > 0 and chinese_chars / total_chars > 0.1) else "en"
-
-                        # Calculate word count (CJK-aware)
-                        if detected_language in ("zh", "ja", "ko"):
-                            # For CJK: count characters
-                            word_count = len(re.findall(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]", fulltext_content))
-                        else:
-                            # For other languages: count words
-                            word_count = len(fulltext_content.split())
-
-                        content_data = {
-                            "url": link,
-                            "title": title,
-                            "full_text": fulltext_content,
-                            "authors": [],
-                            "keywords": [],
-                            "top_image": None,
-                            "language": detected_language,
-                            "fetched_at": datetime.now(timezone.utc).isoformat(),
-                            "word_count": word_count,
-                            "metadata": {
-                                "source_domain": "rsshub",
-                                "source_feed": feed.name,
-                            },
-                        }
-                        file_path = storage_service.save_content(
-                            news.id, symbol, content_data, published_at
-                        )
-                        news.content_file_path = file_path
-                        news.content_status = ContentStatus.FETCHED.value
-                        news.content_fetched_at = datetime.now(timezone.utc)
-                        result["fulltext_articles"].append(news)
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to save fulltext for %s: %s", link, e
-                        )
-                        # Fall back to standard pipeline
-                        result["standard_articles"].append(news)
-                else:
-                    try:
-                        async with db.begin_nested():
-                            db.add(news)
-                            await db.flush()
-                    except IntegrityError:
-                        logger.debug("Duplicate URL skipped (race): %s", link)
-                        result["skipped_count"] += 1
-                        continue
-                    result["standard_articles"].append(news)
-
-                result["new_count"] += 1
-
-            # Update feed stats on success
-            feed.last_polled_at = datetime.now(timezone.utc)
-            feed.consecutive_errors = 0
-            feed.last_error = None
-            feed.article_count += result["new_count"]
-
-            elapsed = fetched_data.get("elapsed", 0)
-            logger.info(
-                "Polled feed %s: %d new, %d skipped (%.1fs)",
-                feed.name, result["new_count"], result["skipped_count"], elapsed,
-            )
+            result["new_count"] += 1
+            if row["content_file_path"]:
+                result["fulltext_articles"].append(news)
+            else:
+                result["standard_articles"].append(news)
 
+    @staticmethod
+    def _save_fulltext(
+        storage_service: NewsStorageService,
+        row: Dict[str, Any],
+        feed_name: str,
+        fulltext_content: str,
+    ) -> Optional[str]:
+        """Save feed-provided fulltext for a pending row; None on failure."""
+        try:
+            # Detect language (CJK-aware)
+            chinese_chars = len(re.findall(r"[\u4e00-\u9fff]", fulltext_content))
+            total_chars = len(fulltext_content)
+            detected_language = "zh" if (total_chars > 0 and chinese_chars / total_chars > 0.1) else "en"
+
+            # Calculate word count (CJK-aware)
+            if detected_language in ("zh", "ja", "ko"):
+                # For CJK: count characters
+                word_count = len(re.findall(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]", fulltext_content))
+            else:
+                # For other languages: count words
+                word_count = len(fulltext_content.split())
+
+            content_data = {
+                "url": row["url"],
+                "title": row["title"],
+                "full_text": fulltext_content,
+                "authors": [],
+                "keywords": [],
+                "top_image": None,
+                "language": detected_language,
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "word_count": word_count,
+                "metadata": {
+                    "source_domain": "rsshub",
+                    "source_feed": feed_name,
+                },
+            }
+            return storage_service.save_content(
+                row["id"], row["symbol"], content_data, row["published_at"]
+            )
         except Exception as e:
-            result["error"] = str(e)[:500]
-            feed.last_polled_at = datetime.now(timezone.utc)
-            feed.consecutive_errors += 1
-            feed.last_error = result["error"]
-            logger.exception("Feed %s poll failed: %s", feed.name, e)
-
-            if feed.consecutive_errors >= 10:
-                feed.is_enabled = False
-                logger.warning(
-                    "Auto-disabled feed %s after %d consecutive errors",
-                    feed.name, feed.consecutive_errors,
-                )
+            # Fall back to standard pipeline
+            logger.warning("Failed to save fulltext for %s: %s", row["url"], e)
+            return None
+
+    @staticmethod
+    def _record_feed_error(feed: RssFeed, error: str, now: datetime) -> None:
+        """Record a failed poll and auto-disable after repeated failures."""
+        feed.last_polled_at = now
+        feed.consecutive_errors += 1
+        feed.last_error = error
+
+        if feed.consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+            feed.is_enabled = False
+            logger.warning(
+                "Auto-disabled feed %s after %d consecutive errors",
+                feed.name, feed.consecutive_errors,
+            )
 
-        return result
+    @staticmethod
+    def _record_feed_success(
+        feed: RssFeed,
+        now: datetime,
+        fetched_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a successful poll; store validators from a full (200) fetch."""
+        feed.last_polled_at = now
+        feed.consecutive_errors = 0
+        feed.last_error = None
+        if fetched_data is not None and not fetched_data.get("not_modified"):
+            feed.etag = fetched_data.get("etag")
+            feed.last_modified = fetched_data.get("last_modified")
 
     async def poll_all_due_feeds(
         self,
@@ -385,30 +557,39 @@ class RssService:
         """
         Poll all enabled feeds that are due for polling.
 
-        Phase 1: HTTP fetch + parse concurrently with Semaphore(3).
-        Phase 2: DB writes sequentially using the single db session.
+        Due feeds are selected in SQL. Phase 1 fetches them concurrently
+        over a shared HTTP client, with the concurrency adapting between
+        ``RSS_FETCH_CONCURRENCY_MIN`` and ``RSS_FETCH_CONCURRENCY_MAX``.
+        Phase 2 stores the new entries of all feeds in one bulk insert.
         """
         now = datetime.now(timezone.utc)
 
-        # Find all enabled feeds that are due
-        query = select(RssFeed).where(RssFeed.is_enabled == True)
-        result = await db.execute(query)
-        all_feeds = result.scalars().all()
-
-        due_feeds = []
-        for feed in all_feeds:
-            if feed.last_polled_at is None:
-                due_feeds.append(feed)
-            else:
-                next_poll = feed.last_polled_at + timedelta(
-                    minutes=feed.poll_interval_minutes
-                )
-                if now >= next_poll:
-                    due_feeds.append(feed)
+        total_result = await db.execute(
+            select(func.count()).select_from(RssFeed).where(RssFeed.is_enabled == True)
+        )
+        total_feeds = total_result.scalar() or 0
+
+        # Adaptive schedule (rss_poll_scheduler); feeds polled before it
+        # existed fall back to their static interval.
+        next_poll_at = func.coalesce(
+            RssFeed.next_poll_at,
+            RssFeed.last_polled_at + func.make_interval(
+                0, 0, 0, 0, 0, RssFeed.poll_interval_minutes,
+            ),
+        )
+        result = await db.execute(
+            select(RssFeed)
+            .where(
+                RssFeed.is_enabled == True,
+                or_(RssFeed.last_polled_at.is_(None), next_poll_at <= now),
+            )
+            .order_by(next_poll_at.asc().nulls_first())
+        )
+        due_feeds = result.scalars().all()
 
         if not due_feeds:
             return {
-                "total_feeds": len(all_feeds),
+                "total_feeds": total_feeds,
                 "due_feeds": 0,
                 "polled": 0,
                 "total_new": 0,
@@ -417,32 +598,46 @@ class RssService:
 
         logger.info(
             "RSS monitor: %d/%d feeds due for polling",
-            len(due_feeds), len(all_feeds),
+            len(due_feeds), total_feeds,
         )
 
         # Phase 1: Fetch all feeds concurrently (HTTP only, no DB)
-        semaphore = asyncio.Semaphore(3)
-
-        async def _fetch_one(feed: RssFeed) -> Dict[str, Any]:
-            async with semaphore:
-                return await self._fetch_feed_data(feed)
+        limiter = _AdaptiveLimiter(
+            minimum=settings.RSS_FETCH_CONCURRENCY_MIN,
+            maximum=settings.RSS_FETCH_CONCURRENCY_MAX,
+        )
 
-        fetch_tasks = [_fetch_one(feed) for feed in due_feeds]
-        fetched_results = await asyncio.gather(*fetch_tasks, return_exceptions=True)
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=settings.RSS_FETCH_CONCURRENCY_MAX,
+                max_keepalive_connections=settings.RSS_FETCH_CONCURRENCY_MAX,
+            ),
+        ) as client:
+
+            async def _fetch_one(feed: RssFeed) -> Dict[str, Any]:
+                async with limiter:
+                    fetched_data = await self._fetch_feed_data(feed, client)
+                    limiter.record(fetched_data["overloaded"])
+                    return fetched_data
+
+            fetched_results = await asyncio.gather(
+                *[_fetch_one(feed) for feed in due_feeds], return_exceptions=True,
+            )
 
-        # Phase 2: Process DB writes sequentially
         stats = {
-            "total_feeds": len(all_feeds),
+            "total_feeds": total_feeds,
             "due_feeds": len(due_feeds),
             "polled": 0,
+            "not_modified": 0,
             "total_new": 0,
             "errors": 0,
+            "fetch_concurrency_peak": limiter.peak,
             "feed_results": [],
         }
 
-        for i, fetched_data in enumerate(fetched_results):
-            feed = due_feeds[i]
-
+        polled: List[Tuple[RssFeed, Dict[str, Any]]] = []
+        for feed, fetched_data in zip(due_feeds, fetched_results):
             if isinstance(fetched_data, Exception):
                 logger.error(
                     "Feed %s fetch raised exception: %s",
@@ -450,17 +645,25 @@ class RssService:
                 )
                 stats["errors"] += 1
                 continue
+            polled.append((feed, fetched_data))
 
-            feed_result = await self.poll_feed(
-                db, feed, system_settings, fetched_data=fetched_data
-            )
-
+        # Phase 2: One dedup lookup + bulk insert for all feeds
+        for feed_result in await self._store_polled_feeds(db, polled):
             stats["polled"] += 1
             stats["total_new"] += feed_result.get("new_count", 0)
+            if feed_result.get("not_modified"):
+                stats["not_modified"] += 1
             if feed_result.get("error"):
                 stats["errors"] += 1
             stats["feed_results"].append(feed_result)
 
+        logger.info(
+            "RSS poll cycle: polled=%d, not_modified=%d, new=%d, errors=%d, "
+            "fetch_concurrency_peak=%d",
+            stats["polled"], stats["not_modified"], stats["total_new"],
+            stats["errors"], stats["fetch_concurrency_peak"],
+        )
+
         return stats
 
     # ==================== CRUD Operations ====================
@@ -521,10 +724,21 @@ class RssService:
         feed: RssFeed,
         data: Dict[str, Any],
     ) -> RssFeed:
-        """Update an existing RSS feed."""
+        """Update an existing RSS feed.
+
+        ``None`` values are ignored, except for ``CLEARABLE_FEED_FIELDS``
+        where they clear the per-feed override.
+        """
         for key, value in data.items():
-            if hasattr(feed, key) and value is not None:
+            if hasattr(feed, key) and (value is not None or key in CLEARABLE_FEED_FIELDS):
                 setattr(feed, key, value)
+        # Re-schedule from the static interval once polling settings change
+        if data.keys() & {
+            "poll_interval_minutes",
+            "min_poll_interval_minutes",
+            "max_poll_interval_minutes",
+        }:
+            feed.next_poll_at = None
         await db.commit()
         await db.refresh(feed)
         return feed
@@ -40,6 +40,10 @@ class SkillDefinition:
     description: str
     category: str  # "market_data", "news", "user_data", "knowledge", "computation"
     parameters: List[SkillParameter] = field(default_factory=list)
+    # Seconds a successful result may be shared across callers (None = not cached)
+    cache_ttl: Optional[float] = None
+    # Parameters identifying a cached result (None = all parameters)
+    cache_key_params: Optional[List[str]] = None
 
     def to_json_schema(self) -> Dict[str, Any]:
         """Convert to JSON Schema format (compatible with ToolDefinition.parameters)."""
@@ -97,11 +101,19 @@ class BaseSkill(ABC):
     def category(self) -> str:
         return self.definition().category
 
+    async def execute_cached(self, **kwargs: Any) -> SkillResult:
+        """Execute, reusing a recent result when the definition declares ``cache_ttl``."""
+        from app.skills.cache import get_skill_result_cache
+
+        return await get_skill_result_cache().get_or_execute(
+            self.definition(), kwargs, lambda: self.execute(**kwargs)
+        )
+
     async def safe_execute(self, timeout: float = 15.0, **kwargs: Any) -> SkillResult:
         """Execute with timeout and error handling.  Never raises."""
         start = time.time()
         try:
-            result = await asyncio.wait_for(self.execute(**kwargs), timeout=timeout)
+            result = await asyncio.wait_for(self.execute_cached(**kwargs), timeout=timeout)
             result.metadata.setdefault("latency_ms", int((time.time() - start) * 1000))
             return result
         except asyncio.TimeoutError:
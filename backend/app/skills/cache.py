@@ -0,0 +1,195 @@
+"""Cross-request cache for skill results.
+
+Skills declare caching on their ``SkillDefinition``:
+
+- ``cache_ttl``: seconds a successful result is reused (None = never cached)
+- ``cache_key_params``: parameters that identify the result (None = all
+  declared parameters). Market-wide skills such as ``get_market_context``
+  declare ``[]`` so every symbol shares one entry.
+
+Results are kept in-process and, when the data is JSON-serializable, in
+Redis so API workers and Celery tasks share them. Concurrent identical
+calls in a process share one execution. Failures are never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.skills.base import SkillDefinition, SkillResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "skill:"
+
+# Max results held in-process
+_LOCAL_MAX_ENTRIES = 2_000
+
+
+def skill_cache_key(defn: SkillDefinition, kwargs: Dict[str, Any]) -> Optional[str]:
+    """Cache key for a call, or None if the call is not cacheable."""
+    if defn.cache_ttl is None:
+        return None
+    names = (
+        defn.cache_key_params
+        if defn.cache_key_params is not None
+        else [p.name for p in defn.parameters]
+    )
+    defaults = {p.name: p.default for p in defn.parameters}
+    params: Dict[str, Any] = {}
+    for name in names:
+        value = kwargs.get(name, defaults.get(name))
+        if name == "symbol" and isinstance(value, str):
+            value = value.strip().upper()
+        params[name] = value
+    try:
+        raw = json.dumps(params, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.sha1(raw.encode()).hexdigest()[:20]
+    return f"{CACHE_KEY_PREFIX}{defn.name}:{digest}"
+
+
+def _as_hit(result: SkillResult, source: str) -> SkillResult:
+    """Copy of a cached result (own metadata dict) marked as a cache hit."""
+    metadata = dict(result.metadata)
+    metadata["cache"] = source
+    return replace(result, metadata=metadata)
+
+
+class SkillResultCache:
+    """In-process LRU + Redis cache of successful skill results."""
+
+    def __init__(self, max_entries: int = _LOCAL_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._local: "OrderedDict[str, Tuple[float, SkillResult]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get_or_execute(
+        self,
+        defn: SkillDefinition,
+        kwargs: Dict[str, Any],
+        execute: Callable[[], Awaitable[SkillResult]],
+    ) -> SkillResult:
+        """Return a cached result for this call, or run ``execute`` and cache it."""
+        key = skill_cache_key(defn, kwargs)
+        if key is None:
+            return await execute()
+
+        now = time.monotonic()
+        hit = self._local.get(key)
+        if hit is not None:
+            if hit[0] > now:
+                self._local.move_to_end(key)
+                self.hits += 1
+                return _as_hit(hit[1], "local")
+            del self._local[key]
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            self.hits += 1
+            try:
+                return _as_hit(await asyncio.shield(pending), "shared")
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # This caller was cancelled
+                # The leading caller was cancelled (e.g. its timeout); run it here
+                return await execute()
+
+        future: asyncio.Future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._load(defn, key, execute)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Nobody may be waiting on the shared future
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def _load(
+        self,
+        defn: SkillDefinition,
+        key: str,
+        execute: Callable[[], Awaitable[SkillResult]],
+    ) -> SkillResult:
+        redis = None
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            raw = await redis.get(key)
+            if raw:
+                data = json.loads(raw)
+                result = SkillResult(success=True, data=data["data"], metadata=data["metadata"])
+                self._put_local(key, result, defn.cache_ttl)
+                self.redis_hits += 1
+                return _as_hit(result, "redis")
+        except Exception as e:
+            logger.debug("Skill cache read failed for %s: %s", key, e)
+
+        self.misses += 1
+        result = await execute()
+        if not result.success:
+            return result
+
+        self._put_local(key, result, defn.cache_ttl)
+        if redis is not None:
+            try:
+                payload = json.dumps({"data": result.data, "metadata": result.metadata})
+            except (TypeError, ValueError):
+                payload = None  # Not JSON data; keep it process-local
+            if payload is not None:
+                try:
+                    await redis.set(key, payload, ex=max(1, int(defn.cache_ttl)))
+                except Exception as e:
+                    logger.debug("Skill cache write failed for %s: %s", key, e)
+        return result
+
+    def _put_local(self, key: str, result: SkillResult, ttl: float) -> None:
+        self._local[key] = (time.monotonic() + ttl, result)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    def clear(self) -> None:
+        self._local.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "local_entries": len(self._local),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+        }
+
+
+# Singleton instance
+_skill_result_cache: Optional[SkillResultCache] = None
+
+
+def get_skill_result_cache() -> SkillResultCache:
+    """Get singleton instance of SkillResultCache."""
+    global _skill_result_cache
+    if _skill_result_cache is None:
+        _skill_result_cache = SkillResultCache()
+    return _skill_result_cache
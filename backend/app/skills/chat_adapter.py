@@ -8,9 +8,12 @@ injection and result truncation.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -63,6 +66,36 @@ TOOL_LABELS = {
 _USER_SCOPED_SKILLS = {"get_portfolio", "get_watchlist", "qlib_create_backtest"}
 _DB_SCOPED_SKILLS = {"get_portfolio", "get_watchlist", "search_knowledge_base", "get_news", "qlib_create_backtest"}
 
+# Seconds a successful tool result is reused on later turns of the same
+# conversation; 0 = shared within a turn only.  Tools not listed (backtest
+# creation, portfolio optimization) run on every call.
+TOOL_MEMO_TTLS = {
+    "get_stock_quote": 15,
+    "get_stock_history": 300,
+    "get_stock_info": 3600,
+    "get_stock_financials": 3600,
+    "search_stocks": 3600,
+    "get_news": 300,
+    "get_portfolio": 0,
+    "get_watchlist": 0,
+    "search_knowledge_base": 300,
+    "qlib_compute_factors": 3600,
+    "qlib_evaluate_expression": 3600,
+}
+
+# Tools warmed when a turn starts with a stock in context.  A fresh
+# conversation gets the first three; later turns get the quote plus the
+# tools the conversation has actually used.
+PREFETCH_TOOLS = [
+    "get_stock_quote",
+    "get_stock_history",
+    "get_news",
+    "get_stock_info",
+    "get_stock_financials",
+]
+_PREFETCH_DEFAULT = {"get_stock_quote", "get_stock_history", "get_news"}
+_PREFETCH_MAX_CALLS = 4
+
 
 def skill_to_tool_definition(skill: BaseSkill) -> ToolDefinition:
     """Convert a Skill to a ToolDefinition for LLM function calling."""
@@ -99,11 +132,17 @@ def get_tool_label(tool_name: str, args: Dict[str, Any]) -> str:
     return base
 
 
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
 def _smart_serialize(data: Any, max_chars: int = MAX_TOOL_RESULT_CHARS) -> str:
     """Serialize data to JSON with structure-aware truncation.
 
     Preserves valid JSON and financial precision by intelligently trimming
-    lists and dicts rather than hard-cutting the serialized string.
+    lists and dicts rather than hard-cutting the serialized string.  Lists
+    of same-keyed records (bars, articles) that do not fit are sent as a
+    compact ``{"columns", "rows"}`` table instead of repeating every key.
     """
     try:
         full = json.dumps(data, ensure_ascii=False, default=str)
@@ -112,6 +151,11 @@ def _smart_serialize(data: Any, max_chars: int = MAX_TOOL_RESULT_CHARS) -> str:
     if len(full) <= max_chars:
         return full
     if isinstance(data, list):
+        table = _to_table(data)
+        if table is not None:
+            fitted = _fit_table(*table, max_chars)
+            if fitted is not None:
+                return _dumps(fitted)
         return _serialize_list(data, max_chars)
     if isinstance(data, dict):
         return _serialize_dict(data, max_chars)
@@ -200,11 +244,11 @@ def _serialize_dict(data: dict, max_chars: int) -> str:
 
     Scalar fields (str, int, float, bool, None) are always preserved to
     maintain financial data precision.  Complex fields (list, dict) are
-    added one by one; oversized lists are sampled and oversized dicts
-    replaced with a placeholder.
+    added one by one; record lists are turned into columnar tables,
+    other oversized lists are sampled and oversized dicts replaced with a
+    placeholder.  Output length is tracked incrementally, so each field is
+    serialized once rather than re-dumping the whole dict per field.
     """
-    _dumps = lambda v: json.dumps(v, ensure_ascii=False, default=str)
-
     scalars: Dict[str, Any] = {}
     complex_keys: list[str] = []
     for k, v in data.items():
@@ -224,54 +268,53 @@ def _serialize_dict(data: dict, max_chars: int) -> str:
 
     # Incrementally add complex fields.
     result = dict(scalars)
+    length = len(scalars_json)
+
+    def _added(key: str, value_json: str) -> int:
+        # ", " (unless first) + "key": value
+        return (2 if result else 0) + len(_dumps(key)) + 2 + len(value_json)
+
     for key in complex_keys:
         value = data[key]
-        candidate = dict(result)
-        candidate[key] = value
-        candidate_json = _dumps(candidate)
-
-        if len(candidate_json) <= max_chars:
+        value_json = _dumps(value)
+        if length + _added(key, value_json) <= max_chars:
             result[key] = value
+            length += _added(key, value_json)
             continue
 
         # Try to fit a reduced version of the value.
+        reduced = None
         if isinstance(value, list) and len(value) > 0:
-            reduced = _try_reduce_list_field(value, key, result, max_chars, _dumps)
-            if reduced is not None:
+            table = _to_table(value)
+            if table is not None:
+                budget = max_chars - length - _added(key, "")
+                reduced = _fit_table(*table, budget) if budget > 0 else None
+            if reduced is None:
+                reduced = _try_reduce_list_field(value, max_chars - length - _added(key, ""))
+        elif isinstance(value, dict):
+            reduced = "{...}"
+
+        if reduced is not None:
+            reduced_json = _dumps(reduced)
+            if length + _added(key, reduced_json) <= max_chars:
                 result[key] = reduced
-                continue
-
-        if isinstance(value, dict):
-            # Replace with a placeholder.
-            candidate2 = dict(result)
-            candidate2[key] = "{...}"
-            if len(_dumps(candidate2)) <= max_chars:
-                result[key] = "{...}"
-                continue
+                length += _added(key, reduced_json)
 
-        # Skip this field entirely — doesn't fit even as placeholder.
+        # Otherwise skip this field entirely — doesn't fit even reduced.
 
     # If we added nothing beyond scalars and there were complex fields, mark truncated.
-    if set(result.keys()) == set(scalars.keys()) and complex_keys:
+    if len(result) == len(scalars) and complex_keys:
         logger.debug(
             "Dict serialization: all %d complex fields dropped, keeping %d scalars",
             len(complex_keys), len(scalars),
         )
-        candidate = dict(result)
-        candidate["_truncated"] = True
-        if len(_dumps(candidate)) <= max_chars:
+        if length + _added("_truncated", "true") <= max_chars:
             result["_truncated"] = True
 
     return _dumps(result)
 
 
-def _try_reduce_list_field(
-    value: list,
-    key: str,
-    current: dict,
-    max_chars: int,
-    _dumps: Any,
-) -> Any:
+def _try_reduce_list_field(value: list, budget: int) -> Any:
     """Try to fit a list field by sampling first 3 or 1 items with a suffix marker."""
     total = len(value)
     for sample_size in (3, 1):
@@ -279,13 +322,150 @@ def _try_reduce_list_field(
             continue
         sampled = list(value[:sample_size])
         sampled.append(f"...+{total - sample_size}")
-        candidate = dict(current)
-        candidate[key] = sampled
-        if len(_dumps(candidate)) <= max_chars:
+        if len(_dumps(sampled)) <= budget:
             return sampled
     return None
 
 
+# ---------------------------------------------------------------------------
+# Columnar tables for lists of records
+# ---------------------------------------------------------------------------
+
+# Time component of midnight-aligned dates (daily and longer bars)
+_MIDNIGHT = re.compile(r"T00:00:00(?:\.0+)?(?:Z|[+-]\d{2}:\d{2})?$")
+
+_OHLCV_COLUMNS = ("date", "open", "high", "low", "close", "volume")
+
+
+def _compact(value: Any) -> Any:
+    # Provider floats carry float32 noise (187.33999633789062)
+    if isinstance(value, float):
+        return round(value, 4)
+    return value
+
+
+def _to_table(items: list) -> Optional[Tuple[List[str], List[list]]]:
+    """(columns, rows) for a list of dicts sharing the same keys, else None."""
+    if len(items) < 2 or not all(isinstance(item, dict) for item in items):
+        return None
+    columns = list(items[0].keys())
+    key_set = set(columns)
+    if any(item.keys() != key_set for item in items):
+        return None
+    rows = [[_compact(item[c]) for c in columns] for item in items]
+
+    if "date" in columns:
+        i = columns.index("date")
+        if all(isinstance(row[i], str) and _MIDNIGHT.search(row[i]) for row in rows):
+            for row in rows:
+                row[i] = row[i][:10]
+    return columns, rows
+
+
+def _is_bar_table(columns: List[str]) -> bool:
+    return all(c in columns for c in _OHLCV_COLUMNS)
+
+
+def _downsample_bars(columns: List[str], rows: List[list], span: int) -> List[list]:
+    """Merge every ``span`` consecutive OHLCV rows into one.
+
+    Buckets are aligned to the latest bar, so the most recent bucket is
+    complete.  Each merged row is dated by its first bar.
+    """
+    idx = {c: columns.index(c) for c in _OHLCV_COLUMNS}
+    merged = []
+    for end in range(len(rows), 0, -span):
+        bucket = rows[max(0, end - span):end]
+        row = list(bucket[-1])
+        row[idx["date"]] = bucket[0][idx["date"]]
+        row[idx["open"]] = bucket[0][idx["open"]]
+        row[idx["high"]] = max(r[idx["high"]] for r in bucket)
+        row[idx["low"]] = min(r[idx["low"]] for r in bucket)
+        row[idx["volume"]] = sum(r[idx["volume"]] or 0 for r in bucket)
+        merged.append(row)
+    merged.reverse()
+    return merged
+
+
+def _fit_rows(columns: List[str], rows: List[list], max_chars: int, **extra: Any) -> Optional[Dict[str, Any]]:
+    """Table with as many rows as fit in ``max_chars``, or None if none do.
+
+    Each row is serialized once; a binary search over the row count then
+    only re-serializes the small table header.  Time series (tables with a
+    ``date`` column) keep their latest rows, other tables their first.
+    """
+    total = len(rows)
+    from_end = "date" in columns
+    row_lens = [len(_dumps(row)) for row in rows]
+    if from_end:
+        row_lens.reverse()
+    prefix = [0]
+    for n in row_lens:
+        prefix.append(prefix[-1] + n)
+
+    def _header(n: int) -> Dict[str, Any]:
+        table: Dict[str, Any] = {"columns": columns, "rows": []}
+        table.update(extra)
+        if n < total:
+            table["_omitted"] = f"{total - n}/{total} {'earlier' if from_end else 'later'} rows not shown"
+        return table
+
+    def _length(n: int) -> int:
+        # "rows": [] grows by the rows plus ", " between them
+        return len(_dumps(_header(n))) + prefix[n] + 2 * max(n - 1, 0)
+
+    lo, hi, best = 1, total, 0
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if _length(mid) <= max_chars:
+            best = mid
+            lo = mid + 1
+        else:
+            hi = mid - 1
+    if best == 0:
+        return None
+
+    table = _header(best)
+    table["rows"] = rows[total - best:] if from_end else rows[:best]
+    return table
+
+
+def _fit_table(columns: List[str], rows: List[list], max_chars: int) -> Optional[Dict[str, Any]]:
+    """Columnar table fitting ``max_chars``, downsampling long bar series.
+
+    OHLCV series that do not fit are merged into coarser bars (e.g. 5 daily
+    bars per row ~ weekly) so the whole range stays visible; the merge
+    factor is reported as ``_bar_span``.  The finest merge that still fits
+    is found by binary search over the merged row count.
+    """
+    table = _fit_rows(columns, rows, max_chars)
+    if table is None or len(table["rows"]) == len(rows) or not _is_bar_table(columns):
+        return table
+
+    def _merged(target: int) -> Optional[Dict[str, Any]]:
+        span = math.ceil(len(rows) / target)
+        merged = _downsample_bars(columns, rows, span)
+        fitted = _fit_rows(columns, merged, max_chars, _bar_span=span)
+        if fitted is None or len(fitted["rows"]) < len(merged):
+            return None
+        return fitted
+
+    best = None
+    lo, hi = 1, len(table["rows"]) * 2
+    try:
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            fitted = _merged(mid)
+            if fitted is not None:
+                best = fitted
+                lo = mid + 1
+            else:
+                hi = mid - 1
+    except TypeError:  # Missing prices; keep the latest raw bars
+        return table
+    return best or table
+
+
 async def execute_chat_tool(
     tool_name: str,
     arguments: Dict[str, Any],
@@ -313,7 +493,7 @@ async def execute_chat_tool(
             kwargs["db"] = db
 
         result = await asyncio.wait_for(
-            skill.execute(**kwargs),
+            skill.execute_cached(**kwargs),
             timeout=TOOL_TIMEOUT_SECONDS,
         )
 
@@ -335,3 +515,184 @@ async def execute_chat_tool(
     except Exception as e:
         logger.exception("Tool %s execution failed: %s", tool_name, e)
         return {"error": f"Tool {tool_name} failed"}
+
+
+def plan_tool_prefetch(symbol: str, usage: Dict[str, int]) -> List[tuple]:
+    """(tool_name, arguments) pairs worth starting before the model asks.
+
+    Args:
+        symbol: Stock in the conversation's context
+        usage: Tool call counts from earlier turns of the conversation
+    """
+    if usage:
+        wanted = {"get_stock_quote"} | {name for name, count in usage.items() if count > 0}
+    else:
+        wanted = _PREFETCH_DEFAULT
+    plan = [(name, {"symbol": symbol}) for name in PREFETCH_TOOLS if name in wanted]
+    return plan[:_PREFETCH_MAX_CALLS]
+
+
+def tool_call_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+    """Key identifying a tool call by name and normalized arguments.
+
+    Declared defaults are filled in and string arguments trimmed (symbols
+    upper-cased), so ``get_stock_history(symbol="aapl")`` and
+    ``get_stock_history(symbol="AAPL", period="1y")`` share a key.
+    """
+    from app.skills.registry import get_skill_registry
+
+    normalized: Dict[str, Any] = {}
+    skill = get_skill_registry().get(tool_name)
+    if skill is not None:
+        for param in skill.definition().parameters:
+            if param.default is not None:
+                normalized[param.name] = param.default
+    for name, value in arguments.items():
+        if isinstance(value, str):
+            value = value.strip()
+            if name == "symbol":
+                value = value.upper()
+        normalized[name] = value
+    raw = json.dumps(normalized, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{tool_name}:{hashlib.sha1(raw.encode()).hexdigest()[:16]}"
+
+
+class ChatToolMemo:
+    """Tool results shared within a chat turn and reused across turns.
+
+    Identical calls (same tool, normalized arguments) in one turn run once,
+    including calls issued in parallel and repeats in later tool-loop
+    iterations.  Successful results of tools with a positive
+    ``TOOL_MEMO_TTLS`` entry are also kept in Redis per conversation, so
+    repeating a call on the next turn skips the provider and DB work.
+    """
+
+    def __init__(self, conversation_id: Any) -> None:
+        self.conversation_id = conversation_id
+        self._calls: Dict[str, asyncio.Future] = {}
+        self._prefetches: set = set()
+        self._used: Dict[str, int] = {}
+        self.hits = 0
+
+    async def run(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        execute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Return the memoized result for this call, or run ``execute``."""
+        ttl = TOOL_MEMO_TTLS.get(tool_name)
+        if ttl is None:
+            return await execute()
+
+        key = tool_call_key(tool_name, arguments)
+        pending = self._calls.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await self._load(key, ttl, execute)
+        except asyncio.CancelledError:
+            del self._calls[key]
+            future.cancel()
+            raise
+        except Exception as e:
+            del self._calls[key]
+            future.set_exception(e)
+            future.exception()  # Nobody may be waiting on it
+            raise
+
+        future.set_result(result)
+        if "error" in result:
+            # Let a later iteration retry a failed call
+            del self._calls[key]
+        return result
+
+    def prefetch(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        execute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> None:
+        """Start a call in the background; an identical later call joins it."""
+        task = asyncio.create_task(self.run(tool_name, arguments, execute))
+        self._prefetches.add(task)
+        task.add_done_callback(self._prefetch_done)
+
+    def cancel_prefetches(self) -> None:
+        """Cancel prefetches still running when the turn ends."""
+        for task in list(self._prefetches):
+            task.cancel()
+
+    def _prefetch_done(self, task: asyncio.Task) -> None:
+        self._prefetches.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug("Tool prefetch failed: %s", task.exception())
+
+    # Usage statistics steer what later turns prefetch
+
+    def record_usage(self, tool_name: str) -> None:
+        self._used[tool_name] = self._used.get(tool_name, 0) + 1
+
+    async def load_usage(self) -> Dict[str, int]:
+        """Tool call counts from earlier turns of this conversation."""
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            raw = await redis.hgetall(f"chat:tools:{self.conversation_id}:usage")
+            return {name: int(count) for name, count in raw.items()}
+        except Exception as e:
+            logger.debug("Tool usage read failed for %s: %s", self.conversation_id, e)
+            return {}
+
+    async def save_usage(self) -> None:
+        if not self._used:
+            return
+        key = f"chat:tools:{self.conversation_id}:usage"
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            for name, count in self._used.items():
+                await redis.hincrby(key, name, count)
+            await redis.expire(key, 7 * 24 * 3600)
+        except Exception as e:
+            logger.debug("Tool usage write failed for %s: %s", self.conversation_id, e)
+
+    async def _load(
+        self,
+        key: str,
+        ttl: int,
+        execute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        if ttl <= 0:
+            return await execute()
+
+        redis_key = f"chat:tools:{self.conversation_id}:{key}"
+        redis = None
+        try:
+            from app.db.redis import get_redis
+
+            redis = await get_redis()
+            cached = await redis.get(redis_key)
+            if cached:
+                self.hits += 1
+                return json.loads(cached)
+        except Exception as e:
+            logger.debug("Tool memo read failed for %s: %s", key, e)
+
+        result = await execute()
+        if redis is not None and "error" not in result:
+            try:
+                await redis.set(
+                    redis_key,
+                    json.dumps(result, ensure_ascii=False, default=str),
+                    ex=ttl,
+                )
+            except Exception as e:
+                logger.debug("Tool memo write failed for %s: %s", key, e)
+        return result
@@ -42,6 +42,7 @@ class GetAnalystRatingsSkill(BaseSkill):
                     required=True,
                 ),
             ],
+            cache_ttl=3600,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
@@ -45,6 +45,7 @@ class GetFundHoldingsCnSkill(BaseSkill):
                     required=True,
                 ),
             ],
+            cache_ttl=3600,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
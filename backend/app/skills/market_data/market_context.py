@@ -23,6 +23,7 @@ class GetMarketContextSkill(BaseSkill):
             ),
             category="market_data",
             parameters=[],
+            cache_ttl=300,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
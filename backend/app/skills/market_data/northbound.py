@@ -52,6 +52,7 @@ class GetNorthboundHoldingSkill(BaseSkill):
                     default=30,
                 ),
             ],
+            cache_ttl=3600,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
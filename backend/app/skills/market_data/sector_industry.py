@@ -57,6 +57,7 @@ class GetSectorIndustrySkill(BaseSkill):
                     default="US",
                 ),
             ],
+            cache_ttl=86400,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
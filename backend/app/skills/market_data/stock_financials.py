@@ -41,6 +41,7 @@ class GetStockFinancialsSkill(BaseSkill):
                     required=True,
                 ),
             ],
+            cache_ttl=3600,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
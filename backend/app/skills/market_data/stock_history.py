@@ -60,6 +60,7 @@ class GetStockHistorySkill(BaseSkill):
                     default="1d",
                 ),
             ],
+            cache_ttl=300,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
@@ -41,6 +41,7 @@ class GetStockInfoSkill(BaseSkill):
                     required=True,
                 ),
             ],
+            cache_ttl=3600,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
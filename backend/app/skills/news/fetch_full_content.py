@@ -5,10 +5,13 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from app.skills.base import BaseSkill, SkillDefinition, SkillParameter, SkillResult
 
+if TYPE_CHECKING:
+    from app.services.full_content_service import ContentSource, FetchResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,39 +88,49 @@ class FetchFullContentSkill(BaseSkill):
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
-        from app.services.full_content_service import (
-            ContentSource,
-            get_full_content_service,
-        )
-        from app.services.news_storage_service import get_news_storage_service
+        from app.services.full_content_service import get_full_content_service
+
+        error = self._validate(kwargs)
+        if error is not None:
+            return error
 
-        url = kwargs.get("url")
-        news_id_str = kwargs.get("news_id")
-        symbol = kwargs.get("symbol")
         market = kwargs.get("market", "US")
-        content_source_str = kwargs.get("content_source", "trafilatura")
-        polygon_api_key = kwargs.get("polygon_api_key")
-        published_at_str = kwargs.get("published_at")
 
-        # Validate required parameters
-        if not url:
-            return SkillResult(success=False, error="url parameter is required")
-        if not news_id_str:
-            return SkillResult(success=False, error="news_id parameter is required")
-        if not symbol:
-            return SkillResult(success=False, error="symbol parameter is required")
+        # Fetch content with fallback (uses singleton with all configured providers)
+        service = get_full_content_service()
 
-        # Parse news_id as UUID
-        try:
-            news_uuid = uuid.UUID(news_id_str)
-        except (ValueError, TypeError):
-            return SkillResult(
-                success=False,
-                error=f"Invalid news_id UUID: {news_id_str}",
-            )
+        fetch_result = await service.fetch_with_fallback(
+            url=kwargs["url"],
+            primary_source=primary_source_for(kwargs.get("content_source", "trafilatura")),
+            language=language_for_market(market),
+            polygon_api_key=kwargs.get("polygon_api_key"),
+        )
+
+        return self.store_result(fetch_result, **kwargs)
+
+    def store_result(self, fetch_result: FetchResult, **kwargs: Any) -> SkillResult:
+        """Persist an already fetched ``FetchResult`` to file storage.
+
+        Used directly by batch callers that fetch through
+        ``FullContentService.fetch_many_with_fallback``; takes the same
+        keyword arguments as ``execute``.
+        """
+        from app.services.news_storage_service import get_news_storage_service
+
+        error = self._validate(kwargs)
+        if error is not None:
+            return error
+
+        url = kwargs["url"]
+        news_id_str = kwargs["news_id"]
+        symbol = kwargs["symbol"]
+        content_source_str = kwargs.get("content_source", "trafilatura")
+        language = language_for_market(kwargs.get("market", "US"))
+        news_uuid = uuid.UUID(news_id_str)
 
         # Parse published_at
         published_at = None
+        published_at_str = kwargs.get("published_at")
         if published_at_str:
             try:
                 published_at = datetime.fromisoformat(
@@ -126,29 +139,6 @@ class FetchFullContentSkill(BaseSkill):
             except (ValueError, TypeError):
                 published_at = None
 
-        # Determine content source enum
-        if content_source_str == "polygon":
-            primary_source = ContentSource.POLYGON
-        elif content_source_str == "tavily":
-            primary_source = ContentSource.TAVILY
-        elif content_source_str == "playwright":
-            primary_source = ContentSource.PLAYWRIGHT
-        else:
-            primary_source = ContentSource.TRAFILATURA
-
-        # Detect expected language from market
-        language = "zh" if market in ("SH", "SZ") else "en"
-
-        # Fetch content with fallback (uses singleton with all configured providers)
-        service = get_full_content_service()
-
-        fetch_result = await service.fetch_with_fallback(
-            url=url,
-            primary_source=primary_source,
-            language=language,
-            polygon_api_key=polygon_api_key,
-        )
-
         if not fetch_result.success or not fetch_result.full_text:
             return SkillResult(
                 success=False,
@@ -213,3 +203,39 @@ class FetchFullContentSkill(BaseSkill):
                 "source": str(fetch_result.source) if fetch_result.source else content_source_str,
             },
         )
+
+    @staticmethod
+    def _validate(kwargs: Dict[str, Any]) -> Optional[SkillResult]:
+        """Error result for missing or malformed required parameters."""
+        if not kwargs.get("url"):
+            return SkillResult(success=False, error="url parameter is required")
+        news_id_str = kwargs.get("news_id")
+        if not news_id_str:
+            return SkillResult(success=False, error="news_id parameter is required")
+        if not kwargs.get("symbol"):
+            return SkillResult(success=False, error="symbol parameter is required")
+
+        # Parse news_id as UUID
+        try:
+            uuid.UUID(news_id_str)
+        except (ValueError, TypeError):
+            return SkillResult(
+                success=False,
+                error=f"Invalid news_id UUID: {news_id_str}",
+            )
+        return None
+
+
+def primary_source_for(content_source: Optional[str]) -> ContentSource:
+    """Map a ``content_source`` parameter to its ContentSource (default trafilatura)."""
+    from app.services.full_content_service import ContentSource
+
+    try:
+        return ContentSource(content_source)
+    except ValueError:
+        return ContentSource.TRAFILATURA
+
+
+def language_for_market(market: Optional[str]) -> str:
+    """Expected article language for a market."""
+    return "zh" if market in ("SH", "SZ") else "en"
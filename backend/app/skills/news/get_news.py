@@ -48,6 +48,7 @@ class GetNewsSkill(BaseSkill):
                     default=10,
                 ),
             ],
+            cache_ttl=300,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
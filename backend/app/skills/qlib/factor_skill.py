@@ -30,6 +30,7 @@ class QlibFactorSkill(BaseSkill):
                     enum=["us", "hk", "cn", "sh", "sz", "metal"],
                 ),
             ],
+            cache_ttl=3600,
         )
 
     async def execute(self, **kwargs: Any) -> SkillResult:
@@ -0,0 +1,124 @@
+"""SimHash fingerprints for near-duplicate news detection.
+
+A 64-bit SimHash is computed over word tokens (Latin text) and character
+bigrams (CJK text), so the same story syndicated with small wording
+changes lands within a few bits of Hamming distance.
+
+Candidate lookup uses banding: the fingerprint is split into
+``max_distance + 1`` bands, and by the pigeonhole principle two
+fingerprints within ``max_distance`` bits share at least one identical
+band. Only fingerprints sharing a band are compared exactly.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
+
+FINGERPRINT_BITS = 64
+
+# Default maximum Hamming distance considered a near-duplicate
+DEFAULT_MAX_DISTANCE = 3
+
+# Texts with fewer features produce unstable fingerprints and are skipped
+MIN_FEATURES = 6
+
+_LATIN_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_CJK_RUN_RE = re.compile(r"[㐀-䶿一-鿿豈-﫿]+")
+
+T = TypeVar("T")
+
+
+def _features(text: str) -> Counter:
+    """Extract weighted features: Latin words (len >= 2) and CJK bigrams."""
+    text = text.lower()
+    features: Counter = Counter(
+        tok for tok in _LATIN_TOKEN_RE.findall(text) if len(tok) >= 2
+    )
+    for run in _CJK_RUN_RE.findall(text):
+        if len(run) == 1:
+            features[run] += 1
+        for i in range(len(run) - 1):
+            features[run[i:i + 2]] += 1
+    return features
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    Compute a 64-bit SimHash fingerprint.
+
+    Args:
+        text: Text to fingerprint (typically title + summary)
+
+    Returns:
+        Fingerprint as an unsigned int, or None if the text has too few
+        features to fingerprint reliably.
+    """
+    features = _features(text or "")
+    if sum(features.values()) < MIN_FEATURES:
+        return None
+
+    weights = [0] * FINGERPRINT_BITS
+    for feature, weight in features.items():
+        h = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big",
+        )
+        for bit in range(FINGERPRINT_BITS):
+            if h >> bit & 1:
+                weights[bit] += weight
+            else:
+                weights[bit] -= weight
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return bin(a ^ b).count("1")
+
+
+def bands(fingerprint: int, max_distance: int = DEFAULT_MAX_DISTANCE) -> List[Tuple[int, int]]:
+    """
+    Split a fingerprint into ``max_distance + 1`` bands.
+
+    Returns:
+        List of (band index, band value) pairs usable as bucket keys
+    """
+    num_bands = max_distance + 1
+    width = FINGERPRINT_BITS // num_bands
+    result = []
+    for i in range(num_bands):
+        # Last band absorbs the remainder bits
+        bits = width if i < num_bands - 1 else FINGERPRINT_BITS - width * i
+        result.append((i, (fingerprint >> (i * width)) & ((1 << bits) - 1)))
+    return result
+
+
+class NearDuplicateIndex(Generic[T]):
+    """In-memory banded index mapping fingerprints to item identifiers."""
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE) -> None:
+        self.max_distance = max_distance
+        self._buckets: Dict[Tuple[int, int], List[Tuple[int, T]]] = {}
+
+    def find(self, fingerprint: int) -> Optional[T]:
+        """Return the closest indexed item within ``max_distance``, if any."""
+        best: Optional[Tuple[int, T]] = None
+        for key in bands(fingerprint, self.max_distance):
+            for other, item in self._buckets.get(key, ()):
+                distance = hamming_distance(fingerprint, other)
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, item)
+        return best[1] if best else None
+
+    def add(self, fingerprint: int, item: T) -> None:
+        """Index an item under its fingerprint."""
+        for key in bands(fingerprint, self.max_distance):
+            self._buckets.setdefault(key, []).append((fingerprint, item))
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._buckets.values()) // (self.max_distance + 1)
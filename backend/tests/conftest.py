@@ -1,8 +1,16 @@
 """
 Pytest configuration and fixtures for WebStock backend tests.
 """
-import pytest
+import sys
 from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+# Celery tasks live in ../worker (copied next to the backend in the images)
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+if (_REPO_ROOT / "worker").is_dir() and str(_REPO_ROOT) not in sys.path:
+    sys.path.append(str(_REPO_ROOT))
 
 
 @pytest.fixture
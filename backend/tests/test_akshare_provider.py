@@ -0,0 +1,103 @@
+"""
+Tests for AKShare HK quotes served from the spot snapshot.
+"""
+import akshare as ak
+import pandas as pd
+import pytest
+
+from app.services.providers import akshare as akshare_provider
+from app.services.providers.akshare import AKShareProvider
+from app.services.stock_types import Market
+
+HK_ROW = {
+    "名称": "腾讯控股",
+    "最新价": 400.0,
+    "涨跌额": 4.0,
+    "涨跌幅": 1.01,
+    "成交量": 1000,
+    "最高": 402.0,
+    "最低": 395.0,
+    "今开": 396.0,
+    "昨收": 396.0,
+}
+
+
+class FakeSnapshot:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def get_row(self, table, code):
+        return self.rows.get(code)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.setattr(
+        akshare_provider, "get_market_snapshot_service",
+        lambda: FakeSnapshot({"00700": dict(HK_ROW)}),
+    )
+    provider = AKShareProvider()
+    provider._redis = FakeRedis()
+    return provider
+
+
+def _xueqiu(calls, items):
+    def stock_individual_spot_xq(symbol):
+        calls.append(symbol)
+        if items is None:
+            raise RuntimeError("xueqiu token required")
+        return pd.DataFrame({"item": list(items), "value": list(items.values())})
+
+    return stock_individual_spot_xq
+
+
+class TestHkQuoteMarketCap:
+    """Tests for deriving HK market cap from the cached share count."""
+
+    @pytest.mark.asyncio
+    async def test_market_cap_from_cached_total_shares(self, provider, monkeypatch):
+        calls = []
+        monkeypatch.setattr(ak, "stock_individual_spot_xq", _xueqiu(calls, {
+            "现价": 380.0, "基金份额/总股本": 9.2e9, "资产净值/总市值": 3.5e12,
+        }))
+
+        first = await provider.get_quote("0700.HK", Market.HK)
+        second = await provider.get_quote("0700.HK", Market.HK)
+
+        assert first.price == 400.0
+        assert first.market_cap == pytest.approx(9.2e9 * 400.0)
+        assert second.market_cap == first.market_cap
+        assert calls == ["00700"]  # share count cached
+
+    @pytest.mark.asyncio
+    async def test_total_shares_derived_from_market_cap(self, provider, monkeypatch):
+        monkeypatch.setattr(ak, "stock_individual_spot_xq", _xueqiu([], {
+            "现价": 350.0, "资产净值/总市值": 3.5e12,
+        }))
+
+        quote = await provider.get_quote("0700.HK", Market.HK)
+
+        assert quote.market_cap == pytest.approx(1e10 * 400.0)
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_backs_off(self, provider, monkeypatch):
+        calls = []
+        monkeypatch.setattr(ak, "stock_individual_spot_xq", _xueqiu(calls, None))
+
+        first = await provider.get_quote("0700.HK", Market.HK)
+        second = await provider.get_quote("0700.HK", Market.HK)
+
+        assert first.price == second.price == 400.0
+        assert first.market_cap is None and second.market_cap is None
+        assert calls == ["00700"]
@@ -0,0 +1,107 @@
+"""
+Tests for analysis run coalescing and result replay.
+"""
+import asyncio
+
+import pytest
+
+from app.agents.langgraph.coalescing import AnalysisCoalescer, analysis_key
+from app.core.user_ai_config import UserAIConfig, current_user_ai_config
+
+
+class FakeWorkflow:
+    """Event source standing in for the LangGraph workflow."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.runs = 0
+
+    def __call__(self, outcome):
+        return self._events(outcome)
+
+    async def _events(self, outcome):
+        self.runs += 1
+        yield {"type": "start", "data": {"symbol": "AAPL"}}
+        for i in range(3):
+            await asyncio.sleep(0.01)
+            yield {"type": "chunk", "data": {"content": str(i)}}
+        if self.fail:
+            outcome["error"] = RuntimeError("llm down")
+            yield {"type": "error", "data": {}}
+            return
+        outcome["state"] = {"symbol": "AAPL"}
+        yield {"type": "complete", "data": {}}
+
+
+async def _types(coalescer, key, source, delay=0.0):
+    await asyncio.sleep(delay)
+    return [event["type"] async for event in coalescer.stream(key, source)]
+
+
+KEY = ("AAPL", "us", "en", "default")
+EXPECTED = ["start", "chunk", "chunk", "chunk", "complete"]
+
+
+class TestAnalysisCoalescer:
+    """Tests for single-flight runs and the replay cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_run(self):
+        coalescer = AnalysisCoalescer(ttl=60)
+        workflow = FakeWorkflow()
+
+        first, late, state = await asyncio.gather(
+            _types(coalescer, KEY, workflow),
+            _types(coalescer, KEY, workflow, delay=0.015),
+            coalescer.result(KEY, workflow),
+        )
+
+        assert workflow.runs == 1
+        assert first == EXPECTED
+        assert late == EXPECTED  # late subscriber gets the earlier events too
+        assert state == {"symbol": "AAPL"}
+
+    @pytest.mark.asyncio
+    async def test_completed_run_is_replayed(self):
+        coalescer = AnalysisCoalescer(ttl=60)
+        workflow = FakeWorkflow()
+        await coalescer.result(KEY, workflow)
+
+        events = [event async for event in coalescer.stream(KEY, workflow)]
+        assert workflow.runs == 1
+        assert events[0]["data"]["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_not_cached(self):
+        coalescer = AnalysisCoalescer(ttl=60)
+        workflow = FakeWorkflow(fail=True)
+
+        with pytest.raises(RuntimeError):
+            await coalescer.result(KEY, workflow)
+        assert await _types(coalescer, KEY, workflow) == ["start", "chunk", "chunk", "chunk", "error"]
+        assert workflow.runs == 2
+
+    @pytest.mark.asyncio
+    async def test_run_cancelled_when_last_subscriber_leaves(self):
+        coalescer = AnalysisCoalescer(ttl=60)
+        stream = coalescer.stream(KEY, FakeWorkflow())
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert coalescer.stats()["inflight"] == 0
+        assert coalescer.stats()["cached"] == 0
+
+
+class TestAnalysisKey:
+    """Tests for the coalescing key."""
+
+    def test_distinct_ai_configs_do_not_share(self):
+        token = current_user_ai_config.set(UserAIConfig(model="gpt-4o", api_key="a"))
+        try:
+            key_a = analysis_key("aapl", "us", "en")
+            current_user_ai_config.set(UserAIConfig(model="gpt-4o", api_key="b"))
+            key_b = analysis_key("AAPL", "us", "en")
+        finally:
+            current_user_ai_config.reset(token)
+        assert key_a[:3] == key_b[:3] == ("AAPL", "us", "en")
+        assert key_a != key_b
@@ -0,0 +1,79 @@
+"""
+Tests for executor bulkheads.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.core.bulkhead import Bulkhead, BulkheadConfig, BulkheadFullError
+
+
+@pytest.fixture
+def gate():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+class TestBulkhead:
+    """Tests for admission, cancellation and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_runs_function_with_arguments(self):
+        bulkhead = Bulkhead("test", BulkheadConfig(max_workers=2, max_queue=4))
+        assert await bulkhead.run(lambda a, b=0: a + b, 1, b=2) == 3
+        status = bulkhead.get_status()
+        assert status["stats"]["completed"] == 1
+        assert status["running"] == 0 and status["queued"] == 0
+        bulkhead.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self, gate):
+        bulkhead = Bulkhead("test", BulkheadConfig(max_workers=1, max_queue=1))
+        running = asyncio.ensure_future(bulkhead.run(gate.wait))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(bulkhead.run(lambda: "queued"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(BulkheadFullError):
+            await bulkhead.run(lambda: None)
+        assert bulkhead.stats.rejected == 1
+
+        gate.set()
+        assert await queued == "queued"
+        await running
+        bulkhead.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_queued_call(self, gate):
+        bulkhead = Bulkhead("test", BulkheadConfig(max_workers=1, max_queue=4))
+        ran = []
+        running = asyncio.ensure_future(bulkhead.run(gate.wait, timeout=0.05))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await bulkhead.run(lambda: ran.append(1), timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await running
+
+        gate.set()
+        await asyncio.sleep(0.05)
+        assert ran == []
+        stats = bulkhead.get_status()
+        assert stats["queued"] == 0
+        assert stats["stats"]["cancelled_queued"] == 1
+        assert stats["stats"]["abandoned_running"] == 1
+        bulkhead.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_and_raised(self):
+        bulkhead = Bulkhead("test")
+
+        def boom():
+            raise ValueError("upstream error")
+
+        with pytest.raises(ValueError):
+            await bulkhead.run(boom)
+        assert bulkhead.stats.failed == 1
+        bulkhead.shutdown()
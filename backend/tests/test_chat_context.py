@@ -0,0 +1,115 @@
+"""
+Tests for the incremental chat context window.
+"""
+import json
+import uuid
+
+import pytest
+
+from app.services.chat_context import (
+    MAX_CONTEXT_MESSAGES,
+    ChatContextService,
+    evict_oldest,
+    _key,
+)
+
+
+def _turns(*tokens):
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"m{i}", "tokens": t}
+        for i, t in enumerate(tokens)
+    ]
+
+
+class FakeRedis:
+    """In-memory subset of the Redis commands used by the context cache."""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.lists.pop(key, None)
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+
+    async def ltrim(self, key, start, end):
+        items = self.lists.get(key, [])
+        end = len(items) if end == -1 else end + 1
+        self.lists[key] = items[start:end] if start >= 0 else items[start:]
+
+    async def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+
+    async def get_redis():
+        return fake
+
+    monkeypatch.setattr("app.db.redis.get_redis", get_redis)
+    return fake
+
+
+class TestEvictOldest:
+    """Tests for chunked eviction."""
+
+    def test_within_budget_keeps_everything(self):
+        entries = _turns(100, 100, 100)
+        assert evict_oldest(entries, max_messages=4, max_tokens=1000) == (entries, [])
+
+    def test_evicts_down_to_half_budget(self):
+        entries = _turns(300, 300, 300, 300)
+        kept, evicted = evict_oldest(entries, max_messages=10, max_tokens=1000)
+        assert [e["content"] for e in evicted] == ["m0", "m1", "m2"]
+        assert sum(e["tokens"] for e in kept) <= 500
+
+        kept, evicted = evict_oldest(_turns(*[1] * 5), max_messages=4, max_tokens=1000)
+        assert len(kept) == 2 and len(evicted) == 3
+
+    def test_keeps_latest_turn_even_if_oversized(self):
+        kept, evicted = evict_oldest(_turns(10, 5000), max_messages=10, max_tokens=1000)
+        assert [e["content"] for e in kept] == ["m1"]
+        assert len(evicted) == 1
+
+
+class TestChatContextService:
+    """Tests for appending to the cached window."""
+
+    @pytest.mark.asyncio
+    async def test_append_queues_evicted_turns(self, redis):
+        conversation_id = uuid.uuid4()
+        turns = _turns(*[10] * MAX_CONTEXT_MESSAGES)
+        redis.values[_key(conversation_id, "window")] = json.dumps(turns)
+
+        service = ChatContextService()
+        assert await service.append(conversation_id, "user", "hello", tokens=10) is True
+
+        window = json.loads(redis.values[_key(conversation_id, "window")])
+        pending = [json.loads(p) for p in redis.lists[_key(conversation_id, "pending")]]
+        assert len(window) == MAX_CONTEXT_MESSAGES // 2
+        assert window[-1]["content"] == "hello"
+        assert pending + window[:-1] == turns
+
+    @pytest.mark.asyncio
+    async def test_append_without_window_is_a_noop(self, redis):
+        service = ChatContextService()
+        assert await service.append(uuid.uuid4(), "user", "hello", tokens=1) is False
+        assert redis.values == {}
@@ -0,0 +1,149 @@
+"""
+Tests for chat tool call dedup and memoization.
+"""
+import asyncio
+
+import pytest
+
+from app.skills.chat_adapter import ChatToolMemo, plan_tool_prefetch, tool_call_key
+
+
+class FakeRedis:
+    """Minimal async get/set store."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+
+    async def get_redis():
+        return fake
+
+    monkeypatch.setattr("app.db.redis.get_redis", get_redis)
+    return fake
+
+
+def _counting_tool(result):
+    calls = []
+
+    async def execute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return result
+
+    return execute, calls
+
+
+class TestChatToolMemo:
+    """Tests for in-turn dedup and cross-turn reuse."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_identical_calls_run_once(self, redis):
+        memo = ChatToolMemo("conv-1")
+        execute, calls = _counting_tool({"result": "{}"})
+
+        results = await asyncio.gather(
+            memo.run("get_stock_quote", {"symbol": "AAPL"}, execute),
+            memo.run("get_stock_quote", {"symbol": " aapl "}, execute),
+        )
+
+        assert len(calls) == 1
+        assert results[0] == results[1]
+
+    @pytest.mark.asyncio
+    async def test_result_reused_on_next_turn(self, redis):
+        execute, calls = _counting_tool({"result": "bars"})
+        await ChatToolMemo("conv-1").run("get_stock_history", {"symbol": "AAPL"}, execute)
+        await ChatToolMemo("conv-1").run("get_stock_history", {"symbol": "AAPL"}, execute)
+        await ChatToolMemo("conv-2").run("get_stock_history", {"symbol": "AAPL"}, execute)
+
+        assert len(calls) == 2  # second conversation does not share
+
+    @pytest.mark.asyncio
+    async def test_errors_and_turn_only_tools_are_not_kept(self, redis):
+        memo = ChatToolMemo("conv-1")
+        failing, failing_calls = _counting_tool({"error": "Tool get_news failed"})
+        await memo.run("get_news", {"symbol": "AAPL"}, failing)
+        await memo.run("get_news", {"symbol": "AAPL"}, failing)
+        assert len(failing_calls) == 2
+
+        portfolio, _ = _counting_tool({"result": "[]"})
+        await memo.run("get_portfolio", {}, portfolio)
+        assert redis.values == {}
+
+    @pytest.mark.asyncio
+    async def test_unlisted_tools_always_run(self, redis):
+        memo = ChatToolMemo("conv-1")
+        execute, calls = _counting_tool({"result": "ok"})
+        await memo.run("qlib_create_backtest", {"name": "x"}, execute)
+        await memo.run("qlib_create_backtest", {"name": "x"}, execute)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_model_call_joins_prefetch(self, redis):
+        memo = ChatToolMemo("conv-1")
+        execute, calls = _counting_tool({"result": "quote"})
+        memo.prefetch("get_stock_quote", {"symbol": "AAPL"}, execute)
+        await asyncio.sleep(0)
+
+        result = await memo.run("get_stock_quote", {"symbol": "AAPL"}, execute)
+        assert result == {"result": "quote"}
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_unused_prefetches_cancelled_at_turn_end(self, redis):
+        memo = ChatToolMemo("conv-1")
+        finished = []
+
+        async def slow_quote():
+            await asyncio.sleep(10)
+            finished.append(1)
+            return {"result": "quote"}
+
+        memo.prefetch("get_stock_quote", {"symbol": "AAPL"}, slow_quote)
+        memo.prefetch("get_stock_history", {"symbol": "AAPL"}, slow_quote)
+        await asyncio.sleep(0)
+        tasks = list(memo._prefetches)
+
+        memo.cancel_prefetches()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(task.cancelled() for task in tasks)
+        assert not memo._prefetches and not memo._calls
+        assert finished == []
+
+
+class TestPlanToolPrefetch:
+    """Tests for choosing which tools to warm."""
+
+    def test_fresh_conversation_gets_defaults(self):
+        names = [name for name, _ in plan_tool_prefetch("AAPL", {})]
+        assert names == ["get_stock_quote", "get_stock_history", "get_news"]
+
+    def test_follows_conversation_usage(self):
+        plan = plan_tool_prefetch("AAPL", {"get_stock_financials": 2, "get_portfolio": 1})
+        assert plan == [
+            ("get_stock_quote", {"symbol": "AAPL"}),
+            ("get_stock_financials", {"symbol": "AAPL"}),
+        ]
+
+
+class TestToolCallKey:
+    """Tests for argument normalization."""
+
+    def test_defaults_and_symbol_case(self):
+        assert tool_call_key("get_stock_history", {"symbol": "aapl"}) == tool_call_key(
+            "get_stock_history", {"symbol": "AAPL", "period": "1y", "interval": "1d"}
+        )
+        assert tool_call_key("get_stock_history", {"symbol": "AAPL", "period": "5d"}) != tool_call_key(
+            "get_stock_history", {"symbol": "AAPL"}
+        )
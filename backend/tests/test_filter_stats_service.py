@@ -0,0 +1,204 @@
+"""
+Tests for buffered filter statistics counters.
+"""
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+
+from app.services import filter_stats_service
+from app.services.filter_stats_service import KEY_PREFIX, TTL_DAYS, FilterStatsService
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hincrby(self, key, field, amount):
+        self.commands.append(("hincrby", key, field, amount))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    def hgetall(self, key):
+        self.commands.append(("hgetall", key))
+
+    def mget(self, keys):
+        self.commands.append(("mget", keys))
+
+    async def execute(self):
+        return self.redis.run(self.commands)
+
+
+class FakeRedis:
+    """Redis stub counting pipeline round-trips."""
+
+    def __init__(self):
+        self.hashes = defaultdict(dict)
+        self.strings = {}
+        self.ttls = {}
+        self.round_trips = 0
+        self.fail = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def run(self, commands):
+        self.round_trips += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+        replies = []
+        for name, key, *args in commands:
+            if name == "hincrby":
+                field, amount = args
+                value = int(self.hashes[key].get(field, 0)) + amount
+                self.hashes[key][field] = str(value)
+                replies.append(value)
+            elif name == "expire":
+                self.ttls[key] = args[0]
+                replies.append(True)
+            elif name == "hgetall":
+                replies.append(dict(self.hashes.get(key, {})))
+            else:
+                replies.append([self.strings.get(k) for k in key])
+        return replies
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+
+    async def get_redis():
+        return redis
+
+    monkeypatch.setattr(filter_stats_service, "get_redis", get_redis)
+    return redis
+
+
+@pytest.fixture
+def today():
+    return datetime.now().strftime("%Y%m%d")
+
+
+class TestBufferedIncrements:
+    """Tests for accumulating increments and flushing them in one pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_increments_flushed_together_after_delay(self, redis, today):
+        service = FilterStatsService(flush_delay=0.01)
+        await service.increment("initial_useful")
+        await service.increment("initial_useful", 2)
+        await service.track_tokens("layer1_macro", 100, 20)
+        await service.track_tokens("layer1_macro", 50, 0)
+
+        assert redis.round_trips == 0
+        assert service._pending[(today, "initial_useful")] == 3
+
+        await asyncio.sleep(0.05)
+
+        day_key = f"{KEY_PREFIX}:{today}"
+        assert redis.round_trips == 1
+        assert redis.hashes[day_key] == {
+            "initial_useful": "3",
+            "layer1_macro_input_tokens": "150",
+            "layer1_macro_output_tokens": "20",
+        }
+        assert redis.ttls[day_key] == TTL_DAYS * 86400
+        assert not service._pending
+        assert service._flush_task.done()
+
+    @pytest.mark.asyncio
+    async def test_unknown_types_and_zero_counts_not_buffered(self, redis):
+        service = FilterStatsService(flush_delay=0.01)
+        await service.increment("not_a_stat")
+        await service.track_tokens("unknown_stage", 10, 10)
+        await service.track_tokens("deep", 0, None)
+
+        assert not service._pending
+        assert service._flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_deltas_for_retry(self, redis, today):
+        service = FilterStatsService(flush_delay=0.01)
+        redis.fail = True
+        await service.increment("fine_keep", 2)
+        await asyncio.sleep(0.05)
+
+        assert redis.round_trips == 1
+        assert service._pending[(today, "fine_keep")] == 2
+        assert service._flush_task.done()  # stopped; next increment retries
+
+        redis.fail = False
+        await service.increment("fine_keep")
+        await asyncio.sleep(0.05)
+
+        assert redis.hashes[f"{KEY_PREFIX}:{today}"]["fine_keep"] == "3"
+        assert not service._pending
+
+
+class TestFetchDays:
+    """Tests for reading per-day hashes with the legacy per-stat keys."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_legacy_keys_combined_in_one_pipeline(self, redis):
+        redis.hashes[f"{KEY_PREFIX}:20260301"] = {
+            "initial_useful": "4",
+            "deep_input_tokens": "1000",
+            "retired_stat": "9",
+        }
+        redis.strings[f"{KEY_PREFIX}:20260301:initial_useful"] = "1"
+        redis.strings[f"{KEY_PREFIX}:20260228:fine_delete"] = "7"
+        service = FilterStatsService()
+
+        stats = await service._fetch_days(["20260301", "20260228", "20260227"])
+
+        assert redis.round_trips == 1
+        assert stats["20260301"]["initial_useful"] == 5
+        assert stats["20260301"]["deep_input_tokens"] == 1000
+        assert "retired_stat" not in stats["20260301"]
+        assert stats["20260228"]["fine_delete"] == 7
+        assert set(stats["20260227"].values()) == {0}
+        assert set(stats["20260227"]) == set(service.STAT_TYPES + service.TOKEN_TYPES)
+
+    @pytest.mark.asyncio
+    async def test_pending_increments_visible_to_reads(self, redis, today):
+        service = FilterStatsService(flush_delay=60)
+        await service.increment("embedding_error")
+
+        stats = await service.get_daily_stats()
+
+        assert stats["embedding_error"] == 1
+        assert redis.round_trips == 2  # flush, then read
+        await service.drain()
+
+    @pytest.mark.asyncio
+    async def test_read_failure_returns_zeros(self, redis):
+        redis.fail = True
+        stats = await FilterStatsService()._fetch_days(["20260301"])
+        assert set(stats["20260301"].values()) == {0}
+
+
+class TestDrain:
+    """Tests for flushing buffered increments on shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_drain_filter_stats_flushes_without_waiting(self, redis, monkeypatch, today):
+        service = FilterStatsService(flush_delay=60)
+        monkeypatch.setattr(filter_stats_service, "_service", service)
+        await service.increment("layer1_discard", 5)
+        flush_task = service._flush_task
+
+        await asyncio.wait_for(filter_stats_service.drain_filter_stats(), 1)
+
+        assert redis.hashes[f"{KEY_PREFIX}:{today}"]["layer1_discard"] == "5"
+        assert redis.round_trips == 1
+        assert flush_task.done()
+        assert service._flush_task is None and service._loop is None
+
+    @pytest.mark.asyncio
+    async def test_drain_without_service_is_noop(self, redis, monkeypatch):
+        monkeypatch.setattr(filter_stats_service, "_service", None)
+        await filter_stats_service.drain_filter_stats()
+        assert redis.round_trips == 0
@@ -0,0 +1,231 @@
+"""
+Tests for batched full-content fetching through the Playwright service.
+"""
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from app.services import full_content_service
+from app.services.full_content_service import (
+    ContentProvider,
+    ContentSource,
+    FetchResult,
+    FullContentService,
+    PlaywrightProvider,
+)
+from worker.tasks import full_content_tasks
+
+LONG_TEXT = "word " * 200
+
+
+def _ndjson_transport(lines, requests):
+    def handler(request):
+        requests.append(json.loads(request.content))
+        body = "".join(line + "\n" for line in lines).encode()
+        return httpx.Response(200, content=body, headers={"content-type": "application/x-ndjson"})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def provider():
+    provider = PlaywrightProvider(service_url="http://playwright")
+    provider._available = True
+    provider._last_check = time.monotonic()
+    return provider
+
+
+def _use_transport(monkeypatch, transport):
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)
+    )
+
+
+class FakeProvider(ContentProvider):
+    """Provider returning scripted results per URL."""
+
+    def __init__(self, source, results):
+        self.source = source
+        self.results = results
+        self.calls = []
+
+    async def fetch(self, url, **kwargs):
+        self.calls.append(url)
+        return self.results.get(url, FetchResult(success=False, error="failed", source=self.source))
+
+
+class FakePlaywright(FakeProvider):
+    """Fake Playwright provider that records batch requests."""
+
+    def __init__(self, results):
+        super().__init__(ContentSource.PLAYWRIGHT, results)
+        self.batches = []
+
+    async def fetch_batch(self, urls):
+        self.batches.append(list(urls))
+        for url in reversed(urls):  # completion order differs from request order
+            yield url, await self.fetch(url)
+
+
+def _full(source):
+    return FetchResult(success=True, full_text=LONG_TEXT, word_count=200, source=source)
+
+
+def _partial(source, words):
+    return FetchResult(success=True, full_text="short", word_count=words, is_partial=True, source=source)
+
+
+class TestPlaywrightFetchBatch:
+    """Tests for parsing the streamed /extract/batch response."""
+
+    @pytest.mark.asyncio
+    async def test_lines_matched_by_index_and_missing_urls_reported(self, provider, monkeypatch):
+        requests = []
+        lines = [
+            json.dumps({"index": 2, "url": "c", "success": True, "full_text": LONG_TEXT}),
+            "",
+            "not json",
+            json.dumps({"index": 0, "url": "a", "success": False, "error": "Navigation failed"}),
+            json.dumps({"index": 0, "url": "a", "success": True, "full_text": LONG_TEXT}),  # duplicate
+        ]
+        _use_transport(monkeypatch, _ndjson_transport(lines, requests))
+
+        results = [pair async for pair in provider.fetch_batch(["a", "b", "c"])]
+
+        assert requests == [{"urls": ["a", "b", "c"]}]
+        assert [url for url, _ in results] == ["c", "a", "b"]
+        by_url = dict(results)
+        assert by_url["c"].success and by_url["c"].word_count == 200
+        assert by_url["a"].error == "Navigation failed"
+        assert by_url["b"].error == "Missing from Playwright batch response"
+
+    @pytest.mark.asyncio
+    async def test_http_error_fails_every_url(self, provider, monkeypatch):
+        _use_transport(monkeypatch, httpx.MockTransport(lambda request: httpx.Response(503)))
+
+        results = dict([pair async for pair in provider.fetch_batch(["a", "b"])])
+
+        assert set(results) == {"a", "b"}
+        assert all(r.error == "Playwright service error: 503" for r in results.values())
+
+
+class TestFetchManyWithFallback:
+    """Tests for the primary pass, one Playwright batch, and per-URL fallbacks."""
+
+    @pytest.fixture
+    def service(self):
+        service = FullContentService()
+        service.providers = {
+            ContentSource.TRAFILATURA: FakeProvider(ContentSource.TRAFILATURA, {
+                "https://a.com/1": _full(ContentSource.TRAFILATURA),
+                "https://b.com/1": _partial(ContentSource.TRAFILATURA, 40),
+            }),
+            ContentSource.PLAYWRIGHT: FakePlaywright({
+                "https://c.com/1": _full(ContentSource.PLAYWRIGHT),
+            }),
+            ContentSource.TAVILY: FakeProvider(ContentSource.TAVILY, {
+                "https://d.com/1": _full(ContentSource.TAVILY),
+            }),
+        }
+        return service
+
+    @pytest.mark.asyncio
+    async def test_only_unfinished_urls_are_rendered_in_one_batch(self, service):
+        urls = ["https://a.com/1", "https://b.com/1", "https://c.com/1", "https://d.com/1", "https://a.com/1"]
+
+        results = dict([pair async for pair in service.fetch_many_with_fallback(urls)])
+
+        playwright = service.providers[ContentSource.PLAYWRIGHT]
+        assert len(playwright.batches) == 1
+        assert sorted(playwright.batches[0]) == ["https://b.com/1", "https://c.com/1", "https://d.com/1"]
+
+        assert results["https://a.com/1"].source == ContentSource.TRAFILATURA
+        assert results["https://c.com/1"].source == ContentSource.PLAYWRIGHT
+        assert results["https://d.com/1"].source == ContentSource.TAVILY
+        # Partial primary result kept when no fallback does better
+        assert results["https://b.com/1"].word_count == 40
+
+        tavily = service.providers[ContentSource.TAVILY]
+        assert sorted(tavily.calls) == ["https://b.com/1", "https://d.com/1"]
+
+    @pytest.mark.asyncio
+    async def test_blocked_domains_skip_fetching(self, service):
+        results = [pair async for pair in service.fetch_many_with_fallback(["https://twitter.com/x"])]
+
+        assert results[0][1].error == "Domain blocked (social media or paywall)"
+        assert service.providers[ContentSource.PLAYWRIGHT].batches == []
+
+
+class StreamingService:
+    """Content service streaming scripted URLs, optionally stalling after them."""
+
+    def __init__(self, yielded, stall=True):
+        self.yielded = yielded
+        self.stall = stall
+        self.closed = False
+
+    async def fetch_many_with_fallback(self, urls, **kwargs):
+        try:
+            for url in self.yielded:
+                yield url, _full(ContentSource.TRAFILATURA)
+            if self.stall:
+                await asyncio.sleep(3600)
+        finally:
+            self.closed = True
+
+
+class TestBatchFetchDeadlines:
+    """Tests for the per-article deadline in the batched Layer 2 fetch."""
+
+    @pytest.fixture
+    def batch(self, monkeypatch):
+        batch = {"service": StreamingService(["https://a.com/1", "https://b.com/1"]),
+                 "marked": {}, "dispatched": []}
+        monkeypatch.setattr(full_content_tasks, "ARTICLE_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(full_content_service, "get_full_content_service", lambda: batch["service"])
+
+        async def store(article, fetch_result, t0):
+            if article["url"] == "https://b.com/1":
+                await asyncio.sleep(3600)  # cleaning hangs
+            return {"success": True, "file_path": f"/data/{article['news_id']}.json"}
+
+        async def mark_failed(failures):
+            batch["marked"].update(failures)
+
+        monkeypatch.setattr(full_content_tasks, "_store_fetched_article", store)
+        monkeypatch.setattr(full_content_tasks, "_mark_fetch_failed", mark_failed)
+        monkeypatch.setattr(
+            full_content_tasks.process_news_article, "delay",
+            lambda **kwargs: batch["dispatched"].append(kwargs["news_id"]),
+        )
+        return batch
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_and_slow_store_marked_failed(self, batch):
+        articles = [
+            {"news_id": f"n{i}", "url": url, "market": "US"}
+            for i, url in enumerate(["https://a.com/1", "https://b.com/1", "https://c.com/1"])
+        ]
+
+        result = await asyncio.wait_for(full_content_tasks._batch_fetch_content_async(articles), 2)
+
+        assert (result["success"], result["failed"], result["dispatched"]) == (1, 2, 1)
+        assert batch["dispatched"] == ["n0"]
+        assert set(batch["marked"]) == {"n1", "n2"}
+        assert str(batch["marked"]["n1"]) == "Store timed out after 0s"
+        assert str(batch["marked"]["n2"]) == "No fetch result within 0s"
+        assert batch["service"].closed
+
+    @pytest.mark.asyncio
+    async def test_nothing_marked_when_every_article_stores(self, batch):
+        batch["service"] = StreamingService(["https://a.com/1"], stall=False)
+        articles = [{"news_id": "n0", "url": "https://a.com/1", "market": "US"}]
+
+        result = await full_content_tasks._batch_fetch_content_async(articles)
+
+        assert result["success"] == 1
+        assert batch["marked"] == {}
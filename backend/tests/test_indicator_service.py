@@ -0,0 +1,121 @@
+"""
+Tests for the incremental technical indicator engine.
+"""
+import random
+
+import pandas as pd
+import pytest
+import ta.momentum
+import ta.trend
+import ta.volatility
+
+from app.services.indicator_service import (
+    IndicatorEngine,
+    IndicatorParams,
+    IndicatorState,
+    build_indicator_result,
+    compute_indicator_series,
+)
+
+ALL_TYPES = ("bb", "ema", "macd", "rsi", "sma")
+
+
+def _bars(n=300, seed=3):
+    rng = random.Random(seed)
+    close = 100.0
+    bars = []
+    for i in range(n):
+        close *= 1 + rng.gauss(0, 0.02)
+        day = pd.Timestamp("2023-01-02") + pd.Timedelta(days=i)
+        bars.append({"date": day.strftime("%Y-%m-%d"), "close": close})
+    return bars
+
+
+def _values(points):
+    return [p["value"] for p in points]
+
+
+def _expected(series):
+    return [round(float(v), 4) for v in series.dropna()]
+
+
+class TestParityWithTa:
+    """Streaming calculators must match the ta library's series."""
+
+    @pytest.fixture
+    def data(self):
+        bars = _bars()
+        close = pd.Series([b["close"] for b in bars], dtype=float)
+        result = compute_indicator_series(bars, list(ALL_TYPES), ma_periods=[10, 50])
+        return close, result
+
+    def test_moving_averages(self, data):
+        close, result = data
+        for period in (10, 50):
+            sma = ta.trend.SMAIndicator(close=close, window=period).sma_indicator()
+            ema = ta.trend.EMAIndicator(close=close, window=period).ema_indicator()
+            assert _values(result[f"sma_{period}"]["series"]) == pytest.approx(_expected(sma), abs=1e-4)
+            assert _values(result[f"ema_{period}"]["series"]) == pytest.approx(_expected(ema), abs=1e-4)
+
+    def test_rsi(self, data):
+        close, result = data
+        rsi = ta.momentum.RSIIndicator(close=close, window=14).rsi()
+        assert _values(result["rsi"]["series"]) == pytest.approx(_expected(rsi), abs=1e-4)
+
+    def test_macd(self, data):
+        close, result = data
+        macd = ta.trend.MACD(close=close)
+        assert _values(result["macd"]["macd_line"]) == pytest.approx(_expected(macd.macd()), abs=1e-4)
+        assert _values(result["macd"]["signal_line"]) == pytest.approx(_expected(macd.macd_signal()), abs=1e-4)
+        assert _values(result["macd"]["histogram"]) == pytest.approx(_expected(macd.macd_diff()), abs=1e-4)
+
+    def test_bollinger_bands(self, data):
+        close, result = data
+        bb = ta.volatility.BollingerBands(close=close, window=20, window_dev=2.0)
+        assert _values(result["bb"]["upper"]) == pytest.approx(_expected(bb.bollinger_hband()), abs=1e-4)
+        assert _values(result["bb"]["lower"]) == pytest.approx(_expected(bb.bollinger_lband()), abs=1e-4)
+
+    def test_insufficient_bars_warns(self):
+        result = compute_indicator_series(_bars(10), ["sma", "macd"], ma_periods=[20])
+        assert "sma_20" not in result
+        assert "MACD needs at least 35 bars, only have 10" in result["warnings"]
+
+
+class TestIndicatorEngine:
+    """Tests for cached, incremental updates."""
+
+    params = IndicatorParams(indicator_types=ALL_TYPES, ma_periods=(5, 20))
+
+    def _full(self, bars, since=None):
+        state = IndicatorState(self.params, intraday=False)
+        state.update(bars)
+        return build_indicator_result(state, since=since)
+
+    def test_appended_bars_match_full_recompute(self):
+        bars = _bars(120)
+        engine = IndicatorEngine()
+        engine.compute("AAPL", "1d", bars[:100], self.params)
+        result = engine.compute("AAPL", "1d", bars, self.params)
+        assert result == self._full(bars)
+        assert engine.stats()["rebuilds"] == 1
+
+    def test_revised_last_bar(self):
+        bars = _bars(80)
+        revised = [dict(b) for b in bars]
+        revised[-1]["close"] *= 1.05
+        engine = IndicatorEngine()
+        engine.compute("AAPL", "1d", bars, self.params)
+        assert engine.compute("AAPL", "1d", revised, self.params) == self._full(revised)
+        assert engine.stats()["hits"] == 1
+
+    def test_different_start_rebuilds(self):
+        bars = _bars(120)
+        engine = IndicatorEngine()
+        engine.compute("AAPL", "1d", bars[:100], self.params)
+        assert engine.compute("AAPL", "1d", bars[10:], self.params) == self._full(bars[10:])
+        assert engine.stats()["rebuilds"] == 2
+
+    def test_since_trims_points(self):
+        bars = _bars(60)
+        result = IndicatorEngine().compute("AAPL", "1d", bars, self.params, since=bars[50]["date"])
+        assert [p["time"] for p in result["sma_5"]["series"]] == [b["date"] for b in bars[50:]]
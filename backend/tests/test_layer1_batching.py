@@ -0,0 +1,53 @@
+"""
+Tests for Layer 1 token-budget batch planning.
+"""
+from app.services.layer1_scoring_service import _estimate_tokens, _plan_batches
+
+
+class TestEstimateTokens:
+    """Tests for _estimate_tokens function."""
+
+    def test_empty(self):
+        assert _estimate_tokens("") == 0
+
+    def test_latin_text(self):
+        assert _estimate_tokens("a" * 400) == 100
+
+    def test_cjk_counts_per_char(self):
+        assert _estimate_tokens("美联储宣布降息") == 7
+
+
+class TestPlanBatches:
+    """Tests for _plan_batches function."""
+
+    def test_short_articles_share_a_batch(self):
+        articles = [{"title": f"Headline {i}", "text": ""} for i in range(30)]
+        plan = _plan_batches(articles, token_budget=6000, max_articles=40)
+        assert len(plan) == 1
+        assert plan[0][0] == list(range(30))
+
+    def test_long_articles_split_by_budget(self):
+        articles = [{"title": "t", "text": "x" * 2000} for _ in range(6)]
+        plan = _plan_batches(articles, token_budget=1200, max_articles=40)
+        assert [len(indices) for indices, _ in plan] == [2, 2, 2]
+        assert all(tokens <= 1200 for _, tokens in plan)
+
+    def test_max_articles_cap(self):
+        articles = [{"title": "t", "text": ""} for _ in range(25)]
+        plan = _plan_batches(articles, token_budget=100_000, max_articles=10)
+        assert [len(indices) for indices, _ in plan] == [10, 10, 5]
+
+    def test_oversized_article_gets_own_batch(self):
+        articles = [
+            {"title": "a", "text": "short"},
+            {"title": "b", "text": "x" * 3000},
+            {"title": "c", "text": "short"},
+        ]
+        plan = _plan_batches(articles, token_budget=100, max_articles=40)
+        assert [indices for indices, _ in plan] == [[0], [1], [2]]
+
+    def test_preserves_input_order(self):
+        articles = [{"title": str(i), "text": "y" * (i * 100)} for i in range(20)]
+        plan = _plan_batches(articles, token_budget=800, max_articles=40)
+        flattened = [i for indices, _ in plan for i in indices]
+        assert flattened == list(range(20))
@@ -0,0 +1,184 @@
+"""
+Tests for buffered LLM usage writes and daily rollups.
+"""
+import asyncio
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import llm_cost_service
+from app.services.llm_cost_service import LlmCostService, LlmUsageSink, usage_sub_group
+from worker import task_helpers
+
+DAY = date(2026, 3, 2)
+PRICING = SimpleNamespace(
+    id="pricing-1",
+    input_price=Decimal("2"),
+    cached_input_price=Decimal("1"),
+    output_price=Decimal("8"),
+)
+ROLLUP_SUMS = (
+    "prompt_tokens", "completion_tokens", "cached_tokens", "total_tokens", "cost_usd", "calls",
+)
+
+
+class TestUsageSubGroup:
+    """Tests for the category breakdown sub-group."""
+
+    @pytest.mark.parametrize("purpose, metadata, expected", [
+        ("analysis", {"agent_type": "technical", "agent": "x"}, "technical"),
+        ("layer1_scoring", {"agent": "macro"}, "macro"),
+        ("layer3_analysis", {"agent": "risk"}, "risk"),
+        ("deep_filter", {"agent": "signal"}, "signal"),
+        ("chat", {"agent": "macro"}, ""),
+        ("layer1_scoring", {"agent_type": "macro"}, ""),
+        ("analysis", None, ""),
+    ])
+    def test_sub_group(self, purpose, metadata, expected):
+        assert usage_sub_group(purpose, metadata) == expected
+
+    def test_non_string_values_truncated(self):
+        assert usage_sub_group("layer1_scoring", {"agent": 7}) == "7"
+        assert len(usage_sub_group("analysis", {"agent_type": "a" * 150})) == 100
+
+
+class RecordingUsageSink(LlmUsageSink):
+    """Sink collecting records instead of writing them."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    async def _write(self, batch):
+        self.records.extend(batch)
+        return len(batch)
+
+
+class FakeSession:
+    """Session keeping inserted usage records and emulating the rollup upsert."""
+
+    def __init__(self):
+        self.records = []
+        self.daily = {}
+        self.upsert_sql = None
+
+    async def execute(self, statement, params=None):
+        if params is not None:
+            self.records.extend(params)
+            return
+        self.upsert_sql = str(statement.compile(dialect=postgresql.dialect()))
+        summed = statement._post_values_clause.update_values_to_set
+        for values in statement._multi_values[0]:
+            row = {column.name: value for column, value in values.items()}
+            key = (row["day"], row["purpose"], row["model"], row["sub_group"])
+            if key in self.daily:
+                for col in summed:
+                    self.daily[key][col] += row[col]
+            else:
+                self.daily[key] = row
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = LlmCostService()
+    service.pricing_lookups = []
+
+    async def get_active_pricing(model, day, db=None):
+        service.pricing_lookups.append((model, day))
+        return PRICING if model == "gpt-priced" else None
+
+    monkeypatch.setattr(service, "get_active_pricing", get_active_pricing)
+    return service
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    sink = RecordingUsageSink()
+    monkeypatch.setattr(llm_cost_service, "_usage_sink", sink)
+    return sink
+
+
+async def _recorded(service, sink, calls):
+    for purpose, model, prompt, completion, cached, metadata in calls:
+        await service.record_usage(
+            purpose=purpose, model=model, prompt_tokens=prompt,
+            completion_tokens=completion, cached_tokens=cached, metadata=metadata,
+        )
+    await llm_cost_service.drain_llm_usage()
+    for record in sink.records:
+        record["created_at"] = datetime(2026, 3, 2, 12, tzinfo=timezone.utc)
+    records, sink.records = sink.records, []
+    return records
+
+
+class TestWriteUsageBatch:
+    """Tests for pricing buffered records and upserting daily rollups."""
+
+    @pytest.mark.asyncio
+    async def test_prices_records_and_rolls_up_by_sub_group(self, service, sink):
+        records = await _recorded(service, sink, [
+            ("layer1_scoring", "gpt-priced", 1000, 100, 400, {"agent": "macro"}),
+            ("layer1_scoring", "gpt-priced", 500, 50, 0, {"agent": "macro"}),
+            ("layer1_scoring", "gpt-priced", 200, 20, 0, {"agent": "market"}),
+            ("chat", "local-model", 300, 30, 0, None),
+        ])
+        db = FakeSession()
+
+        await service.write_usage_batch(db, records)
+
+        # Pricing resolved once per (model, day)
+        assert service.pricing_lookups == [("gpt-priced", DAY), ("local-model", DAY)]
+        assert [r["cost_usd"] for r in db.records] == [
+            Decimal("0.002400"), Decimal("0.001400"), Decimal("0.000560"), Decimal("0"),
+        ]
+        assert [r["pricing_id"] for r in db.records] == ["pricing-1"] * 3 + [None]
+
+        macro = db.daily[(DAY, "layer1_scoring", "gpt-priced", "macro")]
+        assert (macro["calls"], macro["prompt_tokens"], macro["cached_tokens"]) == (2, 1500, 400)
+        assert macro["total_tokens"] == 1650
+        assert macro["cost_usd"] == Decimal("0.003800")
+        assert db.daily[(DAY, "layer1_scoring", "gpt-priced", "market")]["calls"] == 1
+        assert db.daily[(DAY, "chat", "local-model", "")]["cost_usd"] == Decimal("0")
+
+    @pytest.mark.asyncio
+    async def test_rollup_upsert_adds_to_existing_day(self, service, sink):
+        db = FakeSession()
+        for _ in range(2):
+            records = await _recorded(service, sink, [
+                ("analysis", "gpt-priced", 1000, 100, 0, {"agent_type": "technical"}),
+            ])
+            await service.write_usage_batch(db, records)
+
+        assert "ON CONFLICT ON CONSTRAINT uq_llm_usage_daily_key DO UPDATE SET" in db.upsert_sql
+        for col in ROLLUP_SUMS:
+            assert f"{col} = (llm_usage_daily.{col} + excluded.{col})" in db.upsert_sql
+
+        row = db.daily[(DAY, "analysis", "gpt-priced", "technical")]
+        assert len(db.daily) == 1
+        assert (row["calls"], row["prompt_tokens"], row["total_tokens"]) == (2, 2000, 2200)
+        assert row["cost_usd"] == Decimal("0.005600")
+        assert len(db.records) == 2
+
+
+class TestWorkerShutdownDrain:
+    """Tests for flushing usage records left behind when a worker exits."""
+
+    def test_shutdown_hook_writes_buffered_usage(self, service, sink, monkeypatch):
+        monkeypatch.setattr(task_helpers, "_SINGLETON_RESETS", [])
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(service.record_usage(purpose="chat", model="m", prompt_tokens=5))
+        flusher = sink._task
+        flusher.cancel()
+        loop.run_until_complete(asyncio.gather(flusher, return_exceptions=True))
+        loop.close()  # task loop closed without draining
+        assert sink.records == []
+
+        try:
+            task_helpers.drain_buffers_on_shutdown()
+        finally:
+            asyncio.set_event_loop(None)
+
+        assert [r["prompt_tokens"] for r in sink.records] == [5]
@@ -0,0 +1,97 @@
+"""
+Tests for the shared AKShare spot snapshot.
+"""
+import asyncio
+
+import pandas as pd
+import pytest
+
+from app.services.providers import market_snapshot
+from app.services.providers.market_snapshot import (
+    SPOT_CN,
+    MarketSnapshotService,
+    build_spot_frame,
+    frame_from_payload,
+    frame_to_payload,
+    search_frame,
+)
+
+
+def _raw_spot():
+    return pd.DataFrame(
+        {
+            "序号": [1, 2, 3],
+            "代码": ["600519", "000001", "300750"],
+            "名称": ["贵州茅台", "平安银行", "宁德时代"],
+            "最新价": [1500.0, 10.5, None],
+            "涨跌额": [12.0, -0.1, None],
+            "涨跌幅": [0.81, -0.94, None],
+            "成交量": [20000, 900000, None],
+            "总市值": [1.9e12, 2.0e11, 8.0e11],
+            "量比": [1.1, 0.9, 1.0],
+        }
+    )
+
+
+class TestSpotFrame:
+    """Tests for frame building, serialization and search."""
+
+    def test_indexed_by_code_with_selected_columns(self):
+        frame = build_spot_frame(_raw_spot())
+        assert list(frame.index) == ["600519", "000001", "300750"]
+        assert "量比" not in frame.columns
+        assert frame.loc["000001", "最新价"] == 10.5
+
+    def test_payload_round_trip(self):
+        frame = build_spot_frame(_raw_spot())
+        restored, fetched_at = frame_from_payload(frame_to_payload(frame, 123.0))
+        assert fetched_at == 123.0
+        pd.testing.assert_frame_equal(restored, frame, check_dtype=False)
+
+    def test_search_by_name_and_code(self):
+        frame = build_spot_frame(_raw_spot())
+        assert search_frame(frame, "茅台") == [("600519", "贵州茅台")]
+        assert [code for code, _ in search_frame(frame, "00")] == ["600519", "000001", "300750"]
+        assert search_frame(frame, "*ST") == []
+
+
+class TestMarketSnapshotService:
+    """Tests for snapshot refresh and lookups."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        async def no_redis():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(market_snapshot, "get_redis", no_redis)
+        service = MarketSnapshotService(refresh_seconds=60)
+        calls = []
+
+        async def download(table, redis):
+            calls.append(table)
+            await asyncio.sleep(0.01)
+            frame = build_spot_frame(_raw_spot())
+            service._frames[table] = (frame, market_snapshot.time.time())
+            return frame
+
+        monkeypatch.setattr(service, "_download", download)
+        service.calls = calls
+        return service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_download(self, service):
+        rows = await asyncio.gather(
+            *(service.get_row(SPOT_CN, code) for code in ("600519", "000001", "999999"))
+        )
+        assert service.calls == [SPOT_CN]
+        assert rows[0]["名称"] == "贵州茅台"
+        assert rows[2] is None
+
+        await service.get_rows(SPOT_CN, ["300750"])
+        assert service.calls == [SPOT_CN]
+
+    @pytest.mark.asyncio
+    async def test_missing_values_become_none(self, service):
+        row = await service.get_row(SPOT_CN, "300750")
+        assert row["最新价"] is None
+        assert row["总市值"] == 8.0e11
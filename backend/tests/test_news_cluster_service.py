@@ -0,0 +1,127 @@
+"""
+Tests for symbol-scoped near-duplicate clustering.
+"""
+from collections import defaultdict
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.news import _hide_near_duplicates
+from app.models.news import News
+from app.services import news_cluster_service
+from app.services.news_cluster_service import NewsClusterService, cluster_scope
+
+HEADLINE = "Apple, Microsoft lead rally as tech stocks climb on strong earnings outlook"
+SUMMARY = "Shares of Apple and Microsoft rose sharply on Tuesday after upbeat guidance."
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hgetall(self, key):
+        self.commands.append(("hgetall", key))
+
+    def hset(self, key, field, value):
+        self.commands.append(("hset", key, field, value))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    async def execute(self):
+        replies = []
+        for name, key, *args in self.commands:
+            if name == "hgetall":
+                replies.append(dict(self.redis.hashes.get(key, {})))
+            elif name == "hset":
+                self.redis.hashes[key][args[0]] = args[1]
+                replies.append(1)
+            else:
+                replies.append(True)
+        return replies
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = defaultdict(dict)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+
+    async def get_redis():
+        return redis
+
+    monkeypatch.setattr(news_cluster_service, "get_redis", get_redis)
+    return redis
+
+
+class TestClusterScope:
+    """Tests for clustering only articles of the same symbol."""
+
+    @pytest.mark.asyncio
+    async def test_shared_headline_stays_separate_per_symbol(self, redis):
+        service = NewsClusterService()
+        aapl, msft = cluster_scope("AAPL", "US"), cluster_scope("MSFT", "US")
+
+        duplicates = await service.link_duplicates([
+            ("aapl-1", aapl, HEADLINE, SUMMARY),
+            ("msft-1", msft, HEADLINE, SUMMARY),
+            ("general-1", cluster_scope("", "US"), HEADLINE, SUMMARY),
+            ("aapl-2", aapl, HEADLINE, SUMMARY),
+        ])
+
+        assert duplicates == {"aapl-2": "aapl-1"}
+
+    @pytest.mark.asyncio
+    async def test_window_links_later_copies_within_scope(self, redis):
+        service = NewsClusterService()
+        aapl, msft = cluster_scope("AAPL", "US"), cluster_scope("MSFT", "US")
+        await service.link_duplicates([("aapl-1", aapl, HEADLINE, SUMMARY)])
+
+        # Later poll, fresh local index: only the Redis window is shared
+        duplicates = await service.link_duplicates([
+            ("msft-1", msft, HEADLINE, SUMMARY),
+            ("aapl-2", aapl, HEADLINE, SUMMARY),
+        ])
+
+        assert duplicates == {"aapl-2": "aapl-1"}
+        assert any(key.startswith("news:simhash:US:MSFT:") for key in redis.hashes)
+
+    @pytest.mark.asyncio
+    async def test_local_index_shared_across_batches(self, redis, monkeypatch):
+        async def redis_down():
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(news_cluster_service, "get_redis", redis_down)
+        service = NewsClusterService()
+        aapl, msft = cluster_scope("AAPL", "US"), cluster_scope("MSFT", "US")
+        indexes = {}
+
+        await service.link_duplicates([("aapl-1", aapl, HEADLINE, SUMMARY)], local_index=indexes)
+        duplicates = await service.link_duplicates([
+            ("msft-1", msft, HEADLINE, SUMMARY),
+            ("aapl-2", aapl, HEADLINE, SUMMARY),
+        ], local_index=indexes)
+
+        assert duplicates == {"aapl-2": "aapl-1"}
+        assert set(indexes) == {aapl, msft}
+
+
+class TestHideNearDuplicates:
+    """Tests for the listing filter on near-duplicates."""
+
+    def test_duplicates_hidden_only_under_same_scope_representative(self):
+        query = _hide_near_duplicates(select(News).where(News.symbol.in_(["MSFT"])))
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "news.duplicate_of_id IS NULL OR NOT (EXISTS" in sql
+        assert "news_1.id = news.duplicate_of_id" in sql
+        assert "news_1.symbol = news.symbol" in sql
+        assert "news_1.market = news.market" in sql
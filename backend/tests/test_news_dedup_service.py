@@ -0,0 +1,193 @@
+"""
+Tests for the news URL dedup index helpers.
+"""
+import pytest
+
+from app.services import news_dedup_service
+from app.services.news_dedup_service import (
+    INDEX_KEY,
+    READY_KEY,
+    NewsDedupService,
+    bit_positions,
+    bloom_parameters,
+)
+
+
+class TestBloomParameters:
+    """Tests for bloom_parameters function."""
+
+    def test_standard_sizing(self):
+        # ~9.6 bits per item and 7 hashes for a 1% false-positive rate
+        num_bits, num_hashes = bloom_parameters(1_000_000, 0.01)
+        assert 9_500_000 < num_bits < 9_700_000
+        assert num_hashes == 7
+
+    def test_lower_fp_rate_needs_more_bits(self):
+        bits_1pct, _ = bloom_parameters(1000, 0.01)
+        bits_01pct, _ = bloom_parameters(1000, 0.001)
+        assert bits_01pct > bits_1pct
+
+    def test_zero_capacity_is_clamped(self):
+        num_bits, num_hashes = bloom_parameters(0, 0.01)
+        assert num_bits > 0
+        assert num_hashes >= 1
+
+
+class TestBitPositions:
+    """Tests for bit_positions function."""
+
+    def test_deterministic(self):
+        url = "https://example.com/news/1"
+        assert bit_positions(url, 10_000, 7) == bit_positions(url, 10_000, 7)
+
+    def test_count_and_range(self):
+        positions = bit_positions("https://example.com/a", 1024, 5)
+        assert len(positions) == 5
+        assert all(0 <= p < 1024 for p in positions)
+
+    def test_different_urls_differ(self):
+        a = bit_positions("https://example.com/a", 1_000_000, 7)
+        b = bit_positions("https://example.com/b", 1_000_000, 7)
+        assert a != b
+
+    def test_no_false_negatives(self):
+        num_bits, num_hashes = bloom_parameters(500, 0.01)
+        bitmap = bytearray((num_bits + 7) // 8)
+        urls = [f"https://example.com/news/{i}" for i in range(500)]
+        for url in urls:
+            for pos in bit_positions(url, num_bits, num_hashes):
+                bitmap[pos >> 3] |= 0x80 >> (pos & 7)
+        for url in urls:
+            assert all(
+                bitmap[pos >> 3] & (0x80 >> (pos & 7))
+                for pos in bit_positions(url, num_bits, num_hashes)
+            )
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def exists(self, key):
+        self.commands.append(("exists", key))
+
+    def getbit(self, key, pos):
+        self.commands.append(("getbit", key, pos))
+
+    def setbit(self, key, pos, value):
+        self.commands.append(("setbit", key, pos, value))
+
+    async def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        replies = []
+        for name, key, *args in self.commands:
+            if name == "exists":
+                replies.append(int(key in self.redis.keys))
+            elif name == "getbit":
+                replies.append(int(args[0] in self.redis.bits))
+            else:
+                self.redis.bits.add(args[0])
+                replies.append(0)
+        return replies
+
+
+class FakeRedis:
+    """Redis stub keeping the Bloom bitmap as a set of offsets."""
+
+    def __init__(self):
+        self.keys = {READY_KEY, INDEX_KEY}
+        self.bits = set()
+        self.fail = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeResult:
+    def __init__(self, urls):
+        self.urls = urls
+
+    def fetchall(self):
+        return [(url,) for url in self.urls]
+
+
+class FakeSession:
+    """Session answering ``url IN (...)`` queries from a set of stored URLs."""
+
+    def __init__(self, stored):
+        self.stored = set(stored)
+        self.checked = []
+
+    async def execute(self, statement):
+        (urls,) = statement.compile().params.values()
+        self.checked.append(sorted(urls))
+        return FakeResult([u for u in urls if u in self.stored])
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+
+    async def get_redis():
+        return redis
+
+    monkeypatch.setattr(news_dedup_service, "get_redis", get_redis)
+    return redis
+
+
+@pytest.fixture
+def service():
+    return NewsDedupService(capacity=1000, fp_rate=0.01)
+
+
+def _index(service, redis, *urls):
+    for url in urls:
+        redis.bits.update(bit_positions(url, service.num_bits, service.num_hashes))
+
+
+class TestFilterNewUrls:
+    """Tests for Bloom-filtered URL dedup with DB confirmation."""
+
+    @pytest.mark.asyncio
+    async def test_bloom_misses_skip_the_db(self, service, redis):
+        db = FakeSession(stored=[])
+
+        new = await service.filter_new_urls(db, ["https://a.com/1", "https://b.com/1", ""])
+
+        assert new == {"https://a.com/1", "https://b.com/1"}
+        assert db.checked == []
+        # New URLs recorded so the next lookup sees them
+        assert await service._probable_hits(["https://a.com/1"]) == {"https://a.com/1"}
+
+    @pytest.mark.asyncio
+    async def test_bloom_hits_confirmed_against_db(self, service, redis):
+        stored, false_positive = "https://a.com/stored", "https://b.com/not-stored"
+        _index(service, redis, stored, false_positive)
+        db = FakeSession(stored=[stored])
+
+        new = await service.filter_new_urls(db, [stored, false_positive, "https://c.com/new"])
+
+        assert db.checked == [sorted([stored, false_positive])]
+        assert new == {false_positive, "https://c.com/new"}
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable_falls_back_to_db(self, service, redis):
+        redis.fail = True
+        db = FakeSession(stored=["https://a.com/1"])
+
+        new = await service.filter_new_urls(db, ["https://a.com/1", "https://b.com/1"])
+
+        assert db.checked == [["https://a.com/1", "https://b.com/1"]]
+        assert new == {"https://b.com/1"}
+
+    @pytest.mark.asyncio
+    async def test_unbuilt_index_falls_back_to_db(self, service, redis):
+        redis.keys.discard(READY_KEY)
+        db = FakeSession(stored=[])
+
+        new = await service.filter_new_urls(db, ["https://a.com/1"])
+
+        assert db.checked == [["https://a.com/1"]]
+        assert new == {"https://a.com/1"}
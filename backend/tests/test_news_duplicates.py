@@ -0,0 +1,86 @@
+"""
+Tests for serving near-duplicate news through their representative.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.api.v1.news import _news_to_response, _resolve_duplicate
+from app.models.news import FilterStatus, News
+
+
+def _news(**overrides):
+    values = dict(
+        id=uuid.uuid4(),
+        symbol="AAPL",
+        title="Apple beats estimates",
+        summary="Wire copy",
+        source="reuters",
+        url=f"https://example.com/{uuid.uuid4()}",
+        published_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        market="US",
+        content_status="pending",
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+    values.update(overrides)
+    return News(**values)
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def scalar_one_or_none(self):
+        return self.row
+
+
+class FakeSession:
+    """Session whose queries return one scripted row."""
+
+    def __init__(self, row):
+        self.row = row
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        return FakeResult(self.row)
+
+
+class TestDuplicateResolution:
+    """Tests for representative lookup and response merging."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_reports_representative_analysis(self):
+        representative = _news(
+            content_status="embedded",
+            sentiment_tag="bullish",
+            investment_summary="Beat on services revenue",
+            content_score=180,
+        )
+        duplicate = _news(
+            source="yahoo",
+            filter_status=FilterStatus.DUPLICATE.value,
+            processing_path="duplicate",
+            duplicate_of_id=representative.id,
+        )
+
+        analyzed = await _resolve_duplicate(FakeSession(representative), duplicate)
+        response = _news_to_response(duplicate, analyzed)
+
+        assert response.id == str(duplicate.id)
+        assert response.source == "yahoo"
+        assert response.filter_status == "duplicate"
+        assert response.content_status == "embedded"
+        assert response.sentiment_tag == "bullish"
+        assert response.summary == "Beat on services revenue"
+
+    @pytest.mark.asyncio
+    async def test_originals_and_orphans_resolve_to_themselves(self):
+        original = _news()
+        session = FakeSession(None)
+        assert await _resolve_duplicate(session, original) is original
+        assert session.queries == 0
+
+        orphan = _news(duplicate_of_id=uuid.uuid4())  # representative deleted
+        assert await _resolve_duplicate(session, orphan) is orphan
@@ -0,0 +1,168 @@
+"""
+Tests for the staged news monitor pipeline.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from worker.tasks import news_monitor
+from worker.tasks.news_monitor import (
+    SCORING_BATCH_SIZE,
+    _STAGE_DONE,
+    _Candidate,
+    _dedup_stage,
+    _run_stages,
+    _score_stage,
+)
+
+
+def _candidates(start, count):
+    return [
+        _Candidate(
+            url=f"https://news.example/{i}",
+            title=f"Headline {i}",
+            summary=None,
+            source="test",
+            symbol="AAPL",
+            market="US",
+            published_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            origin="global",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def _stats():
+    return {"duplicates": 0, "near_duplicates": 0}
+
+
+class FakeDedupService:
+    """URL index reporting ``stored`` URLs as already known."""
+
+    def __init__(self, stored=()):
+        self.stored = set(stored)
+
+    async def filter_new_urls(self, db, urls):
+        return {u for u in urls if u not in self.stored}
+
+
+@pytest.fixture
+def dedup(monkeypatch):
+    service = FakeDedupService(stored={"https://news.example/3"})
+
+    @asynccontextmanager
+    async def task_session():
+        yield None
+
+    monkeypatch.setattr(news_monitor, "get_task_session", task_session)
+    monkeypatch.setattr("app.services.news_dedup_service.get_news_dedup_service", lambda: service)
+    return service
+
+
+async def _drain(queue):
+    items = []
+    while (item := await queue.get()) is not _STAGE_DONE:
+        items.append(item)
+    return items
+
+
+class TestDedupStage:
+    """Tests for dedup and re-batching between fetch and scoring."""
+
+    @pytest.mark.asyncio
+    async def test_rebatches_in_order_at_scoring_batch_size(self, dedup):
+        in_q, out_q = asyncio.Queue(), asyncio.Queue()
+        articles = _candidates(0, 2 * SCORING_BATCH_SIZE + 6)
+        for chunk in (articles[:7], articles[5:30], articles[30:]):  # overlapping URLs
+            in_q.put_nowait(chunk)
+        in_q.put_nowait(_STAGE_DONE)
+        stats = _stats()
+
+        await _dedup_stage(in_q, out_q, False, stats)
+        batches = await _drain(out_q)
+
+        assert [len(b) for b in batches] == [SCORING_BATCH_SIZE, SCORING_BATCH_SIZE, 5]
+        urls = [c.url for b in batches for c in b]
+        assert urls == [c.url for c in articles if c.url != "https://news.example/3"]
+        assert stats["duplicates"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_output_queue_blocks_upstream(self, dedup):
+        in_q = asyncio.Queue(maxsize=1)
+        out_q = asyncio.Queue(maxsize=1)
+        task = asyncio.create_task(_dedup_stage(in_q, out_q, False, _stats()))
+
+        for n in range(3):
+            batch = _candidates(100 + n * SCORING_BATCH_SIZE, SCORING_BATCH_SIZE)
+            await asyncio.wait_for(in_q.put(batch), 1)
+        await asyncio.sleep(0.01)
+
+        # One batch buffered downstream, one held by the stage, one waiting upstream
+        assert out_q.full() and in_q.full()
+        assert not task.done()
+
+        in_q_put = asyncio.create_task(in_q.put(_STAGE_DONE))
+        batches = await asyncio.wait_for(_drain(out_q), 1)
+        await asyncio.wait_for(asyncio.gather(task, in_q_put), 1)
+        assert len(batches) == 3
+
+
+class TestScoreStage:
+    """Tests for the concurrent scoring workers."""
+
+    @pytest.mark.asyncio
+    async def test_end_marker_reaches_every_worker(self):
+        in_q, out_q = asyncio.Queue(), asyncio.Queue()
+        for n in range(5):
+            in_q.put_nowait(_candidates(n, 1))
+        in_q.put_nowait(_STAGE_DONE)
+
+        await asyncio.wait_for(
+            asyncio.gather(*[_score_stage(in_q, out_q, None, False) for _ in range(3)]), 1
+        )
+
+        assert out_q.qsize() == 5
+        assert all(scoring_map == {} for _, scoring_map in out_q._queue)
+
+
+class TestRunStages:
+    """Tests for failure propagation across stages."""
+
+    @pytest.mark.asyncio
+    async def test_failing_consumer_shuts_down_blocked_stages(self, dedup):
+        fetched_q = asyncio.Queue(maxsize=1)
+        deduped_q = asyncio.Queue(maxsize=1)
+
+        async def fetch():
+            for n in range(10):
+                await fetched_q.put(_candidates(n * SCORING_BATCH_SIZE, SCORING_BATCH_SIZE))
+            await fetched_q.put(_STAGE_DONE)
+
+        async def write():
+            await deduped_q.get()
+            raise RuntimeError("database unavailable")
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            await asyncio.wait_for(
+                _run_stages(fetch(), _dedup_stage(fetched_q, deduped_q, False, _stats()), write()),
+                timeout=2,
+            )
+
+    @pytest.mark.asyncio
+    async def test_failing_producer_stops_consumers(self):
+        queue = asyncio.Queue(maxsize=1)
+        consumed = []
+
+        async def fetch():
+            await queue.put(_candidates(0, 1))
+            raise RuntimeError("provider crashed")
+
+        async def consume():
+            while (item := await queue.get()) is not _STAGE_DONE:
+                consumed.append(item)
+
+        with pytest.raises(RuntimeError, match="provider crashed"):
+            await asyncio.wait_for(_run_stages(fetch(), consume()), timeout=1)
+        assert len(consumed) <= 1
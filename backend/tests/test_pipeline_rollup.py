@@ -0,0 +1,226 @@
+"""
+Tests for pipeline event rollup aggregation helpers.
+"""
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.pipeline_event import PipelineEventRollup
+from app.services import pipeline_rollup_service
+from app.services.pipeline_rollup_service import (
+    REFRESH_LOCK_KEY,
+    NodeRollup,
+    PipelineRollupService,
+    event_counters,
+    histogram_quantile,
+    latency_bucket,
+)
+
+NOW = datetime(2026, 3, 2, 14, 0, tzinfo=timezone.utc)
+
+
+class TestLatencyHistogram:
+    """Tests for the log-bucket latency histogram."""
+
+    def test_buckets_are_monotonic(self):
+        values = [0.2, 1, 2, 3, 10, 100, 1000, 60_000]
+        indices = [latency_bucket(v) for v in values]
+        assert indices == sorted(indices)
+
+    def test_quantiles_within_error_bound(self):
+        rng = random.Random(42)
+        durations = sorted(rng.lognormvariate(5, 1) for _ in range(5000))
+        agg = NodeRollup(layer="2", node="fetch")
+        for d in durations:
+            agg.add_event("success", d)
+
+        for q in (0.5, 0.95):
+            exact = durations[int(q * (len(durations) - 1))]
+            assert abs(agg.quantile(q) - exact) / exact < 0.1
+
+    def test_empty_histogram(self):
+        assert histogram_quantile({}, 0.5) is None
+
+    def test_quantile_clamped_to_max(self):
+        assert histogram_quantile({latency_bucket(1000): 1}, 0.95, max_ms=1000) <= 1000
+
+
+class TestNodeRollup:
+    """Tests for NodeRollup aggregation."""
+
+    def test_counts_and_duration(self):
+        agg = NodeRollup(layer="1", node="initial_filter")
+        agg.add_event("success", 10.0)
+        agg.add_event("error", 30.0)
+        agg.add_event("skip", None)
+        assert (agg.count, agg.success_count, agg.error_count) == (3, 1, 1)
+        assert agg.duration_count == 2
+        assert agg.avg_ms == 20.0
+        assert agg.duration_max == 30.0
+
+    def test_split_and_merged_rows_match(self):
+        durations = [5, 12, 40, 90, 250, 800, 1500]
+        whole = NodeRollup(layer="2", node="x")
+        for d in durations:
+            whole.add_event("success", d, {"provider": "tavily"})
+
+        merged = NodeRollup(layer="2", node="x")
+        for part in (durations[:3], durations[3:]):
+            piece = NodeRollup(layer="2", node="x")
+            for d in part:
+                piece.add_event("success", d, {"provider": "tavily"})
+            # Round-trip through the stored row, as refresh() and read() do
+            merged.merge_row(PipelineEventRollup(**piece.to_row(NOW, NOW)))
+
+        assert (merged.count, merged.success_count) == (whole.count, whole.success_count)
+        assert merged.duration_sum == whole.duration_sum
+        assert merged.duration_max == whole.duration_max
+        assert merged.histogram == whole.histogram
+        assert merged.counters == whole.counters
+        assert merged.quantile(0.5) == whole.quantile(0.5)
+        assert merged.quantile(0.95) == whole.quantile(0.95)
+
+
+class TestEventCounters:
+    """Tests for node-specific metadata counters."""
+
+    def test_layer1_score_bucket_and_decision(self):
+        counters = event_counters(
+            "1", "layer1_scoring", "success",
+            {"score": 170, "decision": "full_analysis"}, None,
+        )
+        assert counters["score:150-194"] == 1
+        assert counters["score:150-194:full_analysis"] == 1
+        assert counters["score:150-194:lightweight"] == 0
+
+    def test_errors_contribute_no_counters(self):
+        assert event_counters("1", "layer1_scoring", "error", {"score": 10}, None) == {}
+
+    def test_fetch_provider_defaults_to_unknown(self):
+        counters = event_counters("1.5", "fetch", "success", {"images_downloaded": 2}, None)
+        assert counters["provider:unknown"] == 1
+        assert counters["with_images"] == 1
+
+    def test_cache_hit_rate(self):
+        counters = event_counters(
+            "2", "multi_agent_analysis", "success", None,
+            {"cache_hit_rate": 0.4, "cached_tokens": 100, "prompt_tokens": 250},
+        )
+        assert counters["cache_hits"] == 1
+        assert counters["hit_rate_sum"] == 0.4
+        assert counters["prompt_tokens"] == 250
+
+
+class FakeRedis:
+    """Redis stub for SET NX locks and the compare-and-delete script."""
+
+    def __init__(self, log):
+        self.store = {}
+        self.log = log
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token):
+        if self.store.get(key) != token:
+            return 0
+        del self.store[key]
+        self.log.append("release")
+        return 1
+
+
+class FakeStream:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def partitions(self, size):
+        yield self.rows
+
+
+class FakeResult:
+    def first(self):
+        return (NOW,)  # rollups exist: refresh the lookback window only
+
+
+class FakeSession:
+    """Session recording the refresh's statements and commit."""
+
+    def __init__(self, log, rows, on_commit=None):
+        self.log = log
+        self.rows = rows
+        self.inserted = []
+        self.on_commit = on_commit
+
+    async def execute(self, statement, params=None):
+        if params is not None:
+            self.inserted.extend(params)
+            self.log.append("insert")
+        elif statement.is_delete:
+            self.log.append("delete")
+        return FakeResult()
+
+    async def stream(self, statement):
+        return FakeStream(self.rows)
+
+    async def commit(self):
+        self.log.append("commit")
+        if self.on_commit:
+            await self.on_commit()
+
+
+class TestRefresh:
+    """Tests for the locked rollup refresh."""
+
+    @pytest.fixture
+    def log(self):
+        return []
+
+    @pytest.fixture
+    def redis(self, log, monkeypatch):
+        redis = FakeRedis(log)
+
+        async def get_redis():
+            return redis
+
+        monkeypatch.setattr(pipeline_rollup_service, "get_redis", get_redis)
+        return redis
+
+    @pytest.mark.asyncio
+    async def test_commits_before_releasing_lock(self, log, redis):
+        rows = [
+            ("1", "initial_filter", "success", 10.0, None, None, NOW),
+            ("1", "initial_filter", "error", 30.0, None, None, NOW),
+        ]
+        db = FakeSession(log, rows)
+
+        stats = await PipelineRollupService().refresh(db)
+
+        assert log == ["delete", "insert", "commit", "release"]
+        assert stats["events"] == 2 and stats["buckets"] == 1
+        assert db.inserted[0]["count"] == 2
+        assert REFRESH_LOCK_KEY not in redis.store
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_skipped(self, log, redis):
+        redis.store[REFRESH_LOCK_KEY] = "other"
+
+        stats = await PipelineRollupService().refresh(FakeSession(log, []))
+
+        assert stats["skipped"] == 1
+        assert log == []
+
+    @pytest.mark.asyncio
+    async def test_expired_lock_taken_over_is_not_released(self, log, redis):
+        async def lock_expires_and_is_taken():
+            redis.store[REFRESH_LOCK_KEY] = "next-refresh"
+
+        db = FakeSession(log, [], on_commit=lock_expires_and_is_taken)
+
+        await PipelineRollupService().refresh(db)
+
+        assert redis.store[REFRESH_LOCK_KEY] == "next-refresh"
+        assert "release" not in log
@@ -0,0 +1,112 @@
+"""
+Tests for the buffered pipeline trace sink.
+"""
+import asyncio
+
+import pytest
+
+from app.services import pipeline_trace_sink
+from app.services.pipeline_trace_sink import PipelineTraceSink
+from worker import task_helpers
+
+
+class RecordingSink(PipelineTraceSink):
+    """Sink that records batches instead of writing to the database."""
+
+    def __init__(self, write_delay: float = 0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.write_delay = write_delay
+
+    async def _write(self, batch):
+        if self.write_delay:
+            await asyncio.sleep(self.write_delay)
+        self.batches.append(batch)
+        self.written += len(batch)
+        return len(batch)
+
+
+def _events(n):
+    return [{"id": str(i)} for i in range(n)]
+
+
+class TestPipelineTraceSink:
+    """Tests for PipelineTraceSink buffering and flushing."""
+
+    @pytest.mark.asyncio
+    async def test_drain_writes_everything_in_batches(self):
+        sink = RecordingSink(max_events=100, batch_size=10, flush_interval=60)
+        await sink.put(_events(25))
+        await sink.drain()
+        assert [len(b) for b in sink.batches] == [10, 10, 5]
+        assert sink.stats()["buffered"] == 0
+        assert sink.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_full_batch_wakes_flusher(self):
+        sink = RecordingSink(max_events=100, batch_size=5, flush_interval=60)
+        await sink.put(_events(5))
+        await asyncio.sleep(0.01)
+        assert sink.written == 5
+        await sink.drain()
+
+    @pytest.mark.asyncio
+    async def test_drops_when_full_and_flusher_stalled(self):
+        sink = RecordingSink(
+            write_delay=0.2, max_events=10, batch_size=100,
+            flush_interval=60, backpressure_timeout=0.01,
+        )
+        await sink.put(_events(10))
+        # Flusher takes the first 10 and stalls writing them; 10 more fit
+        # in the freed buffer and the last 5 are dropped.
+        await sink.put(_events(15))
+        assert sink.enqueued == 20
+        assert sink.dropped == 5
+        await sink.drain()
+        assert sink.written == 20
+
+    @pytest.mark.asyncio
+    async def test_backpressure_waits_for_space(self):
+        sink = RecordingSink(
+            max_events=10, batch_size=10, flush_interval=60, backpressure_timeout=1.0,
+        )
+        await sink.put(_events(25))
+        await sink.drain()
+        assert sink.dropped == 0
+        assert sink.written == 25
+
+
+class TestFlushOnClose:
+    """Tests for draining the trace sink when a task loop or worker exits."""
+
+    @pytest.fixture
+    def sink(self, monkeypatch):
+        sink = RecordingSink(max_events=100, batch_size=10, flush_interval=60)
+        monkeypatch.setattr(pipeline_trace_sink, "_sink", sink)
+        monkeypatch.setattr(task_helpers, "_recorder_registered", True)
+        monkeypatch.setattr(task_helpers, "_SINGLETON_RESETS", [])
+        yield sink
+        asyncio.set_event_loop(None)
+
+    def test_task_loop_drained_before_close(self, sink):
+        async def task():
+            await sink.put(_events(15))
+            return "done"
+
+        assert task_helpers.run_async_task(task) == "done"
+        assert sink.written == 15
+        assert sink.stats()["buffered"] == 0
+
+    def test_worker_shutdown_writes_events_left_on_closed_loop(self, sink):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(sink.put(_events(3)))
+        flusher = sink._task
+        flusher.cancel()
+        loop.run_until_complete(asyncio.gather(flusher, return_exceptions=True))
+        loop.close()  # closed without draining
+        assert sink.written == 0
+
+        task_helpers.drain_buffers_on_shutdown(sig=None, how="TERM", exitcode=0)
+
+        assert sink.written == 3
+        assert sink.stats()["buffered"] == 0
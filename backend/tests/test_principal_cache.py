@@ -0,0 +1,71 @@
+"""
+Tests for the authenticated principal cache.
+"""
+import time
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import inspect as sa_inspect
+
+from app.core.principal_cache import (
+    PrincipalCache,
+    principal_from_dict,
+    principal_to_dict,
+)
+from app.models.user import AccountStatus, User, UserRole
+
+
+def _user(**overrides):
+    values = dict(
+        id=7,
+        role=UserRole.ADMIN,
+        account_status=AccountStatus.ACTIVE,
+        email="a@example.com",
+        password_hash="x",
+        is_active=True,
+        is_locked=False,
+        failed_login_attempts=0,
+        locked_until=datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc),
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        updated_at=datetime(2025, 6, 1, tzinfo=timezone.utc),
+    )
+    values.update(overrides)
+    return User(**values)
+
+
+class TestPrincipalSerialization:
+    """Tests for principal dict round-trips."""
+
+    def test_round_trip_restores_types(self):
+        user = principal_from_dict(principal_to_dict(_user()))
+        assert user.role is UserRole.ADMIN
+        assert user.account_status is AccountStatus.ACTIVE
+        assert user.locked_until == datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc)
+
+    def test_rebuilt_user_is_clean_and_detached(self):
+        user = principal_from_dict(principal_to_dict(_user()))
+        state = sa_inspect(user)
+        assert state.detached
+        assert not state.modified
+
+
+class TestLocalTier:
+    """Tests for the in-process tier."""
+
+    @pytest.mark.asyncio
+    async def test_invalidation_blocks_stale_load(self):
+        cache = PrincipalCache(local_ttl=60, redis_ttl=60)
+        loaded_at = time.monotonic()
+        cache.invalidate_local([7])
+        # A load that started before the invalidation must not repopulate
+        await cache.put(_user(), generation=-1, loaded_at=loaded_at)
+        assert 7 not in cache._local
+
+        await cache.put(_user(), generation=-1, loaded_at=time.monotonic())
+        assert 7 in cache._local
+
+    def test_lru_bound(self):
+        cache = PrincipalCache(local_ttl=60, redis_ttl=60, max_local=2)
+        for user_id in (1, 2, 3):
+            cache._put_local(user_id, {"id": user_id}, time.monotonic())
+        assert list(cache._local) == [2, 3]
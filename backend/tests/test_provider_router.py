@@ -0,0 +1,95 @@
+"""
+Tests for latency-aware, hedged provider routing.
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.config import settings
+from app.core import circuit_breaker
+from app.services.providers.router import ProviderRouter
+from app.services.stock_types import DataSource, Market
+
+
+class FakeProvider:
+    """Provider returning a fixed result after a delay."""
+
+    def __init__(self, source, delay=0.0, result=None, error=None):
+        self.source = source
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    @classmethod
+    def is_available(cls):
+        return True
+
+    async def get_quote(self, symbol, market):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def routing_settings(monkeypatch):
+    monkeypatch.setattr(settings, "PROVIDER_HEDGING_ENABLED", True)
+    monkeypatch.setattr(settings, "PROVIDER_HEDGE_MIN_DELAY", 0.01)
+    monkeypatch.setattr(settings, "PROVIDER_HEDGE_MAX_DELAY", 0.1)
+    circuit_breaker._circuit_breakers.clear()
+    yield
+    circuit_breaker._circuit_breakers.clear()
+
+
+def _hk_router(akshare, yfinance):
+    # HK routes akshare first, yfinance second
+    return ProviderRouter(yfinance=yfinance, akshare=akshare)
+
+
+class TestProviderRouter:
+    """Tests for ordering, fallback and hedging."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self):
+        akshare = FakeProvider(DataSource.AKSHARE, delay=2.0, result="ak")
+        yfinance = FakeProvider(DataSource.YFINANCE, result="yf")
+        router = _hk_router(akshare, yfinance)
+
+        started = time.monotonic()
+        assert await router.get_quote("0700.HK", Market.HK) == "yf"
+        assert time.monotonic() - started < 1.0
+
+    @pytest.mark.asyncio
+    async def test_none_falls_through_and_counts_as_error(self):
+        akshare = FakeProvider(DataSource.AKSHARE, result=None)
+        yfinance = FakeProvider(DataSource.YFINANCE, result="yf")
+        router = _hk_router(akshare, yfinance)
+
+        assert await router.get_quote("0700.HK", Market.HK) == "yf"
+        stats = router._health.stats(akshare, Market.HK, "get_quote")
+        assert stats.error_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_all_empty_returns_none(self):
+        router = _hk_router(
+            FakeProvider(DataSource.AKSHARE), FakeProvider(DataSource.YFINANCE)
+        )
+        assert await router.get_quote("9999.HK", Market.HK) is None
+
+    @pytest.mark.asyncio
+    async def test_failing_primary_is_demoted(self):
+        akshare = FakeProvider(DataSource.AKSHARE, error=RuntimeError("down"))
+        yfinance = FakeProvider(DataSource.YFINANCE, result="yf")
+        router = _hk_router(akshare, yfinance)
+
+        for _ in range(10):
+            assert await router.get_quote("0700.HK", Market.HK) == "yf"
+        ranked = router._health.rank(router.get_providers(Market.HK), Market.HK, "get_quote")
+        assert ranked[0] is yfinance
+
+        calls = akshare.calls
+        await router.get_quote("0700.HK", Market.HK)
+        assert akshare.calls == calls
@@ -0,0 +1,87 @@
+"""
+Tests for streaming quote fan-out.
+"""
+import asyncio
+import json
+from contextlib import aclosing
+
+import pytest
+
+from app.config import settings
+from app.services.quote_stream_service import QuoteStreamService
+
+
+class FakeQuote:
+    def __init__(self, price):
+        self.price = price
+
+    def to_dict(self):
+        return {"symbol": "AAPL", "price": self.price, "timestamp": "now", "source": "yfinance"}
+
+
+class FakeRouter:
+    """Provider router returning a scripted sequence of prices."""
+
+    def __init__(self, prices):
+        self.prices = list(prices)
+        self.calls = 0
+
+    async def get_quote(self, symbol, market):
+        self.calls += 1
+        price = self.prices[min(self.calls, len(self.prices)) - 1]
+        return FakeQuote(price)
+
+
+@pytest.fixture
+def router(monkeypatch):
+    router = FakeRouter([100.0, 100.0, 101.0])
+
+    async def get_provider_router():
+        return router
+
+    async def no_redis():
+        raise ConnectionError("redis unavailable")
+
+    async def no_cached_quote(symbol):
+        return None
+
+    monkeypatch.setattr(settings, "QUOTE_STREAM_INTERVAL", 0.01)
+    monkeypatch.setattr("app.services.providers.get_provider_router", get_provider_router)
+    monkeypatch.setattr("app.db.redis.get_redis", no_redis)
+    monkeypatch.setattr(QuoteStreamService, "_initial_quote", lambda self, symbol: no_cached_quote(symbol))
+    return router
+
+
+async def _prices(service, count):
+    prices = []
+    async with aclosing(service.stream(["AAPL"], heartbeat=1.0)) as events:
+        async for event in events:
+            prices.append(event["data"]["price"])
+            if len(prices) == count:
+                return prices
+
+
+class TestQuoteStreamService:
+    """Tests for shared refresh loops and change-only delivery."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_refresh_loop(self, router):
+        service = QuoteStreamService()
+        first, second = await asyncio.gather(_prices(service, 2), _prices(service, 2))
+
+        assert first == second == [100.0, 101.0]  # unchanged quote not re-sent
+        assert router.calls == 3
+        assert service.get_status()["symbols"] == 0  # loop stopped after last unsubscribe
+
+    @pytest.mark.asyncio
+    async def test_messages_from_other_workers_are_fanned_out(self, router):
+        service = QuoteStreamService()
+        queue = asyncio.Queue()
+        service._subscribers["MSFT"] = {queue}
+
+        event = {"type": "quote", "symbol": "MSFT", "data": {"price": 1.0}}
+        service._on_message({"data": json.dumps({"origin": "other-worker", **event})})
+        service._on_message({"data": json.dumps({"origin": service._worker_id, **event})})
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == event
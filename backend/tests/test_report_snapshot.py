@@ -0,0 +1,165 @@
+"""
+Tests for shared report market data helpers.
+"""
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import report_service
+from app.services.report_service import (
+    compute_technical_summaries,
+    plan_report_batches,
+    summarize_news,
+)
+from worker.tasks import report_generator
+
+
+class TestComputeTechnicalSummaries:
+    """Tests for vectorized report technicals."""
+
+    def test_uptrend_is_bullish(self):
+        closes = [100.0 + i for i in range(25)]
+        summary = compute_technical_summaries({"AAPL": closes})["AAPL"]
+        assert summary.trend == "bullish"
+        assert summary.rsi == 100.0
+        assert summary.support_level == 105.0
+        assert summary.resistance_level == 124.0
+
+    def test_rsi_matches_simple_average(self):
+        closes = [10, 11, 10, 12, 11, 13, 12, 14, 13, 15, 14, 16, 15, 17, 16]
+        summary = compute_technical_summaries({"X": [float(c) for c in closes]})["X"]
+        deltas = [b - a for a, b in zip(closes, closes[1:])]
+        gain = sum(d for d in deltas if d > 0) / 14
+        loss = sum(-d for d in deltas if d < 0) / 14
+        assert summary.rsi == round(100 - 100 / (1 + gain / loss), 2)
+        # Fewer than 20 closes: no SMA 20 trend
+        assert summary.trend == "neutral"
+
+    def test_short_and_mixed_lengths(self):
+        result = compute_technical_summaries({
+            "SHORT": [1.0] * 10,
+            "DOWN": [200.0 - i for i in range(30)],
+        })
+        assert result["SHORT"].trend is None
+        assert result["SHORT"].rsi is None
+        assert result["DOWN"].trend == "bearish"
+        assert result["DOWN"].rsi == 0.0
+
+
+class TestSummarizeNews:
+    """Tests for news sentiment counts."""
+
+    def test_counts_recent_articles(self):
+        news = [{"title": "a", "sentiment_score": 0.5}] * 3 + [
+            {"title": "b", "sentiment_score": -0.5},
+            {"title": "c"},
+        ]
+        summary = summarize_news("AAPL", news)
+        assert (summary.positive_count, summary.negative_count, summary.neutral_count) == (3, 1, 1)
+        assert summary.total_articles == 5
+        assert len(summary.top_headlines) == 5
+
+
+class TestPlanReportBatches:
+    """Tests for grouping reports by shared symbols."""
+
+    def test_overlapping_watchlists_share_batches(self):
+        jobs = [
+            ("r1", ["MSFT", "AAPL"]),
+            ("r2", ["TSLA"]),
+            ("r3", ["AAPL", "MSFT"]),
+            ("r4", ["TSLA", "NVDA"]),
+        ]
+        batches = plan_report_batches(jobs, batch_size=2)
+        assert sorted(map(sorted, batches)) == [["r1", "r3"], ["r2", "r4"]]
+
+    def test_batch_size(self):
+        jobs = [(f"r{i}", ["AAPL"]) for i in range(5)]
+        assert [len(b) for b in plan_report_batches(jobs, batch_size=2)] == [2, 2, 1]
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Session serving scripted reports and schedules."""
+
+    def __init__(self, reports, schedules):
+        self.reports = {r.id: r for r in reports}
+        self.schedules = schedules
+
+    async def execute(self, statement):
+        entity = statement.column_descriptions[0]["entity"]
+        if entity.__name__ == "Report":
+            return FakeResult(list(self.reports.values()))
+        return FakeResult(self.schedules)
+
+    async def get(self, model, report_id):
+        return self.reports.get(report_id)
+
+    async def commit(self):
+        pass
+
+
+class FakeGenerator:
+    """Report generator that fails for one report."""
+
+    def __init__(self, db):
+        pass
+
+    async def get_symbols_for_schedules(self, schedules):
+        return {s.id: ["AAPL"] for s in schedules}
+
+    async def generate_report(self, report, **kwargs):
+        if report.id == "r2":
+            raise RuntimeError("LLM summary failed")
+        report.status = "completed"
+        return report
+
+
+class TestGenerateReportBatch:
+    """Tests for rendering a batch of scheduled reports."""
+
+    @pytest.mark.asyncio
+    async def test_failing_report_does_not_abort_batch(self, monkeypatch):
+        reports = [
+            SimpleNamespace(id=f"r{i}", status="pending", schedule_id="s1") for i in range(1, 4)
+        ]
+        schedule = SimpleNamespace(id="s1", include_portfolio=False, include_news=False)
+        session = FakeSession(reports, [schedule])
+        embedded, marked = [], {}
+
+        @asynccontextmanager
+        async def get_task_session():
+            yield session
+
+        async def build_market_snapshot(symbols, news_symbols=None):
+            return object()
+
+        async def mark_failed(failures):
+            marked.update(failures)
+
+        monkeypatch.setattr(report_generator, "get_task_session", get_task_session)
+        monkeypatch.setattr(report_service, "ReportGenerator", FakeGenerator)
+        monkeypatch.setattr(report_service, "build_market_snapshot", build_market_snapshot)
+        monkeypatch.setattr(report_generator, "_mark_reports_failed", mark_failed)
+        monkeypatch.setattr(
+            report_generator, "_dispatch_report_embedding",
+            lambda report, symbols: embedded.append(report.id),
+        )
+
+        stats = await report_generator._generate_report_batch_async(["r1", "r2", "r3"])
+
+        assert (stats["completed"], stats["failed"]) == (2, 1)
+        assert sorted(embedded) == ["r1", "r3"]
+        assert list(marked) == ["r2"]
+        assert str(marked["r2"]) == "LLM summary failed"
@@ -0,0 +1,97 @@
+"""
+Tests for adaptive RSS poll scheduling.
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.services.rss_poll_scheduler import (
+    hour_factor,
+    next_poll_interval,
+    record_poll,
+)
+
+NOW = datetime(2026, 3, 2, 14, 0, tzinfo=timezone.utc)
+
+
+def _feed(**overrides):
+    values = dict(
+        poll_interval_minutes=15,
+        min_poll_interval_minutes=2,
+        max_poll_interval_minutes=240,
+        consecutive_errors=0,
+        last_entry_at=None,
+        avg_interarrival_minutes=None,
+        empty_poll_ratio=None,
+        hourly_activity=None,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestRecordPoll:
+    """Tests for record_poll function."""
+
+    def test_learns_interarrival(self):
+        feed = _feed()
+        times = [NOW - timedelta(minutes=m) for m in (40, 30, 20, 10)]
+        record_poll(feed, NOW, times)
+        assert feed.avg_interarrival_minutes == 10
+        assert feed.last_entry_at == NOW - timedelta(minutes=10)
+        assert feed.empty_poll_ratio == 0
+
+    def test_empty_polls_raise_ratio(self):
+        feed = _feed()
+        for _ in range(5):
+            record_poll(feed, NOW, [])
+        assert feed.empty_poll_ratio > 0.6
+
+    def test_quiet_stretch_stretches_estimate(self):
+        feed = _feed(avg_interarrival_minutes=10.0, last_entry_at=NOW - timedelta(hours=2))
+        record_poll(feed, NOW, [])
+        assert feed.avg_interarrival_minutes > 10
+
+    def test_hourly_histogram(self):
+        feed = _feed()
+        record_poll(feed, NOW, [NOW - timedelta(minutes=5)])
+        assert feed.hourly_activity[13] == 1.0
+        assert len(feed.hourly_activity) == 24
+
+
+class TestNextPollInterval:
+    """Tests for next_poll_interval function."""
+
+    def test_static_interval_without_history(self):
+        assert next_poll_interval(_feed(), NOW) == 15
+
+    def test_busy_feed_polls_faster(self):
+        feed = _feed(avg_interarrival_minutes=6.0, empty_poll_ratio=0.0)
+        assert next_poll_interval(feed, NOW) == 3
+
+    def test_quiet_feed_backs_off(self):
+        feed = _feed(avg_interarrival_minutes=120.0, empty_poll_ratio=0.9)
+        assert next_poll_interval(feed, NOW) > 100
+
+    def test_clamped_to_bounds(self):
+        fast = _feed(avg_interarrival_minutes=0.5, empty_poll_ratio=0.0)
+        slow = _feed(avg_interarrival_minutes=5000.0, empty_poll_ratio=1.0)
+        assert next_poll_interval(fast, NOW) == 2
+        assert next_poll_interval(slow, NOW) == 240
+
+    def test_errors_back_off(self):
+        feed = _feed(consecutive_errors=2, avg_interarrival_minutes=6.0)
+        assert next_poll_interval(feed, NOW) == 60
+
+
+class TestHourFactor:
+    """Tests for hour_factor function."""
+
+    def test_needs_enough_samples(self):
+        assert hour_factor(_feed(hourly_activity=[1.0] + [0.0] * 23), 5) == 1.0
+
+    def test_quiet_hour_slower_busy_hour_faster(self):
+        hourly = [0.0] * 24
+        for h in range(13, 21):
+            hourly[h] = 10.0
+        feed = _feed(hourly_activity=hourly)
+        assert hour_factor(feed, 3) == 2.0
+        assert hour_factor(feed, 14) < 1.0
@@ -0,0 +1,298 @@
+"""
+Tests for RSS polling: adaptive fetch concurrency, conditional GETs and bulk insert.
+"""
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.news import News
+from app.services import rss_service
+from app.services.rss_service import RssService, _AdaptiveLimiter
+
+NOW = datetime(2026, 3, 2, 14, 0, tzinfo=timezone.utc)
+
+FEED_XML = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Wire</title>
+<item><title>Fed holds rates</title><link>https://news.example/fed</link>
+<pubDate>Mon, 02 Mar 2026 13:00:00 GMT</pubDate></item>
+<item><title>Oil slips</title><link>https://news.example/oil</link></item>
+</channel></rss>"""
+
+
+def _feed(**overrides):
+    values = dict(
+        id=uuid.uuid4(),
+        name="wire",
+        rsshub_route="/wire",
+        fulltext_mode=False,
+        etag=None,
+        last_modified=None,
+        consecutive_errors=0,
+        last_error=None,
+        last_polled_at=None,
+        symbol=None,
+        market="US",
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestAdaptiveLimiter:
+    """Tests for the AIMD feed fetch concurrency limit."""
+
+    def test_additive_increase_up_to_maximum(self):
+        limiter = _AdaptiveLimiter(minimum=2, maximum=4)
+        for _ in range(3):  # ~one slot per `limit` successes
+            limiter.record(overloaded=False)
+        assert int(limiter._limit) == 3
+
+        for _ in range(50):
+            limiter.record(overloaded=False)
+        assert limiter._limit == 4
+        assert limiter.peak == 4
+
+    def test_multiplicative_decrease_down_to_minimum(self):
+        limiter = _AdaptiveLimiter(minimum=2, maximum=16)
+        limiter._limit = 12.0
+        limiter.record(overloaded=True)
+        assert limiter._limit == 6
+        limiter.record(overloaded=True)
+        limiter.record(overloaded=True)
+        assert limiter._limit == 2
+
+    @pytest.mark.asyncio
+    async def test_admits_at_most_limit_fetches(self):
+        limiter = _AdaptiveLimiter(minimum=2, maximum=2)
+        running = peak = 0
+
+        async def fetch():
+            nonlocal running, peak
+            async with limiter:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*[fetch() for _ in range(6)])
+        assert peak == 2
+
+
+class TestConditionalFetch:
+    """Tests for ETag / Last-Modified round-trips."""
+
+    @pytest.mark.asyncio
+    async def test_validators_round_trip_to_304(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                text=FEED_XML,
+                headers={"ETag": '"v1"', "Last-Modified": "Mon, 02 Mar 2026 13:00:00 GMT"},
+            )
+
+        service = RssService(rsshub_base_url="http://rsshub")
+        feed = _feed()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await service._fetch_feed_data(feed, client)
+            RssService._record_feed_success(feed, NOW, first)
+            second = await service._fetch_feed_data(feed, client)
+            RssService._record_feed_success(feed, NOW, second)
+
+        assert "if-none-match" not in requests[0].headers
+        assert [e["link"] for e in first["entries"]] == [
+            "https://news.example/fed",
+            "https://news.example/oil",
+        ]
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert requests[1].headers["if-modified-since"] == "Mon, 02 Mar 2026 13:00:00 GMT"
+        assert second["not_modified"] is True and second["entries"] == []
+        # A 304 keeps the validators from the last full fetch
+        assert feed.etag == '"v1"'
+        assert feed.last_modified == "Mon, 02 Mar 2026 13:00:00 GMT"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status, overloaded", [(503, True), (429, True), (404, False)])
+    async def test_overload_signals(self, status, overloaded):
+        service = RssService(rsshub_base_url="http://rsshub")
+        transport = httpx.MockTransport(lambda request: httpx.Response(status))
+        async with httpx.AsyncClient(transport=transport) as client:
+            data = await service._fetch_feed_data(_feed(), client)
+
+        assert data["error"] == f"HTTP {status}"
+        assert data["overloaded"] is overloaded
+
+
+class FakeDedupService:
+    def __init__(self, stored):
+        self.stored = set(stored)
+
+    async def filter_new_urls(self, db, urls):
+        return {u for u in urls if u not in self.stored}
+
+
+class FakeStorage:
+    def __init__(self):
+        self.saved = []
+        self.deleted = []
+
+    def save_content(self, news_id, symbol, content, published_at):
+        path = f"{symbol}/{news_id}.json"
+        self.saved.append(path)
+        return path
+
+    def delete_content(self, path):
+        self.deleted.append(path)
+        return True
+
+
+class FakeResult:
+    def __init__(self, rows=(), objects=()):
+        self._rows = list(rows)
+        self._objects = list(objects)
+
+    def fetchall(self):
+        return self._rows
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self._objects)
+
+
+class FakeSession:
+    """Session emulating ON CONFLICT (url) DO NOTHING against ``existing_urls``."""
+
+    def __init__(self, existing_urls=()):
+        self.existing_urls = set(existing_urls)
+        self.insert_sql = None
+        self.inserted = {}
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    async def execute(self, statement, params=None):
+        if params is not None:
+            self.insert_sql = str(statement.compile(dialect=postgresql.dialect()))
+            returned = []
+            for row in params:
+                if row["url"] not in self.existing_urls:
+                    self.existing_urls.add(row["url"])
+                    self.inserted[row["id"]] = News(**row)
+                    returned.append((row["id"],))
+            return FakeResult(rows=returned)
+        return FakeResult(objects=list(self.inserted.values()))
+
+
+def _entries(*links, fulltext=None):
+    return {
+        "entries": [
+            {
+                "link": link,
+                "title": link.rsplit("/", 1)[-1],
+                "summary": None,
+                "published_at": NOW,
+                "fulltext_content": fulltext,
+            }
+            for link in links
+        ]
+    }
+
+
+def _result():
+    return {
+        "new_count": 0,
+        "skipped_count": 0,
+        "fulltext_articles": [],
+        "standard_articles": [],
+    }
+
+
+class TestBulkInsert:
+    """Tests for the cross-feed ON CONFLICT DO NOTHING insert."""
+
+    @pytest.fixture
+    def storage(self, monkeypatch):
+        storage = FakeStorage()
+        monkeypatch.setattr(rss_service, "get_news_storage_service", lambda: storage)
+        monkeypatch.setattr(
+            rss_service, "get_news_dedup_service",
+            lambda: FakeDedupService(stored={"https://news.example/old"}),
+        )
+        return storage
+
+    @pytest.mark.asyncio
+    async def test_one_insert_skips_stored_claimed_and_conflicting_urls(self, storage):
+        # "race" was not in the URL index but another writer stored it first
+        db = FakeSession(existing_urls={"https://news.example/race"})
+        first, second = _result(), _result()
+        to_store = [
+            (_feed(name="a"), _entries("https://news.example/old", "https://news.example/new",
+                                       "https://news.example/race"), first),
+            (_feed(name="b"), _entries("https://news.example/new", "https://news.example/other"), second),
+        ]
+
+        await RssService()._bulk_insert_entries(db, to_store, NOW)
+
+        assert "ON CONFLICT (url) DO NOTHING RETURNING news.id" in db.insert_sql
+        assert (first["new_count"], first["skipped_count"]) == (1, 2)
+        assert (second["new_count"], second["skipped_count"]) == (1, 1)
+        assert [n.url for n in first["standard_articles"]] == ["https://news.example/new"]
+        assert [n.url for n in second["standard_articles"]] == ["https://news.example/other"]
+
+    @pytest.mark.asyncio
+    async def test_fulltext_of_conflicting_rows_is_removed(self, storage):
+        db = FakeSession(existing_urls={"https://news.example/race"})
+        result = _result()
+        feed = _feed(fulltext_mode=True)
+
+        await RssService()._bulk_insert_entries(
+            db, [(feed, _entries("https://news.example/race", "https://news.example/kept",
+                                 fulltext="body " * 200), result)], NOW,
+        )
+
+        assert len(storage.saved) == 2
+        assert len(storage.deleted) == 1
+        assert [n.url for n in result["fulltext_articles"]] == ["https://news.example/kept"]
+        assert result["fulltext_articles"][0].content_status == "fetched"
+
+
+class RecordingSession:
+    async def commit(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+
+class TestUpdateFeed:
+    """Tests for partial feed updates."""
+
+    @pytest.mark.asyncio
+    async def test_explicit_null_clears_poll_bounds_only(self):
+        from app.schemas.rss_feed import RssFeedUpdate
+
+        feed = _feed(
+            poll_interval_minutes=15,
+            min_poll_interval_minutes=10,
+            max_poll_interval_minutes=120,
+            next_poll_at=NOW,
+        )
+        data = RssFeedUpdate.model_validate(
+            {"name": None, "minPollIntervalMinutes": None}
+        ).model_dump(exclude_unset=True, by_alias=False)
+
+        await RssService().update_feed(RecordingSession(), feed, data)
+
+        assert feed.name == "wire"
+        assert feed.min_poll_interval_minutes is None
+        assert feed.max_poll_interval_minutes == 120
+        assert feed.next_poll_at is None
@@ -0,0 +1,77 @@
+"""
+Tests for SimHash near-duplicate helpers.
+"""
+from app.utils.simhash import (
+    NearDuplicateIndex,
+    bands,
+    hamming_distance,
+    simhash,
+)
+
+STORY = (
+    "Apple shares rise after quarterly revenue beats Wall Street estimates "
+    "as iPhone sales in China recover strongly"
+)
+
+
+class TestSimhash:
+    """Tests for simhash function."""
+
+    def test_deterministic(self):
+        assert simhash(STORY) == simhash(STORY)
+
+    def test_short_text_is_skipped(self):
+        assert simhash("Apple rises") is None
+        assert simhash("") is None
+
+    def test_small_edit_stays_close(self):
+        edited = STORY.replace("strongly", "sharply")
+        assert hamming_distance(simhash(STORY), simhash(edited)) <= 10
+
+    def test_case_and_punctuation_ignored(self):
+        assert simhash(STORY) == simhash(STORY.upper() + "!!")
+
+    def test_unrelated_text_is_far(self):
+        other = (
+            "Federal Reserve holds interest rates steady and signals two cuts "
+            "later this year amid cooling inflation data"
+        )
+        assert hamming_distance(simhash(STORY), simhash(other)) > 3
+
+    def test_cjk_text(self):
+        text = "苹果公司第三季度营收超出市场预期，股价盘后上涨百分之五"
+        assert simhash(text) is not None
+
+
+class TestBands:
+    """Tests for bands function."""
+
+    def test_band_count(self):
+        assert len(bands(simhash(STORY), 3)) == 4
+
+    def test_close_fingerprints_share_a_band(self):
+        fp = simhash(STORY)
+        flipped = fp ^ (1 << 0) ^ (1 << 20) ^ (1 << 40)
+        assert set(bands(fp, 3)) & set(bands(flipped, 3))
+
+
+class TestNearDuplicateIndex:
+    """Tests for NearDuplicateIndex."""
+
+    def test_find_within_distance(self):
+        index = NearDuplicateIndex(max_distance=3)
+        fp = simhash(STORY)
+        index.add(fp, "a")
+        assert index.find(fp ^ 0b101) == "a"
+
+    def test_miss_beyond_distance(self):
+        index = NearDuplicateIndex(max_distance=3)
+        fp = simhash(STORY)
+        index.add(fp, "a")
+        assert index.find(fp ^ 0xF0F0) is None
+
+    def test_len(self):
+        index = NearDuplicateIndex(max_distance=3)
+        index.add(1, "a")
+        index.add(2, "b")
+        assert len(index) == 2
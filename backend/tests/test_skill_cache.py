@@ -0,0 +1,110 @@
+"""
+Tests for the cross-request skill result cache.
+"""
+import asyncio
+
+import pytest
+
+from app.skills.base import BaseSkill, SkillDefinition, SkillParameter, SkillResult
+from app.skills.cache import SkillResultCache, skill_cache_key
+
+
+class FakeSkill(BaseSkill):
+    """Skill counting its executions."""
+
+    def __init__(self, cache_ttl=60, key_params=None, fail=False, delay=0.0):
+        self.cache_ttl = cache_ttl
+        self.key_params = key_params
+        self.fail = fail
+        self.delay = delay
+        self.calls = 0
+
+    def definition(self) -> SkillDefinition:
+        return SkillDefinition(
+            name="fake_skill",
+            description="Fake",
+            category="market_data",
+            parameters=[
+                SkillParameter(name="symbol", type="string", description="Ticker"),
+                SkillParameter(
+                    name="period", type="string", description="Period",
+                    required=False, default="1y",
+                ),
+            ],
+            cache_ttl=self.cache_ttl,
+            cache_key_params=self.key_params,
+        )
+
+    async def execute(self, **kwargs) -> SkillResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            return SkillResult(success=False, error="upstream down")
+        return SkillResult(success=True, data={"symbol": kwargs["symbol"]})
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = SkillResultCache()
+    monkeypatch.setattr("app.skills.cache.get_skill_result_cache", lambda: cache)
+
+    # No Redis in unit tests: the local tier is exercised on its own
+    async def no_redis():
+        raise ConnectionError("redis unavailable")
+
+    monkeypatch.setattr("app.db.redis.get_redis", no_redis)
+    return cache
+
+
+class TestSkillResultCache:
+    """Tests for hits, sharing and what is never cached."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_call_is_served_from_cache(self, cache):
+        skill = FakeSkill()
+        first = await skill.safe_execute(symbol="aapl")
+        second = await skill.safe_execute(symbol="AAPL", period="1y")
+
+        assert skill.calls == 1
+        assert second.data == first.data
+        assert second.metadata["cache"] == "local"
+        assert "cache" not in first.metadata
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self, cache):
+        skill = FakeSkill(delay=0.02)
+        results = await asyncio.gather(*(skill.safe_execute(symbol="AAPL") for _ in range(5)))
+
+        assert skill.calls == 1
+        assert all(r.success for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failures_and_uncached_skills_always_execute(self, cache):
+        failing = FakeSkill(fail=True)
+        await failing.safe_execute(symbol="AAPL")
+        await failing.safe_execute(symbol="AAPL")
+        assert failing.calls == 2
+
+        uncached = FakeSkill(cache_ttl=None)
+        await uncached.safe_execute(symbol="AAPL")
+        await uncached.safe_execute(symbol="AAPL")
+        assert uncached.calls == 2
+
+
+class TestSkillCacheKey:
+    """Tests for key construction from declared parameters."""
+
+    def test_defaults_and_key_params(self):
+        defn = FakeSkill().definition()
+        assert skill_cache_key(defn, {"symbol": "AAPL"}) == skill_cache_key(
+            defn, {"symbol": "aapl", "period": "1y"}
+        )
+        assert skill_cache_key(defn, {"symbol": "AAPL", "period": "3mo"}) != skill_cache_key(
+            defn, {"symbol": "AAPL"}
+        )
+
+        market_wide = FakeSkill(key_params=[]).definition()
+        assert skill_cache_key(market_wide, {"symbol": "AAPL"}) == skill_cache_key(
+            market_wide, {"symbol": "MSFT"}
+        )
+        assert skill_cache_key(FakeSkill(cache_ttl=None).definition(), {"symbol": "AAPL"}) is None
@@ -0,0 +1,59 @@
+"""
+Tests for chat tool result serialization.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+from app.skills.chat_adapter import MAX_TOOL_RESULT_CHARS, _smart_serialize
+
+
+def _bars(n):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "date": (start + timedelta(days=i)).isoformat(),
+            "open": 100.0 + i,
+            "high": 102.33999633789062 + i,
+            "low": 99.0 + i,
+            "close": 101.0 + i,
+            "volume": 1_000_000,
+        }
+        for i in range(n)
+    ]
+
+
+class TestSmartSerialize:
+    """Tests for budget fitting and the columnar record format."""
+
+    def test_small_results_are_plain_json(self):
+        data = {"symbol": "AAPL", "bars": _bars(1)}
+        assert json.loads(_smart_serialize(data)) == data
+
+    def test_long_history_is_downsampled_over_full_range(self):
+        history = {"symbol": "AAPL", "interval": "1d", "bars": _bars(250)}
+        out = _smart_serialize(history)
+        assert len(out) <= MAX_TOOL_RESULT_CHARS
+
+        table = json.loads(out)["bars"]
+        assert table["columns"] == ["date", "open", "high", "low", "close", "volume"]
+        span = table["_bar_span"]
+        first, last = table["rows"][0], table["rows"][-1]
+        assert all(len(row[0]) == 10 for row in table["rows"])  # midnight times dropped
+        # Latest bucket ends at the latest bar and aggregates its volume
+        assert last[4] == 101.0 + 249
+        assert last[5] == 1_000_000 * span
+        assert first[0] < last[0]
+
+    def test_record_list_keeps_first_rows_within_budget(self):
+        articles = [{"title": f"Headline {i}", "source": "Reuters"} for i in range(100)]
+        table = json.loads(_smart_serialize(articles, max_chars=300))
+
+        assert table["columns"] == ["title", "source"]
+        assert table["rows"][0] == ["Headline 0", "Reuters"]
+        assert table["_omitted"].endswith("later rows not shown")
+        assert len(_smart_serialize(articles, max_chars=300)) <= 300
+
+    def test_mixed_lists_fall_back_to_item_truncation(self):
+        items = [{"a": 1}, {"b": 2}] * 100
+        out = json.loads(_smart_serialize(items, max_chars=200))
+        assert "_omitted" in out[-1]
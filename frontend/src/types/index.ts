@@ -682,9 +682,13 @@ export interface RssFeed {
   symbol: string | null
   market: string
   pollIntervalMinutes: number
+  minPollIntervalMinutes: number | null
+  maxPollIntervalMinutes: number | null
   fulltextMode: boolean
   isEnabled: boolean
   lastPolledAt: string | null
+  nextPollAt: string | null
+  avgInterarrivalMinutes: number | null
   lastError: string | null
   consecutiveErrors: number
   articleCount: number
@@ -700,6 +704,8 @@ export interface RssFeedCreate {
   symbol?: string | null
   market?: string
   pollIntervalMinutes?: number
+  minPollIntervalMinutes?: number | null
+  maxPollIntervalMinutes?: number | null
   fulltextMode?: boolean
 }
 
@@ -22,6 +22,11 @@ class Settings(BaseSettings):
     NAVIGATION_TIMEOUT: int = 15000   # ms
     MAX_CONTENT_LENGTH: int = 50000   # chars
 
+    # Concurrency (shared by /extract and /extract/batch)
+    MAX_CONCURRENT_PAGES: int = 6     # browser contexts rendering at once
+    MAX_PAGES_PER_DOMAIN: int = 2     # per-domain limit within a batch
+    MAX_BATCH_URLS: int = 50
+
     # MCP server port
     MCP_PORT: int = 8931
 
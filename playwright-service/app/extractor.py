@@ -3,7 +3,8 @@
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from playwright.async_api import async_playwright, Browser, Page
 from playwright_stealth import stealth_async
@@ -17,6 +18,12 @@ logger = logging.getLogger(__name__)
 MAX_SNAPSHOT_DEPTH = 50
 
 
+def _domain_of(url: str) -> str:
+    """Normalized hostname used as the per-domain concurrency key."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
 class PlaywrightExtractor:
     """Content extractor using Playwright for JS rendering + trafilatura for extraction."""
 
@@ -24,6 +31,8 @@ class PlaywrightExtractor:
         self._browser: Optional[Browser] = None
         self._playwright = None
         self._lock = asyncio.Lock()
+        # Bounds the number of live browser contexts across all requests
+        self._page_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_PAGES)
 
     async def initialize(self) -> None:
         """Initialize Playwright browser."""
@@ -85,12 +94,60 @@ class PlaywrightExtractor:
         await stealth_async(page)
         return page
 
-    async def extract(self, url: str) -> Dict[str, Any]:
+    async def extract(self, url: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Fast mode: Playwright render -> trafilatura extract.
 
+        ``timeout`` (seconds) bounds rendering only; it starts once a page
+        slot is acquired, so time queued behind other requests is excluded.
+
         Returns dict with: success, full_text, word_count, language, authors, metadata, error
         """
+        async with self._page_slots:
+            return await asyncio.wait_for(self._extract_page(url), timeout=timeout)
+
+    async def extract_many(
+        self, urls: List[str],
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Extract many URLs concurrently, yielding (index, result) as each finishes.
+
+        Rendering shares the global page slots with single-URL requests and
+        is additionally limited per domain, so one slow site cannot occupy
+        the whole pool. The timeout applies to rendering only, not to time
+        spent queued for a slot. Pending work is cancelled if the consumer
+        stops iterating (e.g. the client disconnects).
+        """
+        timeout_s = settings.BROWSER_TIMEOUT / 1000.0
+        domain_slots: Dict[str, asyncio.Semaphore] = {}
+
+        async def _run(index: int, url: str) -> Tuple[int, Dict[str, Any]]:
+            domain_slot = domain_slots.setdefault(
+                _domain_of(url), asyncio.Semaphore(settings.MAX_PAGES_PER_DOMAIN),
+            )
+            async with domain_slot, self._page_slots:
+                try:
+                    result = await asyncio.wait_for(
+                        self._extract_page(url), timeout=timeout_s,
+                    )
+                except asyncio.TimeoutError:
+                    logger.error("Batch extraction timed out for URL: %s", url[:100])
+                    result = {"success": False, "error": "Content extraction timed out"}
+                except Exception as e:
+                    logger.error("Batch extraction error for %s: %s", url[:80], e)
+                    result = {"success": False, "error": f"{type(e).__name__}: {str(e)[:400]}"}
+            return index, result
+
+        tasks = [asyncio.create_task(_run(i, url)) for i, url in enumerate(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _extract_page(self, url: str) -> Dict[str, Any]:
+        """Render and extract a single URL (caller holds a page slot)."""
         page = await self._create_page()
         try:
             await page.goto(
@@ -161,11 +218,18 @@ class PlaywrightExtractor:
             await page.close()
             await context.close()
 
-    async def snapshot(self, url: str) -> Dict[str, Any]:
+    async def snapshot(self, url: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Smart mode: Playwright render -> accessibility snapshot.
         Returns structured text suitable for LLM processing.
+
+        ``timeout`` (seconds) starts once a page slot is acquired.
         """
+        async with self._page_slots:
+            return await asyncio.wait_for(self._snapshot_page(url), timeout=timeout)
+
+    async def _snapshot_page(self, url: str) -> Dict[str, Any]:
+        """Render a single URL and serialize its accessibility tree."""
         page = await self._create_page()
         try:
             await page.goto(
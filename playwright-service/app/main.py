@@ -1,11 +1,13 @@
 """Playwright extraction service - HTTP API."""
 
 import asyncio
+import json
 import logging
 from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from .config import settings
@@ -32,6 +34,20 @@ class ExtractResponse(BaseModel):
     error: Optional[str] = None
 
 
+class BatchExtractRequest(BaseModel):
+    urls: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.MAX_BATCH_URLS,
+        description="URLs to extract content from",
+    )
+
+
+class BatchExtractItem(ExtractResponse):
+    index: int
+    url: str
+
+
 class SnapshotRequest(BaseModel):
     url: str = Field(..., description="URL to get accessibility snapshot from")
 
@@ -71,12 +87,9 @@ async def extract_content(request: ExtractRequest):
     """Extract content from URL with overall timeout protection (P2-3.4)."""
     try:
         extractor = await get_extractor()
-        # Wrap with overall timeout to prevent hung requests
+        # Timeout covers rendering only, not waiting for a free page slot
         timeout_s = settings.BROWSER_TIMEOUT / 1000.0
-        result = await asyncio.wait_for(
-            extractor.extract(request.url),
-            timeout=timeout_s,
-        )
+        result = await extractor.extract(request.url, timeout=timeout_s)
         return ExtractResponse(**result)
     except asyncio.TimeoutError:
         logger.error("Extract endpoint timed out for URL: %s", request.url[:100])
@@ -90,16 +103,32 @@ async def extract_content(request: ExtractRequest):
         raise HTTPException(status_code=500, detail="Internal extraction error")
 
 
+@app.post("/extract/batch")
+async def extract_batch(request: BatchExtractRequest):
+    """Extract many URLs, streaming NDJSON lines in completion order.
+
+    Each line is a BatchExtractItem; ``index`` refers to the position in
+    the request so clients can correlate out-of-order results. Per-URL
+    failures and timeouts are reported inline rather than failing the batch.
+    """
+    extractor = await get_extractor()
+
+    async def _stream():
+        async for index, result in extractor.extract_many(request.urls):
+            item = BatchExtractItem(index=index, url=request.urls[index], **result)
+            yield json.dumps(item.model_dump(), ensure_ascii=False) + "\n"
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
 @app.post("/snapshot", response_model=SnapshotResponse)
 async def get_snapshot(request: SnapshotRequest):
     """Get accessibility snapshot with overall timeout protection."""
     try:
         extractor = await get_extractor()
+        # Timeout covers rendering only, not waiting for a free page slot
         timeout_s = settings.BROWSER_TIMEOUT / 1000.0
-        result = await asyncio.wait_for(
-            extractor.snapshot(request.url),
-            timeout=timeout_s,
-        )
+        result = await extractor.snapshot(request.url, timeout=timeout_s)
         return SnapshotResponse(**result)
     except asyncio.TimeoutError:
         logger.error("Snapshot endpoint timed out for URL: %s", request.url[:100])
@@ -4,6 +4,9 @@ import os
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_shutdown, worker_shutdown
+
+from worker.task_helpers import drain_buffers_on_shutdown
 
 # Redis configuration from environment variables
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/1")
@@ -45,6 +48,7 @@ celery_app.conf.update(
         "worker.tasks.full_content_tasks.process_news_article": {"queue": "default"},
         "worker.tasks.full_content_tasks.cleanup_expired_news": {"queue": "default"},
         "worker.tasks.full_content_tasks.cleanup_pipeline_events": {"queue": "default"},
+        "worker.tasks.full_content_tasks.refresh_pipeline_rollups": {"queue": "default"},
         "worker.tasks.full_content_tasks.cleanup_old_usage_records": {"queue": "default"},
     },
 
@@ -95,10 +99,18 @@ celery_app.conf.update(
             "task": "worker.tasks.full_content_tasks.cleanup_expired_news",
             "schedule": crontab(hour=4, minute=0),  # Daily at 4:00 AM
         },
+        "rebuild-news-url-index": {
+            "task": "worker.tasks.news_monitor.rebuild_news_url_index",
+            "schedule": crontab(hour=4, minute=15),  # Daily at 4:15 AM (after news cleanup)
+        },
         "cleanup-pipeline-events": {
             "task": "worker.tasks.full_content_tasks.cleanup_pipeline_events",
             "schedule": crontab(hour=4, minute=30),  # Daily at 4:30 AM (after news cleanup)
         },
+        "refresh-pipeline-rollups": {
+            "task": "worker.tasks.full_content_tasks.refresh_pipeline_rollups",
+            "schedule": crontab(minute="*/5"),  # Every 5 minutes
+        },
         "update-stock-list": {
             "task": "worker.tasks.stock_list_tasks.update_stock_list",
             "schedule": crontab(hour=5, minute=30),  # Daily at 5:30 AM UTC
@@ -113,7 +125,8 @@ celery_app.conf.update(
         },
         "monitor-rss-feeds": {
             "task": "worker.tasks.rss_monitor.monitor_rss_feeds",
-            "schedule": crontab(minute="*/5"),
+            # Cheap when nothing is due; per-feed cadence is adaptive
+            "schedule": crontab(minute="*"),
         },
         # JWT Key Rotation - DISABLED by default
         # Manual rotation recommended: python worker/scripts/manage_keys.py rotate
@@ -125,5 +138,10 @@ celery_app.conf.update(
     },
 )
 
+# Write buffered trace events / LLM usage records before a worker exits
+worker_process_shutdown.connect(drain_buffers_on_shutdown)
+worker_shutdown.connect(drain_buffers_on_shutdown)
+
+
 if __name__ == "__main__":
     celery_app.start()
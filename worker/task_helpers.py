@@ -2,7 +2,8 @@
 
 Provides:
 - run_async_task(): Run async coroutines in Celery with proper event loop
-  lifecycle and singleton reset.
+  lifecycle, buffer draining and singleton reset.
+- drain_buffers_on_shutdown(): Flush leftover buffers when a worker exits.
 - ensure_usage_recorder(): One-time LLM cost tracking registration.
 - run_layer1_scoring_if_enabled(): Layer 1 3-agent scoring wrapper.
 - build_score_details(): Serialize Layer1ScoringResult for DB storage.
@@ -11,6 +12,7 @@ Provides:
 import asyncio
 import importlib
 import logging
+import sys
 from typing import Any, Callable, Dict, List, TypeVar
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,15 @@ T = TypeVar("T")
 # One-time registration flag for LLM usage recorder in Celery workers
 _recorder_registered = False
 
+# Async hooks run on the task's loop before it closes (flush background
+# buffers bound to the loop). Each entry: (module_path, coroutine_function_name)
+_LOOP_DRAINS = [
+    ("app.services.pipeline_trace_sink", "drain_trace_sink"),
+    ("app.services.filter_stats_service", "drain_filter_stats"),
+    ("app.services.llm_cost_service", "drain_llm_usage"),
+    ("app.core.principal_cache", "drain_principal_invalidations"),
+]
+
 # Singletons to reset after each event loop closes.
 # Each entry: (module_path, reset_function_name)
 _SINGLETON_RESETS = [
@@ -65,6 +76,19 @@ def ensure_usage_recorder():
         logger.warning("Failed to register LLM usage recorder: %s", e)
 
 
+async def _drain_loop_buffers():
+    """Flush loop-bound background buffers before the task's loop closes."""
+    for module_path, func_name in _LOOP_DRAINS:
+        # A module that was never imported has nothing buffered
+        module = sys.modules.get(module_path)
+        if module is None:
+            continue
+        try:
+            await getattr(module, func_name)()
+        except Exception as e:
+            logger.warning("Failed to call %s.%s: %s", module_path, func_name, e)
+
+
 def _reset_singletons():
     """Reset all singleton async clients after event loop close.
 
@@ -84,9 +108,10 @@ def _reset_singletons():
 def run_async_task(coro_func: Callable[..., T], *args, **kwargs) -> T:
     """Run an async function in a new event loop, properly cleaning up afterwards.
 
-    This helper ensures all singleton async clients are reset after each task
-    to avoid "Event loop is closed" errors when tasks reuse singleton clients
-    that were bound to different (now closed) event loops.
+    Loop-bound background buffers (e.g. pipeline trace events) are flushed
+    before the loop closes, and all singleton async clients are reset after
+    each task to avoid "Event loop is closed" errors when tasks reuse
+    singleton clients that were bound to different (now closed) event loops.
 
     Args:
         coro_func: Async callable to execute.
@@ -100,6 +125,27 @@ def run_async_task(coro_func: Callable[..., T], *args, **kwargs) -> T:
     asyncio.set_event_loop(loop)
     try:
         return loop.run_until_complete(coro_func(*args, **kwargs))
+    finally:
+        loop.run_until_complete(_drain_loop_buffers())
+        loop.close()
+        _reset_singletons()
+
+
+def drain_buffers_on_shutdown(**_signal_kwargs: Any) -> None:
+    """Flush background buffers still holding items when the worker exits.
+
+    Connected to Celery's ``worker_process_shutdown`` (prefork children) and
+    ``worker_shutdown`` (solo/threads pools) signals. ``run_async_task``
+    drains after every task, but a task interrupted mid-drain (e.g. by its
+    soft time limit) leaves items behind on a closed loop; they are written
+    here on a fresh loop instead of being lost with the process.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(_drain_loop_buffers())
+    except Exception as e:
+        logger.warning("Failed to drain buffers on worker shutdown: %s", e)
     finally:
         loop.close()
         _reset_singletons()
@@ -5,12 +5,12 @@ to prevent unbounded database growth. Does not delete pending/running backtests
 regardless of age to avoid disrupting active work.
 """
 
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
 from worker.celery_app import celery_app
+from worker.task_helpers import run_async_task
 from app.db.task_session import get_task_session
 
 logger = logging.getLogger(__name__)
@@ -31,13 +31,7 @@ def cleanup_old_backtests():
     This task should be scheduled to run daily at 5:15 AM.
     """
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_cleanup_backtests_async())
-            return result
-        finally:
-            loop.close()
+        return run_async_task(_cleanup_backtests_async)
     except Exception as e:
         logger.exception("Backtest cleanup task failed: %s", e)
         raise
@@ -134,6 +134,7 @@ async def _process_news_article_async(
 
 
 BATCH_CHUNK_SIZE = 30  # Max articles per batch task
+ARTICLE_TIMEOUT_SECONDS = 60.0  # Per-article deadline: fetch stream gap, store + cleaning
 
 
 @celery_app.task(bind=True, max_retries=2)
@@ -141,9 +142,10 @@ def batch_fetch_content(self, articles: List[Dict[str, Any]]):
     """Batch fetch and clean content for news articles with controlled concurrency.
 
     Layer 2: Bridges news discovery/scoring (Layer 1) and LangGraph processing (Layer 3).
-    Uses asyncio.Semaphore to limit concurrent HTTP fetches to 3, with 1.0s
-    delay between fetches for rate limit protection. After successful fetch,
-    runs LLM content cleaning to produce cleaned_text and extract image insights.
+    Limits concurrent primary fetches to 3, with 1.0s delay between fetches
+    for rate limit protection; articles needing JS rendering go to Playwright
+    as one streamed batch. After successful fetch, runs LLM content cleaning
+    to produce cleaned_text and extract image insights.
 
     Args:
         articles: List of dicts with keys: news_id, url, market, symbol,
@@ -158,29 +160,110 @@ def batch_fetch_content(self, articles: List[Dict[str, Any]]):
 
 
 async def _batch_fetch_content_async(articles: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Async implementation of batch content fetching with controlled concurrency."""
+    """Async implementation of batch content fetching with controlled concurrency.
+
+    Articles are grouped by fetch options and each group goes through
+    ``FullContentService.fetch_many_with_fallback``, so every article that
+    needs JS rendering is sent to Playwright in one streamed batch request.
+    Results are stored and cleaned as they arrive.
+
+    Each article gets ``ARTICLE_TIMEOUT_SECONDS``: a group whose stream yields
+    nothing for that long gives up on its remaining URLs, and a store that
+    overruns it is cancelled. Those articles are marked failed.
+    """
     if not articles:
         logger.info("batch_fetch: empty batch, skipping")
         return {"status": "skipped", "reason": "empty_batch"}
 
-    sem = asyncio.Semaphore(3)
-    FETCH_DELAY = 1.0
+    from app.services.full_content_service import get_full_content_service
+    from app.skills.news.fetch_full_content import language_for_market, primary_source_for
 
-    async def fetch_one(article: Dict[str, Any]) -> Dict[str, Any]:
-        async with sem:
-            result = await _fetch_single_article(article)
-            await asyncio.sleep(FETCH_DELAY)
-            return result
+    FETCH_CONCURRENCY = 3
+    FETCH_DELAY = 1.0
 
     logger.info(
-        "Starting batch fetch for %d articles (semaphore=3, delay=%.1fs)",
-        len(articles), FETCH_DELAY,
+        "Starting batch fetch for %d articles (concurrency=%d, delay=%.1fs)",
+        len(articles), FETCH_CONCURRENCY, FETCH_DELAY,
     )
 
-    results = await asyncio.gather(
-        *[fetch_one(a) for a in articles],
-        return_exceptions=True,
-    )
+    # Articles sharing fetch options share one batched fetch
+    groups: Dict[tuple, Dict[str, List[int]]] = {}
+    for i, article in enumerate(articles):
+        options = (
+            primary_source_for(article.get("content_source", "trafilatura")),
+            language_for_market(article.get("market", "US")),
+            article.get("polygon_api_key"),
+        )
+        groups.setdefault(options, {}).setdefault(article["url"], []).append(i)
+
+    service = get_full_content_service()
+    results: List[Any] = [None] * len(articles)
+    store_sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+    t0 = time.monotonic()
+
+    async def store(i: int, fetch_result: Any) -> None:
+        # Storing includes LLM cleaning; keep it off the fetch stream
+        async with store_sem:
+            try:
+                async with asyncio.timeout(ARTICLE_TIMEOUT_SECONDS):
+                    results[i] = await _store_fetched_article(articles[i], fetch_result, t0)
+            except TimeoutError:
+                results[i] = TimeoutError(
+                    f"Store timed out after {ARTICLE_TIMEOUT_SECONDS:.0f}s"
+                )
+            except Exception as e:
+                results[i] = e
+
+    async def run_group(options: tuple, by_url: Dict[str, List[int]]) -> None:
+        primary_source, language, polygon_api_key = options
+        pending = dict(by_url)
+        stores: List[asyncio.Task] = []
+
+        def fail_pending(error: Exception) -> None:
+            logger.error(
+                "batch_fetch: group fetch failed, %d urls unfetched: %s", len(pending), error,
+            )
+            for indexes in pending.values():
+                for i in indexes:
+                    results[i] = error
+
+        stream = service.fetch_many_with_fallback(
+            list(by_url),
+            primary_source=primary_source,
+            language=language,
+            polygon_api_key=polygon_api_key,
+            concurrency=FETCH_CONCURRENCY,
+            delay=FETCH_DELAY,
+        )
+        try:
+            while True:
+                # Idle deadline: a stalled stream fails the remaining URLs
+                async with asyncio.timeout(ARTICLE_TIMEOUT_SECONDS):
+                    try:
+                        url, fetch_result = await anext(stream)
+                    except StopAsyncIteration:
+                        break
+                stores.extend(
+                    asyncio.create_task(store(i, fetch_result))
+                    for i in pending.pop(url, ())
+                )
+        except TimeoutError:
+            fail_pending(TimeoutError(f"No fetch result within {ARTICLE_TIMEOUT_SECONDS:.0f}s"))
+        except Exception as e:
+            fail_pending(e)
+        finally:
+            await stream.aclose()
+            await asyncio.gather(*stores)
+
+    await asyncio.gather(*(run_group(o, g) for o, g in groups.items()))
+
+    failures = {
+        article["news_id"]: result
+        for article, result in zip(articles, results)
+        if isinstance(result, Exception)
+    }
+    if failures:
+        await _mark_fetch_failed(failures)
 
     # Dispatch Layer 3 for successful fetches
     success_count = 0
@@ -241,14 +324,49 @@ async def _batch_fetch_content_async(articles: List[Dict[str, Any]]) -> Dict[str
     }
 
 
-async def _fetch_single_article(article: Dict[str, Any]) -> Dict[str, Any]:
-    """Fetch content for a single article, run LLM cleaning, and update DB.
+async def _mark_fetch_failed(failures: Dict[str, Exception]) -> None:
+    """Mark articles whose fetch or store raised or timed out as failed.
+
+    ``_store_fetched_article`` records ordinary fetch failures itself; this
+    covers the articles it never finished, so they do not stay pending.
+
+    Args:
+        failures: news_id -> exception that ended the article's processing
+    """
+    from app.models.news import News, ContentStatus
+    from sqlalchemy import select
+
+    now = datetime.now(timezone.utc)
+    try:
+        async with get_task_session() as db:
+            res = await db.execute(
+                select(News).where(News.id.in_([uuid.UUID(i) for i in failures]))
+            )
+            for news in res.scalars():
+                error = failures[str(news.id)]
+                news.content_status = ContentStatus.FAILED.value
+                news.content_error = (str(error) or type(error).__name__)[:500]
+                news.content_fetched_at = now
+            await db.commit()
+    except Exception as e:
+        logger.error("batch_fetch: failed to mark %d articles failed: %s", len(failures), e)
+
+
+async def _store_fetched_article(
+    article: Dict[str, Any], fetch_result: Any, t0: float,
+) -> Dict[str, Any]:
+    """Store a fetched article, run LLM cleaning, and update DB.
 
-    Uses FetchFullContentSkill for HTTP fetching, then runs
+    Persists the fetch result through FetchFullContentSkill, then runs
     ContentCleaningService to produce cleaned_text and extract image
     insights. Updates the News record with content status, file path,
     and cleaning results.
 
+    Args:
+        article: Batch item (news_id, url, symbol, market, ...)
+        fetch_result: FetchResult from the batched fetch
+        t0: Monotonic time the batch started (for trace durations)
+
     Returns:
         Dict with 'success', 'file_path', and optional 'error' keys.
     """
@@ -266,17 +384,14 @@ async def _fetch_single_article(article: Dict[str, Any]) -> Dict[str, Any]:
         logger.error("fetch_full_content skill not found in registry")
         return {"success": False, "error": "fetch_full_content skill not found"}
 
-    t0 = time.monotonic()
-
-    # Execute fetch
-    result = await skill.safe_execute(
-        timeout=60.0,
+    # Save fetched content
+    result = skill.store_result(
+        fetch_result,
         url=url,
         news_id=news_id,
         symbol=article.get("symbol", ""),
         market=article.get("market", "US"),
         content_source=article.get("content_source", "trafilatura"),
-        polygon_api_key=article.get("polygon_api_key"),
         published_at=article.get("published_at"),
         title=article.get("title", ""),
     )
@@ -288,7 +403,7 @@ async def _fetch_single_article(article: Dict[str, Any]) -> Dict[str, Any]:
             res = await db.execute(query)
             news = res.scalar_one_or_none()
             if not news:
-                logger.warning("_fetch_single_article: news record not found: %s", news_id)
+                logger.warning("_store_fetched_article: news record not found: %s", news_id)
                 return {"success": False, "error": "news record not found"}
 
             now = datetime.now(timezone.utc)
@@ -307,7 +422,7 @@ async def _fetch_single_article(article: Dict[str, Any]) -> Dict[str, Any]:
                 try:
                     from app.services.pipeline_trace_service import PipelineTraceService
                     await PipelineTraceService.record_event(
-                        db, news_id=news_id, layer="2", node="fetch",
+                        news_id=news_id, layer="2", node="fetch",
                         status="error", duration_ms=elapsed,
                         metadata={"content_status": str(news.content_status)},
                         error=error_msg[:200] if error_msg else None,
@@ -441,7 +556,7 @@ async def _fetch_single_article(article: Dict[str, Any]) -> Dict[str, Any]:
                     trace_metadata["has_visual_data"] = cleaning_result.has_visual_data
 
                 await PipelineTraceService.record_event(
-                    db, news_id=news_id, layer="2", node="fetch",
+                    news_id=news_id, layer="2", node="fetch",
                     status="success", duration_ms=elapsed,
                     metadata=trace_metadata,
                 )
@@ -599,14 +714,39 @@ def cleanup_pipeline_events():
 
 async def _cleanup_pipeline_events_async() -> Dict[str, Any]:
     """Async implementation of pipeline events cleanup."""
+    from app.services.pipeline_rollup_service import get_pipeline_rollup_service
     from app.services.pipeline_trace_service import PipelineTraceService
 
     async with get_task_session() as db:
         deleted = await PipelineTraceService.cleanup_old_events(db, retention_days=7)
+        rollups_deleted = await get_pipeline_rollup_service().cleanup(db)
         await db.commit()
 
-    logger.info("Pipeline events cleanup: deleted %d old events", deleted)
-    return {"deleted": deleted}
+    logger.info(
+        "Pipeline events cleanup: deleted %d old events, %d old rollup buckets",
+        deleted, rollups_deleted,
+    )
+    return {"deleted": deleted, "rollups_deleted": rollups_deleted}
+
+
+@celery_app.task(name="worker.tasks.full_content_tasks.refresh_pipeline_rollups")
+def refresh_pipeline_rollups():
+    """Fold recent pipeline trace events into hourly rollups."""
+    try:
+        return run_async_task(_refresh_pipeline_rollups_async)
+    except Exception as e:
+        logger.exception("refresh_pipeline_rollups failed: %s", e)
+        raise
+
+
+async def _refresh_pipeline_rollups_async() -> Dict[str, Any]:
+    """Async implementation of pipeline rollup refresh."""
+    from app.services.pipeline_rollup_service import get_pipeline_rollup_service
+
+    async with get_task_session() as db:
+        stats = await get_pipeline_rollup_service().refresh(db)  # commits under its lock
+
+    return stats
 
 
 @celery_app.task(name="worker.tasks.full_content_tasks.cleanup_old_usage_records")
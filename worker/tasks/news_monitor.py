@@ -4,8 +4,10 @@ import asyncio
 import json
 import logging
 import time
+import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from worker.celery_app import celery_app
 
@@ -76,6 +78,507 @@ def monitor_news(self):
         raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
 
 
+# ---------------------------------------------------------------------------
+# Staged monitor pipeline
+# ---------------------------------------------------------------------------
+#
+#   fetchers (Finnhub categories, AKShare, watchlist symbols)
+#       -> fetched_q -> dedup -> dedup_q -> Layer 1 scorers -> scored_q -> writer
+#
+# All stages run concurrently. Queues are bounded (in batches), so a slow
+# stage applies back-pressure to its producers instead of buffering the
+# whole cycle in memory. Each stage that touches the DB owns its session
+# because an AsyncSession must not be shared across concurrent tasks.
+
+FINNHUB_CATEGORIES = ("general", "forex", "crypto", "merger")
+WATCHLIST_SYMBOL_LIMIT = 40         # Symbols fetched per run
+WATCHLIST_ARTICLES_PER_SYMBOL = 5
+WATCHLIST_FETCH_CONCURRENCY = 4
+WATCHLIST_FETCH_DELAY = 0.3         # Per-slot spacing between symbol fetches (s)
+SCORING_BATCH_SIZE = 20             # Articles per Layer 1 scoring call
+SCORING_WORKERS = 2                 # Concurrent Layer 1 batches
+DEDUP_LINGER_SECONDS = 2.0          # Max wait to fill a scoring batch
+STAGE_QUEUE_SIZE = 8                # Batches buffered between stages
+
+# End-of-stream marker passed through the stage queues
+_STAGE_DONE = None
+
+
+@dataclass
+class _Candidate:
+    """Source-agnostic article flowing through the monitor pipeline."""
+
+    url: str
+    title: str
+    summary: Optional[str]
+    source: str
+    symbol: str
+    market: str
+    published_at: datetime
+    origin: str  # "global" or "watchlist"
+    # Assigned up front so near-duplicates can link to their representative
+    news_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    duplicate_of: Optional[uuid.UUID] = None
+
+    @classmethod
+    def from_article(cls, article) -> "_Candidate":
+        """Build from a provider ``NewsArticle`` (global news)."""
+        return cls(
+            url=article.url,
+            title=article.title or "",
+            summary=article.summary,
+            source=article.source,
+            symbol=article.symbol,
+            market=article.market,
+            published_at=article.published_at,
+            origin="global",
+        )
+
+    @classmethod
+    def from_watchlist(cls, symbol: str, data: Dict[str, Any]) -> "_Candidate":
+        """Build from a ``NewsService.get_news_by_symbol`` dict."""
+        return cls(
+            url=data.get("url", ""),
+            title=data.get("title", "") or "",
+            summary=data.get("summary"),
+            source=data.get("source", "unknown"),
+            symbol=data.get("symbol", symbol),
+            market=data.get("market", "US"),
+            published_at=_parse_datetime(data.get("publishedAt")),
+            origin="watchlist",
+        )
+
+
+async def _run_stages(*coros) -> List[Any]:
+    """Run pipeline stages concurrently; cancel the rest if any stage fails.
+
+    Without cancellation a crashed consumer would leave its producers
+    blocked forever on a full queue. Stages therefore only send the end
+    marker on normal completion: a cancelled stage must not block again
+    putting it on a queue nobody drains.
+    """
+    tasks = [asyncio.create_task(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _fetch_stage(
+    out_q: asyncio.Queue,
+    finnhub_api_key: Optional[str],
+    watchlist_symbols: List[str],
+    stats: Dict[str, Any],
+) -> None:
+    """Fetch all sources concurrently, emitting one batch per source call."""
+    from app.services.news_service import (
+        FinnhubProvider,
+        AKShareProvider,
+        get_news_service,
+    )
+
+    async def fetch_finnhub(category: str) -> None:
+        try:
+            articles = await FinnhubProvider.get_general_news(
+                category=category,
+                api_key=finnhub_api_key,
+            )
+        except Exception as e:
+            logger.warning(f"Layer 1: Finnhub [{category}] fetch failed: {e}")
+            return
+        logger.info(f"Layer 1: Finnhub [{category}] fetched {len(articles)} articles")
+        stats["global_finnhub"] += len(articles)
+        stats["global_fetched"] += len(articles)
+        await out_q.put([_Candidate.from_article(a) for a in articles])
+
+    async def fetch_akshare() -> None:
+        try:
+            articles = await AKShareProvider.get_trending_news_cn()
+        except Exception as e:
+            logger.warning(f"Layer 1: AKShare fetch failed: {e}")
+            return
+        logger.info(f"Layer 1: AKShare fetched {len(articles)} articles")
+        stats["global_akshare"] += len(articles)
+        stats["global_fetched"] += len(articles)
+        await out_q.put([_Candidate.from_article(a) for a in articles])
+
+    news_service = await get_news_service()
+    watchlist_slots = asyncio.Semaphore(WATCHLIST_FETCH_CONCURRENCY)
+
+    async def fetch_watchlist(symbol: str) -> None:
+        async with watchlist_slots:
+            try:
+                articles = await news_service.get_news_by_symbol(
+                    symbol,
+                    force_refresh=True,
+                )
+            except Exception as e:
+                logger.warning(f"Error fetching watchlist news for {symbol}: {e}")
+                return
+            finally:
+                await asyncio.sleep(WATCHLIST_FETCH_DELAY)  # Rate limiting
+        stats["watchlist_fetched"] += len(articles)
+        await out_q.put([
+            _Candidate.from_watchlist(symbol, a)
+            for a in articles[:WATCHLIST_ARTICLES_PER_SYMBOL]
+        ])
+
+    await asyncio.gather(
+        *[fetch_finnhub(cat) for cat in FINNHUB_CATEGORIES],
+        fetch_akshare(),
+        *[fetch_watchlist(s) for s in watchlist_symbols],
+    )
+    await out_q.put(_STAGE_DONE)
+
+
+async def _dedup_stage(
+    in_q: asyncio.Queue,
+    out_q: asyncio.Queue,
+    enable_pipeline: bool,
+    stats: Dict[str, Any],
+) -> None:
+    """Drop in-run and already-stored URLs, re-batching for the scorers.
+
+    Stored URLs are detected via the shared URL index, which only falls
+    back to the DB for probable hits. With the pipeline ON, new articles
+    are also clustered by SimHash; near-duplicates are linked to their
+    cluster representative and pass through scoring untouched.
+
+    Full scoring batches are emitted immediately; a partial batch is
+    flushed once upstream has been quiet for ``DEDUP_LINGER_SECONDS`` so
+    scoring never waits for the slowest source.
+    """
+    from app.services.news_cluster_service import cluster_scope, get_news_cluster_service
+    from app.services.news_dedup_service import get_news_dedup_service
+    from app.utils.simhash import NearDuplicateIndex
+
+    dedup_service = get_news_dedup_service()
+    cluster_service = get_news_cluster_service()
+    cluster_index: Dict[str, NearDuplicateIndex[str]] = {}
+    seen_urls: set = set()
+    pending: List[_Candidate] = []
+
+    async def emit(flush_partial: bool) -> None:
+        nonlocal pending
+        while len(pending) >= SCORING_BATCH_SIZE or (flush_partial and pending):
+            await out_q.put(pending[:SCORING_BATCH_SIZE])
+            pending = pending[SCORING_BATCH_SIZE:]
+
+    async with get_task_session() as dedup_db:
+        while True:
+            try:
+                # asyncio.timeout, not wait_for: on 3.11 wait_for can swallow
+                # a cancellation that races with get() completing
+                async with asyncio.timeout(DEDUP_LINGER_SECONDS):
+                    batch = await in_q.get()
+            except TimeoutError:
+                await emit(flush_partial=True)
+                continue
+            if batch is _STAGE_DONE:
+                break
+
+            fresh = []
+            for candidate in batch:
+                if candidate.url and candidate.url not in seen_urls:
+                    seen_urls.add(candidate.url)
+                    fresh.append(candidate)
+            if not fresh:
+                continue
+
+            try:
+                new_urls = await dedup_service.filter_new_urls(
+                    dedup_db, [c.url for c in fresh]
+                )
+            except Exception as e:
+                logger.warning("Dedup query failed, dropping %d articles: %s", len(fresh), e)
+                continue
+
+            stats["duplicates"] += len(fresh) - len(new_urls)
+            new_candidates = [c for c in fresh if c.url in new_urls]
+
+            if enable_pipeline and new_candidates:
+                duplicate_map = await cluster_service.link_duplicates(
+                    [
+                        (str(c.news_id), cluster_scope(c.symbol, c.market), c.title, c.summary)
+                        for c in new_candidates
+                    ],
+                    local_index=cluster_index,
+                )
+                for c in new_candidates:
+                    rep_id = duplicate_map.get(str(c.news_id))
+                    if rep_id:
+                        c.duplicate_of = uuid.UUID(rep_id)
+                stats["near_duplicates"] += len(duplicate_map)
+
+            pending.extend(new_candidates)
+            await emit(flush_partial=False)
+
+        await emit(flush_partial=True)
+    await out_q.put(_STAGE_DONE)
+
+
+async def _score_stage(
+    in_q: asyncio.Queue,
+    out_q: asyncio.Queue,
+    system_settings,
+    enable_pipeline: bool,
+) -> None:
+    """Score deduped batches with Layer 1 (pass-through when pipeline is OFF).
+
+    Near-duplicates are not scored, fetched or analyzed; the news API hides
+    them from listings and serves their representative's content and
+    analysis (``News.duplicate_of_id``).
+
+    Several instances run concurrently; the end marker is put back so that
+    every sibling worker sees it.
+    """
+    while True:
+        batch = await in_q.get()
+        if batch is _STAGE_DONE:
+            await in_q.put(_STAGE_DONE)
+            return
+
+        scoring_map: Dict[str, Any] = {}
+        if enable_pipeline and any(c.duplicate_of is None for c in batch):
+            articles_for_scoring = [
+                {
+                    "url": c.url,
+                    "headline": c.title,
+                    "summary": c.summary or "",
+                }
+                for c in batch
+                if c.duplicate_of is None
+            ]
+            try:
+                async with get_task_session() as scoring_db:
+                    scoring_results, _ = await run_layer1_scoring_if_enabled(
+                        scoring_db, system_settings, articles_for_scoring
+                    )
+                scoring_map = {r.url: r for r in scoring_results}
+            except Exception as e:
+                logger.warning("Layer 1: Scoring failed, batch defaults to lightweight: %s", e)
+
+        await out_q.put((batch, scoring_map))
+
+
+def _build_news_row(
+    candidate: _Candidate,
+    scoring,
+    enable_pipeline: bool,
+) -> Tuple[Any, Optional[str], Optional[str], Optional[int]]:
+    """Build the News row for a candidate.
+
+    Returns:
+        Tuple of (News, decision label, reasoning, score). The decision is
+        None when the pipeline is OFF.
+    """
+    from app.models.news import News, FilterStatus
+
+    if not enable_pipeline:
+        filter_status = content_score = processing_path = score_details = None
+        decision = reasoning = None
+    elif candidate.duplicate_of is not None:
+        filter_status = FilterStatus.DUPLICATE.value
+        content_score = None
+        processing_path = "duplicate"
+        score_details = None
+        decision = "duplicate"
+        reasoning = f"near-duplicate of {candidate.duplicate_of}"
+    elif scoring and scoring.routing_decision == "discard":
+        filter_status = FilterStatus.DISCARDED.value
+        content_score = scoring.total_score
+        processing_path = "discarded"
+        score_details = build_score_details(scoring)
+        decision = "discarded"
+        reasoning = scoring.reasoning
+    elif scoring:
+        filter_status = FilterStatus.INITIAL_USEFUL.value
+        content_score = scoring.total_score
+        processing_path = scoring.routing_decision  # "lightweight" or "full_analysis"
+        score_details = build_score_details(scoring)
+        decision = scoring.routing_decision
+        reasoning = scoring.reasoning
+    else:
+        # No scoring result (scoring failed) -- default to lightweight
+        filter_status = FilterStatus.INITIAL_USEFUL.value
+        content_score = 0
+        processing_path = "lightweight"
+        score_details = None
+        decision = "lightweight"
+        reasoning = "scoring_unavailable"
+
+    news = News(
+        id=candidate.news_id,
+        symbol=candidate.symbol,
+        title=candidate.title[:500],
+        summary=candidate.summary,
+        source=candidate.source,
+        url=candidate.url,
+        published_at=candidate.published_at,
+        market=candidate.market,
+        related_entities=None,
+        has_stock_entities=False,
+        has_macro_entities=False,
+        max_entity_score=None,
+        primary_entity=None,
+        primary_entity_type=None,
+        filter_status=filter_status,
+        content_score=content_score,
+        processing_path=processing_path,
+        score_details=score_details,
+        duplicate_of_id=candidate.duplicate_of,
+    )
+    return news, decision, reasoning, content_score
+
+
+async def _write_stage(
+    db,
+    in_q: asyncio.Queue,
+    enable_pipeline: bool,
+    stats: Dict[str, Any],
+) -> None:
+    """Persist scored batches and dispatch follow-up work per batch.
+
+    Each batch is committed on its own so that Layer 1.5 fetching, trace
+    events and importance analysis start while later batches are still
+    being fetched or scored.
+    """
+    from sqlalchemy import select
+    from app.models.news import News
+
+    while True:
+        item = await in_q.get()
+        if item is _STAGE_DONE:
+            return
+        batch, scoring_map = item
+
+        rows = []
+        for attempt in range(2):
+            rows = [
+                (c, *_build_news_row(c, scoring_map.get(c.url), enable_pipeline))
+                for c in batch
+            ]
+            db.add_all([row[1] for row in rows])
+            try:
+                await db.commit()
+                break
+            except Exception as e:
+                await db.rollback()
+                rows = []
+                if attempt:
+                    logger.error("Failed to store batch of %d articles: %s", len(batch), e)
+                    break
+                # Most likely a URL stored concurrently (e.g. by the RSS
+                # monitor): drop rows that now exist and retry once.
+                logger.warning("Batch commit failed, re-checking duplicates: %s", e)
+                result = await db.execute(
+                    select(News.url).where(News.url.in_([c.url for c in batch]))
+                )
+                existing_urls = {row[0] for row in result.fetchall()}
+                batch = [c for c in batch if c.url not in existing_urls]
+                if not batch:
+                    break
+
+        if not rows:
+            continue
+
+        dispatch_rows = []
+        for candidate, news, decision, reasoning, score in rows:
+            stats["articles_stored"] += 1
+            scoring = scoring_map.get(candidate.url)
+            if scoring and scoring.is_critical and enable_pipeline:
+                stats["layer1_critical"] += 1
+            if decision == "discarded":
+                stats["layer1_discard"] += 1
+                continue
+            if decision == "duplicate":
+                continue
+            if decision == "full_analysis":
+                stats["layer1_full_analysis"] += 1
+            elif decision == "lightweight":
+                stats["layer1_lightweight"] += 1
+            dispatch_rows.append(news)
+
+            # Global articles only get importance analysis with the pipeline
+            # ON; watchlist articles always do (pre-existing behaviour).
+            if enable_pipeline or candidate.origin == "watchlist":
+                importance = _score_article_importance({
+                    "source": candidate.source,
+                    "title": candidate.title,
+                    "summary": candidate.summary,
+                })
+                if importance >= 2.0:
+                    analyze_important_news.delay(str(news.id))
+                    logger.info(
+                        "Queued AI analysis for important article: %s (score=%.1f)",
+                        candidate.title[:60],
+                        importance,
+                    )
+
+        # Write pipeline trace events for Layer 1
+        if enable_pipeline:
+            from app.services.pipeline_trace_service import PipelineTraceService
+            try:
+                await PipelineTraceService.record_events_batch([
+                    PipelineTraceService.make_event(
+                        news_id=str(news.id), layer="1",
+                        node="layer1_scoring", status="success",
+                        metadata={
+                            "decision": decision,
+                            "reason": reasoning or "",
+                            "score": score or 0,
+                        },
+                    )
+                    for _, news, decision, reasoning, score in rows
+                ])
+            except Exception as e:
+                logger.warning("Failed to write pipeline trace events: %s", e)
+
+            # Dispatch Layer 1.5: batch fetch content
+            _dispatch_batch_fetch(dispatch_rows)
+
+        await _update_progress(
+            "streaming",
+            f"Stored {stats['articles_stored']} new articles...",
+            50,
+        )
+
+
+def _dispatch_batch_fetch(news_rows: List[Any]) -> None:
+    """Queue Layer 1.5 batch_fetch_content for committed News rows."""
+    batch = []
+    for news_obj in news_rows:
+        if news_obj.id and news_obj.url:
+            batch.append({
+                "news_id": str(news_obj.id),
+                "url": news_obj.url,
+                "market": news_obj.market or "US",
+                "symbol": news_obj.symbol or "",
+                "title": news_obj.title or "",
+                "summary": news_obj.summary or "",
+                "source": news_obj.source or "",
+                "published_at": news_obj.published_at.isoformat() if news_obj.published_at else None,
+                "content_source": "trafilatura",
+                # Scoring data flows through to Layer 3
+                "content_score": news_obj.content_score or 0,
+                "processing_path": news_obj.processing_path or "lightweight",
+                "score_details": news_obj.score_details,
+            })
+
+    if not batch:
+        return
+
+    from worker.tasks.full_content_tasks import batch_fetch_content, BATCH_CHUNK_SIZE
+    # Split large batches into chunks to keep task duration reasonable
+    for i in range(0, len(batch), BATCH_CHUNK_SIZE):
+        chunk = batch[i:i + BATCH_CHUNK_SIZE]
+        batch_fetch_content.delay(chunk)
+        logger.info("Dispatched batch_fetch_content: %d articles", len(chunk))
+
+
 async def _monitor_news_async() -> Dict[str, Any]:
     """
     Async implementation of news monitoring.
@@ -86,20 +589,15 @@ async def _monitor_news_async() -> Dict[str, Any]:
     - ON:  Full 3-layer pipeline -- Layer 1 scoring -> Layer 2 fetch+clean
       -> Layer 3 analyze/embed.
 
-    Two-layer news acquisition strategy:
-    - Layer 1: Global market news (Finnhub general + AKShare trending)
-    - Layer 2: Watchlist symbol-specific news (per-symbol queries)
+    Sources are global market news (Finnhub categories + AKShare trending)
+    and watchlist symbol-specific news. They are fetched concurrently and
+    streamed through dedup -> Layer 1 scoring -> storage/dispatch (see the
+    stage functions above), so scoring starts on the first deduped batch.
     """
     from sqlalchemy import select
 
     from app.config import settings as app_settings
     from app.models.watchlist import WatchlistItem
-    from app.models.news import News, NewsAlert, FilterStatus
-    from app.services.news_service import (
-        FinnhubProvider,
-        AKShareProvider,
-        get_news_service,
-    )
     from app.services.settings_service import SettingsService
 
     logger.info("Starting news monitor task")
@@ -110,6 +608,8 @@ async def _monitor_news_async() -> Dict[str, Any]:
         "global_finnhub": 0,
         "global_akshare": 0,
         "watchlist_fetched": 0,
+        "duplicates": 0,
+        "near_duplicates": 0,
         "articles_stored": 0,
         "alerts_triggered": 0,
         "llm_pipeline_enabled": False,
@@ -120,7 +620,7 @@ async def _monitor_news_async() -> Dict[str, Any]:
         "layer1_critical": 0,
     }
 
-    trace_batch = []  # Pipeline trace events to write after commit
+    t0 = time.monotonic()
 
     try:
         async with get_task_session() as db:
@@ -128,509 +628,47 @@ async def _monitor_news_async() -> Dict[str, Any]:
             settings_service = SettingsService()
             system_settings = await settings_service.get_system_settings(db)
             finnhub_api_key = system_settings.finnhub_api_key or app_settings.FINNHUB_API_KEY
-
-            # Track seen URLs to avoid duplicates
-            seen_urls: set = set()
-
-            # Collect important articles for post-commit AI analysis dispatch
-            important_articles: List[tuple] = []  # (News obj, importance score, title preview)
-            all_new_articles: List = []  # Track all new articles for dispatch
-
-            # ===== Layer 1: Global Market News (Finnhub + AKShare) =====
-            await _update_progress("layer1", "Layer 1: Fetching global market news...", 5)
             enable_pipeline = system_settings.enable_llm_pipeline
             stats["llm_pipeline_enabled"] = enable_pipeline
 
-            try:
-                # --- Fetch from both sources ---
-                # Source 1: Finnhub news (all categories) -- always use get_general_news
-                finnhub_articles = []
-                finnhub_categories = ["general", "forex", "crypto", "merger"]
-                for cat in finnhub_categories:
-                    try:
-                        cat_articles = await FinnhubProvider.get_general_news(
-                            category=cat,
-                            api_key=finnhub_api_key,
-                        )
-                        finnhub_articles.extend(cat_articles)
-                        logger.info(f"Layer 1: Finnhub [{cat}] fetched {len(cat_articles)} articles")
-                    except Exception as e:
-                        logger.warning(f"Layer 1: Finnhub [{cat}] fetch failed: {e}")
-                stats["global_finnhub"] = len(finnhub_articles)
-
-                await _update_progress("layer1_akshare", "Layer 1: Fetching AKShare news...", 10)
-
-                # Source 2: AKShare trending
-                akshare_articles = []
-                try:
-                    akshare_articles = await AKShareProvider.get_trending_news_cn()
-                    stats["global_akshare"] = len(akshare_articles)
-                    logger.info(f"Layer 1: AKShare fetched {len(akshare_articles)} articles")
-                except Exception as e:
-                    logger.warning(f"Layer 1: AKShare fetch failed: {e}")
-
-                # Combine all global articles
-                global_articles = finnhub_articles + akshare_articles
-                stats["global_fetched"] = len(global_articles)
-
-                # Batch dedup: query DB once for all URLs
-                candidate_urls = [a.url for a in global_articles if a.url and a.url not in seen_urls]
-                existing_urls = set()
-                if candidate_urls:
-                    dedup_query = select(News.url).where(News.url.in_(candidate_urls))
-                    dedup_result = await db.execute(dedup_query)
-                    existing_urls = {row[0] for row in dedup_result.fetchall()}
-
-                new_articles = []
-                for a in global_articles:
-                    if a.url and a.url not in seen_urls and a.url not in existing_urls:
-                        new_articles.append(a)
-                    if a.url:
-                        seen_urls.add(a.url)
+            await ensure_news_url_index()
 
-                logger.info(
-                    f"Layer 1: {len(global_articles)} fetched (Finnhub={stats['global_finnhub']}, "
-                    f"AKShare={stats['global_akshare']}), "
-                    f"{len(existing_urls)} already in DB, {len(new_articles)} new"
-                )
+            # Get all unique symbols from watchlists (all markets)
+            result = await db.execute(select(WatchlistItem.symbol).distinct())
+            watchlist_symbols = [row[0] for row in result.fetchall()][:WATCHLIST_SYMBOL_LIMIT]
 
-                if enable_pipeline:
-                    # Pipeline ON: run Layer 1 scoring on all new global articles
-                    articles_for_scoring = [
-                        {
-                            "url": a.url,
-                            "headline": a.title,
-                            "summary": a.summary or "",
-                        }
-                        for a in new_articles
-                    ]
-
-                    await _update_progress("layer1_scoring", f"Layer 1: Scoring {len(new_articles)} new articles...", 20)
-
-                    scoring_results = []
-                    try:
-                        scoring_results, _ = await run_layer1_scoring_if_enabled(
-                            db, system_settings, articles_for_scoring
-                        )
-                    except Exception as e:
-                        logger.warning("Layer 1: Scoring failed, all articles default to lightweight: %s", e)
-
-                    # Build URL -> scoring result map
-                    scoring_map = {}
-                    for r in scoring_results:
-                        scoring_map[r.url] = r
-
-                    # Store articles with scoring data
-                    for article in new_articles:
-                        scoring = scoring_map.get(article.url)
-
-                        if scoring and scoring.routing_decision == "discard":
-                            # Discarded: store with discarded status, do NOT dispatch
-                            news = News(
-                                symbol=article.symbol,
-                                title=article.title[:500] if article.title else "",
-                                summary=article.summary,
-                                source=article.source,
-                                url=article.url,
-                                published_at=article.published_at,
-                                market=article.market,
-                                related_entities=None,
-                                has_stock_entities=False,
-                                has_macro_entities=False,
-                                max_entity_score=None,
-                                primary_entity=None,
-                                primary_entity_type=None,
-                                filter_status=FilterStatus.DISCARDED.value,
-                                content_score=scoring.total_score,
-                                processing_path="discarded",
-                                score_details=build_score_details(scoring),
-                            )
-                            db.add(news)
-                            stats["articles_stored"] += 1
-                            stats["layer1_discard"] += 1
-                            if scoring.is_critical:
-                                stats["layer1_critical"] += 1
-
-                            trace_batch.append({
-                                "news_obj": news,
-                                "decision": "discarded",
-                                "reason": scoring.reasoning,
-                                "score": scoring.total_score,
-                            })
-                            continue
-
-                        # Not discarded: store with scoring data and dispatch later
-                        if scoring:
-                            filter_status = FilterStatus.INITIAL_USEFUL.value
-                            content_score = scoring.total_score
-                            processing_path = scoring.routing_decision  # "lightweight" or "full_analysis"
-                            score_details = build_score_details(scoring)
-                            is_critical = scoring.is_critical
-                            decision_label = scoring.routing_decision
-                            reasoning = scoring.reasoning
-
-                            if scoring.routing_decision == "full_analysis":
-                                stats["layer1_full_analysis"] += 1
-                            else:
-                                stats["layer1_lightweight"] += 1
-                            if scoring.is_critical:
-                                stats["layer1_critical"] += 1
-                        else:
-                            # No scoring result (scoring failed) -- default to lightweight
-                            filter_status = FilterStatus.INITIAL_USEFUL.value
-                            content_score = 0
-                            processing_path = "lightweight"
-                            score_details = None
-                            is_critical = False
-                            decision_label = "lightweight"
-                            reasoning = "scoring_unavailable"
-
-                        news = News(
-                            symbol=article.symbol,
-                            title=article.title[:500] if article.title else "",
-                            summary=article.summary,
-                            source=article.source,
-                            url=article.url,
-                            published_at=article.published_at,
-                            market=article.market,
-                            related_entities=None,
-                            has_stock_entities=False,
-                            has_macro_entities=False,
-                            max_entity_score=None,
-                            primary_entity=None,
-                            primary_entity_type=None,
-                            filter_status=filter_status,
-                            content_score=content_score,
-                            processing_path=processing_path,
-                            score_details=score_details,
-                        )
-                        db.add(news)
-                        all_new_articles.append(news)
-                        stats["articles_stored"] += 1
-
-                        trace_batch.append({
-                            "news_obj": news,
-                            "decision": decision_label,
-                            "reason": reasoning,
-                            "score": content_score,
-                        })
-
-                        article_dict = article.to_dict()
-                        importance = _score_article_importance(article_dict)
-                        if importance >= 2.0:
-                            important_articles.append(
-                                (news, importance, article.title[:60] if article.title else "")
-                            )
-
-                    logger.info(
-                        "Layer 1 (pipeline ON): discard=%d, lightweight=%d, "
-                        "full_analysis=%d, critical=%d",
-                        stats["layer1_discard"],
-                        stats["layer1_lightweight"],
-                        stats["layer1_full_analysis"],
-                        stats["layer1_critical"],
-                    )
-
-                else:
-                    # Pipeline OFF: store all new articles with basic metadata only
-                    for article in new_articles:
-                        news = News(
-                            symbol=article.symbol,
-                            title=article.title[:500] if article.title else "",
-                            summary=article.summary,
-                            source=article.source,
-                            url=article.url,
-                            published_at=article.published_at,
-                            market=article.market,
-                            related_entities=None,
-                            has_stock_entities=False,
-                            has_macro_entities=False,
-                            max_entity_score=None,
-                            primary_entity=None,
-                            primary_entity_type=None,
-                        )
-                        db.add(news)
-                        stats["articles_stored"] += 1
-
-                    logger.info(
-                        "Layer 1 (pipeline OFF): stored=%d articles with basic metadata",
-                        stats["articles_stored"],
-                    )
-
-            except Exception as e:
-                logger.exception(f"Error in Layer 1 (Global news): {e}")
-
-            # ===== Layer 2: Watchlist Symbol-Specific News =====
-            await _update_progress("layer2", "Layer 2: Fetching watchlist news...", 45)
-            try:
-                # Get all unique symbols from watchlists (all markets)
-                query = select(WatchlistItem.symbol).distinct()
-                result = await db.execute(query)
-                watchlist_symbols = [row[0] for row in result.fetchall()]
-
-                news_service = await get_news_service()
-                import asyncio
-
-                # Pass 1: Collect all watchlist articles
-                watchlist_collected = []  # (symbol, article_data)
-                for symbol in watchlist_symbols[:40]:  # Limit to 40 symbols per run
-                    try:
-                        articles = await news_service.get_news_by_symbol(
-                            symbol,
-                            force_refresh=True,
-                        )
-                        stats["watchlist_fetched"] += len(articles)
-                        for article_data in articles[:5]:  # Limit per symbol
-                            url = article_data.get("url", "")
-                            if url and url not in seen_urls:
-                                watchlist_collected.append((symbol, article_data))
-                            if url:
-                                seen_urls.add(url)
-                        await asyncio.sleep(0.3)  # Rate limiting
-                    except Exception as e:
-                        logger.warning(f"Error fetching watchlist news for {symbol}: {e}")
-                        continue
-
-                # Pass 2: Batch dedup against DB (single query)
-                wl_urls = [a[1].get("url", "") for a in watchlist_collected if a[1].get("url")]
-                existing_wl_urls = set()
-                if wl_urls:
-                    dedup_query = select(News.url).where(News.url.in_(wl_urls))
-                    dedup_result = await db.execute(dedup_query)
-                    existing_wl_urls = {row[0] for row in dedup_result.fetchall()}
-
-                # Pass 3: Collect new (non-duplicate) watchlist articles
-                new_watchlist = []
-                for symbol, article_data in watchlist_collected:
-                    url = article_data.get("url", "")
-                    if url in existing_wl_urls:
-                        continue
-                    new_watchlist.append((symbol, article_data))
-
-                # Pass 4: Score + store watchlist articles
-                wl_scoring_map: dict = {}
-                wl_scoring_count = 0
-                if enable_pipeline and new_watchlist:
-                    # Run Layer 1 scoring (same as global articles)
-                    wl_articles_for_scoring = [
-                        {
-                            "url": ad.get("url", ""),
-                            "headline": ad.get("title", ""),
-                            "summary": ad.get("summary") or "",
-                        }
-                        for _, ad in new_watchlist
-                    ]
-                    await _update_progress(
-                        "wl_scoring",
-                        f"Watchlist: Scoring {len(new_watchlist)} articles...",
-                        55,
-                    )
-                    try:
-                        wl_scoring_results, _ = await run_layer1_scoring_if_enabled(
-                            db, system_settings, wl_articles_for_scoring
-                        )
-                        wl_scoring_map = {r.url: r for r in wl_scoring_results}
-                        wl_scoring_count = len(wl_scoring_results)
-                    except Exception as e:
-                        logger.warning(
-                            "Watchlist: Layer 1 scoring failed, defaulting to lightweight: %s", e
-                        )
+            await _update_progress(
+                "fetching",
+                f"Fetching global and {len(watchlist_symbols)} watchlist sources...",
+                5,
+            )
 
-                for symbol, article_data in new_watchlist:
-                    url = article_data.get("url", "")
-                    scoring = wl_scoring_map.get(url) if enable_pipeline else None
-
-                    if enable_pipeline and scoring and scoring.routing_decision == "discard":
-                        # Discarded: store but don't dispatch to Layer 2
-                        news = News(
-                            symbol=article_data.get("symbol", symbol),
-                            title=article_data.get("title", "")[:500],
-                            summary=article_data.get("summary"),
-                            source=article_data.get("source", "unknown"),
-                            url=url,
-                            published_at=_parse_datetime(article_data.get("publishedAt")),
-                            market=article_data.get("market", "US"),
-                            related_entities=None,
-                            has_stock_entities=False,
-                            has_macro_entities=False,
-                            max_entity_score=None,
-                            primary_entity=None,
-                            primary_entity_type=None,
-                            filter_status=FilterStatus.DISCARDED.value,
-                            content_score=scoring.total_score,
-                            processing_path="discarded",
-                            score_details=build_score_details(scoring),
-                        )
-                        db.add(news)
-                        stats["articles_stored"] += 1
-                        stats["layer1_discard"] += 1
-                        if scoring.is_critical:
-                            stats["layer1_critical"] += 1
-                        trace_batch.append({
-                            "news_obj": news,
-                            "decision": "discarded",
-                            "reason": scoring.reasoning,
-                            "score": scoring.total_score,
-                        })
-                        continue
-
-                    # Not discarded: determine routing from scoring
-                    if enable_pipeline and scoring:
-                        filter_status = FilterStatus.INITIAL_USEFUL.value
-                        content_score = scoring.total_score
-                        processing_path = scoring.routing_decision
-                        score_details = build_score_details(scoring)
-                        decision_label = scoring.routing_decision
-                        reasoning = scoring.reasoning
-                        if scoring.routing_decision == "full_analysis":
-                            stats["layer1_full_analysis"] += 1
-                        else:
-                            stats["layer1_lightweight"] += 1
-                        if scoring.is_critical:
-                            stats["layer1_critical"] += 1
-                    elif enable_pipeline:
-                        # Scoring failed or unavailable — default to lightweight
-                        filter_status = FilterStatus.INITIAL_USEFUL.value
-                        content_score = 0
-                        processing_path = "lightweight"
-                        score_details = None
-                        decision_label = "lightweight"
-                        reasoning = "scoring_unavailable"
-                    else:
-                        filter_status = None
-                        content_score = None
-                        processing_path = None
-                        score_details = None
-                        decision_label = None
-                        reasoning = None
-
-                    news = News(
-                        symbol=article_data.get("symbol", symbol),
-                        title=article_data.get("title", "")[:500],
-                        summary=article_data.get("summary"),
-                        source=article_data.get("source", "unknown"),
-                        url=url,
-                        published_at=_parse_datetime(article_data.get("publishedAt")),
-                        market=article_data.get("market", "US"),
-                        related_entities=None,
-                        has_stock_entities=False,
-                        has_macro_entities=False,
-                        max_entity_score=None,
-                        primary_entity=None,
-                        primary_entity_type=None,
-                        filter_status=filter_status,
-                        content_score=content_score,
-                        processing_path=processing_path,
-                        score_details=score_details,
-                    )
-                    db.add(news)
-                    all_new_articles.append(news)
-                    stats["articles_stored"] += 1
-
-                    if enable_pipeline:
-                        trace_batch.append({
-                            "news_obj": news,
-                            "decision": decision_label,
-                            "reason": reasoning,
-                            "score": content_score,
-                        })
-
-                    importance = _score_article_importance(article_data)
-                    if importance >= 2.0:
-                        important_articles.append(
-                            (news, importance, article_data.get("title", "")[:60])
-                        )
+            fetched_q: asyncio.Queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+            dedup_q: asyncio.Queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+            scored_q: asyncio.Queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+
+            async def scoring_pool() -> None:
+                await asyncio.gather(*[
+                    _score_stage(dedup_q, scored_q, system_settings, enable_pipeline)
+                    for _ in range(SCORING_WORKERS)
+                ])
+                await scored_q.put(_STAGE_DONE)
+
+            await _run_stages(
+                _fetch_stage(fetched_q, finnhub_api_key, watchlist_symbols, stats),
+                _dedup_stage(fetched_q, dedup_q, enable_pipeline, stats),
+                scoring_pool(),
+                _write_stage(db, scored_q, enable_pipeline, stats),
+            )
 
+            if not enable_pipeline:
                 logger.info(
-                    "Watchlist: fetched=%d, collected=%d, dupes=%d, new=%d, scored=%d",
-                    stats["watchlist_fetched"],
-                    len(watchlist_collected),
-                    len(existing_wl_urls),
-                    len(new_watchlist),
-                    wl_scoring_count,
+                    "Pipeline OFF: stored %d articles with basic metadata, no dispatch",
+                    stats["articles_stored"],
                 )
 
-            except Exception as e:
-                logger.exception(f"Error in Layer 2 (Watchlist news): {e}")
-
-            # Commit all new articles
-            await _update_progress("saving", f"Saving {stats['articles_stored']} new articles...", 85)
-            await db.commit()
-
-            # Dispatch AI analysis for important articles AFTER commit
-            # so that rows exist in DB and IDs are assigned
-            for news_obj, importance, title_preview in important_articles:
-                await db.refresh(news_obj)  # Ensure ID is loaded
-                if news_obj.id:
-                    analyze_important_news.delay(str(news_obj.id))
-                    logger.info(
-                        "Queued AI analysis for important article: %s (score=%.1f)",
-                        title_preview,
-                        importance,
-                    )
-
-            # Write pipeline trace events for Layer 1
-            if trace_batch:
-                from app.services.pipeline_trace_service import PipelineTraceService
-                try:
-                    for item in trace_batch:
-                        news_obj = item["news_obj"]
-                        if news_obj.id:
-                            await PipelineTraceService.record_event(
-                                db, news_id=str(news_obj.id), layer="1",
-                                node="layer1_scoring", status="success",
-                                metadata={
-                                    "decision": item["decision"],
-                                    "reason": item.get("reason", ""),
-                                    "score": item.get("score", 0),
-                                },
-                            )
-                    await db.commit()
-                except Exception as e:
-                    logger.warning("Failed to write pipeline trace events: %s", e)
-
-            # Dispatch Layer 1.5: batch fetch content (only when pipeline is ON)
-            if enable_pipeline and all_new_articles:
-                await _update_progress("dispatch", f"Dispatching batch fetch for {len(all_new_articles)} articles...", 92)
-                batch = []
-                for news_obj in all_new_articles:
-                    try:
-                        await db.refresh(news_obj)
-                        if news_obj.id and news_obj.url:
-                            batch.append({
-                                "news_id": str(news_obj.id),
-                                "url": news_obj.url,
-                                "market": news_obj.market or "US",
-                                "symbol": news_obj.symbol or "",
-                                "title": news_obj.title or "",
-                                "summary": news_obj.summary or "",
-                                "source": news_obj.source or "",
-                                "published_at": news_obj.published_at.isoformat() if news_obj.published_at else None,
-                                "content_source": "trafilatura",
-                                # Scoring data flows through to Layer 3
-                                "content_score": news_obj.content_score or 0,
-                                "processing_path": news_obj.processing_path or "lightweight",
-                                "score_details": news_obj.score_details,
-                            })
-                    except Exception as e:
-                        logger.warning("Failed to prepare article for batch fetch: %s", e)
-
-                if batch:
-                    from worker.tasks.full_content_tasks import batch_fetch_content, BATCH_CHUNK_SIZE
-                    # Split large batches into chunks to keep task duration reasonable
-                    for i in range(0, len(batch), BATCH_CHUNK_SIZE):
-                        chunk = batch[i:i + BATCH_CHUNK_SIZE]
-                        batch_fetch_content.delay(chunk)
-                        logger.info(
-                            "Dispatched batch_fetch_content: chunk %d/%d (%d articles)",
-                            i // BATCH_CHUNK_SIZE + 1,
-                            (len(batch) + BATCH_CHUNK_SIZE - 1) // BATCH_CHUNK_SIZE,
-                            len(chunk),
-                        )
-            elif not enable_pipeline:
-                logger.info("Pipeline OFF: skipping batch fetch dispatch for %d articles", len(all_new_articles))
-
             # Check news alerts
+            await _update_progress("alerts", "Checking news alerts...", 95)
             alerts_triggered = await _check_news_alerts(db, stats["articles_stored"])
             stats["alerts_triggered"] = alerts_triggered
 
@@ -642,14 +680,17 @@ async def _monitor_news_async() -> Dict[str, Any]:
         await _finish_progress(stats)
 
     logger.info(
-        "News monitor completed: "
+        "News monitor completed in %.1fs: "
         "global=%d (finnhub=%d, akshare=%d), "
-        "watchlist=%d, stored=%d, alerts=%d, "
+        "watchlist=%d, dupes=%d, near_dupes=%d, stored=%d, alerts=%d, "
         "pipeline=%s, discard=%d, lightweight=%d, full=%d, critical=%d",
+        time.monotonic() - t0,
         stats["global_fetched"],
         stats["global_finnhub"],
         stats["global_akshare"],
         stats["watchlist_fetched"],
+        stats["duplicates"],
+        stats["near_duplicates"],
         stats["articles_stored"],
         stats["alerts_triggered"],
         stats["llm_pipeline_enabled"],
@@ -662,6 +703,38 @@ async def _monitor_news_async() -> Dict[str, Any]:
     return stats
 
 
+async def ensure_news_url_index() -> None:
+    """Queue a URL index build if none exists yet (dedup uses the DB meanwhile)."""
+    from app.services.news_dedup_service import get_news_dedup_service
+
+    if not await get_news_dedup_service().is_ready():
+        logger.info("News URL index not built yet, queueing rebuild")
+        rebuild_news_url_index.delay()
+
+
+@celery_app.task(bind=True, max_retries=1, soft_time_limit=1200, time_limit=1500)
+def rebuild_news_url_index(self):
+    """
+    Rebuild the shared news URL dedup index from the news table.
+
+    Scheduled daily after news cleanup so deleted articles drop out of the
+    filter, and queued on demand when the index is missing.
+    """
+    try:
+        return run_async_task(_rebuild_news_url_index_async)
+    except Exception as e:
+        logger.exception(f"News URL index rebuild failed: {e}")
+        raise self.retry(exc=e, countdown=300)
+
+
+async def _rebuild_news_url_index_async() -> Dict[str, Any]:
+    """Async implementation of the URL index rebuild."""
+    from app.services.news_dedup_service import get_news_dedup_service
+
+    async with get_task_session() as db:
+        return await get_news_dedup_service().rebuild(db)
+
+
 async def _check_news_alerts(db, new_article_count: int) -> int:
     """Check news alerts against recent articles and trigger notifications."""
     from sqlalchemy import select
@@ -5,6 +5,7 @@ from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List
 
 from worker.celery_app import celery_app
+from worker.task_helpers import run_async_task
 
 # Use Celery-safe database utilities (avoids event loop conflicts)
 from app.db.task_session import get_task_session
@@ -117,16 +118,8 @@ def monitor_prices(self):
 
     This task is registered with Celery Beat schedule.
     """
-    import asyncio
-
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_monitor_prices_async())
-            return result
-        finally:
-            loop.close()
+        return run_async_task(_monitor_prices_async)
     except Exception as e:
         logger.exception(f"Price monitor task failed: {e}")
         # Retry with exponential backoff
@@ -220,16 +213,8 @@ def cleanup_old_triggered_alerts():
     Removes triggered alerts that are older than 30 days.
     This task should be scheduled to run daily.
     """
-    import asyncio
-
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_cleanup_alerts_async())
-            return result
-        finally:
-            loop.close()
+        return run_async_task(_cleanup_alerts_async)
     except Exception as e:
         logger.exception(f"Alert cleanup task failed: {e}")
         raise
@@ -277,16 +262,8 @@ def cleanup_inactive_subscriptions():
     Removes subscriptions that have been inactive for more than 90 days.
     This task should be scheduled to run weekly.
     """
-    import asyncio
-
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_cleanup_subscriptions_async())
-            return result
-        finally:
-            loop.close()
+        return run_async_task(_cleanup_subscriptions_async)
     except Exception as e:
         logger.exception(f"Subscription cleanup task failed: {e}")
         raise
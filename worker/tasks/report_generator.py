@@ -1,16 +1,21 @@
 """Report generation Celery tasks."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from worker.celery_app import celery_app
+from worker.task_helpers import run_async_task
 
 # Use Celery-safe database utilities (avoids event loop conflicts)
 from app.db.task_session import get_task_session
 
 logger = logging.getLogger(__name__)
 
+# Reports rendered concurrently within a batch (each uses its own session)
+REPORT_RENDER_CONCURRENCY = 4
+
 
 @celery_app.task(bind=True, max_retries=2)
 def check_scheduled_reports(self):
@@ -21,20 +26,13 @@ def check_scheduled_reports(self):
     1. Get all active schedules
     2. Check if current time matches any schedule
     3. Create pending reports for matching schedules
-    4. Dispatch generate_report tasks
+    4. Group the reports into symbol-sharing batches and dispatch one
+       generate_report_batch task per batch
 
     This task is registered with Celery Beat schedule.
     """
-    import asyncio
-
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_check_scheduled_reports_async())
-            return result
-        finally:
-            loop.close()
+        return run_async_task(_check_scheduled_reports_async)
     except Exception as e:
         logger.exception(f"Check scheduled reports task failed: {e}")
         # Retry with backoff
@@ -44,15 +42,21 @@ def check_scheduled_reports(self):
 async def _check_scheduled_reports_async() -> Dict[str, Any]:
     """Async implementation of checking scheduled reports."""
     from app.models.report import ReportFormat
-    from app.services.report_service import ReportGenerator, ReportService
+    from app.services.report_service import (
+        ReportGenerator,
+        ReportService,
+        plan_report_batches,
+    )
 
     logger.info("Checking for scheduled reports")
 
     stats = {
         "schedules_checked": 0,
         "reports_created": 0,
+        "batches": 0,
         "errors": 0,
     }
+    jobs: List[Tuple[str, List[str]]] = []
 
     try:
         async with get_task_session() as db:
@@ -69,10 +73,14 @@ async def _check_scheduled_reports_async() -> Dict[str, Any]:
 
             logger.info(f"Found {len(due_schedules)} due schedules")
 
+            # Resolve symbols for all schedules at once
+            symbols_by_schedule = await generator.get_symbols_for_schedules(
+                due_schedules
+            )
+
             for schedule in due_schedules:
                 try:
-                    # Get symbols for this schedule
-                    symbols = await generator.get_symbols_for_schedule(schedule)
+                    symbols = symbols_by_schedule.get(schedule.id, [])
 
                     if not symbols:
                         logger.warning(
@@ -98,9 +106,7 @@ async def _check_scheduled_reports_async() -> Dict[str, Any]:
                     # Cleanup old reports for user
                     await service.cleanup_old_reports(schedule.user_id)
 
-                    # Dispatch generation task
-                    generate_report.delay(str(report.id))
-
+                    jobs.append((str(report.id), symbols))
                     stats["reports_created"] += 1
                     logger.info(
                         f"Created report {report.id} for schedule {schedule.id}"
@@ -112,15 +118,21 @@ async def _check_scheduled_reports_async() -> Dict[str, Any]:
                     )
                     stats["errors"] += 1
 
-            logger.info(
-                f"Scheduled reports check completed: "
-                f"{stats['reports_created']} reports created"
-            )
-
     except Exception as e:
         logger.exception(f"Error in check scheduled reports: {e}")
         raise
 
+    # Dispatch generation: reports with overlapping symbols share a batch
+    # and therefore one market data snapshot
+    for batch in plan_report_batches(jobs):
+        generate_report_batch.delay(batch)
+        stats["batches"] += 1
+
+    logger.info(
+        f"Scheduled reports check completed: "
+        f"{stats['reports_created']} reports created in {stats['batches']} batches"
+    )
+
     return stats
 
 
@@ -139,16 +151,8 @@ def generate_report(self, report_id: str):
     Args:
         report_id: UUID of the report to generate
     """
-    import asyncio
-
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_generate_report_async(report_id))
-            return result
-        finally:
-            loop.close()
+        return run_async_task(_generate_report_async, report_id)
     except Exception as e:
         logger.exception(f"Generate report task failed for {report_id}: {e}")
         # Retry with exponential backoff
@@ -253,20 +257,7 @@ async def _generate_report_async(report_id: str) -> Dict[str, Any]:
                 f"(status: {report.status})"
             )
 
-            # Dispatch embedding for RAG search
-            if report.status == ReportStatus.COMPLETED.value and report.content:
-                try:
-                    from worker.tasks.embedding_tasks import embed_report
-                    embed_text = _extract_report_text(report.content)
-                    if embed_text:
-                        embed_report.delay(
-                            str(report.id),
-                            embed_text,
-                            symbols[0] if len(symbols) == 1 else None,
-                        )
-                        logger.info("Queued embedding for report %s", report_id)
-                except Exception as e:
-                    logger.warning("Failed to dispatch report embedding: %s", e)
+            _dispatch_report_embedding(report, symbols)
 
             return {
                 "status": report.status,
@@ -297,6 +288,171 @@ async def _generate_report_async(report_id: str) -> Dict[str, Any]:
         raise
 
 
+@celery_app.task(bind=True, max_retries=3)
+def generate_report_batch(self, report_ids: List[str]):
+    """
+    Generate several scheduled reports from one shared market snapshot.
+
+    Quotes, daily history and news are fetched once for the union of the
+    reports' symbols, then each report is rendered (portfolio summary, AI
+    summary) in its own session. A report whose rendering raises is marked
+    failed on its own without aborting the batch. Reports that are no longer
+    pending are skipped, so a retry only regenerates unfinished ones.
+
+    Args:
+        report_ids: UUIDs of the reports to generate
+    """
+    try:
+        return run_async_task(_generate_report_batch_async, report_ids)
+    except Exception as e:
+        logger.exception(f"Generate report batch task failed ({len(report_ids)} reports): {e}")
+        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+
+
+async def _generate_report_batch_async(report_ids: List[str]) -> Dict[str, Any]:
+    """Async implementation of batched report generation."""
+    from app.models.report import Report, ReportSchedule, ReportStatus
+    from app.services.report_service import ReportGenerator, build_market_snapshot
+    from sqlalchemy import select
+
+    logger.info(f"Starting batch generation for {len(report_ids)} reports")
+    stats = {"reports": 0, "completed": 0, "failed": 0, "skipped": 0, "symbols": 0}
+
+    # 1. Load pending reports and resolve their symbols/options
+    jobs: List[Dict[str, Any]] = []
+    async with get_task_session() as db:
+        result = await db.execute(select(Report).where(Report.id.in_(report_ids)))
+        reports = result.scalars().all()
+        pending = [
+            r for r in reports
+            if r.status in (ReportStatus.PENDING.value, ReportStatus.GENERATING.value)
+        ]
+        stats["skipped"] = len(report_ids) - len(pending)
+
+        schedule_ids = {r.schedule_id for r in pending if r.schedule_id}
+        schedules: Dict[str, ReportSchedule] = {}
+        if schedule_ids:
+            result = await db.execute(
+                select(ReportSchedule).where(ReportSchedule.id.in_(schedule_ids))
+            )
+            schedules = {s.id: s for s in result.scalars().all()}
+        symbols_by_schedule = await ReportGenerator(db).get_symbols_for_schedules(
+            list(schedules.values())
+        )
+
+        for report in pending:
+            schedule = schedules.get(report.schedule_id)
+            symbols = symbols_by_schedule.get(schedule.id, []) if schedule else []
+            if not symbols:
+                logger.warning(f"No symbols for report {report.id}")
+                report.status = ReportStatus.FAILED.value
+                report.error_message = "No symbols to include in report"
+                stats["failed"] += 1
+                continue
+            jobs.append({
+                "report_id": report.id,
+                "symbols": symbols,
+                "include_portfolio": schedule.include_portfolio,
+                "include_news": schedule.include_news,
+            })
+        await db.commit()
+
+    if not jobs:
+        return stats
+
+    # 2. Fetch market data once for the union of symbols
+    all_symbols = list(dict.fromkeys(s for job in jobs for s in job["symbols"]))
+    news_symbols = list(dict.fromkeys(
+        s for job in jobs if job["include_news"] for s in job["symbols"]
+    ))
+    snapshot = await build_market_snapshot(all_symbols, news_symbols=news_symbols)
+    stats["symbols"] = len(all_symbols)
+
+    # 3. Render each report from the snapshot
+    semaphore = asyncio.Semaphore(REPORT_RENDER_CONCURRENCY)
+
+    async def _render(job: Dict[str, Any]) -> None:
+        async with semaphore:
+            async with get_task_session() as db:
+                report = await db.get(Report, job["report_id"])
+                if report is None:
+                    return
+                report = await ReportGenerator(db).generate_report(
+                    report=report,
+                    symbols=job["symbols"],
+                    include_portfolio=job["include_portfolio"],
+                    include_news=job["include_news"],
+                    snapshot=snapshot,
+                )
+                stats["reports"] += 1
+                if report.status == ReportStatus.COMPLETED.value:
+                    stats["completed"] += 1
+                    _dispatch_report_embedding(report, job["symbols"])
+                else:
+                    stats["failed"] += 1
+
+    # One failing report must not abort the rest of the batch
+    results = await asyncio.gather(*[_render(job) for job in jobs], return_exceptions=True)
+    failures = {
+        job["report_id"]: result
+        for job, result in zip(jobs, results)
+        if isinstance(result, BaseException)
+    }
+    if failures:
+        for report_id, error in failures.items():
+            logger.error(f"Error generating report {report_id}: {error!r}", exc_info=error)
+        stats["failed"] += len(failures)
+        await _mark_reports_failed(failures)
+
+    logger.info(
+        f"Report batch completed: {stats['completed']} completed, "
+        f"{stats['failed']} failed, {stats['skipped']} skipped, "
+        f"{stats['symbols']} unique symbols"
+    )
+    return stats
+
+
+async def _mark_reports_failed(failures: Dict[Any, BaseException]) -> None:
+    """Mark reports whose rendering raised as failed (best effort)."""
+    from app.models.report import Report, ReportStatus
+    from sqlalchemy import update
+
+    try:
+        async with get_task_session() as db:
+            for report_id, error in failures.items():
+                await db.execute(
+                    update(Report)
+                    .where(Report.id == report_id)
+                    .values(
+                        status=ReportStatus.FAILED.value,
+                        error_message=str(error)[:500],
+                    )
+                )
+            await db.commit()
+    except Exception as update_error:
+        logger.error(f"Failed to update status of {len(failures)} reports: {update_error}")
+
+
+def _dispatch_report_embedding(report, symbols: List[str]) -> None:
+    """Queue embedding of a completed report for RAG search."""
+    from app.models.report import ReportStatus
+
+    if report.status != ReportStatus.COMPLETED.value or not report.content:
+        return
+    try:
+        from worker.tasks.embedding_tasks import embed_report
+        embed_text = _extract_report_text(report.content)
+        if embed_text:
+            embed_report.delay(
+                str(report.id),
+                embed_text,
+                symbols[0] if len(symbols) == 1 else None,
+            )
+            logger.info("Queued embedding for report %s", report.id)
+    except Exception as e:
+        logger.warning("Failed to dispatch report embedding: %s", e)
+
+
 def _extract_report_text(content) -> str:
     """Extract plain text from JSON report content for embedding."""
     import json
@@ -338,16 +494,8 @@ def cleanup_old_reports():
     Keeps only the most recent MAX_REPORTS_PER_USER (30) reports per user.
     This task should be scheduled to run daily.
     """
-    import asyncio
-
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_cleanup_old_reports_async())
-            return result
-        finally:
-            loop.close()
+        return run_async_task(_cleanup_old_reports_async)
     except Exception as e:
         logger.exception(f"Report cleanup task failed: {e}")
         raise
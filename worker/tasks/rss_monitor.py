@@ -9,6 +9,7 @@ import asyncio
 import json
 import logging
 import time
+import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
@@ -27,6 +28,20 @@ RSS_MONITOR_STATUS_KEY = "rss:monitor:status"
 RSS_MONITOR_PROGRESS_KEY = "rss:monitor:progress"
 RSS_MONITOR_LAST_RUN_KEY = "rss:monitor:last_run"
 
+# Prevents overlapping runs; TTL matches the Celery hard time limit
+RSS_MONITOR_LOCK_KEY = "lock:rss:monitor"
+RSS_MONITOR_LOCK_TTL = 300
+
+# Atomic compare-and-delete (same as CacheService.release_lock): a run that
+# outlived its TTL must not release a lock now held by the next run
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
 
 async def _update_rss_progress(stage: str, message: str, percent: int = 0):
     """Update RSS monitor progress in Redis for the admin dashboard."""
@@ -66,8 +81,9 @@ def monitor_rss_feeds(self):
     """
     Periodic task to poll all due RSS feeds.
 
-    Runs every 5 minutes to:
-    1. Find all enabled feeds whose poll interval has elapsed
+    Runs every minute to:
+    1. Find all enabled feeds whose adaptive next poll time has passed
+       (see app.services.rss_poll_scheduler)
     2. Fetch articles from RSSHub
     3. Deduplicate against existing News records
     4. Run Layer 1 scoring (if LLM pipeline enabled)
@@ -87,7 +103,31 @@ def monitor_rss_feeds(self):
 
 
 async def _monitor_rss_feeds_async() -> Dict[str, Any]:
-    """Async implementation of RSS feed monitoring."""
+    """Async implementation of RSS feed monitoring.
+
+    Guarded by a Redis lock: the task runs every minute, so a slow run
+    (LLM scoring) must not overlap with the next one polling the same feeds.
+    """
+    from app.db.redis import get_redis
+
+    redis = await get_redis()
+    token = uuid.uuid4().hex
+    if not await redis.set(RSS_MONITOR_LOCK_KEY, token, nx=True, ex=RSS_MONITOR_LOCK_TTL):
+        logger.info("RSS monitor already running, skipping this run")
+        return {"status": "skipped", "reason": "already_running"}
+
+    try:
+        return await _run_rss_monitor()
+    finally:
+        try:
+            if not await redis.eval(_RELEASE_LOCK_SCRIPT, 1, RSS_MONITOR_LOCK_KEY, token):
+                logger.warning("RSS monitor lock expired before the run finished")
+        except Exception as e:
+            logger.warning("Failed to release RSS monitor lock: %s", e)
+
+
+async def _run_rss_monitor() -> Dict[str, Any]:
+    """Poll due feeds, score new articles and dispatch them."""
     from sqlalchemy import select
 
     from app.services.rss_service import get_rss_service
@@ -103,6 +143,8 @@ async def _monitor_rss_feeds_async() -> Dict[str, Any]:
         "total_new": 0,
         "standard_dispatched": 0,
         "filter_skipped": 0,
+        "not_modified": 0,
+        "near_duplicates": 0,
         "errors": 0,
         "llm_pipeline_enabled": False,
         # Layer 1 scoring stats (only when pipeline enabled)
@@ -122,17 +164,23 @@ async def _monitor_rss_feeds_async() -> Dict[str, Any]:
 
             rss_service = get_rss_service()
 
+            # Dedup inside poll_feed uses the shared URL index once built
+            from worker.tasks.news_monitor import ensure_news_url_index
+            await ensure_news_url_index()
+
             await _update_rss_progress(
                 "polling", "Polling due RSS feeds...", 10
             )
 
-            # Poll all due feeds (with Semaphore(3) inside)
+            # Poll all due feeds (conditional GETs with adaptive concurrency,
+            # one bulk insert for all new entries)
             poll_result = await rss_service.poll_all_due_feeds(
                 db, system_settings
             )
 
             stats["feeds_polled"] = poll_result.get("polled", 0)
             stats["errors"] = poll_result.get("errors", 0)
+            stats["not_modified"] = poll_result.get("not_modified", 0)
 
             # Early commit: persist feed stats (last_polled_at, article_count,
             # consecutive_errors) and new News records immediately.
@@ -172,6 +220,31 @@ async def _monitor_rss_feeds_async() -> Dict[str, Any]:
                 40,
             )
 
+            if enable_pipeline and all_new_articles:
+                # Near-duplicates (same story from several feeds) are linked
+                # to their cluster representative and skip scoring/dispatch
+                from app.services.news_cluster_service import (
+                    cluster_scope,
+                    get_news_cluster_service,
+                )
+
+                duplicate_map = await get_news_cluster_service().link_duplicates([
+                    (str(a.id), cluster_scope(a.symbol, a.market), a.title, a.summary)
+                    for a in all_new_articles
+                ])
+                if duplicate_map:
+                    representatives = []
+                    for article in all_new_articles:
+                        rep_id = duplicate_map.get(str(article.id))
+                        if rep_id:
+                            article.filter_status = FilterStatus.DUPLICATE.value
+                            article.processing_path = "duplicate"
+                            article.duplicate_of_id = uuid.UUID(rep_id)
+                        else:
+                            representatives.append(article)
+                    stats["near_duplicates"] = len(duplicate_map)
+                    all_new_articles = representatives
+
             if enable_pipeline and all_new_articles:
                 # Format articles for scoring
                 FILTER_SUMMARY_LIMIT = 300
@@ -311,11 +384,12 @@ async def _monitor_rss_feeds_async() -> Dict[str, Any]:
         await _finish_rss_progress(stats)
 
     logger.info(
-        "RSS monitor completed: feeds=%d, new=%d, dispatched=%d, "
+        "RSS monitor completed: feeds=%d, new=%d, near_dupes=%d, dispatched=%d, "
         "discard=%d, lightweight=%d, full=%d, critical=%d, errors=%d, "
         "pipeline=%s",
         stats["feeds_polled"],
         stats["total_new"],
+        stats["near_duplicates"],
         stats["standard_dispatched"],
         stats["layer1_discard"],
         stats["layer1_lightweight"],
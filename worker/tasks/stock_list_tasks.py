@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from worker.celery_app import celery_app
+from worker.task_helpers import run_async_task
 
 logger = logging.getLogger(__name__)
 
@@ -624,16 +625,9 @@ def update_chinese_names(self, symbols: List[str]):
 @celery_app.task
 def get_stock_list_stats():
     """Get statistics about the current stock list."""
-    import asyncio
-
     async def _get_stats():
         from app.services.stock_list_service import get_stock_list_service
         service = await get_stock_list_service()
         return service.get_stats()
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_get_stats())
-    finally:
-        loop.close()
+    return run_async_task(_get_stats)